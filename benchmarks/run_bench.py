@@ -0,0 +1,64 @@
+"""Run orasnap benchmark presets and keep JSON results for comparison.
+
+Usage:
+    python benchmarks/run_bench.py [small|medium|large] [--scenarios bulk,parallel]
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from orasnap.bench.harness import format_reports, reports_to_json, run_benchmarks
+from orasnap.bench.synthetic import SyntheticSchema
+
+PRESETS = {
+    "small": SyntheticSchema(tables=200, views=50, packages=40, sequences=20, synonyms=500, audit_rows=500),
+    "medium": SyntheticSchema(
+        tables=2000,
+        views=500,
+        packages=300,
+        package_lines=1000,
+        sequences=200,
+        synonyms=10000,
+        audit_rows=20000,
+    ),
+    "large": SyntheticSchema(
+        tables=10000,
+        partitions_per_table=32,
+        indexes_per_table=4,
+        views=2000,
+        packages=1500,
+        package_lines=3000,
+        sequences=1000,
+        synonyms=40000,
+        audit_rows=200000,
+        latency_ms=2.0,
+    ),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="orasnap synthetic benchmark presets")
+    parser.add_argument("preset", nargs="?", default="small", choices=sorted(PRESETS))
+    parser.add_argument("--scenarios", default="bulk,metadata_api,parallel,async,incremental,audit,server_hash,source,dictionary")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    schema = PRESETS[args.preset]
+    scenarios = [item.strip() for item in args.scenarios.split(",") if item.strip()]
+    reports = run_benchmarks(schema, scenarios=scenarios, workers=args.workers)
+    print(format_reports(reports))
+
+    results_dir = Path(__file__).resolve().parent / "results"
+    results_dir.mkdir(exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = results_dir / f"{args.preset}-{stamp}.json"
+    output.write_text(reports_to_json(reports, schema), encoding="utf-8")
+    print(f"results={output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -43,6 +43,8 @@ GRANT CREATE SESSION TO ORASNAP_SVC;
 GRANT EXECUTE ON SYS.DBMS_METADATA TO ORASNAP_SVC;
 GRANT SELECT_CATALOG_ROLE TO ORASNAP_SVC;
 GRANT SELECT ANY DICTIONARY TO ORASNAP_SVC;
+-- extraction.server_hash: true 사용 시(서버에서 GET_DDL 해시 계산)
+GRANT EXECUTE ON SYS.DBMS_CRYPTO TO ORASNAP_SVC;
 
 -- 감사 로그 테이블 저장 quota: USERS 테이블스페이스 무제한
 ALTER USER ORASNAP_SVC QUOTA UNLIMITED ON USERS;
@@ -98,7 +100,8 @@ CREATE INDEX ORASNAP_SVC.IX_DDL_AUDIT_LOG_01
 -- =============================================================================
 -- STEP 6) DB 레벨 DDL 감사 트리거 생성
 -- 실행 계정: ORASNAP_SVC
--- 기록 이벤트: CREATE, ALTER, DROP, TRUNCATE
+-- 기록 이벤트: CREATE, ALTER, DROP, TRUNCATE, COMMENT
+-- (COMMENT는 extraction.mode=audit에서 테이블 코멘트 변경 감지에 사용)
 -- 시스템 계정(SYS, SYSTEM, CTXSYS 등) 관련 DDL은 노이즈 방지를 위해 제외
 -- =============================================================================
 CREATE OR REPLACE TRIGGER ORASNAP_SVC.TRG_DDL_AUDIT_DB
@@ -116,7 +119,7 @@ BEGIN
     RETURN;
   END IF;
 
-  IF ORA_SYSEVENT NOT IN ('CREATE', 'ALTER', 'DROP', 'TRUNCATE') THEN
+  IF ORA_SYSEVENT NOT IN ('CREATE', 'ALTER', 'DROP', 'TRUNCATE', 'COMMENT') THEN
     RETURN;
   END IF;
 
@@ -190,6 +193,38 @@ SELECT owner, trigger_name, status
 SELECT COUNT(*) AS audit_rows
   FROM ORASNAP_SVC.DDL_AUDIT_LOG;
 
+-- =============================================================================
+-- STEP 8) (선택) orasnap watch 즉시 알림
+-- 실행 계정: GRANT는 SYS 또는 관리자, 트리거는 ORASNAP_SVC
+-- 설명:
+-- - watch.alert_name: "ORASNAP_DDL"로 설정하면 폴링 대기 대신 이 신호에 바로 깨어납니다.
+-- - GRANT 없이 트리거를 만들면 트리거가 INVALID가 되어 DB 전체 DDL이 실패하므로
+--   반드시 GRANT 후 생성하고, 생성 뒤 STATUS가 VALID인지 확인하세요.
+-- =============================================================================
+GRANT EXECUTE ON SYS.DBMS_ALERT TO ORASNAP_SVC;
+
+CREATE OR REPLACE TRIGGER ORASNAP_SVC.TRG_DDL_AUDIT_ALERT
+AFTER DDL ON DATABASE
+DECLARE
+  PRAGMA AUTONOMOUS_TRANSACTION;
+BEGIN
+  IF ORA_SYSEVENT IN ('CREATE', 'ALTER', 'DROP', 'TRUNCATE', 'COMMENT')
+     AND NOT (ORA_DICT_OBJ_OWNER = 'ORASNAP_SVC' AND ORA_DICT_OBJ_NAME LIKE 'TRG_DDL_AUDIT%')
+  THEN
+    DBMS_ALERT.SIGNAL('ORASNAP_DDL', ORA_SYSEVENT);
+    COMMIT;
+  END IF;
+EXCEPTION
+  WHEN OTHERS THEN
+    ROLLBACK;
+END;
+/
+
+SELECT owner, trigger_name, status
+  FROM dba_triggers
+ WHERE owner = 'ORASNAP_SVC'
+   AND trigger_name = 'TRG_DDL_AUDIT_ALERT';
+
 -- =============================================================================
 -- 완료
 -- =============================================================================
@@ -0,0 +1 @@
+"""Synthetic-schema benchmarks with a local Oracle stand-in."""
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator
+
+from orasnap.bench.synthetic import SyntheticOracleDb, SyntheticSchema
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ExtractionConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+)
+from orasnap.oracle import audit_exporter as audit_exporter_module
+from orasnap.oracle import extractor as extractor_module
+from orasnap.pipeline import SnapshotPipeline, SnapshotRunResult
+
+SCENARIOS = (
+    "bulk",
+    "metadata_api",
+    "parallel",
+    "async",
+    "incremental",
+    "audit",
+    "server_hash",
+    "source",
+    "dictionary",
+)
+BENCH_OBJECT_TYPES = ["TABLE", "INDEX", "VIEW", "PACKAGE", "PACKAGE BODY", "SEQUENCE", "SYNONYM"]
+# 시나리오별 scope.type_strategies(없으면 모든 타입 bulk).
+SCENARIO_TYPE_STRATEGIES = {
+    "metadata_api": {object_type: "metadata_api" for object_type in BENCH_OBJECT_TYPES},
+    "source": {"PACKAGE": "source", "PACKAGE BODY": "source"},
+    "dictionary": {"VIEW": "dictionary", "SEQUENCE": "dictionary", "SYNONYM": "dictionary"},
+}
+
+
+@dataclass(frozen=True)
+class StageSample:
+    stage: str
+    seconds: float
+    peak_bytes: int
+
+
+@dataclass
+class ScenarioReport:
+    scenario: str
+    objects: int
+    extracted: int
+    written: int
+    audit_exported: int
+    round_trips: int
+    total_seconds: float
+    stages: list[StageSample] = field(default_factory=list)
+
+    @property
+    def peak_bytes(self) -> int:
+        return max((sample.peak_bytes for sample in self.stages), default=0)
+
+
+class _StageMemory:
+    """파이프라인 단계 경계마다 tracemalloc 최대치를 기록하고 초기화한다."""
+
+    def __init__(self) -> None:
+        self.samples: list[StageSample] = []
+
+    def __call__(self, stage: str, seconds: float) -> None:
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        self.samples.append(StageSample(stage=stage, seconds=seconds, peak_bytes=peak))
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+
+@contextmanager
+def patched_oracledb(database: SyntheticOracleDb) -> Iterator[None]:
+    originals = (extractor_module.oracledb, audit_exporter_module.oracledb)
+    extractor_module.oracledb = database
+    audit_exporter_module.oracledb = database
+    try:
+        yield
+    finally:
+        extractor_module.oracledb, audit_exporter_module.oracledb = originals
+
+
+def init_repo(repo_path: Path) -> None:
+    repo_path.mkdir(parents=True, exist_ok=True)
+    for args in (
+        ["init", "-q"],
+        ["config", "user.email", "bench@orasnap.local"],
+        ["config", "user.name", "orasnap-bench"],
+        ["commit", "-q", "--allow-empty", "-m", "bench seed"],
+    ):
+        subprocess.run(["git", "-C", str(repo_path), *args], check=True, capture_output=True)
+
+
+def bench_config(work_dir: Path, schema: SyntheticSchema, scenario: str, workers: int) -> AppConfig:
+    mode = {
+        "incremental": "incremental",
+        "audit": "audit",
+        "server_hash": "incremental",
+    }.get(scenario, "full")
+    return AppConfig(
+        oracle=OracleConfig(
+            host="bench.local",
+            port=1521,
+            service_name="BENCH",
+            username="ORASNAP_BENCH",
+            password="bench",
+            workers=workers if scenario in {"parallel", "async"} else 1,
+        ),
+        scope=ScopeConfig(
+            include_schemas=[schema.owner],
+            object_types=list(BENCH_OBJECT_TYPES),
+            type_strategies=dict(SCENARIO_TYPE_STRATEGIES.get(scenario, {})),
+        ),
+        output=OutputConfig(
+            snapshot_root=work_dir / "repo" / "snapshots",
+            manifest_file=str(work_dir / "files.json"),
+        ),
+        git=GitConfig(repo_path=work_dir / "repo", auto_push=False),
+        logs=LogsConfig(),
+        audit=AuditConfig(
+            enabled=schema.audit_rows > 0,
+            root=work_dir / "repo" / "_audit",
+            state_file=str(work_dir / "audit_state.json"),
+        ),
+        extraction=ExtractionConfig(
+            mode=mode,
+            engine="async" if scenario == "async" else "thread",
+            manifest_file=str(work_dir / "manifest.json"),
+            full_refresh_hours=0,
+            server_hash=scenario == "server_hash",
+        ),
+    )
+
+
+def run_pipeline(
+    config: AppConfig,
+    work_dir: Path,
+    logger: logging.Logger,
+    observer: _StageMemory | None = None,
+) -> SnapshotRunResult:
+    pipeline = SnapshotPipeline(
+        config=config,
+        logger=logger,
+        audit_state_path=work_dir / "audit_state.json",
+        manifest_path=Path(config.extraction.manifest_file),
+        file_manifest_path=Path(config.output.manifest_file),
+        stage_observer=observer,
+    )
+    return pipeline.run(dry_run=False)
+
+
+def run_scenario(
+    scenario: str,
+    schema: SyntheticSchema,
+    workers: int = 4,
+    change_ratio: float = 0.05,
+    track_memory: bool = True,
+    logger: logging.Logger | None = None,
+) -> ScenarioReport:
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Unknown benchmark scenario: {scenario}")
+    logger = logger or logging.getLogger("orasnap.bench")
+    database = SyntheticOracleDb(schema)
+
+    with tempfile.TemporaryDirectory(prefix="orasnap-bench-") as temp_dir, patched_oracledb(database):
+        work_dir = Path(temp_dir)
+        init_repo(work_dir / "repo")
+        config = bench_config(work_dir, schema, scenario, workers)
+
+        if scenario in {"incremental", "audit", "server_hash"}:
+            # 직전 스냅샷을 만든 뒤 일부 객체만 바꿔서 두 번째 실행을 측정한다.
+            seed_config = replace(config, extraction=replace(config.extraction, mode="audit"))
+            run_pipeline(seed_config, work_dir, logger)
+            if scenario == "server_hash":
+                # 뷰/패키지를 모두 같은 내용으로 재배포한 상황: LAST_DDL_TIME은 바뀌지만 본문은 그대로다.
+                database.catalog.recompile(1.0)
+            database.catalog.touch(change_ratio)
+            database.server.round_trips = 0
+
+        observer = _StageMemory()
+        if track_memory:
+            tracemalloc.start()
+        started = perf_counter()
+        try:
+            result = run_pipeline(config, work_dir, logger, observer)
+        finally:
+            if track_memory:
+                tracemalloc.stop()
+        total_seconds = perf_counter() - started
+
+    return ScenarioReport(
+        scenario=scenario,
+        objects=len(database.catalog.objects),
+        extracted=result.extracted_count,
+        written=result.written_count,
+        audit_exported=result.audit_exported_count,
+        round_trips=database.server.round_trips,
+        total_seconds=total_seconds,
+        stages=observer.samples,
+    )
+
+
+def run_benchmarks(
+    schema: SyntheticSchema,
+    scenarios: list[str] | None = None,
+    workers: int = 4,
+    change_ratio: float = 0.05,
+    track_memory: bool = True,
+) -> list[ScenarioReport]:
+    logger = logging.getLogger("orasnap.bench")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return [
+        run_scenario(
+            scenario,
+            schema,
+            workers=workers,
+            change_ratio=change_ratio,
+            track_memory=track_memory,
+            logger=logger,
+        )
+        for scenario in scenarios or list(SCENARIOS)
+    ]
+
+
+def format_reports(reports: list[ScenarioReport]) -> str:
+    lines = [
+        f"{'scenario':<12} {'stage':<8} {'seconds':>9} {'items/s':>10} {'peak MiB':>9}",
+    ]
+    for report in reports:
+        for sample in report.stages:
+            items = {
+                "extract": report.extracted,
+                "audit": report.audit_exported,
+            }.get(sample.stage, report.written)
+            rate = items / sample.seconds if sample.seconds > 0 and items else 0.0
+            lines.append(
+                f"{report.scenario:<12} {sample.stage:<8} {sample.seconds:>9.3f} "
+                f"{rate:>10.1f} {sample.peak_bytes / 1048576:>9.2f}"
+            )
+        lines.append(
+            f"{report.scenario:<12} {'total':<8} {report.total_seconds:>9.3f} "
+            f"{report.extracted / report.total_seconds if report.total_seconds else 0:>10.1f} "
+            f"{report.peak_bytes / 1048576:>9.2f}  "
+            f"objects={report.objects} extracted={report.extracted} round_trips={report.round_trips}"
+        )
+    return "\n".join(lines)
+
+
+def reports_to_json(reports: list[ScenarioReport], schema: SyntheticSchema) -> str:
+    payload = {
+        "schema": asdict(schema),
+        "scenarios": [
+            {**asdict(report), "peak_bytes": report.peak_bytes} for report in reports
+        ],
+    }
+    return json.dumps(payload, ensure_ascii=False, indent=2)
@@ -0,0 +1,592 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+BASE_DDL_TIME = datetime(2026, 1, 1, 0, 0, 0)
+QUOTED_NAME_PATTERN = re.compile(r"'((?:[^']|'')*)'")
+DB_TYPE_CURSOR = "DB_TYPE_CURSOR"
+
+
+@dataclass(frozen=True)
+class SyntheticSchema:
+    owner: str = "BENCH"
+    tables: int = 200
+    columns_per_table: int = 12
+    partitions_per_table: int = 4
+    indexes_per_table: int = 2
+    comments_per_table: int = 6
+    views: int = 50
+    packages: int = 40
+    package_lines: int = 400
+    sequences: int = 0
+    synonyms: int = 0
+    audit_rows: int = 500
+    # 1회 왕복(execute/fetch 배치)당 지연과 GET_DDL 객체당 서버 처리 시간.
+    latency_ms: float = 1.0
+    ddl_ms_per_object: float = 0.0
+
+
+class _SyntheticCatalog:
+    """생성된 스키마의 ALL_OBJECTS/ALL_INDEXES/주석/감사 로그를 메모리에 들고 있다."""
+
+    def __init__(self, schema: SyntheticSchema) -> None:
+        self.schema = schema
+        self.owner = schema.owner
+        self.versions: dict[tuple[str, str], int] = {}
+        # 내용은 그대로 두고 LAST_DDL_TIME만 바꾼 횟수(같은 소스 재컴파일/재배포).
+        self.recompiles: dict[tuple[str, str], int] = {}
+        self.objects: list[tuple[str, str]] = []
+        self.indexes: dict[str, list[str]] = {}
+        self.index_tables: dict[str, str] = {}
+        self.audit: list[tuple[Any, ...]] = []
+
+        for table_index in range(1, schema.tables + 1):
+            table = f"T_{table_index:05d}"
+            self.objects.append(("TABLE", table))
+            names = [f"IX_{table}_{number}" for number in range(1, schema.indexes_per_table + 1)]
+            self.indexes[table] = names
+            for index_name in names:
+                self.objects.append(("INDEX", index_name))
+                self.index_tables[index_name] = table
+        for view_index in range(1, schema.views + 1):
+            self.objects.append(("VIEW", f"V_{view_index:05d}"))
+        for package_index in range(1, schema.packages + 1):
+            self.objects.append(("PACKAGE", f"PKG_{package_index:05d}"))
+            self.objects.append(("PACKAGE BODY", f"PKG_{package_index:05d}"))
+        for sequence_index in range(1, schema.sequences + 1):
+            self.objects.append(("SEQUENCE", f"SEQ_{sequence_index:05d}"))
+        for synonym_index in range(1, schema.synonyms + 1):
+            self.objects.append(("SYNONYM", f"S_{synonym_index:05d}"))
+        self.objects.sort()
+        for key in self.objects:
+            self.versions[key] = 0
+
+        for audit_id in range(1, schema.audit_rows + 1):
+            table = f"T_{(audit_id - 1) % max(schema.tables, 1) + 1:05d}"
+            self._append_audit(audit_id, "ALTER", "TABLE", table)
+
+    def _append_audit(self, audit_id: int, event: str, object_type: str, name: str) -> None:
+        sql_text = f"ALTER TABLE {self.owner}.{name} ADD C_{audit_id} NUMBER"
+        self.audit.append(
+            (
+                audit_id,
+                BASE_DDL_TIME + timedelta(seconds=audit_id),
+                event,
+                self.owner,
+                self.owner,
+                self.owner,
+                "bench",
+                "bench-host",
+                "127.0.0.1",
+                "orasnap-bench",
+                self.owner,
+                object_type,
+                name,
+                sql_text,
+            )
+        )
+
+    def touch(self, ratio: float) -> list[tuple[str, str]]:
+        # ratio 비율의 객체를 변경된 것으로 표시하고 감사 로그에도 남긴다.
+        step = max(1, round(1 / ratio)) if ratio > 0 else 0
+        touched: list[tuple[str, str]] = []
+        if not step:
+            return touched
+        for position, key in enumerate(self.objects):
+            if position % step == 0:
+                self.versions[key] += 1
+                touched.append(key)
+                next_id = len(self.audit) + 1
+                self._append_audit(next_id, "ALTER", key[0], key[1])
+        return touched
+
+    def recompile(self, ratio: float) -> list[tuple[str, str]]:
+        # ratio 비율의 TABLE/INDEX 외 객체(뷰, 패키지)를 같은 내용으로 다시 만든 것처럼 LAST_DDL_TIME만 올린다.
+        step = max(1, round(1 / ratio)) if ratio > 0 else 0
+        recompiled: list[tuple[str, str]] = []
+        if not step:
+            return recompiled
+        for position, key in enumerate(self.objects):
+            if key[0] not in {"TABLE", "INDEX"} and position % step == 0:
+                self.recompiles[key] = self.recompiles.get(key, 0) + 1
+                recompiled.append(key)
+                self._append_audit(len(self.audit) + 1, "CREATE", key[0], key[1])
+        return recompiled
+
+    def ddl_time(self, key: tuple[str, str]) -> datetime:
+        return BASE_DDL_TIME + timedelta(
+            minutes=self.versions.get(key, 0), seconds=self.recompiles.get(key, 0)
+        )
+
+    def ddl(self, object_type: str, name: str) -> str | None:
+        key = (object_type, name)
+        if key not in self.versions:
+            return None
+        version = self.versions[key]
+        owner = self.owner
+        if object_type == "TABLE":
+            columns = ",\n".join(
+                f'   "C_{number:03d}" VARCHAR2({number * 10}) DEFAULT \'V{version}\''
+                for number in range(1, self.schema.columns_per_table + 1)
+            )
+            partitions = ""
+            if self.schema.partitions_per_table:
+                partition_lines = ",\n".join(
+                    f'  PARTITION "P_{number:03d}" VALUES LESS THAN ({number * 1000})\n'
+                    f'  STORAGE(INITIAL 65536 NEXT 1048576) TABLESPACE "BENCH_DATA"'
+                    for number in range(1, self.schema.partitions_per_table + 1)
+                )
+                partitions = f'\n  PARTITION BY RANGE ("C_001")\n (\n{partition_lines}\n )'
+            return (
+                f'\n  CREATE TABLE "{owner}"."{name}"\n   (\n{columns}\n   ) '
+                f'SEGMENT CREATION IMMEDIATE\n  STORAGE(INITIAL 65536 NEXT 1048576)\n'
+                f'  TABLESPACE "BENCH_DATA"{partitions} ;'
+            )
+        if object_type == "INDEX":
+            table = self.index_tables[name]
+            return (
+                f'\n  CREATE INDEX "{owner}"."{name}" ON "{owner}"."{table}" ("C_001")\n'
+                f'  STORAGE(INITIAL 65536) TABLESPACE "BENCH_IDX" ;'
+            )
+        if object_type == "VIEW":
+            return (
+                f'\n  CREATE OR REPLACE FORCE VIEW "{owner}"."{name}" ("C_001") AS \n'
+                f"  {self.view_text(name)};"
+            )
+        if object_type == "SEQUENCE":
+            return (
+                f'\n   CREATE SEQUENCE  "{owner}"."{name}"  MINVALUE 1 MAXVALUE 9999999999999999999999999999 '
+                f"INCREMENT BY {version + 1} START WITH 1 CACHE 20 NOORDER  NOCYCLE  NOKEEP  NOSCALE  GLOBAL ;"
+            )
+        if object_type == "SYNONYM":
+            target = self.synonym_target(name)
+            return f'\n  CREATE OR REPLACE EDITIONABLE SYNONYM "{owner}"."{name}" FOR "{owner}"."{target}";'
+        if object_type in {"PACKAGE", "PACKAGE BODY"}:
+            # ALL_SOURCE(source())를 GET_DDL 형태로 재조립한 결과와 같아야 한다.
+            body = "\n".join(
+                f"    v_{line} := v_{line} + {version}; -- line {line}"
+                for line in range(1, self.schema.package_lines + 1)
+            )
+            body_ddl = (
+                f'\n  CREATE OR REPLACE EDITIONABLE PACKAGE BODY "{owner}"."{name}" AS\n'
+                f"  PROCEDURE RUN IS\n  BEGIN\n{body}\n  END;\nEND {name};\n/"
+            )
+            if object_type == "PACKAGE BODY":
+                return body_ddl
+            return (
+                f'\n  CREATE OR REPLACE EDITIONABLE PACKAGE "{owner}"."{name}" AS\n'
+                f"  PROCEDURE RUN;\nEND {name};\n/{body_ddl}"
+            )
+        return None
+
+    def view_text(self, name: str) -> str:
+        """ALL_VIEWS.TEXT."""
+        return f"SELECT C_001 FROM {self.owner}.T_00001 WHERE ROWNUM <= {self.versions[('VIEW', name)] + 1}"
+
+    def synonym_target(self, name: str) -> str:
+        # 변경(버전)마다 다른 테이블을 가리킨다.
+        number = int(name.split("_")[-1]) + self.versions[("SYNONYM", name)]
+        return f"T_{(number - 1) % max(self.schema.tables, 1) + 1:05d}"
+
+    def dictionary_rows(self, object_type: str, names: set[str] | None) -> list[tuple[Any, ...]]:
+        """ALL_VIEWS/ALL_SEQUENCES/ALL_SYNONYMS 행(dictionary 방식 쿼리의 컬럼 순서)."""
+        rows: list[tuple[Any, ...]] = []
+        for key_type, name in self.objects:
+            if key_type != object_type or (names is not None and name not in names):
+                continue
+            if object_type == "VIEW":
+                # 합성 뷰 DDL에는 EDITIONABLE 키워드가 없으므로 12c 이전처럼 빈 값을 돌려준다.
+                rows.append((name, self.view_text(name), None, "N"))
+            elif object_type == "SEQUENCE":
+                increment = str(self.versions[(object_type, name)] + 1)
+                rows.append(
+                    (name, "1", "9999999999999999999999999999", increment, "1", 20, "N", "N", "N", "N", "N", "N")
+                )
+            else:
+                rows.append((name, self.owner, self.synonym_target(name), None, "Y"))
+        return rows
+
+    def source(self, object_type: str, name: str) -> list[str]:
+        """ALL_SOURCE 행(TEXT). 줄마다 줄바꿈을 포함하고 마지막 줄은 포함하지 않는다."""
+        key = ("PACKAGE", name)
+        if object_type not in {"PACKAGE", "PACKAGE BODY"} or key not in self.versions:
+            return []
+        if object_type == "PACKAGE":
+            return [f"PACKAGE {name} AS\n", "  PROCEDURE RUN;\n", f"END {name};"]
+        version = self.versions[("PACKAGE BODY", name)]
+        return [
+            f"PACKAGE BODY {name} AS\n",
+            "  PROCEDURE RUN IS\n",
+            "  BEGIN\n",
+            *(
+                f"    v_{line} := v_{line} + {version}; -- line {line}\n"
+                for line in range(1, self.schema.package_lines + 1)
+            ),
+            "  END;\n",
+            f"END {name};",
+        ]
+
+
+class _SyntheticNameList:
+    """`SYS.ODCIVARCHAR2LIST` 컬렉션 바인드 대역."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = list(names)
+
+    def aslist(self) -> list[str]:
+        return list(self.names)
+
+
+class _SyntheticNameListType:
+    def newobject(self, names: list[str]) -> _SyntheticNameList:
+        return _SyntheticNameList(names)
+
+
+def _bind_names(binds: list[Any]) -> list[Any]:
+    # TABLE(:n)으로 넘긴 이름 컬렉션 바인드 값을 꺼낸다.
+    for bind in binds:
+        if isinstance(bind, _SyntheticNameList):
+            return bind.aslist()
+    return []
+
+
+class _SyntheticServer:
+    def __init__(self, catalog: _SyntheticCatalog) -> None:
+        self.catalog = catalog
+        self.round_trips = 0
+
+    def execute(self, sql: str, binds: list[Any]) -> tuple[list[tuple[Any, ...]], int]:
+        """SQL 텍스트로 extractor/audit_exporter 쿼리를 구분해서 (행, GET_DDL 호출 수)를 돌려준다."""
+        catalog = self.catalog
+        owner = catalog.owner
+        if "DBMS_METADATA.OPEN(:1)" in sql:
+            # NAME_EXPR 필터 문자열(IN ('A', 'B'))에서 객체 이름을 꺼낸다.
+            object_type = str(binds[0]).replace("_", " ")
+            names = sorted(name.replace("''", "'") for name in QUOTED_NAME_PATTERN.findall(str(binds[2])))
+            rows = []
+            for name in names:
+                ddl = catalog.ddl(object_type, name)
+                if ddl is not None:
+                    rows.append((name, ddl))
+            return rows, len(rows)
+        if "SET_TRANSFORM_PARAM" in sql:
+            return [], 0
+        if "MAX(AUDIT_ID)" in sql:
+            return [(len(catalog.audit),)], 0
+        if "SELECT AUDIT_ID, SYSEVENT" in sql:
+            after = int(binds[0])
+            return [(row[0], row[2], row[10], row[11], row[12]) for row in catalog.audit if row[0] > after], 0
+        if "EVENT_TIME" in sql and "AUDIT_ID > :1" in sql:
+            after = int(binds[0])
+            return [row for row in catalog.audit if row[0] > after], 0
+        if "FROM ALL_INDEXES i" in sql and "GROUP BY" in sql:
+            if owner not in binds:
+                return [], 0
+            rows = []
+            for table, names in sorted(catalog.indexes.items()):
+                if names:
+                    latest = max(catalog.ddl_time(("INDEX", name)) for name in names)
+                    rows.append((owner, table, len(names), latest))
+            return rows, 0
+        if "SELECT OWNER, OBJECT_TYPE, OBJECT_NAME, LAST_DDL_TIME" in sql:
+            if owner not in binds:
+                return [], 0
+            wanted = {str(item) for item in binds}
+            return [
+                (owner, object_type, name, catalog.ddl_time((object_type, name)))
+                for object_type, name in catalog.objects
+                if object_type in wanted
+            ], 0
+        if "LEFT JOIN ALL_TRIGGERS t" in sql:
+            if binds[0] != owner:
+                return [], 0
+            wanted = set(_bind_names(binds))
+            return [
+                (name, object_type, "Y", None)
+                for object_type, name in catalog.objects
+                if object_type in wanted
+            ], 0
+        if "FROM ALL_SOURCE" in sql:
+            if binds[0] != owner:
+                return [], 0
+            source_types = sorted(str(item) for item in binds[1].aslist())
+            names = sorted(
+                set(binds[2].aslist()) if len(binds) > 2 else {name for _, name in catalog.objects}
+            )
+            rows = [
+                (name, source_type, text)
+                for name in names
+                for source_type in source_types
+                for text in catalog.source(source_type, name)
+            ]
+            return rows, 0
+        if "FROM ALL_TAB_COLUMNS c" in sql:
+            if binds[0] != owner:
+                return [], 0
+            names = set(binds[1].aslist()) if len(binds) > 1 else None
+            return [(row[0], "C_001") for row in catalog.dictionary_rows("VIEW", names)], 0
+        for dictionary_view, object_type in (
+            ("FROM ALL_VIEWS v", "VIEW"),
+            ("FROM ALL_SEQUENCES", "SEQUENCE"),
+            ("FROM ALL_SYNONYMS s", "SYNONYM"),
+        ):
+            if dictionary_view in sql:
+                if binds[0] != owner:
+                    return [], 0
+                names = set(binds[1].aslist()) if len(binds) > 1 else None
+                return catalog.dictionary_rows(object_type, names), 0
+        if "DBMS_CRYPTO.HASH" in sql:
+            object_type = str(binds[3])
+            rows = []
+            for name in sorted(str(name) for name in _bind_names(binds)):
+                ddl = catalog.ddl(object_type, name)
+                if ddl is not None:
+                    rows.append((name, hashlib.sha256(ddl.encode("utf-8")).hexdigest()))
+            return rows, len(rows)
+        if "DBMS_METADATA.GET_DDL(:1, OBJECT_NAME" in sql:
+            object_type = str(binds[3])
+            names = sorted(str(name) for name in _bind_names(binds))
+            rows = []
+            for name in names:
+                ddl = catalog.ddl(object_type, name)
+                if ddl is not None:
+                    rows.append((name, ddl))
+            return rows, len(rows)
+        if "DBMS_METADATA.GET_DDL(:1, :2, :3)" in sql:
+            metadata_type = str(binds[0]).replace("_", " ")
+            return [(catalog.ddl(metadata_type, str(binds[1])),)], 1
+        if "FROM ALL_COL_COMMENTS" in sql:
+            rows = []
+            for table in sorted(str(name) for name in _bind_names(binds)):
+                for number in range(1, catalog.schema.comments_per_table + 1):
+                    rows.append((table, f"C_{number:03d}", f"{table} column {number}"))
+            return rows, 0
+        if "FROM ALL_TAB_COMMENTS" in sql:
+            if not catalog.schema.comments_per_table:
+                return [], 0
+            return [(str(table), f"{table} table") for table in _bind_names(binds)], 0
+        if "SELECT TABLE_NAME, OWNER, INDEX_NAME" in sql:
+            rows = []
+            for table in sorted(str(name) for name in _bind_names(binds)):
+                for index_name in catalog.indexes.get(table, []):
+                    rows.append((table, owner, index_name))
+            return rows, 0
+        if "SELECT INDEX_NAME, TABLE_OWNER, TABLE_NAME" in sql:
+            return [
+                (str(name), owner, catalog.index_tables[str(name)])
+                for name in _bind_names(binds)
+                if str(name) in catalog.index_tables
+            ], 0
+        raise RuntimeError(f"Synthetic Oracle does not understand SQL: {sql.strip()[:120]}")
+
+
+class _SyntheticVar:
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def getvalue(self) -> Any:
+        return self.value
+
+
+def _bind_ref_cursor(binds: list[Any], cursor: Any, rows: list[tuple[Any, ...]]) -> bool:
+    # REF CURSOR OUT 바인드가 있으면 결과 행을 그 커서로 넘긴다.
+    for bind in binds:
+        if isinstance(bind, _SyntheticVar):
+            cursor._rows = rows
+            bind.value = cursor
+            return True
+    return False
+
+
+class _SyntheticCursor:
+    def __init__(self, database: "SyntheticOracleDb", connection: Any = None) -> None:
+        self._database = database
+        self.connection = connection
+        self._rows: list[tuple[Any, ...]] = []
+        self.arraysize = 100
+        self.prefetchrows = 2
+
+    def var(self, db_type: Any, arraysize: int | None = None) -> _SyntheticVar:
+        return _SyntheticVar()
+
+    def _round_trip(self, extra_ms: float = 0.0) -> None:
+        self._database.server.round_trips += 1
+        delay = (self._database.schema.latency_ms + extra_ms) / 1000
+        if delay > 0:
+            time.sleep(delay)
+
+    def execute(self, sql: str, binds: list[Any] | None = None) -> None:
+        rows, ddl_calls = self._database.server.execute(sql, list(binds or []))
+        self._round_trip(ddl_calls * self._database.schema.ddl_ms_per_object)
+        self._rows = []
+        if _bind_ref_cursor(list(binds or []), _SyntheticCursor(self._database), rows):
+            # REF CURSOR의 첫 fetch는 별도 왕복이다.
+            self._round_trip()
+        else:
+            self._rows = rows
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        if not self._rows:
+            return None
+        return self._rows.pop(0)
+
+    def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
+        size = size or self.arraysize
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        if batch:
+            self._round_trip()
+        return batch
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        rows, self._rows = self._rows, []
+        # arraysize 단위로 왕복이 발생하는 것을 흉내 낸다(첫 배치는 execute에 포함).
+        for _ in range(max(0, (len(rows) - 1) // max(self.arraysize, 1))):
+            self._round_trip()
+        return rows
+
+    def close(self) -> None:
+        return None
+
+
+class _SyntheticConnection:
+    def __init__(self, database: "SyntheticOracleDb") -> None:
+        self._database = database
+
+    def cursor(self) -> _SyntheticCursor:
+        return _SyntheticCursor(self._database, self)
+
+    def gettype(self, name: str) -> _SyntheticNameListType:
+        self._database.server.round_trips += 1
+        return _SyntheticNameListType()
+
+    def close(self) -> None:
+        return None
+
+    def __enter__(self) -> "_SyntheticConnection":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+class _SyntheticPool:
+    def __init__(self, database: "SyntheticOracleDb", session_callback: Any = None) -> None:
+        self._database = database
+        self._session_callback = session_callback
+
+    def acquire(self) -> _SyntheticConnection:
+        connection = _SyntheticConnection(self._database)
+        if self._session_callback is not None:
+            self._session_callback(connection, None)
+        return connection
+
+    def close(self, force: bool = False) -> None:
+        return None
+
+
+class _SyntheticAsyncCursor:
+    def __init__(self, database: "SyntheticOracleDb", connection: Any = None) -> None:
+        self._database = database
+        self.connection = connection
+        self._rows: list[tuple[Any, ...]] = []
+        self.arraysize = 100
+        self.prefetchrows = 2
+
+    def var(self, db_type: Any, arraysize: int | None = None) -> _SyntheticVar:
+        return _SyntheticVar()
+
+    async def _round_trip(self, extra_ms: float = 0.0) -> None:
+        self._database.server.round_trips += 1
+        delay = (self._database.schema.latency_ms + extra_ms) / 1000
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def execute(self, sql: str, binds: list[Any] | None = None) -> None:
+        rows, ddl_calls = self._database.server.execute(sql, list(binds or []))
+        await self._round_trip(ddl_calls * self._database.schema.ddl_ms_per_object)
+        self._rows = []
+        if _bind_ref_cursor(list(binds or []), _SyntheticAsyncCursor(self._database), rows):
+            await self._round_trip()
+        else:
+            self._rows = rows
+
+    async def fetchone(self) -> tuple[Any, ...] | None:
+        if not self._rows:
+            return None
+        return self._rows.pop(0)
+
+    async def fetchall(self) -> list[tuple[Any, ...]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class _SyntheticAsyncConnection:
+    def __init__(self, database: "SyntheticOracleDb") -> None:
+        self._database = database
+
+    def cursor(self) -> _SyntheticAsyncCursor:
+        return _SyntheticAsyncCursor(self._database, self)
+
+    async def gettype(self, name: str) -> _SyntheticNameListType:
+        self._database.server.round_trips += 1
+        return _SyntheticNameListType()
+
+
+class _SyntheticAsyncAcquire:
+    def __init__(self, pool: "_SyntheticAsyncPool") -> None:
+        self._pool = pool
+        self._connection: _SyntheticAsyncConnection | None = None
+
+    async def __aenter__(self) -> _SyntheticAsyncConnection:
+        pool = self._pool
+        if pool.idle:
+            self._connection = pool.idle.pop()
+            return self._connection
+        # 새 세션에만 session_callback을 부른다(실제 풀처럼 세션을 재사용한다).
+        self._connection = _SyntheticAsyncConnection(pool.database)
+        if pool.session_callback is not None:
+            await pool.session_callback(self._connection, None)
+        return self._connection
+
+    async def __aexit__(self, *_: object) -> None:
+        if self._connection is not None:
+            self._pool.idle.append(self._connection)
+
+
+class _SyntheticAsyncPool:
+    def __init__(self, database: "SyntheticOracleDb", session_callback: Any = None) -> None:
+        self.database = database
+        self.session_callback = session_callback
+        self.idle: list[_SyntheticAsyncConnection] = []
+
+    def acquire(self) -> _SyntheticAsyncAcquire:
+        return _SyntheticAsyncAcquire(self)
+
+    async def close(self, force: bool = False) -> None:
+        return None
+
+
+class SyntheticOracleDb:
+    """`oracledb` 모듈 대신 주입하는 로컬 Oracle 대역(connect/create_pool/create_pool_async)."""
+
+    DB_TYPE_CURSOR = DB_TYPE_CURSOR
+
+    def __init__(self, schema: SyntheticSchema) -> None:
+        self.schema = schema
+        self.catalog = _SyntheticCatalog(schema)
+        self.server = _SyntheticServer(self.catalog)
+
+    def connect(self, **_: object) -> _SyntheticConnection:
+        return _SyntheticConnection(self)
+
+    def create_pool(self, session_callback: Any = None, **_: object) -> _SyntheticPool:
+        return _SyntheticPool(self, session_callback=session_callback)
+
+    def create_pool_async(self, session_callback: Any = None, **_: object) -> _SyntheticAsyncPool:
+        return _SyntheticAsyncPool(self, session_callback=session_callback)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import sys
+from pathlib import Path
 
-from orasnap.pipeline import run_snapshot
+from orasnap.fanout import run_fanout
+from orasnap.pipeline import run_renormalize, run_snapshot, run_watch
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -22,6 +24,32 @@ def _build_parser() -> argparse.ArgumentParser:
         default="config/snapshot.yml",
         help="Path to YAML config file.",
     )
+    snapshot_parser.add_argument(
+        "--targets",
+        default=None,
+        help="Path to a targets YAML file. Runs every listed config concurrently instead of --config.",
+    )
+    snapshot_parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore the object manifest and re-extract every object.",
+    )
+    snapshot_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel extraction sessions (overrides oracle.workers).",
+    )
+    snapshot_parser.add_argument(
+        "--verify-manifest",
+        action="store_true",
+        help="Check snapshot files on disk instead of trusting the file manifest.",
+    )
+    snapshot_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse DDL journaled by an interrupted run for objects whose LAST_DDL_TIME is unchanged.",
+    )
 
     dry_run_parser = subparsers.add_parser(
         "dry-run",
@@ -32,10 +60,149 @@ def _build_parser() -> argparse.ArgumentParser:
         default="config/snapshot.yml",
         help="Path to YAML config file.",
     )
+    dry_run_parser.add_argument(
+        "--targets",
+        default=None,
+        help="Path to a targets YAML file. Runs every listed config concurrently instead of --config.",
+    )
+    dry_run_parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore the object manifest and re-extract every object.",
+    )
+    dry_run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel extraction sessions (overrides oracle.workers).",
+    )
+    dry_run_parser.add_argument(
+        "--verify-manifest",
+        action="store_true",
+        help="Check snapshot files on disk instead of trusting the file manifest.",
+    )
+    # dry-run은 저널을 쓰지 않는다.
+    dry_run_parser.set_defaults(resume=False)
+
+    renormalize_parser = subparsers.add_parser(
+        "renormalize",
+        help="Rebuild the snapshot tree from the local raw DDL cache without a database connection.",
+    )
+    renormalize_parser.add_argument(
+        "--config",
+        default="config/snapshot.yml",
+        help="Path to YAML config file.",
+    )
+    renormalize_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of normalization processes (overrides output.normalize_workers).",
+    )
+    renormalize_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing files or git updates.",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep a session open, poll the DDL audit log and snapshot changed objects as they settle.",
+    )
+    watch_parser.add_argument(
+        "--config",
+        default="config/snapshot.yml",
+        help="Path to YAML config file.",
+    )
+    watch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel extraction sessions (overrides oracle.workers).",
+    )
+    watch_parser.add_argument(
+        "--max-cycles",
+        type=int,
+        default=None,
+        help="Stop after this many snapshot cycles (default: run until SIGINT/SIGTERM).",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Run the pipeline against a synthetic schema and report per-stage throughput/memory.",
+    )
+    bench_parser.add_argument("--tables", type=int, default=200)
+    bench_parser.add_argument("--partitions", type=int, default=4, help="Partitions per table.")
+    bench_parser.add_argument("--indexes", type=int, default=2, help="Indexes per table.")
+    bench_parser.add_argument("--comments", type=int, default=6, help="Column comments per table.")
+    bench_parser.add_argument("--views", type=int, default=50)
+    bench_parser.add_argument("--packages", type=int, default=40)
+    bench_parser.add_argument("--package-lines", type=int, default=400)
+    bench_parser.add_argument("--sequences", type=int, default=0)
+    bench_parser.add_argument("--synonyms", type=int, default=0)
+    bench_parser.add_argument("--audit-rows", type=int, default=500)
+    bench_parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=1.0,
+        help="Simulated latency per database round trip.",
+    )
+    bench_parser.add_argument(
+        "--ddl-ms",
+        type=float,
+        default=0.0,
+        help="Simulated server time per GET_DDL object.",
+    )
+    bench_parser.add_argument("--workers", type=int, default=4)
+    bench_parser.add_argument(
+        "--scenarios",
+        default="bulk,metadata_api,parallel,async,incremental,audit,server_hash,source,dictionary",
+        help="Comma-separated scenarios to run.",
+    )
+    bench_parser.add_argument(
+        "--change-ratio",
+        type=float,
+        default=0.05,
+        help="Share of objects changed before incremental/audit runs.",
+    )
+    bench_parser.add_argument("--no-memory", action="store_true", help="Disable tracemalloc.")
+    bench_parser.add_argument("--json", default=None, help="Write the report as JSON to this path.")
 
     return parser
 
 
+def _run_bench(args: argparse.Namespace) -> int:
+    from orasnap.bench.harness import format_reports, reports_to_json, run_benchmarks
+    from orasnap.bench.synthetic import SyntheticSchema
+
+    schema = SyntheticSchema(
+        tables=args.tables,
+        partitions_per_table=args.partitions,
+        indexes_per_table=args.indexes,
+        comments_per_table=args.comments,
+        views=args.views,
+        packages=args.packages,
+        package_lines=args.package_lines,
+        sequences=args.sequences,
+        synonyms=args.synonyms,
+        audit_rows=args.audit_rows,
+        latency_ms=args.latency_ms,
+        ddl_ms_per_object=args.ddl_ms,
+    )
+    scenarios = [item.strip() for item in args.scenarios.split(",") if item.strip()]
+    reports = run_benchmarks(
+        schema,
+        scenarios=scenarios,
+        workers=args.workers,
+        change_ratio=args.change_ratio,
+        track_memory=not args.no_memory,
+    )
+    print(format_reports(reports))
+    if args.json:
+        Path(args.json).write_text(reports_to_json(reports, schema), encoding="utf-8")
+    return 0
+
+
 def _print_summary(result) -> None:
     print(f"extracted={result.extracted_count}")
     print(f"failed={result.failed_count}")
@@ -55,13 +222,98 @@ def _print_summary(result) -> None:
             print(f"  - {failure}")
 
 
+def _print_fanout_summary(result) -> None:
+    print(f"targets={len(result.outcomes)}")
+    print(f"failed_targets={len(result.failed_targets)}")
+    for key, value in result.totals().items():
+        print(f"{key}={value}")
+    print(f"commits={sum(commit.committed for commit in result.commits)}")
+    if result.log_file:
+        print(f"log_file={result.log_file}")
+    if result.report_file:
+        print(f"report_file={result.report_file}")
+    for commit in result.commits:
+        if commit.commit_sha:
+            print(f"commit_sha={commit.commit_sha} targets={','.join(commit.targets)}")
+    target_failures = [
+        outcome
+        for outcome in result.outcomes
+        if not outcome.ok or (outcome.result is not None and outcome.result.failures)
+    ]
+    if target_failures:
+        print("target_failures:")
+        for outcome in target_failures:
+            if outcome.error:
+                print(f"  - {outcome.name}: {outcome.error}")
+            if outcome.result is not None and outcome.result.failures:
+                print(f"  - {outcome.name}: {len(outcome.result.failures)} objects failed")
+                for failure in outcome.result.failures:
+                    print(f"      {failure}")
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    if args.command == "bench":
+        try:
+            return _run_bench(args)
+        except Exception as exc:  # pragma: no cover - CLI integration path.
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+
+    if args.command == "renormalize":
+        try:
+            result = run_renormalize(args.config, dry_run=args.dry_run, workers=args.workers)
+        except Exception as exc:  # pragma: no cover - CLI integration path.
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        _print_summary(result)
+        return 0
+
+    if args.command == "watch":
+        try:
+            summary = run_watch(args.config, workers=args.workers, max_cycles=args.max_cycles)
+        except KeyboardInterrupt:
+            print("error: interrupted", file=sys.stderr)
+            return 130
+        except Exception as exc:  # pragma: no cover - CLI integration path.
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        print(f"cycles={summary.cycles}")
+        print(f"failed_cycles={summary.failed_cycles}")
+        print(f"reconnects={summary.reconnects}")
+        if summary.last_result is not None:
+            _print_summary(summary.last_result)
+        return 0
+
     dry_run = args.command == "dry-run"
+    if args.targets:
+        try:
+            fanout_result = run_fanout(
+                args.targets,
+                dry_run=dry_run,
+                full_refresh=args.full_refresh,
+                workers=args.workers,
+                verify_manifest=args.verify_manifest,
+                resume=args.resume,
+            )
+        except Exception as exc:  # pragma: no cover - CLI integration path.
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        _print_fanout_summary(fanout_result)
+        # 대상 하나라도 실행/커밋에 실패하면 cron이 알 수 있도록 1을 돌려준다.
+        return 1 if fanout_result.failed_targets else 0
+
     try:
-        result = run_snapshot(args.config, dry_run=dry_run)
+        result = run_snapshot(
+            args.config,
+            dry_run=dry_run,
+            full_refresh=args.full_refresh,
+            workers=args.workers,
+            verify_manifest=args.verify_manifest,
+            resume=args.resume,
+        )
     except Exception as exc:  # pragma: no cover - CLI integration path.
         print(f"error: {exc}", file=sys.stderr)
         return 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,15 @@ DEFAULT_OBJECT_TYPES = [
     "PACKAGE BODY",
     "MATERIALIZED VIEW",
 ]
+# per_target: 대상이 끝날 때마다 커밋, batch: batch_window_seconds 동안 끝난 대상을 한 커밋으로 묶는다.
+TARGET_COMMIT_MODES = ("per_target", "batch")
+TARGET_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+# bulk: ALL_OBJECTS 위에서 GET_DDL, metadata_api: DBMS_METADATA OPEN/FETCH_DDL 핸들.
+DDL_STRATEGIES = ("bulk", "metadata_api", "source", "dictionary")
+# ALL_SOURCE 재조립(source)은 PL/SQL 타입에만 쓸 수 있다.
+SOURCE_STRATEGY_TYPES = ("PACKAGE", "PACKAGE BODY", "PROCEDURE", "FUNCTION", "TYPE", "TYPE BODY", "TRIGGER")
+# 딕셔너리 뷰에서 DDL을 만드는 방식(dictionary)은 ALL_VIEWS/ALL_SEQUENCES/ALL_SYNONYMS 대상 타입에만 쓸 수 있다.
+DICTIONARY_STRATEGY_TYPES = ("VIEW", "SEQUENCE", "SYNONYM")
 
 
 class ConfigError(ValueError):
@@ -34,6 +44,18 @@ class OracleConfig:
     service_name: str
     username: str
     password: str
+    workers: int = 1
+    # 커서 fetch 배치 크기와 첫 execute에 함께 받아올 행 수.
+    arraysize: int = 500
+    prefetch_rows: int = 500
+    # 이 길이(문자) 이하의 CLOB은 문자열로 바로 받고, 넘으면 LOB 로케이터를 청크 단위로 읽는다.
+    lob_inline_max: int = 262144
+    lob_chunk_size: int = 262144
+    # 벌크 GET_DDL 청크 1회 조회가 이 시간/크기 안에 들도록 타입별 청크 크기를 조정한다.
+    bulk_target_seconds: float = 5.0
+    bulk_target_bytes: int = 8388608
+    # 세션 문장 캐시 크기. orasnap이 반복 실행하는 SQL은 십여 개뿐이므로 모두 캐시에 남도록 잡는다.
+    statement_cache_size: int = 40
 
     @property
     def dsn(self) -> str:
@@ -46,12 +68,18 @@ class ScopeConfig:
     include_schemas: list[str] = field(default_factory=list)
     exclude_schemas: list[str] = field(default_factory=list)
     object_types: list[str] = field(default_factory=lambda: list(DEFAULT_OBJECT_TYPES))
+    # 객체 타입별 DDL 추출 방식. 지정하지 않은 타입은 bulk(ALL_OBJECTS 위의 GET_DDL).
+    type_strategies: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
 class OutputConfig:
     snapshot_root: Path
     line_ending: str = "LF"
+    manifest_file: str = ".orasnap_files.json"
+    verify_manifest: bool = False
+    normalize_workers: int = 0
+    normalize_parallel_threshold: int = 1000
 
 
 @dataclass(frozen=True)
@@ -61,11 +89,16 @@ class GitConfig:
     commit_message_template: str = "snapshot: {timestamp}"
     auto_push: bool = True
     remote: str = "origin"
+    commit_backend: str = "add"
 
 
 @dataclass(frozen=True)
 class LogsConfig:
     retention_days: int = 30
+    # 실행마다 로그 옆에 orasnap-YYYYMMDD-HHMMSS.metrics.json을 남긴다.
+    metrics_json: bool = True
+    # node-exporter textfile collector 경로(.prom). 없으면 쓰지 않는다.
+    prometheus_textfile: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -74,6 +107,37 @@ class AuditConfig:
     root: Path | None = None
     table: str = "DDL_AUDIT_LOG"
     state_file: str = ".orasnap_audit_state.json"
+    batch_size: int = 1000
+
+
+@dataclass(frozen=True)
+class ExtractionConfig:
+    mode: str = "full"
+    engine: str = "thread"
+    manifest_file: str = ".orasnap_manifest.json"
+    full_refresh_hours: int = 168
+    # 추출한 원본 DDL을 객체마다 SQLite 저널에 남겨서 중단된 실행을 --resume으로 이어 갈 수 있게 한다.
+    journal: bool = True
+    journal_file: str = ".orasnap_journal.sqlite"
+    # 원본 DDL을 압축해서 내용 해시로 저장한다. `orasnap renormalize`가 DB 없이 스냅샷을 다시 만들 때 쓴다.
+    raw_cache: bool = True
+    raw_cache_dir: str = ".orasnap_raw_cache"
+    # 본문을 받기 전에 서버에서 DBMS_CRYPTO로 GET_DDL 해시를 계산해서 직전 원본과 같으면 전송을 생략한다.
+    server_hash: bool = False
+
+
+@dataclass(frozen=True)
+class WatchConfig:
+    # DDL_AUDIT_LOG 최대 AUDIT_ID 확인 주기(초).
+    poll_seconds: float = 5.0
+    # 새 이벤트가 이 시간 동안 더 들어오지 않으면 스냅샷을 만든다(배포 중 연속 DDL을 한 번에 반영).
+    debounce_seconds: float = 2.0
+    # 이벤트가 계속 들어와도 첫 이벤트 이후 이 시간 안에는 스냅샷을 만든다.
+    max_delay_seconds: float = 60.0
+    # 세션 오류 후 재접속 대기 상한(초). 실패할 때마다 poll_seconds부터 두 배씩 늘린다.
+    max_backoff_seconds: float = 300.0
+    # 지정하면 폴링 사이 대기를 DBMS_ALERT.WAITONE으로 바꿔 트리거 신호에 바로 깨어난다.
+    alert_name: str | None = None
 
 
 @dataclass(frozen=True)
@@ -84,6 +148,8 @@ class AppConfig:
     git: GitConfig
     logs: LogsConfig
     audit: AuditConfig
+    extraction: ExtractionConfig = field(default_factory=ExtractionConfig)
+    watch: WatchConfig = field(default_factory=WatchConfig)
 
 
 def _to_upper_list(raw: Any) -> list[str]:
@@ -116,6 +182,8 @@ def load_config(config_path: str | Path) -> AppConfig:
     git_raw = raw.get("git") or {}
     logs_raw = raw.get("logs") or {}
     audit_raw = raw.get("audit") or {}
+    extraction_raw = raw.get("extraction") or {}
+    watch_raw = raw.get("watch") or {}
 
     try:
         oracle = OracleConfig(
@@ -124,10 +192,31 @@ def load_config(config_path: str | Path) -> AppConfig:
             service_name=str(oracle_raw["service_name"]).strip(),
             username=str(oracle_raw["username"]).strip(),
             password=str(oracle_raw["password"]),
+            workers=int(oracle_raw.get("workers", 1)),
+            arraysize=int(oracle_raw.get("arraysize", 500)),
+            prefetch_rows=int(oracle_raw.get("prefetch_rows", 500)),
+            lob_inline_max=int(oracle_raw.get("lob_inline_max", 262144)),
+            lob_chunk_size=int(oracle_raw.get("lob_chunk_size", 262144)),
+            bulk_target_seconds=float(oracle_raw.get("bulk_target_seconds", 5.0)),
+            bulk_target_bytes=int(oracle_raw.get("bulk_target_bytes", 8388608)),
+            statement_cache_size=int(oracle_raw.get("statement_cache_size", 40)),
         )
     except KeyError as exc:
         raise ConfigError(f"Missing oracle config field: {exc}") from exc
 
+    if oracle.workers < 1:
+        raise ConfigError("oracle.workers must be >= 1.")
+    if oracle.arraysize < 1:
+        raise ConfigError("oracle.arraysize must be >= 1.")
+    if oracle.prefetch_rows < 0:
+        raise ConfigError("oracle.prefetch_rows must be >= 0.")
+    if oracle.lob_inline_max < 1 or oracle.lob_chunk_size < 1:
+        raise ConfigError("oracle.lob_inline_max/lob_chunk_size must be >= 1.")
+    if oracle.bulk_target_seconds <= 0 or oracle.bulk_target_bytes < 1:
+        raise ConfigError("oracle.bulk_target_seconds/bulk_target_bytes must be positive.")
+    if oracle.statement_cache_size < 0:
+        raise ConfigError("oracle.statement_cache_size must be >= 0.")
+
     if not oracle.host or not oracle.service_name or not oracle.username:
         raise ConfigError("oracle.host/service_name/username must be non-empty.")
 
@@ -139,11 +228,35 @@ def load_config(config_path: str | Path) -> AppConfig:
     exclude_schemas = _to_upper_list(scope_raw.get("exclude_schemas"))
     object_types = _to_upper_list(scope_raw.get("object_types")) or list(DEFAULT_OBJECT_TYPES)
 
+    type_strategies_raw = scope_raw.get("type_strategies") or {}
+    if not isinstance(type_strategies_raw, dict):
+        raise ConfigError("scope.type_strategies must be a map of object type to strategy.")
+    type_strategies = {
+        str(object_type).strip().upper(): str(strategy).strip().lower()
+        for object_type, strategy in type_strategies_raw.items()
+    }
+    for object_type, strategy in type_strategies.items():
+        if strategy not in DDL_STRATEGIES:
+            raise ConfigError(
+                f"scope.type_strategies.{object_type} must be one of: {', '.join(DDL_STRATEGIES)}."
+            )
+        if strategy == "source" and object_type not in SOURCE_STRATEGY_TYPES:
+            raise ConfigError(
+                f"scope.type_strategies.{object_type}: source is only supported for "
+                f"{', '.join(SOURCE_STRATEGY_TYPES)}."
+            )
+        if strategy == "dictionary" and object_type not in DICTIONARY_STRATEGY_TYPES:
+            raise ConfigError(
+                f"scope.type_strategies.{object_type}: dictionary is only supported for "
+                f"{', '.join(DICTIONARY_STRATEGY_TYPES)}."
+            )
+
     scope = ScopeConfig(
         discovery_mode=discovery_mode,
         include_schemas=include_schemas,
         exclude_schemas=exclude_schemas,
         object_types=object_types,
+        type_strategies=type_strategies,
     )
 
     base_dir = path.parent
@@ -152,7 +265,23 @@ def load_config(config_path: str | Path) -> AppConfig:
         raise ConfigError("output.line_ending must be LF or CRLF.")
 
     snapshot_root = _resolve_path(output_raw.get("snapshot_root", "snapshots"), base_dir)
-    output = OutputConfig(snapshot_root=snapshot_root, line_ending=line_ending)
+    output_manifest_file = (
+        str(output_raw.get("manifest_file", ".orasnap_files.json")).strip() or ".orasnap_files.json"
+    )
+    normalize_workers = int(output_raw.get("normalize_workers", 0))
+    if normalize_workers < 0:
+        raise ConfigError("output.normalize_workers must be >= 0.")
+    normalize_parallel_threshold = int(output_raw.get("normalize_parallel_threshold", 1000))
+    if normalize_parallel_threshold < 1:
+        raise ConfigError("output.normalize_parallel_threshold must be >= 1.")
+    output = OutputConfig(
+        snapshot_root=snapshot_root,
+        line_ending=line_ending,
+        manifest_file=output_manifest_file,
+        verify_manifest=bool(output_raw.get("verify_manifest", False)),
+        normalize_workers=normalize_workers,
+        normalize_parallel_threshold=normalize_parallel_threshold,
+    )
 
     repo_path = _resolve_path(git_raw.get("repo_path", "."), base_dir)
     git = GitConfig(
@@ -161,12 +290,25 @@ def load_config(config_path: str | Path) -> AppConfig:
         commit_message_template=str(git_raw.get("commit_message_template", "snapshot: {timestamp}")),
         auto_push=bool(git_raw.get("auto_push", True)),
         remote=str(git_raw.get("remote", "origin")).strip() or "origin",
+        commit_backend=str(git_raw.get("commit_backend", "add")).strip().lower(),
     )
+    if git.commit_backend not in {"add", "plumbing"}:
+        raise ConfigError("git.commit_backend must be 'add' or 'plumbing'.")
 
     retention_days = int(logs_raw.get("retention_days", 30))
     if retention_days < 1:
         raise ConfigError("logs.retention_days must be >= 1.")
-    logs = LogsConfig(retention_days=retention_days)
+    prometheus_textfile_raw = logs_raw.get("prometheus_textfile")
+    prometheus_textfile = (
+        _resolve_path(prometheus_textfile_raw, base_dir) if prometheus_textfile_raw else None
+    )
+    if prometheus_textfile is not None and prometheus_textfile.suffix != ".prom":
+        raise ConfigError("logs.prometheus_textfile must end with .prom.")
+    logs = LogsConfig(
+        retention_days=retention_days,
+        metrics_json=bool(logs_raw.get("metrics_json", True)),
+        prometheus_textfile=prometheus_textfile,
+    )
 
     audit_root_raw = audit_raw.get("root")
     audit_root = _resolve_path(audit_root_raw, base_dir) if audit_root_raw else None
@@ -175,11 +317,142 @@ def load_config(config_path: str | Path) -> AppConfig:
         str(audit_raw.get("state_file", ".orasnap_audit_state.json")).strip()
         or ".orasnap_audit_state.json"
     )
+    audit_batch_size = int(audit_raw.get("batch_size", 1000))
+    if audit_batch_size < 1:
+        raise ConfigError("audit.batch_size must be >= 1.")
     audit = AuditConfig(
         enabled=bool(audit_raw.get("enabled", True)),
         root=audit_root,
         table=audit_table,
         state_file=audit_state_file,
+        batch_size=audit_batch_size,
+    )
+
+    extraction_mode = str(extraction_raw.get("mode", "full")).strip().lower()
+    if extraction_mode not in {"full", "incremental", "audit"}:
+        raise ConfigError("extraction.mode must be 'full', 'incremental' or 'audit'.")
+    extraction_engine = str(extraction_raw.get("engine", "thread")).strip().lower()
+    if extraction_engine not in {"thread", "async"}:
+        raise ConfigError("extraction.engine must be 'thread' or 'async'.")
+    manifest_file = (
+        str(extraction_raw.get("manifest_file", ".orasnap_manifest.json")).strip()
+        or ".orasnap_manifest.json"
+    )
+    full_refresh_hours = int(extraction_raw.get("full_refresh_hours", 168))
+    if full_refresh_hours < 0:
+        raise ConfigError("extraction.full_refresh_hours must be >= 0.")
+    journal_file = (
+        str(extraction_raw.get("journal_file", ".orasnap_journal.sqlite")).strip()
+        or ".orasnap_journal.sqlite"
+    )
+    raw_cache_dir = (
+        str(extraction_raw.get("raw_cache_dir", ".orasnap_raw_cache")).strip() or ".orasnap_raw_cache"
+    )
+    extraction = ExtractionConfig(
+        mode=extraction_mode,
+        engine=extraction_engine,
+        manifest_file=manifest_file,
+        full_refresh_hours=full_refresh_hours,
+        journal=bool(extraction_raw.get("journal", True)),
+        journal_file=journal_file,
+        raw_cache=bool(extraction_raw.get("raw_cache", True)),
+        raw_cache_dir=raw_cache_dir,
+        server_hash=bool(extraction_raw.get("server_hash", False)),
     )
 
-    return AppConfig(oracle=oracle, scope=scope, output=output, git=git, logs=logs, audit=audit)
+    watch_alert_name = str(watch_raw.get("alert_name") or "").strip().upper()
+    watch = WatchConfig(
+        poll_seconds=float(watch_raw.get("poll_seconds", 5.0)),
+        debounce_seconds=float(watch_raw.get("debounce_seconds", 2.0)),
+        max_delay_seconds=float(watch_raw.get("max_delay_seconds", 60.0)),
+        max_backoff_seconds=float(watch_raw.get("max_backoff_seconds", 300.0)),
+        alert_name=watch_alert_name or None,
+    )
+    if watch.poll_seconds <= 0:
+        raise ConfigError("watch.poll_seconds must be > 0.")
+    if watch.debounce_seconds < 0:
+        raise ConfigError("watch.debounce_seconds must be >= 0.")
+    if watch.max_delay_seconds < watch.debounce_seconds:
+        raise ConfigError("watch.max_delay_seconds must be >= watch.debounce_seconds.")
+    if watch.max_backoff_seconds < watch.poll_seconds:
+        raise ConfigError("watch.max_backoff_seconds must be >= watch.poll_seconds.")
+
+    return AppConfig(
+        oracle=oracle,
+        scope=scope,
+        output=output,
+        git=git,
+        logs=logs,
+        audit=audit,
+        extraction=extraction,
+        watch=watch,
+    )
+
+
+@dataclass(frozen=True)
+class TargetConfig:
+    name: str
+    config_path: Path
+    # 지정하면 대상 설정 파일의 oracle.workers를 덮어쓴다.
+    workers: int | None = None
+
+
+@dataclass(frozen=True)
+class TargetsConfig:
+    targets: list[TargetConfig]
+    # 동시에 실행할 대상(프로세스) 수. DB 세션 수는 대상별 oracle.workers를 곱한 만큼 늘어난다.
+    concurrency: int = 4
+    commit_mode: str = "per_target"
+    # batch 모드에서 첫 결과 이후 이 시간 동안 끝난 대상을 모아 커밋한다. 0이면 모두 끝난 뒤 한 번.
+    batch_window_seconds: float = 0.0
+
+
+def load_targets(targets_path: str | Path) -> TargetsConfig:
+    path = Path(targets_path).resolve()
+    if not path.exists():
+        raise ConfigError(f"Targets file not found: {path}")
+
+    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    if not isinstance(raw, dict):
+        raise ConfigError("Root targets config must be a map/dictionary.")
+    git_raw = raw.get("git") or {}
+    targets_raw = raw.get("targets") or []
+    if not isinstance(targets_raw, list) or not targets_raw:
+        raise ConfigError("targets must be a non-empty list.")
+
+    targets: list[TargetConfig] = []
+    for index, item in enumerate(targets_raw):
+        if isinstance(item, str):
+            item = {"config": item}
+        if not isinstance(item, dict) or not item.get("config"):
+            raise ConfigError(f"targets[{index}].config is required.")
+        config_path = _resolve_path(str(item["config"]).strip(), path.parent)
+        name = str(item.get("name") or config_path.stem).strip()
+        if not TARGET_NAME_PATTERN.match(name):
+            raise ConfigError(f"targets[{index}].name must match {TARGET_NAME_PATTERN.pattern}: {name}")
+        workers = int(item["workers"]) if item.get("workers") is not None else None
+        if workers is not None and workers < 1:
+            raise ConfigError(f"targets[{index}].workers must be >= 1.")
+        targets.append(TargetConfig(name=name, config_path=config_path, workers=workers))
+
+    names = [target.name for target in targets]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ConfigError(f"Duplicate target names: {', '.join(duplicates)}")
+
+    concurrency = int(raw.get("concurrency", 4))
+    if concurrency < 1:
+        raise ConfigError("concurrency must be >= 1.")
+    commit_mode = str(git_raw.get("commit", "per_target")).strip().lower()
+    if commit_mode not in TARGET_COMMIT_MODES:
+        raise ConfigError(f"git.commit must be one of: {', '.join(TARGET_COMMIT_MODES)}.")
+    batch_window_seconds = float(git_raw.get("batch_window_seconds", 0.0))
+    if batch_window_seconds < 0:
+        raise ConfigError("git.batch_window_seconds must be >= 0.")
+
+    return TargetsConfig(
+        targets=targets,
+        concurrency=concurrency,
+        commit_mode=commit_mode,
+        batch_window_seconds=batch_window_seconds,
+    )
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from time import monotonic, perf_counter
+
+from orasnap.config import AppConfig, ConfigError, TargetConfig, TargetsConfig, load_targets
+from orasnap.metrics import atomic_write_text
+from orasnap.oracle.audit_exporter import OracleAuditExporter
+from orasnap.pipeline import (
+    PendingCommit,
+    SnapshotRunResult,
+    build_pipeline,
+    commit_snapshot,
+    load_run_config,
+    resolve_audit_root,
+    resolve_logs_dir,
+    resolve_project_root,
+    resolve_state_path,
+    setup_logger,
+    start_logging,
+)
+from orasnap.vcs.git_ops import GitOps
+
+
+@dataclass
+class TargetOutcome:
+    name: str
+    result: SnapshotRunResult | None = None
+    # 대상 실행 자체가 예외로 끝났거나 커밋하지 못한 경우의 오류 메시지.
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class FanoutCommit:
+    repo_path: Path
+    targets: list[str]
+    committed: bool
+    commit_sha: str | None
+    pushed: bool
+
+
+@dataclass
+class FanoutResult:
+    outcomes: list[TargetOutcome]
+    commits: list[FanoutCommit] = field(default_factory=list)
+    log_file: Path | None = None
+    report_file: Path | None = None
+
+    @property
+    def failed_targets(self) -> list[TargetOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    def totals(self) -> dict[str, int]:
+        results = [outcome.result for outcome in self.outcomes if outcome.result is not None]
+        return {
+            "extracted": sum(result.extracted_count for result in results),
+            "failed": sum(result.failed_count for result in results),
+            "written": sum(result.written_count for result in results),
+            "deleted": sum(result.deleted_count for result in results),
+            "unchanged": sum(result.unchanged_count for result in results),
+            "audit_exported": sum(result.audit_exported_count for result in results),
+        }
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "totals": self.totals(),
+            "targets": [
+                {
+                    "name": outcome.name,
+                    "ok": outcome.ok,
+                    "error": outcome.error,
+                    "seconds": round(outcome.seconds, 3),
+                    "extracted": outcome.result.extracted_count if outcome.result else None,
+                    "failed": outcome.result.failed_count if outcome.result else None,
+                    "failures": outcome.result.failures if outcome.result else [],
+                    "commit_sha": outcome.result.commit_sha if outcome.result else None,
+                    "log_file": (
+                        str(outcome.result.log_file)
+                        if outcome.result is not None and outcome.result.log_file is not None
+                        else None
+                    ),
+                }
+                for outcome in self.outcomes
+            ],
+            "commits": [
+                {
+                    "repo_path": str(commit.repo_path),
+                    "targets": commit.targets,
+                    "committed": commit.committed,
+                    "commit_sha": commit.commit_sha,
+                    "pushed": commit.pushed,
+                }
+                for commit in self.commits
+            ],
+        }
+
+
+def _run_target(
+    target: TargetConfig,
+    config: AppConfig,
+    dry_run: bool,
+    started_at: datetime,
+    resume: bool = False,
+) -> TargetOutcome:
+    # 프로세스 풀에서 실행되므로 모듈 최상위 함수로 두고, 예외는 문자열로 바꿔 돌려준다
+    # (oracledb 예외는 프로세스 경계를 넘어 다시 만들어지지 않을 수 있다).
+    started = perf_counter()
+    logs_dir = resolve_logs_dir(target.config_path)
+    try:
+        logger, log_file = start_logging(config, logs_dir, started_at, target=target.name)
+        pipeline = build_pipeline(
+            config,
+            target.config_path,
+            logger,
+            log_file,
+            metrics_path=logs_dir / f"orasnap-{target.name}-{started_at:%Y%m%d-%H%M%S}.metrics.json",
+            defer_git=True,
+            resume=resume,
+            target=target.name,
+        )
+        result = pipeline.run(dry_run=dry_run)
+    except Exception as exc:
+        logging.getLogger("orasnap").exception("Snapshot run failed for target %s.", target.name)
+        return TargetOutcome(
+            name=target.name,
+            error=f"{type(exc).__name__}: {exc}",
+            seconds=perf_counter() - started,
+        )
+    return TargetOutcome(name=target.name, result=result, seconds=perf_counter() - started)
+
+
+def _target_paths(target: TargetConfig, config: AppConfig) -> dict[str, Path]:
+    project_root = resolve_project_root(target.config_path)
+    paths = {
+        "extraction.manifest_file": resolve_state_path(config.extraction.manifest_file, project_root),
+        "output.manifest_file": resolve_state_path(config.output.manifest_file, project_root),
+        "audit.state_file": resolve_state_path(config.audit.state_file, project_root),
+        "extraction.journal_file": resolve_state_path(config.extraction.journal_file, project_root),
+        "extraction.raw_cache_dir": resolve_state_path(config.extraction.raw_cache_dir, project_root),
+    }
+    if config.audit.enabled:
+        # 감사 이벤트는 audit.root/<서비스명>/ 아래에 쌓이므로 같은 서비스명을 가진 대상끼리 섞인다.
+        service_folder = OracleAuditExporter._safe_name(config.oracle.service_name)
+        paths["audit.root"] = resolve_audit_root(config) / service_folder
+    if config.logs.prometheus_textfile is not None:
+        paths["logs.prometheus_textfile"] = config.logs.prometheus_textfile
+    return {name: path.resolve() for name, path in paths.items()}
+
+
+def _check_targets(targets: list[TargetConfig], configs: dict[str, AppConfig]) -> None:
+    """대상끼리 스냅샷 디렉터리/상태 파일을 공유하면 서로의 파일을 지우거나 덮어쓰므로 미리 막는다."""
+    owners: dict[Path, str] = {}
+    for target in targets:
+        for key, path in _target_paths(target, configs[target.name]).items():
+            owner = owners.setdefault(path, target.name)
+            if owner != target.name:
+                raise ConfigError(f"Targets {owner} and {target.name} share {key}: {path}")
+
+    roots = [(target.name, configs[target.name].output.snapshot_root.resolve()) for target in targets]
+    for index, (name, root) in enumerate(roots):
+        for other_name, other_root in roots[index + 1 :]:
+            if root == other_root or root.is_relative_to(other_root) or other_root.is_relative_to(root):
+                raise ConfigError(
+                    f"Targets {name} and {other_name} have overlapping output.snapshot_root: {root}, {other_root}"
+                )
+
+    repos: dict[Path, AppConfig] = {}
+    for target in targets:
+        config = configs[target.name]
+        first = repos.setdefault(config.git.repo_path.resolve(), config)
+        if (first.git.branch, first.git.remote, first.git.auto_push, first.git.commit_backend) != (
+            config.git.branch,
+            config.git.remote,
+            config.git.auto_push,
+            config.git.commit_backend,
+        ):
+            raise ConfigError(
+                f"Targets sharing {config.git.repo_path} must use the same git branch/remote/auto_push/commit_backend."
+            )
+
+
+@dataclass
+class _RepoBatch:
+    git_ops: GitOps
+    config: AppConfig
+    use_plumbing: bool
+    pending: list[tuple[str, PendingCommit]] = field(default_factory=list)
+    failed: bool = False
+
+
+class FanoutRunner:
+    """여러 대상을 프로세스 풀에서 동시에 스냅샷하고, git 커밋은 부모 프로세스에서 저장소별로 하나씩 실행한다.
+
+    각 대상은 defer_git으로 SnapshotPipeline을 실행해서 파일만 쓰고 변경 목록을 돌려준다.
+    대상마다 스냅샷 디렉터리가 겹치지 않으므로 다른 대상이 파일을 쓰는 중에도 커밋할 수 있다.
+    """
+
+    def __init__(
+        self,
+        targets_config: TargetsConfig,
+        configs: dict[str, AppConfig],
+        logger: logging.Logger | None = None,
+        executor_factory: Callable[[int], Executor] = ProcessPoolExecutor,
+        run_target: Callable[[TargetConfig, AppConfig, bool, datetime, bool], TargetOutcome] = _run_target,
+        clock: Callable[[], float] = monotonic,
+        resume: bool = False,
+    ) -> None:
+        self.targets_config = targets_config
+        self.configs = configs
+        self.logger = logger or logging.getLogger("orasnap")
+        self.executor_factory = executor_factory
+        self.run_target = run_target
+        self.clock = clock
+        self.resume = resume
+        _check_targets(targets_config.targets, configs)
+
+    def run(self, dry_run: bool) -> FanoutResult:
+        targets = self.targets_config.targets
+        started_at = datetime.now()
+        concurrency = min(self.targets_config.concurrency, len(targets))
+        self.logger.info(
+            "Fan-out started. targets=%s concurrency=%s commit=%s dry_run=%s",
+            len(targets),
+            concurrency,
+            self.targets_config.commit_mode,
+            dry_run,
+        )
+        batches = {} if dry_run else self._open_batches()
+        outcomes: dict[str, TargetOutcome] = {}
+        commits: list[FanoutCommit] = []
+        batch_mode = self.targets_config.commit_mode == "batch"
+        window = self.targets_config.batch_window_seconds
+        deadline: float | None = None
+
+        with self.executor_factory(concurrency) as executor:
+            futures: dict[Future[TargetOutcome], TargetConfig] = {
+                executor.submit(
+                    self.run_target,
+                    target,
+                    self.configs[target.name],
+                    dry_run,
+                    started_at,
+                    self.resume,
+                ): target
+                for target in targets
+            }
+            running = set(futures)
+            while running:
+                timeout = None if deadline is None else max(0.0, deadline - self.clock())
+                done, running = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = futures[future]
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:
+                        # 작업 프로세스가 비정상 종료한 경우(BrokenProcessPool 등).
+                        outcome = TargetOutcome(name=target.name, error=f"{type(exc).__name__}: {exc}")
+                    outcomes[target.name] = outcome
+                    self._log_outcome(outcome)
+                    if dry_run:
+                        continue
+                    batch = batches[self.configs[target.name].git.repo_path.resolve()]
+                    if outcome.result is None or outcome.result.pending_commit is None:
+                        # 일부 파일만 쓰고 실패했을 수 있으므로 다음 실행은 git add로 스테이징한다.
+                        batch.failed = True
+                        continue
+                    batch.pending.append((target.name, outcome.result.pending_commit))
+                    if not batch_mode:
+                        commits.extend(self._commit(batch, outcomes))
+                    elif window > 0 and deadline is None:
+                        deadline = self.clock() + window
+                if deadline is not None and self.clock() >= deadline:
+                    for batch in batches.values():
+                        commits.extend(self._commit(batch, outcomes))
+                    deadline = None
+
+        for batch in batches.values():
+            commits.extend(self._commit(batch, outcomes))
+            if batch.use_plumbing and not batch.failed:
+                batch.git_ops.clear_pending()
+
+        result = FanoutResult(outcomes=[outcomes[target.name] for target in targets], commits=commits)
+        self.logger.info(
+            "Fan-out finished. targets=%s failed_targets=%s commits=%s %s",
+            len(targets),
+            len(result.failed_targets),
+            sum(commit.committed for commit in commits),
+            " ".join(f"{key}={value}" for key, value in result.totals().items()),
+        )
+        return result
+
+    def _open_batches(self) -> dict[Path, _RepoBatch]:
+        batches: dict[Path, _RepoBatch] = {}
+        for target in self.targets_config.targets:
+            config = self.configs[target.name]
+            repo_path = config.git.repo_path.resolve()
+            if repo_path in batches:
+                continue
+            git_ops = GitOps(repo_path=config.git.repo_path)
+            use_plumbing = config.git.commit_backend == "plumbing"
+            if use_plumbing and git_ops.mark_pending():
+                self.logger.warning(
+                    "Previous run did not finish its commit in %s. Staging the snapshot trees with git add.",
+                    repo_path,
+                )
+                use_plumbing = False
+            batches[repo_path] = _RepoBatch(git_ops=git_ops, config=config, use_plumbing=use_plumbing)
+        return batches
+
+    def _commit(self, batch: _RepoBatch, outcomes: dict[str, TargetOutcome]) -> list[FanoutCommit]:
+        if not batch.pending:
+            return []
+        names = [name for name, _ in batch.pending]
+        pending = [item for _, item in batch.pending]
+        batch.pending = []
+        config = self.configs[names[0]] if len(names) == 1 else batch.config
+        label = names[0] if len(names) == 1 else f"{len(names)} targets"
+        try:
+            git_result = commit_snapshot(batch.git_ops, config, pending, batch.use_plumbing, target=label)
+        except Exception as exc:
+            batch.failed = True
+            self.logger.error("Git commit failed for %s: %s", ", ".join(names), exc)
+            for name in names:
+                outcomes[name].error = f"git: {exc}"
+            return []
+        for name in names:
+            result = outcomes[name].result
+            if result is not None:
+                outcomes[name].result = replace(
+                    result,
+                    committed=git_result.committed,
+                    commit_sha=git_result.commit_sha,
+                    pushed=git_result.pushed,
+                    pending_commit=None,
+                )
+        self.logger.info(
+            "Committed %s into %s. committed=%s pushed=%s",
+            ", ".join(names),
+            batch.config.git.repo_path,
+            git_result.committed,
+            git_result.pushed,
+        )
+        return [
+            FanoutCommit(
+                repo_path=batch.config.git.repo_path,
+                targets=names,
+                committed=git_result.committed,
+                commit_sha=git_result.commit_sha,
+                pushed=git_result.pushed,
+            )
+        ]
+
+    def _log_outcome(self, outcome: TargetOutcome) -> None:
+        if outcome.result is None:
+            self.logger.error("Target %s failed in %.2fs: %s", outcome.name, outcome.seconds, outcome.error)
+            return
+        self.logger.info(
+            "Target %s finished in %.2fs. extracted=%s failed=%s written=%s deleted=%s",
+            outcome.name,
+            outcome.seconds,
+            outcome.result.extracted_count,
+            outcome.result.failed_count,
+            outcome.result.written_count,
+            outcome.result.deleted_count,
+        )
+
+
+def run_fanout(
+    targets_path: str | Path,
+    dry_run: bool = False,
+    full_refresh: bool = False,
+    workers: int | None = None,
+    verify_manifest: bool = False,
+    resume: bool = False,
+) -> FanoutResult:
+    targets_file = Path(targets_path).resolve()
+    targets_config = load_targets(targets_file)
+    configs = {
+        # --workers가 있으면 대상별 workers보다 우선한다.
+        target.name: load_run_config(
+            target.config_path,
+            full_refresh,
+            workers if workers is not None else target.workers,
+            verify_manifest,
+        )
+        for target in targets_config.targets
+    }
+    logs_dir = resolve_logs_dir(targets_file)
+    started_at = datetime.now()
+    log_file = logs_dir / f"orasnap-fanout-{started_at:%Y%m%d}.log"
+    logger = setup_logger(log_file, prefix="fanout")
+    result = FanoutRunner(targets_config, configs, logger=logger, resume=resume).run(dry_run=dry_run)
+    result.log_file = log_file
+    report_file = logs_dir / f"orasnap-fanout-{started_at:%Y%m%d-%H%M%S}.report.json"
+    try:
+        atomic_write_text(report_file, json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
+        result.report_file = report_file
+    except OSError as exc:
+        logger.warning("Fan-out report export failed: %s", exc)
+    return result
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import json
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+# DDL 조회 1회(벌크 청크 또는 단건 GET_DDL) 왕복 시간 구간(초).
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = "orasnap"
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        result: list[tuple[str, int]] = []
+        running = 0
+        for bound, count in zip([*map(_format_number, self.buckets), "+Inf"], self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "buckets": dict(self.cumulative()),
+        }
+
+
+@dataclass
+class TypeMetrics:
+    extracted: int = 0
+    failed: int = 0
+    bulk_hits: int = 0
+    fallbacks: int = 0
+    # 서버 해시가 직전 원본과 같아 본문을 받지 않은 객체 수.
+    hash_skipped: int = 0
+    bytes_fetched: int = 0
+    # 실패 객체 수를 ORA/DPY 오류 코드별로 센다.
+    errors: dict[str, int] = field(default_factory=dict)
+    # 조회 방식(bulk/single)별 왕복 시간 분포.
+    latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "extracted": self.extracted,
+            "failed": self.failed,
+            "bulk_hits": self.bulk_hits,
+            "fallbacks": self.fallbacks,
+            "hash_skipped": self.hash_skipped,
+            "bytes_fetched": self.bytes_fetched,
+            "errors": dict(sorted(self.errors.items())),
+            "latency_seconds": {
+                mode: histogram.to_dict() for mode, histogram in sorted(self.latency.items())
+            },
+        }
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**values: str) -> str:
+    if not values:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(value)}"' for key, value in values.items())
+    return "{" + pairs + "}"
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(content, encoding="utf-8")
+    temp_path.replace(path)
+
+
+class RunMetrics:
+    """한 번의 스냅샷 실행에서 모은 지표. 추출 스레드/태스크에서 동시에 기록된다."""
+
+    def __init__(self, labels: dict[str, str] | None = None) -> None:
+        self._lock = threading.Lock()
+        # 모든 Prometheus 샘플에 붙는 상수 레이블(service, fan-out target). 여러 DB의 textfile이
+        # 한 node-exporter 디렉터리에 모여도 시계열이 겹치지 않는다.
+        self.labels = dict(labels or {})
+        self.started_at = datetime.now(timezone.utc)
+        self.success: bool | None = None
+        self.dry_run = False
+        self.stage_seconds: dict[str, float] = {}
+        self.git_seconds: dict[str, float] = {}
+        self.types: dict[str, TypeMetrics] = {}
+        self.bytes_written = 0
+
+    def _type(self, object_type: str) -> TypeMetrics:
+        metrics = self.types.get(object_type)
+        if metrics is None:
+            metrics = self.types[object_type] = TypeMetrics()
+        return metrics
+
+    def observe_fetch(self, object_type: str, mode: str, seconds: float, fetched_bytes: int) -> None:
+        with self._lock:
+            metrics = self._type(object_type)
+            histogram = metrics.latency.get(mode)
+            if histogram is None:
+                histogram = metrics.latency[mode] = LatencyHistogram()
+            histogram.observe(seconds)
+            metrics.bytes_fetched += fetched_bytes
+
+    def record_bulk(self, object_type: str, hits: int, fallbacks: int) -> None:
+        with self._lock:
+            metrics = self._type(object_type)
+            metrics.bulk_hits += hits
+            metrics.fallbacks += fallbacks
+
+    def record_hash_skipped(self, object_type: str, count: int) -> None:
+        with self._lock:
+            self._type(object_type).hash_skipped += count
+
+    def record_extracted(self, object_type: str, count: int = 1) -> None:
+        with self._lock:
+            self._type(object_type).extracted += count
+
+    def record_failed(self, object_type: str, count: int = 1, code: str | None = None) -> None:
+        with self._lock:
+            metrics = self._type(object_type)
+            metrics.failed += count
+            if code is not None:
+                metrics.errors[code] = metrics.errors.get(code, 0) + count
+
+    def record_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[name] = seconds
+
+    def totals(self) -> dict[str, int]:
+        with self._lock:
+            types = list(self.types.values())
+        return {
+            "extracted": sum(item.extracted for item in types),
+            "failed": sum(item.failed for item in types),
+            "bulk_hits": sum(item.bulk_hits for item in types),
+            "fallbacks": sum(item.fallbacks for item in types),
+            "hash_skipped": sum(item.hash_skipped for item in types),
+            "bytes_fetched": sum(item.bytes_fetched for item in types),
+            "bytes_written": self.bytes_written,
+        }
+
+    def bulk_ratio(self) -> float | None:
+        totals = self.totals()
+        resolved = totals["bulk_hits"] + totals["fallbacks"]
+        if resolved == 0:
+            return None
+        return totals["bulk_hits"] / resolved
+
+    def to_dict(self) -> dict[str, object]:
+        totals = self.totals()
+        bulk_ratio = self.bulk_ratio()
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "success": self.success,
+                "dry_run": self.dry_run,
+                "stage_seconds": {name: round(value, 6) for name, value in self.stage_seconds.items()},
+                "git_seconds": {name: round(value, 6) for name, value in sorted(self.git_seconds.items())},
+                "totals": {
+                    **totals,
+                    "bulk_ratio": round(bulk_ratio, 6) if bulk_ratio is not None else None,
+                },
+                "object_types": {
+                    object_type: metrics.to_dict()
+                    for object_type, metrics in sorted(self.types.items())
+                },
+            }
+
+    def write_json(self, path: Path) -> None:
+        atomic_write_text(path, json.dumps(self.to_dict(), ensure_ascii=False, indent=2))
+
+    def to_prometheus(self) -> str:
+        lines: list[str] = []
+
+        def labels(**values: str) -> str:
+            return _labels(**self.labels, **values)
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for suffix_labels, value in samples:
+                lines.append(f"{full_name}{suffix_labels} {_format_number(value)}")
+
+        totals = self.totals()
+        metric(
+            "last_run_timestamp_seconds",
+            "gauge",
+            "Start time of the last snapshot run.",
+            [(labels(), self.started_at.timestamp())],
+        )
+        metric(
+            "last_run_success",
+            "gauge",
+            "1 if the last snapshot run finished without raising.",
+            [(labels(), 1 if self.success else 0)],
+        )
+        metric(
+            "stage_seconds",
+            "gauge",
+            "Wall time per pipeline stage of the last run.",
+            [(labels(stage=name), value) for name, value in self.stage_seconds.items()],
+        )
+        metric(
+            "git_command_seconds",
+            "gauge",
+            "Wall time spent per git subcommand in the last run.",
+            [(labels(command=name), value) for name, value in sorted(self.git_seconds.items())],
+        )
+        for name, attribute, help_text in (
+            ("objects_extracted", "extracted", "Objects extracted in the last run."),
+            ("objects_failed", "failed", "Objects that failed extraction in the last run."),
+            (
+                "objects_hash_skipped",
+                "hash_skipped",
+                "Objects whose server-side DDL hash matched, so the DDL text was not fetched.",
+            ),
+            ("bytes_fetched", "bytes_fetched", "DDL bytes fetched from the database in the last run."),
+        ):
+            metric(
+                name,
+                "gauge",
+                help_text,
+                [
+                    (labels(object_type=object_type), getattr(metrics, attribute))
+                    for object_type, metrics in sorted(self.types.items())
+                ],
+            )
+        metric(
+            "object_errors",
+            "gauge",
+            "Failed objects per error code in the last run.",
+            [
+                (labels(object_type=object_type, code=code), count)
+                for object_type, metrics in sorted(self.types.items())
+                for code, count in sorted(metrics.errors.items())
+            ],
+        )
+        metric(
+            "bulk_objects",
+            "gauge",
+            "Objects resolved by bulk GET_DDL versus per-object fallback in the last run.",
+            [
+                (labels(object_type=object_type, path=path), value)
+                for object_type, metrics in sorted(self.types.items())
+                for path, value in (("bulk", metrics.bulk_hits), ("fallback", metrics.fallbacks))
+            ],
+        )
+        metric(
+            "bytes_written",
+            "gauge",
+            "Snapshot bytes written in the last run.",
+            [(labels(), totals["bytes_written"])],
+        )
+
+        full_name = f"{METRIC_PREFIX}_ddl_fetch_seconds"
+        lines.append(f"# HELP {full_name} DDL fetch round-trip latency of the last run.")
+        lines.append(f"# TYPE {full_name} histogram")
+        for object_type, metrics in sorted(self.types.items()):
+            for mode, histogram in sorted(metrics.latency.items()):
+                for bound, count in histogram.cumulative():
+                    bucket_labels = labels(object_type=object_type, mode=mode, le=bound)
+                    lines.append(f"{full_name}_bucket{bucket_labels} {count}")
+                series_labels = labels(object_type=object_type, mode=mode)
+                lines.append(f"{full_name}_sum{series_labels} {_format_number(histogram.total)}")
+                lines.append(f"{full_name}_count{series_labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        # node-exporter가 쓰다 만 파일을 읽지 않도록 같은 디렉터리에서 교체한다.
+        atomic_write_text(path, self.to_prometheus())
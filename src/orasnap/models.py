@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -9,6 +9,8 @@ class DbObject:
     owner: str
     object_type: str
     object_name: str
+    # 증분 비교용 워터마크. 객체 식별(동등성/해시)에는 포함하지 않는다.
+    last_ddl_time: str | None = field(default=None, compare=False)
 
 
 @dataclass(frozen=True)
@@ -29,6 +31,7 @@ class WriteResult:
     modified_files: list[Path]
     deleted_files: list[Path]
     unchanged_files: int
+    written_bytes: int = 0
 
     @property
     def written_files(self) -> list[Path]:
@@ -1,76 +1,327 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import os
 import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 
 
-TABLESPACE_PATTERN = re.compile(r"(?is)\s+TABLESPACE\s+(?:\"[^\"]+\"|[A-Z0-9_$#]+)")
-STORAGE_PATTERN = re.compile(r"(?is)\s+STORAGE\s*\((?:[^)(]+|\([^)(]*\))*\)")
+# 제거 대상 물리 속성 절(키워드 위치에서 매칭). 앞의 공백(줄바꿈 포함)은 스캐너가 함께 지운다.
+# 소유(possessive) 수량자로 닫는 괄호가 없는 입력에서도 역추적이 폭증하지 않게 한다.
+STORAGE_CLAUSE_PATTERN = re.compile(r"(?i)STORAGE\s*+\((?:[^)(]++|\([^)(]*+\))*+\)")
+TABLESPACE_CLAUSE_PATTERN = re.compile(r"(?i)TABLESPACE\s++(?:\"[^\"]++\"|[A-Z0-9_$#]++)")
 
+# 코드 밖으로 보는 토큰: 문자열 리터럴, 따옴표 식별자, 주석, q'[...]' 리터럴.
+_QUOTED = (
+    r"'[^']*+'"
+    r"|\"[^\"]*+\""
+    r"|/\*[^*]*+\*++(?:[^/*][^*]*+\*++)*+/"
+    r"|[qQ]'(?s:\[.*?\]|\{.*?\}|\(.*?\)|<.*?>|(?P<delimiter>[^\s\[{(<]).*?(?P=delimiter))'"
+)
+OPAQUE_TOKEN_PATTERN = re.compile(_QUOTED + r"|--[^\n]*+")
+# 코드 구간을 토큰 단위로 C 수준에서 소비한다. 한 줄 주석은 줄바꿈까지 있어야 닫힌 것으로 본다
+# (endpos에서 잘린 주석을 코드로 오인하지 않도록).
+CODE_RUN_PATTERN = re.compile(
+    r"(?:[^'\"/qQ-]++|" + _QUOTED + r"|--[^\n]*+\n|-(?!-)|/(?!\*)|[qQ](?!'))*+"
+)
+_CLAUSES = STORAGE_CLAUSE_PATTERN.pattern[4:] + "|" + TABLESPACE_CLAUSE_PATTERN.pattern[4:]
+CLAUSE_AFTER_SPACE_PATTERN = re.compile(r"\s+(?:" + _CLAUSES + ")", re.IGNORECASE)
+PARTITION_TOKEN_PATTERN = re.compile(
+    r"(?P<clause>\s+(?:" + _CLAUSES + r"))|(?P<newline>\n)|" + OPAQUE_TOKEN_PATTERN.pattern,
+    re.IGNORECASE,
+)
+BLANK_LINES_PATTERN = re.compile(r"\n\n\n+")
+_ASCII_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
-def _is_partition_instance_line(stripped_upper: str) -> bool:
-    if stripped_upper.startswith("PARTITION BY"):
-        return False
-    if stripped_upper.startswith("SUBPARTITION BY"):
-        return False
-    return stripped_upper.startswith("PARTITION ") or stripped_upper.startswith("SUBPARTITION ")
 
+def _next_opener(text: str, start: int) -> int:
+    # 리터럴/주석이 시작될 수 있는 가장 가까운 위치. q'...'도 작은따옴표를 포함한다.
+    positions = [text.find(marker, start) for marker in ("'", "--", "/*")]
+    return min((position for position in positions if position >= 0), default=len(text))
 
-def _remove_partition_instance_lines(text: str) -> str:
-    lines = text.split("\n")
-    output: list[str] = []
-    skipping = False
+
+class _CodeTracker:
+    """왼쪽에서 오른쪽으로만 움직이며 주어진 위치가 리터럴/주석 밖(코드)인지 판단한다."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.checkpoint = 0
+        self.opener = _next_opener(text, 0)
+
+    def advance(self, position: int) -> None:
+        # position은 코드 상태여야 한다(제거한 절의 끝, 건너뛴 줄의 다음 줄 시작).
+        self.checkpoint = position
+        if self.opener < position:
+            self.opener = _next_opener(self.text, position)
+
+    def is_code(self, position: int) -> bool:
+        text = self.text
+        checkpoint = self.checkpoint
+        if position < checkpoint:
+            # 직전에 건너뛴 리터럴/주석 토큰 안쪽이다.
+            return False
+        # 사이에 리터럴/주석 시작이 없으면 따옴표 식별자 안인지만 보면 된다.
+        if position < self.opener and not text.count('"', checkpoint, position) % 2:
+            self.checkpoint = position
+            return True
+        while True:
+            end = CODE_RUN_PATTERN.match(text, checkpoint, position).end()
+            if end >= position:
+                self.advance(position)
+                return True
+            token = OPAQUE_TOKEN_PATTERN.match(text, end)
+            if token is None:
+                # 짝이 맞지 않는 따옴표/주석 시작은 일반 문자로 본다.
+                checkpoint = end + 1
+                continue
+            self.advance(token.end())
+            return False
+
+
+def _skip_partition_instance(text: str, upper: str, start: int) -> int:
+    """start 줄부터 파티션 인스턴스 정의를 건너뛰고, 마지막으로 건너뛴 줄의 줄바꿈 위치를 돌려준다.
+
+    괄호 깊이가 0 이하이고 줄이 ','로 끝나지 않을 때까지 다음 줄도 함께 건너뛴다.
+    리터럴/주석 안의 괄호는 세지 않는다.
+    """
+    length = len(text)
     depth = 0
+    last = ""
+    pos = start
+    while True:
+        line_end = text.find("\n", pos)
+        if line_end < 0:
+            line_end = length
+        code = text[pos:line_end]
+        simple = (
+            "'" not in code
+            and "--" not in code
+            and "/*" not in code
+            and upper.find("STORAGE", pos, line_end) < 0
+            and upper.find("TABLESPACE", pos, line_end) < 0
+            and CLAUSE_AFTER_SPACE_PATTERN.match(text, line_end) is None
+        )
+        if simple:
+            # 리터럴/주석/제거할 절이 없는 줄은 토큰을 따라가지 않는다.
+            depth += code.count("(") - code.count(")")
+            tail = code.rstrip()
+            if tail:
+                last = tail[-1]
+            if line_end >= length or (depth <= 0 and last != ","):
+                return line_end
+            last = ""
+            pos = line_end + 1
+            continue
+
+        # 리터럴/주석/절 제거가 걸린 줄은 토큰 단위로 다음 줄바꿈까지 따라간다.
+        while True:
+            match = PARTITION_TOKEN_PATTERN.search(text, pos)
+            stop = match.start() if match is not None else length
+            code = text[pos:stop]
+            depth += code.count("(") - code.count(")")
+            tail = code.rstrip()
+            if tail:
+                last = tail[-1]
+            if match is None:
+                return stop
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == "newline":
+                if depth <= 0 and last != ",":
+                    return stop
+                last = ""
+                break
+            if kind != "clause":
+                last = match.group().rstrip()[-1:] or last
+
+
+def _line_start_in_output(output: list[str]) -> bool:
+    # 출력의 마지막 줄에 공백 말고 내용이 없으면 그 자리가 줄 시작이다. 들여쓰기는 잘라 낸다.
+    for index in range(len(output) - 1, -1, -1):
+        piece = output[index]
+        newline = piece.rfind("\n")
+        tail = piece[newline + 1 :]
+        if tail and not tail.isspace():
+            return False
+        if newline >= 0:
+            output[index] = piece[: newline + 1]
+            del output[index + 1 :]
+            return True
+    output.clear()
+    return True
+
+
+def _strip_physical_attributes(text: str) -> str:
+    """STORAGE/TABLESPACE 절과 파티션 인스턴스 줄을 코드 영역에서만 지운다.
+
+    키워드 후보는 대문자 사본에서 str.find로 찾고, 후보가 리터럴/주석 밖인지는
+    직전 확인 지점부터 토큰을 따라가며 판단한다. 텍스트는 왼쪽에서 오른쪽으로 한 번만 지나간다.
+    """
+    upper = text.upper()
+    if len(upper) != len(text):
+        # 'ß' 같은 문자는 대문자로 바꾸면 길이가 달라지므로 ASCII만 바꾼다.
+        upper = text.translate(_ASCII_UPPER)
+    length = len(text)
+    keywords = ("STORAGE", "TABLESPACE", "PARTITION ")
+    # 키워드별 다음 후보 위치. 없으면 length로 둔다.
+    found = [upper.find(keyword) % (length + 1) for keyword in keywords]
+    if min(found) >= length:
+        return text
+
+    tracker = _CodeTracker(text)
+    output: list[str] = []
+    pos = 0
+    while True:
+        candidate = min(found)
+        if candidate >= length:
+            break
+        kind = found.index(candidate)
+        found[kind] = upper.find(keywords[kind], candidate + 1) % (length + 1)
+        if candidate < pos:
+            continue
 
-    for line in lines:
-        stripped_upper = line.lstrip().upper()
-        if not skipping and _is_partition_instance_line(stripped_upper):
-            skipping = True
-            depth = line.count("(") - line.count(")")
-            if depth <= 0 and not line.rstrip().endswith(","):
-                skipping = False
-                depth = 0
+        if kind < 2:
+            if candidate == 0 or not text[candidate - 1].isspace():
+                continue
+            pattern = STORAGE_CLAUSE_PATTERN if kind == 0 else TABLESPACE_CLAUSE_PATTERN
+            clause = pattern.match(text, candidate)
+            if clause is None or not tracker.is_code(candidate):
+                continue
+            # 원래 정규식(\s+STORAGE...)처럼 앞의 공백 전체를 함께 지운다.
+            output.append(text[pos:candidate].rstrip())
+            pos = clause.end()
+            tracker.advance(pos)
             continue
 
-        if skipping:
-            depth += line.count("(") - line.count(")")
-            if depth <= 0 and not line.rstrip().endswith(","):
-                skipping = False
-                depth = 0
+        if upper.startswith("PARTITION BY", candidate):
+            continue
+        head = candidate - 3 if candidate >= 3 and upper.startswith("SUB", candidate - 3) else candidate
+        newline = text.rfind("\n", pos, head)
+        line_start = newline + 1 if newline >= 0 else pos
+        if text[line_start:head].strip() or not tracker.is_code(head):
+            continue
+        # 앞선 절 제거로 이 줄이 윗줄에 이어졌으면 줄 시작이 아니다.
+        if newline < 0 and not _line_start_in_output(output):
             continue
+        line_end = _skip_partition_instance(text, upper, head)
+        output.append(text[pos:line_start])
+        pos = min(line_end + 1, length)
+        tracker.advance(pos)
 
-        output.append(line)
+    output.append(text[pos:])
+    return "".join(output)
 
-    return "\n".join(output)
+
+def _normalize_chunk(line_ending: str, ddls: list[str]) -> list[str]:
+    # 프로세스 풀에서 실행되므로 모듈 수준 함수로 둔다(pickle 가능).
+    normalizer = DdlNormalizer(line_ending)
+    return [normalizer.normalize(ddl) for ddl in ddls]
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    # 파이프라인은 쓰기 스레드와 DB 드라이버 스레드가 도는 중에 풀을 띄우므로 fork를 쓰지 않는다.
+    # forkserver가 없는 플랫폼(Windows)은 spawn을 쓴다.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
 
 
 class DdlNormalizer:
-    def __init__(self, line_ending: str = "LF") -> None:
+    parallel_chunk_size = 32
+
+    def __init__(
+        self,
+        line_ending: str = "LF",
+        workers: int = 0,
+        parallel_threshold: int = 1000,
+        logger: logging.Logger | None = None,
+    ) -> None:
         normalized = line_ending.upper()
         if normalized not in {"LF", "CRLF"}:
             raise ValueError("line_ending must be LF or CRLF.")
         self.line_ending = normalized
+        # workers=0이면 CPU 수에 맞추고, 1이면 항상 현재 프로세스에서 처리한다.
+        self.workers = workers if workers > 0 else max(1, (os.cpu_count() or 1) - 1)
+        self.parallel_threshold = parallel_threshold
+        self.logger = logger or logging.getLogger(__name__)
+
+    def normalize_many(self, ddls: Iterable[str]) -> list[str]:
+        return list(self.iter_normalized(ddls))
+
+    def iter_normalized(self, ddls: Iterable[str], expected_count: int | None = None) -> Iterator[str]:
+        # 병렬 여부는 호출자가 이미 아는 객체 수(탐색 후 추출 대상 수)로 정하고 입력을 미리 모아 세지 않는다.
+        # 개수를 모르는 스트림은 현재 프로세스에서 처리한다.
+        if expected_count is None and isinstance(ddls, Sized):
+            expected_count = len(ddls)
+        if self.workers <= 1 or expected_count is None or expected_count < self.parallel_threshold:
+            for ddl in ddls:
+                yield self.normalize(ddl)
+            return
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_process_context())
+        except (OSError, NotImplementedError, ValueError) as exc:  # pragma: no cover - platform dependent.
+            self.logger.warning("Process pool unavailable, normalizing in-process: %s", exc)
+            for ddl in ddls:
+                yield self.normalize(ddl)
+            return
+
+        self.logger.info("Parallel normalization: workers=%s", self.workers)
+        with executor:
+            yield from self._iter_parallel(executor, iter(ddls))
+
+    def _iter_parallel(
+        self,
+        executor: ProcessPoolExecutor,
+        ddls: Iterator[str],
+    ) -> Iterator[str]:
+        # 결과를 입력 순서대로 내보내면서 진행 중인 청크 수를 제한해 메모리를 일정하게 유지한다.
+        window = self.workers * 2
+        pending: deque[tuple[list[str], Future[list[str]] | None]] = deque()
+        broken = False
+
+        def collect() -> list[str]:
+            chunk, future = pending.popleft()
+            if future is not None:
+                try:
+                    return future.result()
+                except Exception as exc:  # pragma: no cover - broken pool path.
+                    self.logger.warning("Parallel normalization failed, retrying in-process: %s", exc)
+            return [self.normalize(ddl) for ddl in chunk]
+
+        while True:
+            chunk = list(islice(ddls, self.parallel_chunk_size))
+            if not chunk:
+                break
+            future = None
+            if not broken:
+                try:
+                    future = executor.submit(_normalize_chunk, self.line_ending, chunk)
+                except Exception as exc:  # pragma: no cover - broken pool path.
+                    broken = True
+                    self.logger.warning("Process pool stopped, normalizing in-process: %s", exc)
+            pending.append((chunk, future))
+            if len(pending) >= window:
+                yield from collect()
+        while pending:
+            yield from collect()
 
     def normalize(self, ddl: str) -> str:
-        text = ddl.replace("\r\n", "\n").replace("\r", "\n")
-        text = STORAGE_PATTERN.sub("", text)
-        text = TABLESPACE_PATTERN.sub("", text)
-        text = _remove_partition_instance_lines(text)
-
-        lines = [line.rstrip() for line in text.split("\n")]
-        compacted: list[str] = []
-        previous_blank = False
-        for line in lines:
-            is_blank = len(line.strip()) == 0
-            if is_blank and previous_blank:
-                continue
-            compacted.append(line)
-            previous_blank = is_blank
+        text = ddl
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        text = _strip_physical_attributes(text)
 
-        result = "\n".join(compacted).strip()
-        if result and not result.endswith("\n"):
+        # 줄 끝 공백 제거 후 연속된 빈 줄(공백만 있는 줄 포함)을 하나로 줄인다.
+        text = "\n".join([line.rstrip() for line in text.split("\n")])
+        result = BLANK_LINES_PATTERN.sub("\n\n", text).strip()
+        if result:
             result += "\n"
 
         if self.line_ending == "CRLF":
             result = result.replace("\n", "\r\n")
         return result
-
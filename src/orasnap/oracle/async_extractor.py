@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+from orasnap.models import DbObject, ExtractedDdl
+from orasnap.oracle import extractor as extractor_module
+from orasnap.oracle.extractor import (
+    COLUMN_COMMENTS_SQL,
+    TABLE_COMMENTS_SQL,
+    TABLE_INDEXES_SQL,
+    TRANSFORM_SQL,
+    ItemSink,
+    OracleMetadataExtractor,
+)
+from orasnap.oracle.chunking import BisectState, bisect_budget, error_code
+from orasnap.oracle.session import configure_cursor, first_value, name_list_async, read_lob_async
+
+
+def _emit_all(sink: ItemSink, items: list[ExtractedDdl]) -> None:
+    for item in items:
+        sink(item)
+
+
+# GET_DDL 청크 조회를 asyncio 커넥션 풀에서 동시에 실행한다. 탐색/감사 로그 조회는 가벼우므로 기존 단일
+# 세션 경로를 그대로 쓰고, 비용이 큰 DDL 추출만 `oracledb.create_pool_async` 위에서 병렬로 처리한다.
+class AsyncOracleMetadataExtractor(OracleMetadataExtractor):
+    @contextmanager
+    def _open_session(self) -> Iterator[tuple[Any, None]]:
+        connection = self._connect()
+        try:
+            cursor = self._cursor(connection)
+            self._configure_transform(cursor)
+            yield cursor, None
+        finally:
+            connection.close()
+
+    def _run_extraction(
+        self,
+        cursor: Any,
+        pool: Any,
+        objects: list[DbObject],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        if not objects:
+            return [], []
+        chunks = self._chunk_objects(objects, self._parallel_chunk_size(len(objects)))
+        return asyncio.run(self._extract_async(chunks, sink=sink))
+
+    def _create_pool_async(self) -> Any:
+        return extractor_module.oracledb.create_pool_async(
+            user=self.oracle_config.username,
+            password=self.oracle_config.password,
+            dsn=self.oracle_config.dsn,
+            min=1,
+            max=self.oracle_config.workers,
+            increment=1,
+            stmtcachesize=self.oracle_config.statement_cache_size,
+            session_callback=self._init_session_async,
+        )
+
+    async def _init_session_async(self, connection: Any, requested_tag: str | None) -> None:
+        # 풀 세션이 처음 만들어질 때 한 번만 변환 파라미터를 설정한다(청크마다 왕복하지 않는다).
+        cursor = configure_cursor(connection.cursor(), self.oracle_config)
+        await cursor.execute(TRANSFORM_SQL)
+
+    async def _extract_async(
+        self,
+        chunks: list[list[DbObject]],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        total_objects = sum(len(chunk) for chunk in chunks)
+        concurrency = max(1, min(self.oracle_config.workers, len(chunks)))
+        self.logger.info("Async extraction: chunks=%s concurrency=%s", len(chunks), concurrency)
+
+        pool = self._create_pool_async()
+        semaphore = asyncio.Semaphore(concurrency)
+        items: list[ExtractedDdl] = []
+        failures: list[str] = []
+        done = 0
+
+        async def collect(chunk: list[DbObject], task: asyncio.Task) -> None:
+            nonlocal done
+            try:
+                chunk_items, chunk_failures = await task
+            except Exception as exc:  # pragma: no cover - integration path.
+                chunk_items, chunk_failures = [], self._chunk_failures(chunk, exc)
+            if sink is None:
+                items.extend(chunk_items)
+            elif chunk_items:
+                # 파이프라인 sink(BoundedStream.put)는 쓰기 단계가 밀리면 블록되므로 이벤트 루프 밖에서 부른다.
+                # 이 수집 코루틴만 기다리고, 진행 중인 청크 태스크는 계속 조회한다.
+                await asyncio.to_thread(_emit_all, sink, chunk_items)
+            failures.extend(chunk_failures)
+            done += len(chunk)
+            self.logger.info("Extraction progress: %s/%s", done, total_objects)
+
+        # 스레드 엔진과 같이 진행 중인 청크를 동시 실행 수의 2배로 제한하고 입력 순서대로 수집한다.
+        window = concurrency * 2
+        pending: deque[tuple[list[DbObject], asyncio.Task]] = deque()
+        try:
+            for chunk in chunks:
+                task = asyncio.create_task(self._extract_chunk_async(pool, semaphore, chunk))
+                pending.append((chunk, task))
+                if len(pending) >= window:
+                    await collect(*pending.popleft())
+            while pending:
+                await collect(*pending.popleft())
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+            await pool.close(force=True)
+        return items, failures
+
+    async def _extract_ddl_async(self, cursor: Any, db_object: DbObject) -> str:
+        metadata_type = self._metadata_type(db_object.object_type)
+        started = perf_counter()
+        await cursor.execute(
+            self._single_ddl_sql(),
+            [metadata_type, db_object.object_name, db_object.owner],
+        )
+        row = await cursor.fetchone()
+        value = first_value(row) if row is not None else None
+        if value is None:
+            raise RuntimeError("GET_DDL returned NULL.")
+        ddl = await read_lob_async(value, self.oracle_config.lob_chunk_size)
+        self._observe_fetch(db_object.object_type, "single", started, [ddl])
+        return ddl
+
+    async def _fetch_bulk_rows_async(
+        self,
+        cursor: Any,
+        strategy: str,
+        owner: str,
+        object_type: str,
+        object_names: list[str],
+    ) -> list[tuple[Any, ...]]:
+        if strategy == "metadata_api":
+            ref_cursor = cursor.var(extractor_module.oracledb.DB_TYPE_CURSOR)
+            await cursor.execute(
+                self._metadata_api_sql(),
+                self._metadata_api_binds(owner, object_type, object_names, ref_cursor),
+            )
+            return await configure_cursor(ref_cursor.getvalue(), self.oracle_config).fetchall()
+        names = await name_list_async(cursor, object_names)
+        await cursor.execute(self._bulk_ddl_sql(), self._bulk_ddl_binds(owner, object_type, names))
+        return await cursor.fetchall()
+
+    async def _extract_ddl_bulk_async(
+        self,
+        cursor: Any,
+        objects: list[DbObject],
+        errors: dict[tuple[str, str, str], BaseException] | None = None,
+    ) -> dict[tuple[str, str, str], str]:
+        extracted: dict[tuple[str, str, str], str] = {}
+        if not objects:
+            return extracted
+        owner = objects[0].owner
+        object_type = objects[0].object_type
+        strategy = self._ddl_strategy(object_type)
+        maximum = self._chunk_size_for(strategy)
+        start = 0
+        while start < len(objects):
+            chunk = objects[start : start + self._chunk_sizer.size((strategy, object_type), maximum)]
+            start += len(chunk)
+            started = perf_counter()
+            state = BisectState(budget=bisect_budget(len(chunk)))
+            by_name: dict[str, str] = {}
+            pending = [chunk]
+            while pending:
+                part = pending.pop()
+                try:
+                    rows = await self._fetch_bulk_rows_async(
+                        cursor, strategy, owner, object_type, [item.object_name for item in part]
+                    )
+                except Exception as exc:
+                    pending.extend(self._split_failed_chunk(state, strategy, part, exc))
+                    continue
+                for object_name, *ddl_values in rows:
+                    value = first_value(ddl_values)
+                    if value is None:
+                        continue
+                    ddl = await read_lob_async(value, self.oracle_config.lob_chunk_size)
+                    self._add_bulk_ddl(by_name, object_name, ddl)
+
+            self._finish_bulk_chunk(state, strategy, chunk, started, by_name, errors)
+            self._match_bulk_rows(chunk, by_name, extracted)
+        return extracted
+
+    async def _fetch_table_comments_async(
+        self,
+        cursor: Any,
+        owner: str,
+        table_names: list[str],
+    ) -> dict[str, list[str]]:
+        names = await name_list_async(cursor, table_names)
+        await cursor.execute(COLUMN_COMMENTS_SQL, [owner, names])
+        column_rows = await cursor.fetchall()
+        await cursor.execute(TABLE_COMMENTS_SQL, [owner, names])
+        table_rows = await cursor.fetchall()
+        return self._comment_statements(owner, table_names, column_rows, table_rows)
+
+    async def _extract_table_comments_async(self, cursor: Any, db_object: DbObject) -> list[str]:
+        by_table = await self._fetch_table_comments_async(cursor, db_object.owner, [db_object.object_name])
+        return by_table.get(db_object.object_name, [])
+
+    async def _fetch_table_indexes_async(
+        self,
+        cursor: Any,
+        owner: str,
+        table_names: list[str],
+    ) -> dict[str, list[str]]:
+        object_types = {item.upper() for item in self.scope_config.object_types}
+        if "INDEX" not in object_types:
+            return {}
+
+        await cursor.execute(TABLE_INDEXES_SQL, [owner, await name_list_async(cursor, table_names)])
+        indexes_by_table: dict[str, list[DbObject]] = {}
+        self._group_index_rows(await cursor.fetchall(), indexes_by_table)
+
+        all_indexes = [index for indexes in indexes_by_table.values() for index in indexes]
+        bulk_ddls: dict[tuple[str, str, str], str] = {}
+        bulk_errors: dict[tuple[str, str, str], BaseException] = {}
+        for index_chunk in self._chunk_objects(all_indexes, self._bulk_chunk_size):
+            bulk_ddls.update(
+                await self._extract_ddl_bulk_async(cursor, index_chunk, errors=bulk_errors)
+            )
+
+        statements_by_table: dict[str, list[str]] = {}
+        for table_name, index_objects in indexes_by_table.items():
+            statements: list[str] = []
+            for index_object in index_objects:
+                index_key = self._object_key(index_object)
+                ddl = bulk_ddls.get(index_key)
+                if ddl is None:
+                    try:
+                        if index_key in bulk_errors:
+                            raise bulk_errors[index_key]
+                        ddl = await self._extract_ddl_async(cursor, index_object)
+                    except Exception as exc:  # pragma: no cover - integration path.
+                        self.logger.warning(
+                            "INDEX extraction failed for %s.%s (table=%s.%s): %s",
+                            index_object.owner,
+                            index_object.object_name,
+                            owner,
+                            table_name,
+                            exc,
+                        )
+                        continue
+                statements.append(ddl.strip())
+            statements_by_table[table_name] = statements
+        return statements_by_table
+
+    async def _extract_table_indexes_async(self, cursor: Any, db_object: DbObject) -> list[str]:
+        by_table = await self._fetch_table_indexes_async(cursor, db_object.owner, [db_object.object_name])
+        return by_table.get(db_object.object_name, [])
+
+    async def _extract_chunk_async(
+        self,
+        pool: Any,
+        semaphore: asyncio.Semaphore,
+        chunk: list[DbObject],
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        async with semaphore:
+            async with pool.acquire() as connection:
+                cursor = configure_cursor(connection.cursor(), self.oracle_config)
+                bulk_errors: dict[tuple[str, str, str], BaseException] = {}
+                bulk_ddls = await self._extract_ddl_bulk_async(cursor, chunk, errors=bulk_errors)
+
+                owner = chunk[0].owner
+                comments: dict[str, list[str]] | None = None
+                indexes: dict[str, list[str]] | None = None
+                if chunk[0].object_type == "TABLE":
+                    table_names = [item.object_name for item in chunk]
+                    try:
+                        comments = await self._fetch_table_comments_async(cursor, owner, table_names)
+                    except Exception as exc:
+                        # 실패 시 테이블별 조회로 되돌아간다.
+                        self.logger.warning("Batched comment extraction failed for %s: %s", owner, exc)
+                    try:
+                        indexes = await self._fetch_table_indexes_async(cursor, owner, table_names)
+                    except Exception as exc:
+                        # 실패 시 테이블별 조회로 되돌아간다.
+                        self.logger.warning("Batched index discovery failed for %s: %s", owner, exc)
+
+                items: list[ExtractedDdl] = []
+                failures: list[str] = []
+                for db_object in chunk:
+                    try:
+                        key = self._object_key(db_object)
+                        ddl = bulk_ddls.get(key)
+                        if ddl is None:
+                            if key in bulk_errors:
+                                raise bulk_errors[key]
+                            ddl = await self._extract_ddl_async(cursor, db_object)
+                        if db_object.object_type == "TABLE":
+                            table_comments = (
+                                comments.get(db_object.object_name, [])
+                                if comments is not None
+                                else await self._extract_table_comments_async(cursor, db_object)
+                            )
+                            table_indexes = (
+                                indexes.get(db_object.object_name, [])
+                                if indexes is not None
+                                else await self._extract_table_indexes_async(cursor, db_object)
+                            )
+                            ddl = self._assemble_table_bundle(ddl, table_comments, table_indexes)
+                        items.append(ExtractedDdl(db_object=db_object, ddl=ddl))
+                        self.metrics.record_extracted(db_object.object_type)
+                    except Exception as exc:  # pragma: no cover - integration path.
+                        message = (
+                            f"{db_object.owner}.{db_object.object_type}.{db_object.object_name}: {exc}"
+                        )
+                        failures.append(message)
+                        self.metrics.record_failed(db_object.object_type, code=error_code(exc))
+                        self.logger.warning("DDL extraction failed: %s", message)
+                return items, failures
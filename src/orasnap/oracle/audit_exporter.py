@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from orasnap.config import OracleConfig
+from orasnap.oracle.session import configure_cursor, first_value, read_lob, split_lob_columns
 
 try:
     import oracledb
@@ -19,6 +20,15 @@ SAFE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
 TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_$#."]+$')
 
 
+def validate_audit_table_name(table_name: str) -> str:
+    table = table_name.strip()
+    if not table:
+        return "DDL_AUDIT_LOG"
+    if not TABLE_NAME_PATTERN.match(table):
+        raise ValueError(f"Invalid audit table name: {table}")
+    return table
+
+
 @dataclass(frozen=True)
 class AuditExportResult:
     exported_count: int
@@ -35,12 +45,14 @@ class OracleAuditExporter:
         state_path: Path,
         table_name: str = "DDL_AUDIT_LOG",
         logger: logging.Logger | None = None,
+        batch_size: int = 1000,
     ) -> None:
         self.oracle_config = oracle_config
         self.service_name = service_name
         self.audit_root = audit_root
         self.state_path = state_path
         self.table_name = table_name
+        self.batch_size = max(1, batch_size)
         self.logger = logger or logging.getLogger(__name__)
 
     def _require_driver(self) -> None:
@@ -76,11 +88,14 @@ class OracleAuditExporter:
         return state
 
     def _save_state(self, state: dict[str, int]) -> None:
+        # 배치마다 체크포인트하므로 중간에 중단돼도 깨진 파일이 남지 않도록 교체 방식으로 쓴다.
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(
+        temp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        temp_path.write_text(
             json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True),
             encoding="utf-8",
         )
+        temp_path.replace(self.state_path)
 
     @staticmethod
     def _serialize(value: Any) -> Any:
@@ -109,15 +124,18 @@ class OracleAuditExporter:
                 return str(value)
         return str(value)
 
+    def _read_text(self, value: Any) -> Any:
+        if not hasattr(value, "read"):
+            return value
+        try:
+            return read_lob(value, self.oracle_config.lob_chunk_size)
+        except Exception:
+            return str(value)
+
     def _validate_table_name(self) -> str:
-        table = self.table_name.strip()
-        if not table:
-            return "DDL_AUDIT_LOG"
-        if not TABLE_NAME_PATTERN.match(table):
-            raise ValueError(f"Invalid audit table name: {table}")
-        return table
-
-    def _fetch_rows(self, cursor: "oracledb.Cursor", last_audit_id: int) -> list[tuple[Any, ...]]:
+        return validate_audit_table_name(self.table_name)
+
+    def _execute_query(self, cursor: "oracledb.Cursor", last_audit_id: int) -> None:
         table = self._validate_table_name()
         sql = f"""
             SELECT
@@ -134,20 +152,100 @@ class OracleAuditExporter:
                 OBJ_OWNER,
                 OBJ_TYPE,
                 OBJ_NAME,
-                SQL_TEXT
+                {split_lob_columns("SQL_TEXT", "SQL_TEXT", self.oracle_config.lob_inline_max)}
             FROM {table}
             WHERE AUDIT_ID > :1
             ORDER BY AUDIT_ID
         """
+        configure_cursor(cursor, self.oracle_config, arraysize=self.batch_size)
+        cursor.prefetchrows = self.batch_size + 1
         cursor.execute(sql, [last_audit_id])
-        return cursor.fetchall()
+
+    def _target_path(
+        self,
+        service_folder: str,
+        audit_id: int,
+        obj_owner: Any,
+        obj_type: Any,
+        obj_name: Any,
+    ) -> Path:
+        owner_folder = self._safe_name(str(obj_owner or "UNKNOWN"))
+        type_folder = self._safe_name(str(obj_type or "UNKNOWN").upper().replace(" ", "_"))
+        object_file = self._safe_name(str(obj_name or f"EVENT_{audit_id}"))
+        return self.audit_root / service_folder / owner_folder / type_folder / f"{object_file}.jsonl"
+
+    def _to_record(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        (
+            audit_id,
+            event_time,
+            sysevent,
+            db_user,
+            login_user,
+            current_schema,
+            os_user,
+            host,
+            ip_address,
+            module,
+            obj_owner,
+            obj_type,
+            obj_name,
+            *sql_text_values,
+        ) = row
+        return {
+            "audit_id": int(audit_id),
+            "event_time": self._serialize(event_time),
+            "sysevent": self._serialize(sysevent),
+            "db_user": self._serialize(db_user),
+            "login_user": self._serialize(login_user),
+            "current_schema": self._serialize(current_schema),
+            "os_user": self._serialize(os_user),
+            "host": self._serialize(host),
+            "ip_address": self._serialize(ip_address),
+            "module": self._serialize(module),
+            "obj_owner": self._serialize(obj_owner),
+            "obj_type": self._serialize(obj_type),
+            "obj_name": self._serialize(obj_name),
+            "sql_text": self._serialize(self._read_text(first_value(sql_text_values))),
+        }
+
+    @staticmethod
+    def _last_exported_id(path: Path) -> int | None:
+        # 파일 끝에서 거꾸로 읽어 마지막 완전한 행의 audit_id를 찾는다(중단된 배치의 잘린 행은 제거).
+        if not path.exists():
+            return None
+        with path.open("r+b") as handle:
+            size = handle.seek(0, 2)
+            buffer = b""
+            position = size
+            while position > 0:
+                step = min(65536, position)
+                position -= step
+                handle.seek(position)
+                buffer = handle.read(step) + buffer
+                if buffer.count(b"\n") >= 2 or (position == 0 and b"\n" in buffer):
+                    break
+            if not buffer.endswith(b"\n"):
+                cut = buffer.rfind(b"\n")
+                keep = position + cut + 1 if cut >= 0 else 0
+                handle.truncate(keep)
+                buffer = buffer[: cut + 1] if cut >= 0 else b""
+        lines = buffer.rstrip(b"\n").split(b"\n")
+        if not lines or not lines[-1]:
+            return None
+        try:
+            return int(json.loads(lines[-1].decode("utf-8"))["audit_id"])
+        except (ValueError, KeyError, TypeError):
+            return None
 
     def export(self, dry_run: bool = False) -> AuditExportResult:
         self._require_driver()
 
         state = self._load_state()
         key = self._state_key()
+        pending_key = f"{key}::pending"
         last_audit_id = int(state.get(key, 0))
+        # 직전 실행이 배치 파일 쓰기와 체크포인트 사이에서 중단됐다면 이 ID까지는 파일에 이미 있을 수 있다.
+        recover_until = int(state.get(pending_key, 0))
 
         connection = oracledb.connect(
             user=self.oracle_config.username,
@@ -158,7 +256,8 @@ class OracleAuditExporter:
         try:
             cursor = connection.cursor()
             try:
-                rows = self._fetch_rows(cursor, last_audit_id)
+                self._execute_query(cursor, last_audit_id)
+                rows = cursor.fetchmany(self.batch_size)
             except Exception as exc:
                 message = str(exc)
                 if "ORA-00942" in message:
@@ -174,75 +273,58 @@ class OracleAuditExporter:
             service_folder = self._safe_name(self.service_name)
             added_files: set[Path] = set()
             modified_files: set[Path] = set()
-            max_audit_id = last_audit_id
-
-            for row in rows:
-                (
-                    audit_id,
-                    event_time,
-                    sysevent,
-                    db_user,
-                    login_user,
-                    current_schema,
-                    os_user,
-                    host,
-                    ip_address,
-                    module,
-                    obj_owner,
-                    obj_type,
-                    obj_name,
-                    sql_text,
-                ) = row
-
-                audit_id_int = int(audit_id)
-                max_audit_id = max(max_audit_id, audit_id_int)
-
-                owner_folder = self._safe_name(str(obj_owner or "UNKNOWN"))
-                type_folder = self._safe_name(str(obj_type or "UNKNOWN").upper().replace(" ", "_"))
-                object_file = self._safe_name(str(obj_name or f"EVENT_{audit_id_int}"))
-
-                target = self.audit_root / service_folder / owner_folder / type_folder / f"{object_file}.jsonl"
-                existed_before = target.exists()
-
-                record = {
-                    "audit_id": audit_id_int,
-                    "event_time": self._serialize(event_time),
-                    "sysevent": self._serialize(sysevent),
-                    "db_user": self._serialize(db_user),
-                    "login_user": self._serialize(login_user),
-                    "current_schema": self._serialize(current_schema),
-                    "os_user": self._serialize(os_user),
-                    "host": self._serialize(host),
-                    "ip_address": self._serialize(ip_address),
-                    "module": self._serialize(module),
-                    "obj_owner": self._serialize(obj_owner),
-                    "obj_type": self._serialize(obj_type),
-                    "obj_name": self._serialize(obj_name),
-                    "sql_text": self._serialize(sql_text),
-                }
-
-                if target in added_files:
-                    # 같은 실행에서 신규 파일로 판정된 경우 상태는 added로 유지.
-                    pass
-                elif existed_before:
-                    modified_files.add(target)
-                else:
-                    added_files.add(target)
-
-                if dry_run:
-                    continue
-
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with target.open("a", encoding="utf-8", newline="\n") as handle:
-                    handle.write(json.dumps(record, ensure_ascii=False))
-                    handle.write("\n")
-
-            if not dry_run:
-                state[key] = max_audit_id
-                self._save_state(state)
+            recovered_ids: dict[Path, int | None] = {}
+            exported_count = 0
+
+            while rows:
+                batch: dict[Path, list[str]] = {}
+                batch_max_id = last_audit_id
+                for row in rows:
+                    record = self._to_record(row)
+                    audit_id = record["audit_id"]
+                    batch_max_id = max(batch_max_id, audit_id)
+                    target = self._target_path(service_folder, audit_id, row[10], row[11], row[12])
+
+                    if audit_id <= recover_until and not dry_run:
+                        if target not in recovered_ids:
+                            recovered_ids[target] = self._last_exported_id(target)
+                        written_id = recovered_ids[target]
+                        if written_id is not None and audit_id <= written_id:
+                            continue
+
+                    if target not in added_files and target not in modified_files:
+                        # 같은 실행에서 신규 파일로 판정된 경우 상태는 added로 유지.
+                        if target.exists():
+                            modified_files.add(target)
+                        else:
+                            added_files.add(target)
+                    batch.setdefault(target, []).append(json.dumps(record, ensure_ascii=False))
+                exported_count += sum(len(lines) for lines in batch.values())
+
+                if not dry_run:
+                    state[pending_key] = max(batch_max_id, recover_until)
+                    self._save_state(state)
+                    for target, lines in batch.items():
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        with target.open("a", encoding="utf-8", newline="\n") as handle:
+                            handle.write("\n".join(lines))
+                            handle.write("\n")
+                    if recover_until <= batch_max_id:
+                        del state[pending_key]
+                    state[key] = batch_max_id
+                    self._save_state(state)
+                last_audit_id = batch_max_id
+
+                try:
+                    rows = cursor.fetchmany(self.batch_size)
+                except Exception as exc:  # pragma: no cover - integration path.
+                    self.logger.warning(
+                        "Audit export stopped after audit_id=%s: %s", last_audit_id, exc
+                    )
+                    break
 
             return AuditExportResult(
-                exported_count=len(rows),
+                exported_count=exported_count,
                 added_files=sorted(added_files, key=lambda path: path.as_posix()),
                 modified_files=sorted(modified_files, key=lambda path: path.as_posix()),
             )
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass, field
+
+from orasnap.models import DbObject
+
+ERROR_CODE_PATTERN = re.compile(r"\b(?:ORA|DPY|DPI)-\d{4,5}\b")
+# 세션 자체가 끊긴 오류는 객체 문제가 아니므로 청크를 나눠 다시 시도하지 않는다.
+CONNECTION_ERROR_CODES = {
+    "ORA-03113",
+    "ORA-03114",
+    "ORA-03135",
+    "ORA-12537",
+    "DPY-1001",
+    "DPY-4011",
+}
+MIN_CHUNK_SIZE = 10
+
+
+def error_code(exc: BaseException) -> str:
+    match = ERROR_CODE_PATTERN.search(str(exc))
+    return match.group(0) if match else type(exc).__name__
+
+
+def bisect_budget(chunk_size: int) -> int:
+    # 문제 객체 몇 개를 찾을 만큼만 추가 조회하고, 그 이상이면 단건 폴백에 맡긴다.
+    return 8 * max(1, chunk_size.bit_length())
+
+
+@dataclass
+class BisectState:
+    budget: int
+    failures: int = 0
+    # 한 개로 좁혀서도 실패한 객체와 그 예외.
+    isolated: dict[tuple[str, str, str], BaseException] = field(default_factory=dict)
+
+    def split(self, chunk: list[DbObject], exc: BaseException) -> list[list[DbObject]]:
+        """실패한 청크를 다시 조회할 절반들로 나눈다. 더 나누지 않으면 빈 목록을 돌려준다."""
+        self.failures += 1
+        if len(chunk) == 1:
+            db_object = chunk[0]
+            self.isolated[(db_object.owner, db_object.object_type, db_object.object_name)] = exc
+            return []
+        if error_code(exc) in CONNECTION_ERROR_CODES or self.budget < 2:
+            return []
+        self.budget -= 2
+        middle = len(chunk) // 2
+        return [chunk[middle:], chunk[:middle]]
+
+
+class AdaptiveChunkSizer:
+    """(추출 방식, 객체 타입)별로 관측한 왕복 시간/페이로드 크기에 맞춰 벌크 청크 크기를 조정한다."""
+
+    def __init__(self, target_seconds: float, target_bytes: int, minimum: int = MIN_CHUNK_SIZE) -> None:
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self.minimum = minimum
+        self._sizes: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def size(self, key: tuple[str, str], maximum: int) -> int:
+        with self._lock:
+            return max(1, min(self._sizes.get(key, maximum), maximum))
+
+    def observe(
+        self,
+        key: tuple[str, str],
+        maximum: int,
+        objects: int,
+        seconds: float,
+        fetched_bytes: int,
+    ) -> int:
+        if objects <= 0:
+            return self.size(key, maximum)
+        ideal = float(maximum)
+        if seconds > 0:
+            ideal = min(ideal, self.target_seconds / (seconds / objects))
+        if fetched_bytes > 0:
+            ideal = min(ideal, self.target_bytes / (fetched_bytes / objects))
+        with self._lock:
+            current = min(self._sizes.get(key, maximum), maximum)
+            # 한 번에 두 배 이상 바뀌지 않게 해서 일시적인 지연에 크게 흔들리지 않도록 한다.
+            resized = int(min(current * 2, max(current / 2, ideal)))
+            self._sizes[key] = max(min(self.minimum, maximum), min(resized, maximum))
+            return self._sizes[key]
+
+    def shrink(self, key: tuple[str, str], maximum: int) -> int:
+        with self._lock:
+            current = min(self._sizes.get(key, maximum), maximum)
+            self._sizes[key] = max(min(self.minimum, maximum), current // 2)
+            return self._sizes[key]
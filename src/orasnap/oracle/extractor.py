@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import random
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
 
 from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.metrics import RunMetrics
 from orasnap.models import DbObject, ExtractedDdl
+from orasnap.oracle.audit_exporter import validate_audit_table_name
+from orasnap.oracle.chunking import AdaptiveChunkSizer, BisectState, bisect_budget, error_code
+from orasnap.oracle.session import (
+    configure_cursor,
+    first_value,
+    name_list,
+    read_lob,
+    split_lob_columns,
+)
 
 try:
     import oracledb
@@ -21,25 +39,275 @@ METADATA_TYPE_MAP = {
     "JAVA RESOURCE": "JAVA_RESOURCE",
 }
 
+# GET_DDL('PACKAGE'/'TYPE')는 BODY까지 함께 반환하므로 BODY 변경 시 상위 객체도 다시 추출한다.
+AUDIT_RELATED_TYPES = {
+    "PACKAGE": ("PACKAGE BODY",),
+    "PACKAGE BODY": ("PACKAGE",),
+    "TYPE": ("TYPE BODY",),
+    "TYPE BODY": ("TYPE",),
+}
+AUDIT_IGNORED_EVENTS = {"TRUNCATE"}
+
+TRANSFORM_SQL = """
+            BEGIN
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SQLTERMINATOR', TRUE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'PRETTY', TRUE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SEGMENT_ATTRIBUTES', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'STORAGE', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'TABLESPACE', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'PARTITIONING', FALSE);
+            END;
+            """
+# DBMS_METADATA OPEN/FETCH_DDL 엔진: (OWNER, OBJECT_TYPE) 청크를 핸들 하나로 가져와 REF CURSOR로 돌려준다.
+# 객체마다 GET_DDL을 부르는 것과 달리 메타데이터 컨텍스트를 청크당 한 번만 초기화한다.
+METADATA_API_SQL = """
+            DECLARE
+              l_handle NUMBER;
+              l_transform NUMBER;
+              l_batch SYS.KU$_DDLS;
+              l_ddls SYS.KU$_DDLS := SYS.KU$_DDLS();
+            BEGIN
+              l_handle := DBMS_METADATA.OPEN(:1);
+              DBMS_METADATA.SET_FILTER(l_handle, 'SCHEMA', :2);
+              DBMS_METADATA.SET_FILTER(l_handle, 'NAME_EXPR', :3);
+              DBMS_METADATA.SET_PARSE_ITEM(l_handle, 'NAME');
+              l_transform := DBMS_METADATA.ADD_TRANSFORM(l_handle, 'DDL');
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'SQLTERMINATOR', TRUE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'PRETTY', TRUE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'SEGMENT_ATTRIBUTES', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'STORAGE', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'TABLESPACE', FALSE);
+              DBMS_METADATA.SET_TRANSFORM_PARAM(l_transform, 'PARTITIONING', FALSE);
+              LOOP
+                l_batch := DBMS_METADATA.FETCH_DDL(l_handle);
+                EXIT WHEN l_batch IS NULL;
+                FOR i IN 1 .. l_batch.COUNT LOOP
+                  l_ddls.EXTEND;
+                  l_ddls(l_ddls.LAST) := l_batch(i);
+                END LOOP;
+              END LOOP;
+              DBMS_METADATA.CLOSE(l_handle);
+              OPEN :4 FOR
+                SELECT p.VALUE AS OBJECT_NAME, {ddl_columns}
+                FROM TABLE(l_ddls) d, TABLE(d.PARSEDITEMS) p
+                WHERE p.ITEM = 'NAME';
+            EXCEPTION
+              WHEN OTHERS THEN
+                IF l_handle IS NOT NULL THEN
+                  DBMS_METADATA.CLOSE(l_handle);
+                END IF;
+                RAISE;
+            END;
+            """
+# NO_MERGE: 바깥 CASE 식마다 GET_DDL이 다시 호출되지 않도록 인라인 뷰를 먼저 평가한다.
+SINGLE_DDL_SQL = """
+    SELECT {ddl_columns}
+    FROM (SELECT /*+ NO_MERGE */ DBMS_METADATA.GET_DDL(:1, :2, :3) AS DDL FROM DUAL)
+"""
+# 이름 목록은 SYS.ODCIVARCHAR2LIST 바인드 하나(TABLE(:n))로 넘긴다. 청크 길이마다 SQL 텍스트가 달라져
+# 하드 파스가 생기고 문장 캐시가 맞지 않던 `IN (:5, :6, ...)` 방식을 대체한다.
+BULK_DDL_SQL = """
+    SELECT OBJECT_NAME, {ddl_columns}
+    FROM (
+        SELECT /*+ NO_MERGE */ OBJECT_NAME, DBMS_METADATA.GET_DDL(:1, OBJECT_NAME, :2) AS DDL
+        FROM ALL_OBJECTS
+        WHERE OWNER = :3
+          AND OBJECT_TYPE = :4
+          AND GENERATED = 'N'
+          AND OBJECT_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:5))
+    )
+    ORDER BY OBJECT_NAME
+"""
+# 서버에서 GET_DDL 결과의 SHA-256만 계산해서 돌려준다(CLOB 본문은 네트워크로 보내지 않는다).
+# STANDARD_HASH는 LOB을 받지 않으므로 DBMS_CRYPTO.HASH를 쓴다. CLOB은 AL32UTF8로 변환된 뒤 해시되므로
+# 로컬의 content_hash(ddl)과 같은 값이 된다. SQL에서는 패키지 상수를 쓸 수 없어 HASH_SH256(4)를 숫자로 넘긴다.
+BULK_DDL_HASH_SQL = """
+    SELECT OBJECT_NAME, LOWER(RAWTOHEX(DBMS_CRYPTO.HASH(DDL, 4)))
+    FROM (
+        SELECT /*+ NO_MERGE */ OBJECT_NAME, DBMS_METADATA.GET_DDL(:1, OBJECT_NAME, :2) AS DDL
+        FROM ALL_OBJECTS
+        WHERE OWNER = :3
+          AND OBJECT_TYPE = :4
+          AND GENERATED = 'N'
+          AND OBJECT_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:5))
+    )
+"""
+COLUMN_COMMENTS_SQL = """
+    SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COMMENTS
+    FROM ALL_COL_COMMENTS c
+    JOIN ALL_TAB_COLUMNS t
+      ON t.OWNER = c.OWNER
+     AND t.TABLE_NAME = c.TABLE_NAME
+     AND t.COLUMN_NAME = c.COLUMN_NAME
+    WHERE c.OWNER = :1
+      AND c.TABLE_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))
+      AND c.COMMENTS IS NOT NULL
+    ORDER BY c.TABLE_NAME, t.COLUMN_ID
+"""
+TABLE_COMMENTS_SQL = """
+    SELECT TABLE_NAME, COMMENTS
+    FROM ALL_TAB_COMMENTS
+    WHERE OWNER = :1
+      AND TABLE_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))
+      AND COMMENTS IS NOT NULL
+"""
+TABLE_INDEXES_SQL = """
+    SELECT TABLE_NAME, OWNER, INDEX_NAME
+    FROM ALL_INDEXES
+    WHERE TABLE_OWNER = :1
+      AND TABLE_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))
+      AND GENERATED = 'N'
+    ORDER BY TABLE_NAME, OWNER, INDEX_NAME
+"""
+INDEX_TABLES_SQL = """
+    SELECT INDEX_NAME, TABLE_OWNER, TABLE_NAME
+    FROM ALL_INDEXES
+    WHERE OWNER = :1
+      AND INDEX_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))
+"""
+# `scope.type_strategies: source`: PL/SQL 소스를 GET_DDL 대신 ALL_SOURCE에서 스키마 단위 커서 하나로 읽는다.
+# GET_DDL('PACKAGE'/'TYPE')는 BODY까지 포함하므로 BODY 소스도 함께 읽는다.
+SOURCE_BODY_TYPES = {"PACKAGE": "PACKAGE BODY", "TYPE": "TYPE BODY"}
+SOURCE_OBJECTS_SQL = """
+    SELECT o.OBJECT_NAME, o.OBJECT_TYPE, o.EDITIONABLE, t.STATUS
+    FROM ALL_OBJECTS o
+    LEFT JOIN ALL_TRIGGERS t
+      ON t.OWNER = o.OWNER
+     AND t.TRIGGER_NAME = o.OBJECT_NAME
+     AND o.OBJECT_TYPE = 'TRIGGER'
+    WHERE o.OWNER = :1
+      AND o.OBJECT_TYPE IN (SELECT COLUMN_VALUE FROM TABLE(:2))
+"""
+# 대상이 적으면(증분 실행) 이름으로 거르고, 많으면 스키마 전체를 한 번에 흘려 읽는다.
+SOURCE_SQL = """
+    SELECT NAME, TYPE, TEXT
+    FROM ALL_SOURCE
+    WHERE OWNER = :1
+      AND TYPE IN (SELECT COLUMN_VALUE FROM TABLE(:2)){name_filter}
+    ORDER BY NAME, TYPE, LINE
+"""
+SOURCE_NAME_FILTER = "\n      AND NAME IN (SELECT COLUMN_VALUE FROM TABLE(:3))"
+# ALL_SOURCE 첫 줄의 "PACKAGE BODY [schema.]name" 머리. GET_DDL은 이 부분만 CREATE OR REPLACE 형태로 바꾼다.
+SOURCE_HEADER_PATTERN = re.compile(
+    r"\s*(?P<type>PACKAGE\s+BODY|TYPE\s+BODY|PACKAGE|TYPE|PROCEDURE|FUNCTION|TRIGGER)\s+"
+    r'(?:(?:"[^"]+"|[A-Z][A-Z0-9_$#]*)\s*\.\s*)?(?P<name>"[^"]+"|[A-Z][A-Z0-9_$#]*)',
+    re.IGNORECASE,
+)
+WRAPPED_PATTERN = re.compile(r"\s+WRAPPED\b", re.IGNORECASE)
+# 따옴표 없이 쓸 수 있는 식별자. 뷰 컬럼 목록에 이런 이름만 있는지로 GET_DDL 표본을 나눈다.
+SIMPLE_IDENTIFIER_PATTERN = re.compile(r"[A-Z][A-Z0-9_$#]*")
+# dictionary 방식: 뷰/시퀀스/시노님은 딕셔너리 뷰 한 번 조회로 GET_DDL과 같은 문장을 만든다.
+# 객체 뷰, 편집 뷰, 제약(WITH READ ONLY/CHECK OPTION)이 있는 뷰는 COMPLEX='Y'로 표시해서 GET_DDL로 넘긴다.
+DICTIONARY_VIEWS_SQL = """
+    SELECT v.VIEW_NAME, v.TEXT, o.EDITIONABLE,
+           CASE
+             WHEN v.TYPE_TEXT IS NOT NULL OR v.OID_TEXT IS NOT NULL OR v.EDITIONING_VIEW = 'Y'
+               OR EXISTS (
+                 SELECT 1 FROM ALL_CONSTRAINTS c WHERE c.OWNER = v.OWNER AND c.TABLE_NAME = v.VIEW_NAME
+               )
+             THEN 'Y' ELSE 'N'
+           END AS COMPLEX
+    FROM ALL_VIEWS v
+    JOIN ALL_OBJECTS o
+      ON o.OWNER = v.OWNER
+     AND o.OBJECT_NAME = v.VIEW_NAME
+     AND o.OBJECT_TYPE = 'VIEW'
+    WHERE v.OWNER = :1{name_filter}
+    ORDER BY v.VIEW_NAME
+"""
+DICTIONARY_VIEW_COLUMNS_SQL = """
+    SELECT c.TABLE_NAME, c.COLUMN_NAME
+    FROM ALL_TAB_COLUMNS c
+    JOIN ALL_VIEWS v
+      ON v.OWNER = c.OWNER
+     AND v.VIEW_NAME = c.TABLE_NAME
+    WHERE c.OWNER = :1{name_filter}
+    ORDER BY c.TABLE_NAME, c.COLUMN_ID
+"""
+# 숫자는 MAXVALUE(28자리)가 float로 바뀌지 않도록 문자열로 받는다.
+DICTIONARY_SEQUENCES_SQL = """
+    SELECT SEQUENCE_NAME, TO_CHAR(MIN_VALUE), TO_CHAR(MAX_VALUE), TO_CHAR(INCREMENT_BY),
+           TO_CHAR(LAST_NUMBER), CACHE_SIZE, CYCLE_FLAG, ORDER_FLAG,
+           KEEP_VALUE, SCALE_FLAG, EXTEND_FLAG, SESSION_FLAG
+    FROM ALL_SEQUENCES
+    WHERE SEQUENCE_OWNER = :1{name_filter}
+    ORDER BY SEQUENCE_NAME
+"""
+DICTIONARY_SYNONYMS_SQL = """
+    SELECT s.SYNONYM_NAME, s.TABLE_OWNER, s.TABLE_NAME, s.DB_LINK, o.EDITIONABLE
+    FROM ALL_SYNONYMS s
+    JOIN ALL_OBJECTS o
+      ON o.OWNER = s.OWNER
+     AND o.OBJECT_NAME = s.SYNONYM_NAME
+     AND o.OBJECT_TYPE = 'SYNONYM'
+    WHERE s.OWNER = :1{name_filter}
+    ORDER BY s.SYNONYM_NAME
+"""
+DICTIONARY_NAME_FILTERS = {
+    "VIEW": "\n      AND v.VIEW_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))",
+    "VIEW_COLUMNS": "\n      AND c.TABLE_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))",
+    "SEQUENCE": "\n      AND SEQUENCE_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))",
+    "SYNONYM": "\n      AND s.SYNONYM_NAME IN (SELECT COLUMN_VALUE FROM TABLE(:2))",
+}
+
+# `watch.alert_name`을 지정하면 폴링 대기 대신 감사 트리거의 DBMS_ALERT.SIGNAL을 기다린다.
+ALERT_REGISTER_SQL = "BEGIN DBMS_ALERT.REGISTER(:1); END;"
+ALERT_WAIT_SQL = "BEGIN DBMS_ALERT.WAITONE(:1, :2, :3, :4); END;"
+
+# sink를 넘기면 추출 결과를 모아두지 않고 청크 단위로 바로 흘려보낸다.
+ItemSink = Callable[[ExtractedDdl], None]
+# 직전 실행에서 받은 원본 DDL의 SHA-256(없으면 None). 서버 해시와 같으면 본문을 다시 받지 않는다.
+KnownHash = Callable[[DbObject], str | None]
+
 
 @dataclass(frozen=True)
 class ExtractionResult:
     items: list[ExtractedDdl]
     failures: list[str]
+    reused: list[DbObject] = field(default_factory=list)
+    targets: list[DbObject] | None = None
+    audit_id: int | None = None
+
+
+@dataclass
+class GetDdlCheck:
+    # source/dictionary 방식으로 만든 DDL을 GET_DDL과 비교한 상태. totals는 타입별 대상 객체 수,
+    # seen은 (타입, 변형)별로 지금까지 만든 DDL 수, failed는 GET_DDL과 다른 DDL이 나온 (타입, 변형)이다.
+    # 변형은 같은 타입 안에서 문장 모양이 갈리는 경우(공개/비공개 시노님, 시퀀스 옵션 등)를 나눈 이름이다.
+    label: str
+    totals: dict[str, int]
+    seen: dict[tuple[str, str | None], int] = field(default_factory=dict)
+    failed: set[tuple[str, str | None]] = field(default_factory=set)
+    cursor: Any = None
 
 
 class OracleMetadataExtractor:
     _bulk_chunk_size = 500
+    # NAME_EXPR 필터 문자열이 VARCHAR2(32767)를 넘지 않도록 OPEN/FETCH 엔진은 청크를 더 작게 나눈다.
+    _metadata_api_chunk_size = 200
+    # source/dictionary 방식은 타입마다 처음 몇 개와 무작위로 고른 몇 개(기대값)를 GET_DDL과 비교한다.
+    _verify_first = 3
+    _verify_random = 2
 
     def __init__(
         self,
         oracle_config: OracleConfig,
         scope_config: ScopeConfig,
         logger: logging.Logger | None = None,
+        metrics: RunMetrics | None = None,
     ) -> None:
         self.oracle_config = oracle_config
         self.scope_config = scope_config
         self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics or RunMetrics()
+        self._chunk_sizer = AdaptiveChunkSizer(
+            target_seconds=oracle_config.bulk_target_seconds,
+            target_bytes=oracle_config.bulk_target_bytes,
+        )
+        # hold_session() 동안 추출 호출마다 새로 접속하지 않고 재사용하는 (cursor, pool).
+        self._held_session: tuple[Any, Any] | None = None
+        self._registered_alerts: set[str] = set()
+        self._verify_rng = random.Random()
 
     def _require_driver(self) -> None:
         if oracledb is None:
@@ -67,20 +335,75 @@ class OracleMetadataExtractor:
         return "'" + value.replace("'", "''") + "'"
 
     def _configure_transform(self, cursor: "oracledb.Cursor") -> None:
+        cursor.execute(TRANSFORM_SQL)
+
+    @staticmethod
+    def _format_ddl_time(value: Any) -> str | None:
+        if value is None:
+            return None
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return str(value)
+
+    def _owner_scope_clause(self, column: str, bind_values: list[Any]) -> str | None:
+        include = [schema.upper() for schema in self.scope_config.include_schemas]
+        exclude = [schema.upper() for schema in self.scope_config.exclude_schemas]
+        if include:
+            schemas, operator = include, "IN"
+        elif exclude:
+            schemas, operator = exclude, "NOT IN"
+        else:
+            return None
+        start = len(bind_values) + 1
+        placeholders = ", ".join(f":{index}" for index in range(start, start + len(schemas)))
+        bind_values.extend(schemas)
+        return f"{column} {operator} ({placeholders})"
+
+    @staticmethod
+    def _owner_list_clause(column: str, owners: list[str], bind_values: list[Any]) -> str:
+        start = len(bind_values) + 1
+        placeholders = ", ".join(f":{index}" for index in range(start, start + len(owners)))
+        bind_values.extend(owners)
+        return f"{column} IN ({placeholders})"
+
+    def _discover_index_watermarks(
+        self,
+        cursor: "oracledb.Cursor",
+        owners: list[str] | None = None,
+    ) -> dict[tuple[str, str], str]:
+        bind_values: list[Any] = []
+        where_clauses = ["i.GENERATED = 'N'"]
+        owner_clause = self._owner_scope_clause("i.TABLE_OWNER", bind_values)
+        if owner_clause:
+            where_clauses.append(owner_clause)
+        if owners:
+            where_clauses.append(self._owner_list_clause("i.TABLE_OWNER", owners, bind_values))
+        where_sql = "\n              AND ".join(where_clauses)
         cursor.execute(
-            """
-            BEGIN
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SQLTERMINATOR', TRUE);
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'PRETTY', TRUE);
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'SEGMENT_ATTRIBUTES', FALSE);
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'STORAGE', FALSE);
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'TABLESPACE', FALSE);
-              DBMS_METADATA.SET_TRANSFORM_PARAM(DBMS_METADATA.SESSION_TRANSFORM, 'PARTITIONING', FALSE);
-            END;
-            """
+            f"""
+            SELECT i.TABLE_OWNER, i.TABLE_NAME, COUNT(*), MAX(o.LAST_DDL_TIME)
+            FROM ALL_INDEXES i
+            JOIN ALL_OBJECTS o
+              ON o.OWNER = i.OWNER
+             AND o.OBJECT_NAME = i.INDEX_NAME
+             AND o.OBJECT_TYPE = 'INDEX'
+            WHERE {where_sql}
+            GROUP BY i.TABLE_OWNER, i.TABLE_NAME
+            """,
+            bind_values,
         )
+        watermarks: dict[tuple[str, str], str] = {}
+        for table_owner, table_name, index_count, max_ddl_time in cursor.fetchall():
+            watermarks[(str(table_owner).upper(), str(table_name))] = (
+                f"{int(index_count)}@{self._format_ddl_time(max_ddl_time)}"
+            )
+        return watermarks
 
-    def _discover_objects(self, cursor: "oracledb.Cursor") -> list[DbObject]:
+    def _discover_objects(
+        self,
+        cursor: "oracledb.Cursor",
+        owners: list[str] | None = None,
+    ) -> list[DbObject]:
         object_types = [ot.upper() for ot in self.scope_config.object_types]
         if not object_types:
             return []
@@ -88,7 +411,7 @@ class OracleMetadataExtractor:
         include = [schema.upper() for schema in self.scope_config.include_schemas]
         exclude = [schema.upper() for schema in self.scope_config.exclude_schemas]
 
-        bind_values: list[str] = []
+        bind_values: list[Any] = []
         type_placeholders = ", ".join(f":{index}" for index in range(1, len(object_types) + 1))
         bind_values.extend(object_types)
 
@@ -96,25 +419,15 @@ class OracleMetadataExtractor:
             f"OBJECT_TYPE IN ({type_placeholders})",
             "GENERATED = 'N'",
         ]
-
-        if include:
-            start = len(bind_values) + 1
-            include_placeholders = ", ".join(
-                f":{index}" for index in range(start, start + len(include))
-            )
-            where_clauses.append(f"OWNER IN ({include_placeholders})")
-            bind_values.extend(include)
-        elif exclude:
-            start = len(bind_values) + 1
-            exclude_placeholders = ", ".join(
-                f":{index}" for index in range(start, start + len(exclude))
-            )
-            where_clauses.append(f"OWNER NOT IN ({exclude_placeholders})")
-            bind_values.extend(exclude)
+        owner_clause = self._owner_scope_clause("OWNER", bind_values)
+        if owner_clause:
+            where_clauses.append(owner_clause)
+        if owners:
+            where_clauses.append(self._owner_list_clause("OWNER", owners, bind_values))
 
         where_sql = "\n              AND ".join(where_clauses)
         sql = f"""
-            SELECT OWNER, OBJECT_TYPE, OBJECT_NAME
+            SELECT OWNER, OBJECT_TYPE, OBJECT_NAME, LAST_DDL_TIME
             FROM ALL_OBJECTS
             WHERE {where_sql}
             ORDER BY OWNER, OBJECT_TYPE, OBJECT_NAME
@@ -122,16 +435,31 @@ class OracleMetadataExtractor:
         cursor.execute(sql, bind_values)
         rows = cursor.fetchall()
 
-        objects: list[DbObject] = []
         bundle_table_related = self._should_bundle_table_related()
-        for owner, object_type, object_name in rows:
+        index_watermarks: dict[tuple[str, str], str] = {}
+        if bundle_table_related and "TABLE" in object_types:
+            # 인덱스 변경은 테이블의 LAST_DDL_TIME에 반영되지 않으므로 워터마크에 합친다.
+            index_watermarks = self._discover_index_watermarks(cursor, owners=owners)
+
+        objects: list[DbObject] = []
+        for owner, object_type, object_name, last_ddl_time in rows:
             owner_upper = str(owner).upper()
             object_type_upper = str(object_type).upper()
             if bundle_table_related and object_type_upper == "INDEX":
                 # TABLE 파일에 인덱스를 병합해서 저장하므로 INDEX 단독 파일은 제외.
                 continue
+            ddl_time = self._format_ddl_time(last_ddl_time)
+            if object_type_upper == "TABLE" and ddl_time is not None:
+                index_watermark = index_watermarks.get((owner_upper, str(object_name)))
+                if index_watermark:
+                    ddl_time = f"{ddl_time};indexes={index_watermark}"
             objects.append(
-                DbObject(owner=owner_upper, object_type=object_type_upper, object_name=str(object_name))
+                DbObject(
+                    owner=owner_upper,
+                    object_type=object_type_upper,
+                    object_name=str(object_name),
+                    last_ddl_time=ddl_time,
+                )
             )
 
         if not objects:
@@ -145,21 +473,165 @@ class OracleMetadataExtractor:
 
     def _extract_ddl(self, cursor: "oracledb.Cursor", db_object: DbObject) -> str:
         metadata_type = self._metadata_type(db_object.object_type)
-        cursor.execute(
-            "SELECT DBMS_METADATA.GET_DDL(:1, :2, :3) FROM DUAL",
-            [metadata_type, db_object.object_name, db_object.owner],
-        )
-        value = cursor.fetchone()[0]
+        started = perf_counter()
+        cursor.execute(self._single_ddl_sql(), [metadata_type, db_object.object_name, db_object.owner])
+        value = first_value(cursor.fetchone())
         if value is None:
             raise RuntimeError("GET_DDL returned NULL.")
-        if hasattr(value, "read"):
-            return value.read()
-        return str(value)
+        ddl = self._read_lob(value)
+        self._observe_fetch(db_object.object_type, "single", started, [ddl])
+        return ddl
+
+    def _observe_fetch(self, object_type: str, mode: str, started: float, ddls: Iterable[str]) -> int:
+        fetched_bytes = sum(len(ddl.encode("utf-8")) for ddl in ddls)
+        self.metrics.observe_fetch(object_type, mode, perf_counter() - started, fetched_bytes)
+        return fetched_bytes
+
+    def _read_lob(self, value: Any) -> str:
+        return read_lob(value, self.oracle_config.lob_chunk_size)
+
+    def _ddl_columns(self) -> str:
+        return split_lob_columns("DDL", "DDL", self.oracle_config.lob_inline_max)
+
+    def _single_ddl_sql(self) -> str:
+        return SINGLE_DDL_SQL.format(ddl_columns=self._ddl_columns())
+
+    def _bulk_ddl_sql(self) -> str:
+        return BULK_DDL_SQL.format(ddl_columns=self._ddl_columns())
+
+    def _bulk_ddl_binds(self, owner: str, object_type: str, names: Any) -> list[Any]:
+        return [self._metadata_type(object_type), owner, owner, object_type, names]
+
+    def _ddl_strategy(self, object_type: str) -> str:
+        strategy = self.scope_config.type_strategies.get(object_type.upper(), "bulk")
+        # source/dictionary 방식에서 만들지 못한 객체는 bulk GET_DDL로 받는다.
+        return "bulk" if strategy in {"source", "dictionary"} else strategy
+
+    def _uses_source(self, object_type: str) -> bool:
+        return self.scope_config.type_strategies.get(object_type.upper()) == "source"
+
+    def _uses_dictionary(self, object_type: str) -> bool:
+        return self.scope_config.type_strategies.get(object_type.upper()) == "dictionary"
+
+    def _metadata_api_sql(self) -> str:
+        return METADATA_API_SQL.format(
+            ddl_columns=split_lob_columns("d.DDLTEXT", "DDL", self.oracle_config.lob_inline_max)
+        )
+
+    def _metadata_api_binds(
+        self,
+        owner: str,
+        object_type: str,
+        object_names: list[str],
+        ref_cursor: Any,
+    ) -> list[Any]:
+        name_expr = "IN (" + ", ".join(self._quote_literal(name) for name in object_names) + ")"
+        return [self._metadata_type(object_type), owner, name_expr, ref_cursor]
+
+    def _fetch_bulk_rows(
+        self,
+        cursor: "oracledb.Cursor",
+        strategy: str,
+        owner: str,
+        object_type: str,
+        object_names: list[str],
+    ) -> list[tuple[Any, ...]]:
+        if strategy == "metadata_api":
+            ref_cursor = cursor.var(oracledb.DB_TYPE_CURSOR)
+            cursor.execute(
+                self._metadata_api_sql(),
+                self._metadata_api_binds(owner, object_type, object_names, ref_cursor),
+            )
+            return configure_cursor(ref_cursor.getvalue(), self.oracle_config).fetchall()
+        cursor.execute(
+            self._bulk_ddl_sql(),
+            self._bulk_ddl_binds(owner, object_type, name_list(cursor, object_names)),
+        )
+        return cursor.fetchall()
+
+    def _chunk_size_for(self, strategy: str) -> int:
+        if strategy == "metadata_api":
+            return min(self._bulk_chunk_size, self._metadata_api_chunk_size)
+        return self._bulk_chunk_size
+
+    @staticmethod
+    def _add_bulk_ddl(by_name: dict[str, str], object_name: Any, ddl: str) -> None:
+        # OPEN('PACKAGE') 등은 한 객체에 대해 SPEC/BODY 여러 행을 돌려주므로 GET_DDL처럼 이어 붙인다.
+        name = str(object_name)
+        by_name[name] = by_name[name] + ddl if name in by_name else ddl
+
+    def _match_bulk_rows(
+        self,
+        chunk: list[DbObject],
+        by_name: dict[str, str],
+        extracted: dict[tuple[str, str, str], str],
+    ) -> list[DbObject]:
+        missing: list[DbObject] = []
+        for db_object in chunk:
+            ddl = by_name.get(db_object.object_name)
+            if ddl is None:
+                missing.append(db_object)
+                continue
+            extracted[self._object_key(db_object)] = ddl
+
+        self.metrics.record_bulk(chunk[0].object_type, len(chunk) - len(missing), len(missing))
+        if missing:
+            self.logger.warning(
+                "Bulk DDL extraction missing %s object(s) for %s.%s. Falling back to per-object extraction.",
+                len(missing),
+                chunk[0].owner,
+                chunk[0].object_type,
+            )
+        return missing
+
+    def _split_failed_chunk(
+        self,
+        state: BisectState,
+        strategy: str,
+        chunk: list[DbObject],
+        exc: BaseException,
+    ) -> list[list[DbObject]]:
+        parts = state.split(chunk, exc)
+        self.logger.warning(
+            "Bulk DDL extraction (%s) failed for %s.%s chunk(size=%s, code=%s)%s: %s",
+            strategy,
+            chunk[0].owner,
+            chunk[0].object_type,
+            len(chunk),
+            error_code(exc),
+            ". Bisecting" if parts else "",
+            exc,
+        )
+        return parts
+
+    def _finish_bulk_chunk(
+        self,
+        state: BisectState,
+        strategy: str,
+        chunk: list[DbObject],
+        started: float,
+        by_name: dict[str, str],
+        errors: dict[tuple[str, str, str], BaseException] | None,
+    ) -> None:
+        object_type = chunk[0].object_type
+        fetched_bytes = self._observe_fetch(object_type, strategy, started, by_name.values())
+        sizer_key = (strategy, object_type)
+        maximum = self._chunk_size_for(strategy)
+        if state.failures:
+            self._chunk_sizer.shrink(sizer_key, maximum)
+        else:
+            self._chunk_sizer.observe(
+                sizer_key, maximum, len(chunk), perf_counter() - started, fetched_bytes
+            )
+        # bulk 쿼리에서 단독으로도 실패한 객체는 같은 GET_DDL 단건 호출도 실패하므로 다시 시도하지 않는다.
+        if errors is not None and strategy == "bulk":
+            errors.update(state.isolated)
 
     def _extract_ddl_bulk(
         self,
         cursor: "oracledb.Cursor",
         objects: list[DbObject],
+        errors: dict[tuple[str, str, str], BaseException] | None = None,
     ) -> tuple[dict[tuple[str, str, str], str], list[DbObject]]:
         if not objects:
             return {}, []
@@ -172,135 +644,627 @@ class OracleMetadataExtractor:
         failed_objects: list[DbObject] = []
 
         for (owner, object_type), group in grouped.items():
-            metadata_type = self._metadata_type(object_type)
-            for start in range(0, len(group), self._bulk_chunk_size):
-                chunk = group[start : start + self._bulk_chunk_size]
-                object_names = [item.object_name for item in chunk]
-                name_placeholders = ", ".join(
-                    f":{index}" for index in range(5, 5 + len(object_names))
-                )
-                sql = f"""
-                    SELECT OBJECT_NAME, DBMS_METADATA.GET_DDL(:1, OBJECT_NAME, :2)
-                    FROM ALL_OBJECTS
-                    WHERE OWNER = :3
-                      AND OBJECT_TYPE = :4
-                      AND GENERATED = 'N'
-                      AND OBJECT_NAME IN ({name_placeholders})
-                    ORDER BY OBJECT_NAME
-                """
-                try:
-                    cursor.execute(
-                        sql,
-                        [metadata_type, owner, owner, object_type, *object_names],
-                    )
-                    rows = cursor.fetchall()
-                except Exception as exc:
-                    self.logger.warning(
-                        "Bulk DDL extraction failed for %s.%s chunk(size=%s): %s",
-                        owner,
-                        object_type,
-                        len(chunk),
-                        exc,
-                    )
-                    failed_objects.extend(chunk)
-                    continue
-
+            strategy = self._ddl_strategy(object_type)
+            maximum = self._chunk_size_for(strategy)
+            start = 0
+            while start < len(group):
+                chunk = group[start : start + self._chunk_sizer.size((strategy, object_type), maximum)]
+                start += len(chunk)
+                started = perf_counter()
+                state = BisectState(budget=bisect_budget(len(chunk)))
                 by_name: dict[str, str] = {}
-                for object_name, value in rows:
-                    if value is None:
+                # 실패한 청크는 절반씩 나눠 다시 조회해서 문제 객체만 골라낸다.
+                pending = [chunk]
+                while pending:
+                    part = pending.pop()
+                    try:
+                        rows = self._fetch_bulk_rows(
+                            cursor, strategy, owner, object_type, [item.object_name for item in part]
+                        )
+                    except Exception as exc:
+                        pending.extend(self._split_failed_chunk(state, strategy, part, exc))
                         continue
-                    if hasattr(value, "read"):
-                        by_name[str(object_name)] = value.read()
-                    else:
-                        by_name[str(object_name)] = str(value)
+                    for object_name, *ddl_values in rows:
+                        value = first_value(ddl_values)
+                        if value is None:
+                            continue
+                        self._add_bulk_ddl(by_name, object_name, self._read_lob(value))
 
-                missing: list[DbObject] = []
-                for db_object in chunk:
-                    ddl = by_name.get(db_object.object_name)
-                    if ddl is None:
-                        missing.append(db_object)
-                        continue
-                    extracted[self._object_key(db_object)] = ddl
-
-                if missing:
-                    self.logger.warning(
-                        "Bulk DDL extraction missing %s object(s) for %s.%s. Falling back to per-object extraction.",
-                        len(missing),
-                        owner,
-                        object_type,
-                    )
-                    failed_objects.extend(missing)
+                self._finish_bulk_chunk(state, strategy, chunk, started, by_name, errors)
+                failed_objects.extend(self._match_bulk_rows(chunk, by_name, extracted))
 
         return extracted, failed_objects
 
-    def _extract_table_comments(self, cursor: "oracledb.Cursor", db_object: DbObject) -> list[str]:
-        owner = db_object.owner
-        table_name = db_object.object_name
-        owner_q = self._quote_identifier(owner)
-        table_q = self._quote_identifier(table_name)
+    def _filter_unchanged_by_hash(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+        known_hashes: KnownHash,
+    ) -> tuple[list[DbObject], list[DbObject]]:
+        # 서버 해시가 직전 원본 해시와 같은 객체를 골라낸다. (본문을 받을 객체, 재사용할 객체)를 돌려준다.
+        expected: dict[tuple[str, str, str], str] = {}
+        for db_object in objects:
+            if (
+                db_object.object_type == "TABLE"
+                or self._uses_source(db_object.object_type)
+                or self._uses_dictionary(db_object.object_type)
+            ):
+                # TABLE 파일은 코멘트/인덱스를 합친 번들이고, source/dictionary 방식은 GET_DDL을 부르지 않고
+                # 딕셔너리에서 바로 만드는 편이 해시 비교보다 싸다.
+                continue
+            digest = known_hashes(db_object)
+            if digest:
+                expected[self._object_key(db_object)] = digest
+        if not expected:
+            return objects, []
 
-        statements: list[str] = []
+        candidates = [item for item in objects if self._object_key(item) in expected]
+        unchanged: set[tuple[str, str, str]] = set()
+        for chunk in self._chunk_objects(candidates, self._bulk_chunk_size):
+            owner, object_type = chunk[0].owner, chunk[0].object_type
+            started = perf_counter()
+            try:
+                cursor.execute(
+                    BULK_DDL_HASH_SQL,
+                    self._bulk_ddl_binds(
+                        owner, object_type, name_list(cursor, [item.object_name for item in chunk])
+                    ),
+                )
+                rows = cursor.fetchall()
+            except Exception as exc:
+                # 권한(EXECUTE ON DBMS_CRYPTO)이 없거나 조회가 실패하면 남은 객체는 본문을 그대로 받는다.
+                self.logger.warning(
+                    "Server-side DDL hash failed for %s.%s (code=%s). Fetching full DDL instead: %s",
+                    owner,
+                    object_type,
+                    error_code(exc),
+                    exc,
+                )
+                break
+            hashes = {str(name): str(digest).lower() for name, digest in rows if digest is not None}
+            self.metrics.observe_fetch(
+                object_type, "hash", perf_counter() - started, sum(len(digest) for digest in hashes.values())
+            )
+            skipped = 0
+            for db_object in chunk:
+                key = self._object_key(db_object)
+                if hashes.get(db_object.object_name) == expected[key]:
+                    unchanged.add(key)
+                    skipped += 1
+            self.metrics.record_hash_skipped(object_type, skipped)
 
-        cursor.execute(
-            """
-            SELECT c.COLUMN_NAME, c.COMMENTS
-            FROM ALL_COL_COMMENTS c
-            JOIN ALL_TAB_COLUMNS t
-              ON t.OWNER = c.OWNER
-             AND t.TABLE_NAME = c.TABLE_NAME
-             AND t.COLUMN_NAME = c.COLUMN_NAME
-            WHERE c.OWNER = :1
-              AND c.TABLE_NAME = :2
-              AND c.COMMENTS IS NOT NULL
-            ORDER BY t.COLUMN_ID
-            """,
-            [owner, table_name],
+        self.logger.info(
+            "Server-side DDL hash check: checked=%s unchanged=%s",
+            len(candidates),
+            len(unchanged),
+        )
+        changed = [item for item in objects if self._object_key(item) not in unchanged]
+        reused = [item for item in objects if self._object_key(item) in unchanged]
+        return changed, reused
+
+    @staticmethod
+    def _edition_keyword(editionable: Any) -> str:
+        # ALL_OBJECTS.EDITIONABLE(12c+)이 없거나 비어 있으면 GET_DDL도 키워드를 붙이지 않는다.
+        return {"Y": "EDITIONABLE ", "N": "NONEDITIONABLE "}.get(str(editionable or ""), "")
+
+    @classmethod
+    def _assemble_source(
+        cls,
+        owner: str,
+        object_type: str,
+        object_name: str,
+        text: str,
+        attributes: tuple[Any, Any],
+    ) -> str | None:
+        # ALL_SOURCE 텍스트를 GET_DDL(SQLTERMINATOR) 형태로 바꾼다. 그대로 옮길 수 없으면 None.
+        header = SOURCE_HEADER_PATTERN.match(text)
+        if header is None or " ".join(header.group("type").upper().split()) != object_type:
+            return None
+        name = header.group("name")
+        name = name[1:-1] if name.startswith('"') else name.upper()
+        rest = text[header.end() :]
+        # 암호화(wrap)된 소스는 GET_DDL과 같은 모양을 보장할 수 없으므로 GET_DDL로 받는다.
+        if name != object_name or WRAPPED_PATTERN.match(rest):
+            return None
+        editionable, trigger_status = attributes
+        edition = cls._edition_keyword(editionable)
+        qualified = f"{cls._quote_identifier(owner)}.{cls._quote_identifier(object_name)}"
+        ddl = f"\n  CREATE OR REPLACE {edition}{object_type} {qualified}{rest}"
+        if not ddl.endswith("\n"):
+            ddl += "\n"
+        ddl += "/"
+        if object_type == "TRIGGER":
+            # GET_DDL은 트리거 뒤에 활성 상태를 ALTER TRIGGER 문으로 덧붙인다.
+            if trigger_status not in {"ENABLED", "DISABLED"}:
+                return None
+            ddl += f"\nALTER TRIGGER {qualified} {trigger_status[:-1]};"
+        return ddl
+
+    def _source_ddl(
+        self,
+        db_object: DbObject,
+        texts: dict[str, list[str]],
+        attributes: dict[tuple[str, str], tuple[Any, Any]],
+    ) -> str | None:
+        object_type = db_object.object_type
+        lines = texts.get(object_type)
+        if not lines:
+            return None
+        ddl = self._assemble_source(
+            db_object.owner,
+            object_type,
+            db_object.object_name,
+            "".join(lines),
+            attributes.get((db_object.object_name, object_type), (None, None)),
+        )
+        body_type = SOURCE_BODY_TYPES.get(object_type)
+        if ddl is None or body_type is None or not texts.get(body_type):
+            return ddl
+        body = self._assemble_source(
+            db_object.owner,
+            body_type,
+            db_object.object_name,
+            "".join(texts[body_type]),
+            attributes.get((db_object.object_name, body_type), (None, None)),
+        )
+        return ddl + body if body is not None else None
+
+    @staticmethod
+    def _comparable_ddl(ddl: str) -> list[str]:
+        return [line.rstrip() for line in ddl.strip().splitlines()]
+
+    def _get_ddl_check(self, objects: list[DbObject], label: str) -> GetDdlCheck:
+        totals: dict[str, int] = {}
+        for db_object in objects:
+            totals[db_object.object_type] = totals.get(db_object.object_type, 0) + 1
+        return GetDdlCheck(label=label, totals=totals)
+
+    def _should_verify(
+        self, check: GetDdlCheck, object_type: str, risky: bool, variant: str | None = None
+    ) -> bool:
+        index = check.seen.get((object_type, variant), 0)
+        check.seen[(object_type, variant)] = index + 1
+        if risky or index < self._verify_first:
+            return True
+        # 나머지 객체 중 평균 _verify_random개가 뽑히도록 객체마다 같은 확률로 고른다.
+        remaining = check.totals.get(object_type, 0) - self._verify_first
+        return remaining > 0 and self._verify_rng.random() * remaining < self._verify_random
+
+    def _matches_get_ddl(
+        self,
+        cursor: "oracledb.Cursor",
+        db_object: DbObject,
+        ddl: str,
+        check: GetDdlCheck,
+        risky: bool = False,
+        variant: str | None = None,
+    ) -> bool:
+        # 표본이나 구조가 까다로운 객체(risky)는 GET_DDL과 비교하고, 다르면 그 객체를 GET_DDL로 받는다.
+        # 한 번이라도 다른 (타입, 변형)은 남은 객체도 믿을 수 없으므로 모두 GET_DDL로 넘긴다.
+        object_type = db_object.object_type
+        if (object_type, variant) in check.failed:
+            return False
+        if not self._should_verify(check, object_type, risky, variant):
+            return True
+        if check.cursor is None:
+            # 소스/딕셔너리 커서를 읽는 중이므로 GET_DDL 비교는 별도 커서에서 한다.
+            check.cursor = self._cursor(cursor.connection)
+        try:
+            expected = self._extract_ddl(check.cursor, db_object)
+        except Exception as exc:
+            self.logger.warning(
+                "GET_DDL check failed for %s.%s.%s: %s",
+                db_object.owner,
+                object_type,
+                db_object.object_name,
+                exc,
+            )
+            return False
+        if self._comparable_ddl(expected) == self._comparable_ddl(ddl):
+            return True
+        check.failed.add((object_type, variant))
+        self.logger.warning(
+            "%s differs from GET_DDL for %s.%s.%s. Using GET_DDL for it and the remaining %s objects.",
+            check.label,
+            db_object.owner,
+            object_type,
+            db_object.object_name,
+            object_type if variant is None else f"{object_type} ({variant})",
+        )
+        return False
+
+    def _fast_path_fallback(
+        self,
+        owner: str,
+        objects: list[DbObject],
+        done: set[tuple[str, str, str]],
+        fetched_bytes: dict[str, int],
+        elapsed: float,
+        mode: str,
+        label: str,
+    ) -> list[DbObject]:
+        # source/dictionary 방식의 메트릭을 남기고 GET_DDL로 받아야 할 객체를 돌려준다.
+        fallback = [item for item in objects if self._object_key(item) not in done]
+        for object_type in sorted({item.object_type for item in objects}):
+            total = sum(1 for item in objects if item.object_type == object_type)
+            missed = sum(1 for item in fallback if item.object_type == object_type)
+            self.metrics.observe_fetch(object_type, mode, elapsed, fetched_bytes.get(object_type, 0))
+            self.metrics.record_bulk(object_type, total - missed, missed)
+        if fallback:
+            self.logger.warning(
+                "%s not possible for %s object(s) in %s. Falling back to GET_DDL: %s",
+                label,
+                len(fallback),
+                owner,
+                ", ".join(f"{item.object_type} {item.object_name}" for item in fallback[:10]),
+            )
+        return fallback
+
+    def _extract_owner_source(
+        self,
+        cursor: "oracledb.Cursor",
+        owner: str,
+        objects: list[DbObject],
+        emit: ItemSink,
+    ) -> list[DbObject]:
+        wanted: dict[str, list[DbObject]] = {}
+        source_types: set[str] = set()
+        for db_object in objects:
+            wanted.setdefault(db_object.object_name, []).append(db_object)
+            source_types.add(db_object.object_type)
+            if db_object.object_type in SOURCE_BODY_TYPES:
+                source_types.add(SOURCE_BODY_TYPES[db_object.object_type])
+        type_list = sorted(source_types)
+
+        attributes: dict[tuple[str, str], tuple[Any, Any]] = {}
+        done: set[tuple[str, str, str]] = set()
+        fetched_bytes: dict[str, int] = {}
+        check = self._get_ddl_check(objects, "ALL_SOURCE reassembly")
+        started = perf_counter()
+
+        def finish(object_name: str, texts: dict[str, list[str]]) -> None:
+            for db_object in wanted.get(object_name, []):
+                ddl = self._source_ddl(db_object, texts, attributes)
+                if ddl is None:
+                    # 암호화(wrap)된 소스처럼 재조립할 수 없는 객체는 비교 없이 GET_DDL로 받는다.
+                    continue
+                # 트리거(ALTER TRIGGER 덧붙임)와 본문이 있는 타입은 모두 GET_DDL과 비교한다.
+                risky = db_object.object_type == "TRIGGER" or (
+                    db_object.object_type == "TYPE" and bool(texts.get("TYPE BODY"))
+                )
+                if not self._matches_get_ddl(cursor, db_object, ddl, check, risky=risky):
+                    continue
+                done.add(self._object_key(db_object))
+                fetched_bytes[db_object.object_type] = (
+                    fetched_bytes.get(db_object.object_type, 0) + len(ddl.encode("utf-8"))
+                )
+                self.metrics.record_extracted(db_object.object_type)
+                emit(ExtractedDdl(db_object=db_object, ddl=ddl))
+
+        try:
+            cursor.execute(SOURCE_OBJECTS_SQL, [owner, name_list(cursor, type_list)])
+            for name, object_type, editionable, status in cursor.fetchall():
+                attributes[(str(name), str(object_type))] = (editionable, status)
+            binds: list[Any] = [owner, name_list(cursor, type_list)]
+            name_filter = ""
+            if len(wanted) <= self._bulk_chunk_size:
+                name_filter = SOURCE_NAME_FILTER
+                binds.append(name_list(cursor, sorted(wanted)))
+            cursor.execute(SOURCE_SQL.format(name_filter=name_filter), binds)
+            # NAME, TYPE, LINE 순서이므로 이름이 바뀌면 앞 객체(SPEC/BODY 포함)의 소스가 모두 모인 것이다.
+            current: str | None = None
+            texts: dict[str, list[str]] = {}
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for name, source_type, text in rows:
+                    name = str(name)
+                    if name != current:
+                        if current is not None:
+                            finish(current, texts)
+                        current, texts = name, {}
+                    if name in wanted:
+                        texts.setdefault(str(source_type), []).append(text or "")
+            if current is not None:
+                finish(current, texts)
+        except Exception as exc:
+            self.logger.warning(
+                "ALL_SOURCE extraction failed for %s (code=%s). Falling back to GET_DDL: %s",
+                owner,
+                error_code(exc),
+                exc,
+            )
+        finally:
+            if check.cursor is not None:
+                check.cursor.close()
+
+        return self._fast_path_fallback(
+            owner, objects, done, fetched_bytes, perf_counter() - started, "source", "ALL_SOURCE reassembly"
+        )
+
+    def _extract_source(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+        emit: ItemSink,
+    ) -> list[DbObject]:
+        # ALL_SOURCE를 스키마마다 커서 하나로 읽어 DDL을 재조립한다. 재조립하지 못한 객체를 돌려준다.
+        by_owner: dict[str, list[DbObject]] = {}
+        for db_object in objects:
+            by_owner.setdefault(db_object.owner, []).append(db_object)
+        fallback: list[DbObject] = []
+        for owner, owned in by_owner.items():
+            fallback.extend(self._extract_owner_source(cursor, owner, owned, emit))
+        return fallback
+
+    @classmethod
+    def _view_ddl(
+        cls,
+        owner: str,
+        view_name: str,
+        text: str | None,
+        columns: list[str],
+        editionable: Any,
+    ) -> str | None:
+        if not text or not columns:
+            return None
+        qualified = f"{cls._quote_identifier(owner)}.{cls._quote_identifier(view_name)}"
+        column_list = ", ".join(cls._quote_identifier(column) for column in columns)
+        edition = cls._edition_keyword(editionable)
+        return f"\n  CREATE OR REPLACE FORCE {edition}VIEW {qualified} ({column_list}) AS \n  {text};"
+
+    @classmethod
+    def _sequence_ddl(cls, owner: str, sequence_name: str, attributes: tuple[Any, ...]) -> str:
+        min_value, max_value, increment_by, last_number, cache_size = attributes[:5]
+        cycle, order, keep, scale, extend, session = attributes[5:]
+        qualified = f"{cls._quote_identifier(owner)}.{cls._quote_identifier(sequence_name)}"
+        cache = f"CACHE {cache_size}" if int(cache_size or 0) > 0 else "NOCACHE"
+        scale_clause = "NOSCALE"
+        if scale == "Y":
+            scale_clause = "SCALE  EXTEND" if extend == "Y" else "SCALE  NOEXTEND"
+        return (
+            f"\n   CREATE SEQUENCE  {qualified}  MINVALUE {min_value} MAXVALUE {max_value} "
+            f"INCREMENT BY {increment_by} START WITH {last_number} {cache} "
+            f"{'ORDER' if order == 'Y' else 'NOORDER'}  {'CYCLE' if cycle == 'Y' else 'NOCYCLE'}  "
+            f"{'KEEP' if keep == 'Y' else 'NOKEEP'}  {scale_clause}  "
+            f"{'SESSION' if session == 'Y' else 'GLOBAL'} ;"
+        )
+
+    @classmethod
+    def _synonym_ddl(
+        cls,
+        owner: str,
+        synonym_name: str,
+        table_owner: str | None,
+        table_name: str | None,
+        db_link: str | None,
+        editionable: Any,
+    ) -> str | None:
+        if not table_name:
+            return None
+        target = cls._quote_identifier(table_name)
+        if table_owner:
+            target = f"{cls._quote_identifier(table_owner)}.{target}"
+        if db_link:
+            target += f"@{cls._quote_identifier(db_link)}"
+        if owner == "PUBLIC":
+            return f"\n  CREATE OR REPLACE PUBLIC SYNONYM {cls._quote_identifier(synonym_name)} FOR {target};"
+        qualified = f"{cls._quote_identifier(owner)}.{cls._quote_identifier(synonym_name)}"
+        return f"\n  CREATE OR REPLACE {cls._edition_keyword(editionable)}SYNONYM {qualified} FOR {target};"
+
+    @staticmethod
+    def _view_variant(editionable: Any, columns: list[str]) -> str:
+        quoted = any(SIMPLE_IDENTIFIER_PATTERN.fullmatch(column) is None for column in columns)
+        return (
+            f"editionable={editionable or '-'} columns={'one' if len(columns) == 1 else 'many'} "
+            f"quoted={'Y' if quoted else 'N'}"
+        )
+
+    @staticmethod
+    def _sequence_variant(attributes: tuple[Any, ...]) -> str:
+        cycle, order, keep, scale, extend, session = attributes[5:]
+        return (
+            f"cache={'Y' if int(attributes[4] or 0) > 0 else 'N'} order={order} cycle={cycle} keep={keep} "
+            f"scale={scale} extend={extend} session={session}"
+        )
+
+    @staticmethod
+    def _synonym_variant(owner: str, table_owner: str | None, db_link: str | None, editionable: Any) -> str:
+        scope = "public" if owner == "PUBLIC" else f"private editionable={editionable or '-'}"
+        return f"{scope} target_owner={'Y' if table_owner else 'N'} db_link={'Y' if db_link else 'N'}"
+
+    def _dictionary_ddls(
+        self,
+        cursor: "oracledb.Cursor",
+        owner: str,
+        object_type: str,
+        names: list[str],
+    ) -> Iterator[tuple[str, str | None, str]]:
+        # (이름, DDL, 변형)을 딕셔너리 조회 한 번으로 흘려 보낸다. 만들 수 없는 객체의 DDL은 None.
+        # 변형은 렌더링 분기(공개/비공개·DB 링크 시노님, 시퀀스 옵션, 뷰 컬럼 목록)별로
+        # GET_DDL 표본을 나누는 데 쓴다.
+        binds: list[Any] = [owner]
+        filtered = len(names) <= self._bulk_chunk_size
+        if filtered:
+            binds.append(name_list(cursor, names))
+
+        def name_filter(key: str) -> str:
+            return DICTIONARY_NAME_FILTERS[key] if filtered else ""
+
+        columns: dict[str, list[str]] = {}
+        if object_type == "VIEW":
+            cursor.execute(DICTIONARY_VIEW_COLUMNS_SQL.format(name_filter=name_filter("VIEW_COLUMNS")), binds)
+            for view_name, column_name in cursor.fetchall():
+                columns.setdefault(str(view_name), []).append(str(column_name))
+            sql = DICTIONARY_VIEWS_SQL
+        elif object_type == "SEQUENCE":
+            sql = DICTIONARY_SEQUENCES_SQL
+        else:
+            sql = DICTIONARY_SYNONYMS_SQL
+        cursor.execute(sql.format(name_filter=name_filter(object_type)), binds)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                return
+            for row in rows:
+                name = str(row[0])
+                if object_type == "VIEW":
+                    _, text, editionable, complex_view = row
+                    view_columns = columns.get(name, [])
+                    variant = self._view_variant(editionable, view_columns)
+                    if complex_view == "Y":
+                        yield name, None, variant
+                    else:
+                        yield name, self._view_ddl(owner, name, text, view_columns, editionable), variant
+                elif object_type == "SEQUENCE":
+                    attributes = tuple(row[1:])
+                    yield name, self._sequence_ddl(owner, name, attributes), self._sequence_variant(attributes)
+                else:
+                    variant = self._synonym_variant(owner, row[1], row[3], row[4])
+                    yield name, self._synonym_ddl(owner, name, row[1], row[2], row[3], row[4]), variant
+
+    def _extract_owner_dictionary(
+        self,
+        cursor: "oracledb.Cursor",
+        owner: str,
+        object_type: str,
+        objects: list[DbObject],
+        emit: ItemSink,
+    ) -> list[DbObject]:
+        wanted = {db_object.object_name: db_object for db_object in objects}
+        done: set[tuple[str, str, str]] = set()
+        fetched_bytes: dict[str, int] = {}
+        check = self._get_ddl_check(objects, "Dictionary DDL")
+        started = perf_counter()
+        try:
+            for name, ddl, variant in self._dictionary_ddls(cursor, owner, object_type, sorted(wanted)):
+                db_object = wanted.get(name)
+                if db_object is None or ddl is None:
+                    continue
+                # 변형마다 따로 표본을 비교하고, 다른 변형이 나온 객체만 GET_DDL로 넘긴다.
+                if not self._matches_get_ddl(cursor, db_object, ddl, check, variant=variant):
+                    continue
+                done.add(self._object_key(db_object))
+                fetched_bytes[object_type] = fetched_bytes.get(object_type, 0) + len(ddl.encode("utf-8"))
+                self.metrics.record_extracted(object_type)
+                emit(ExtractedDdl(db_object=db_object, ddl=ddl))
+        except Exception as exc:
+            self.logger.warning(
+                "Dictionary DDL failed for %s.%s (code=%s). Falling back to GET_DDL: %s",
+                owner,
+                object_type,
+                error_code(exc),
+                exc,
+            )
+        finally:
+            if check.cursor is not None:
+                check.cursor.close()
+        return self._fast_path_fallback(
+            owner, objects, done, fetched_bytes, perf_counter() - started, "dictionary", "Dictionary DDL"
         )
-        for column_name, comment_text in cursor.fetchall():
+
+    def _extract_dictionary(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+        emit: ItemSink,
+    ) -> list[DbObject]:
+        # 뷰/시퀀스/시노님 DDL을 (스키마, 타입)마다 딕셔너리 조회 한 번으로 만든다. 만들지 못한 객체를 돌려준다.
+        groups: dict[tuple[str, str], list[DbObject]] = {}
+        for db_object in objects:
+            groups.setdefault((db_object.owner, db_object.object_type), []).append(db_object)
+        fallback: list[DbObject] = []
+        for (owner, object_type), grouped in groups.items():
+            fallback.extend(self._extract_owner_dictionary(cursor, owner, object_type, grouped, emit))
+        return fallback
+
+    def _comment_statements(
+        self,
+        owner: str,
+        table_names: list[str],
+        column_rows: list[tuple[Any, ...]],
+        table_rows: list[tuple[Any, ...]],
+    ) -> dict[str, list[str]]:
+        owner_q = self._quote_identifier(owner)
+        column_comments: dict[str, list[str]] = {}
+        for table_name, column_name, comment_text in column_rows:
             if comment_text is None:
                 continue
+            table_q = self._quote_identifier(str(table_name))
             column_q = self._quote_identifier(str(column_name))
             comment_q = self._quote_literal(str(comment_text))
-            statements.append(
+            column_comments.setdefault(str(table_name), []).append(
                 f"COMMENT ON COLUMN {owner_q}.{table_q}.{column_q} IS {comment_q};"
             )
 
-        cursor.execute(
-            """
-            SELECT COMMENTS
-            FROM ALL_TAB_COMMENTS
-            WHERE OWNER = :1
-              AND TABLE_NAME = :2
-              AND COMMENTS IS NOT NULL
-            """,
-            [owner, table_name],
-        )
-        row = cursor.fetchone()
-        if row and row[0] is not None:
-            table_comment_q = self._quote_literal(str(row[0]))
-            statements.append(f"COMMENT ON TABLE {owner_q}.{table_q} IS {table_comment_q};")
+        table_comments: dict[str, str] = {}
+        for table_name, comment_text in table_rows:
+            if comment_text is None:
+                continue
+            table_comments.setdefault(str(table_name), str(comment_text))
 
-        return statements
+        statements_by_table: dict[str, list[str]] = {}
+        for table_name in table_names:
+            statements = list(column_comments.get(table_name, []))
+            table_comment = table_comments.get(table_name)
+            if table_comment is not None:
+                table_q = self._quote_identifier(table_name)
+                table_comment_q = self._quote_literal(table_comment)
+                statements.append(f"COMMENT ON TABLE {owner_q}.{table_q} IS {table_comment_q};")
+            statements_by_table[table_name] = statements
+        return statements_by_table
 
-    def _extract_table_indexes(self, cursor: "oracledb.Cursor", db_object: DbObject) -> list[str]:
-        object_types = {item.upper() for item in self.scope_config.object_types}
-        if "INDEX" not in object_types:
-            return []
+    def _fetch_table_comments(
+        self,
+        cursor: "oracledb.Cursor",
+        owner: str,
+        table_names: list[str],
+    ) -> dict[str, list[str]]:
+        column_rows: list[tuple[Any, ...]] = []
+        table_rows: list[tuple[Any, ...]] = []
+        for start in range(0, len(table_names), self._bulk_chunk_size):
+            chunk = table_names[start : start + self._bulk_chunk_size]
+            names = name_list(cursor, chunk)
+            cursor.execute(COLUMN_COMMENTS_SQL, [owner, names])
+            column_rows.extend(cursor.fetchall())
+            cursor.execute(TABLE_COMMENTS_SQL, [owner, names])
+            table_rows.extend(cursor.fetchall())
+        return self._comment_statements(owner, table_names, column_rows, table_rows)
 
-        index_objects: list[DbObject] = []
-        cursor.execute(
-            """
-            SELECT OWNER, INDEX_NAME
-            FROM ALL_INDEXES
-            WHERE TABLE_OWNER = :1
-              AND TABLE_NAME = :2
-              AND GENERATED = 'N'
-            ORDER BY OWNER, INDEX_NAME
-            """,
-            [db_object.owner, db_object.object_name],
-        )
-        for index_owner, index_name in cursor.fetchall():
-            index_objects.append(
+    def _prefetch_table_comments(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+    ) -> dict[tuple[str, str, str], list[str]]:
+        tables_by_owner: dict[str, list[str]] = {}
+        for db_object in objects:
+            if db_object.object_type == "TABLE":
+                tables_by_owner.setdefault(db_object.owner, []).append(db_object.object_name)
+
+        prefetched: dict[tuple[str, str, str], list[str]] = {}
+        for owner, table_names in tables_by_owner.items():
+            try:
+                by_table = self._fetch_table_comments(cursor, owner, table_names)
+            except Exception as exc:
+                # 실패 시 테이블별 조회로 되돌아간다.
+                self.logger.warning("Batched comment extraction failed for %s: %s", owner, exc)
+                continue
+            for table_name, statements in by_table.items():
+                prefetched[(owner, "TABLE", table_name)] = statements
+        return prefetched
+
+    def _extract_table_comments(self, cursor: "oracledb.Cursor", db_object: DbObject) -> list[str]:
+        by_table = self._fetch_table_comments(cursor, db_object.owner, [db_object.object_name])
+        return by_table.get(db_object.object_name, [])
+
+    @staticmethod
+    def _group_index_rows(
+        rows: list[tuple[Any, ...]],
+        indexes_by_table: dict[str, list[DbObject]],
+    ) -> None:
+        for table_name, index_owner, index_name in rows:
+            indexes_by_table.setdefault(str(table_name), []).append(
                 DbObject(
                     owner=str(index_owner).upper(),
                     object_type="INDEX",
@@ -308,87 +1272,568 @@ class OracleMetadataExtractor:
                 )
             )
 
-        if not index_objects:
+    def _fetch_table_indexes(
+        self,
+        cursor: "oracledb.Cursor",
+        owner: str,
+        table_names: list[str],
+    ) -> dict[str, list[DbObject]]:
+        indexes_by_table: dict[str, list[DbObject]] = {}
+        for start in range(0, len(table_names), self._bulk_chunk_size):
+            chunk = table_names[start : start + self._bulk_chunk_size]
+            cursor.execute(TABLE_INDEXES_SQL, [owner, name_list(cursor, chunk)])
+            self._group_index_rows(cursor.fetchall(), indexes_by_table)
+        return indexes_by_table
+
+    def _index_statements(
+        self,
+        cursor: "oracledb.Cursor",
+        indexes_by_table: dict[tuple[str, str, str], list[DbObject]],
+    ) -> dict[tuple[str, str, str], list[str]]:
+        all_indexes = [index for indexes in indexes_by_table.values() for index in indexes]
+        bulk_errors: dict[tuple[str, str, str], BaseException] = {}
+        bulk_ddls, _ = self._extract_ddl_bulk(cursor, all_indexes, errors=bulk_errors)
+
+        statements_by_table: dict[tuple[str, str, str], list[str]] = {}
+        for table_key, index_objects in indexes_by_table.items():
+            statements: list[str] = []
+            for index_object in index_objects:
+                index_key = self._object_key(index_object)
+                ddl = bulk_ddls.get(index_key)
+                if ddl is None:
+                    try:
+                        if index_key in bulk_errors:
+                            raise bulk_errors[index_key]
+                        ddl = self._extract_ddl(cursor, index_object)
+                    except Exception as exc:  # pragma: no cover - integration path.
+                        self.logger.warning(
+                            "INDEX extraction failed for %s.%s (table=%s.%s): %s",
+                            index_object.owner,
+                            index_object.object_name,
+                            table_key[0],
+                            table_key[2],
+                            exc,
+                        )
+                        continue
+                statements.append(ddl.strip())
+            statements_by_table[table_key] = statements
+        return statements_by_table
+
+    def _prefetch_table_indexes(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+    ) -> dict[tuple[str, str, str], list[str]]:
+        object_types = {item.upper() for item in self.scope_config.object_types}
+        if "INDEX" not in object_types:
+            return {}
+
+        tables_by_owner: dict[str, list[str]] = {}
+        for db_object in objects:
+            if db_object.object_type == "TABLE":
+                tables_by_owner.setdefault(db_object.owner, []).append(db_object.object_name)
+
+        indexes_by_table: dict[tuple[str, str, str], list[DbObject]] = {}
+        for owner, table_names in tables_by_owner.items():
+            try:
+                by_table = self._fetch_table_indexes(cursor, owner, table_names)
+            except Exception as exc:
+                # 실패 시 테이블별 조회로 되돌아간다.
+                self.logger.warning("Batched index discovery failed for %s: %s", owner, exc)
+                continue
+            for table_name in table_names:
+                indexes_by_table[(owner, "TABLE", table_name)] = by_table.get(table_name, [])
+
+        # 인덱스 DDL은 전체 테이블 대상으로 한 번에 벌크 조회한 뒤 테이블별로 재조립한다.
+        return self._index_statements(cursor, indexes_by_table)
+
+    def _extract_table_indexes(self, cursor: "oracledb.Cursor", db_object: DbObject) -> list[str]:
+        object_types = {item.upper() for item in self.scope_config.object_types}
+        if "INDEX" not in object_types:
             return []
 
-        statements: list[str] = []
-        bulk_ddls, _ = self._extract_ddl_bulk(cursor, index_objects)
-        for index_object in index_objects:
-            key = self._object_key(index_object)
-            ddl = bulk_ddls.get(key)
-            if ddl is None:
-                try:
-                    ddl = self._extract_ddl(cursor, index_object)
-                except Exception as exc:  # pragma: no cover - integration path.
-                    self.logger.warning(
-                        "INDEX extraction failed for %s.%s (table=%s.%s): %s",
-                        index_object.owner,
-                        index_object.object_name,
-                        db_object.owner,
-                        db_object.object_name,
-                        exc,
-                    )
-                    continue
-            statements.append(ddl.strip())
-        return statements
+        key = self._object_key(db_object)
+        by_table = self._fetch_table_indexes(cursor, db_object.owner, [db_object.object_name])
+        indexes = {key: by_table.get(db_object.object_name, [])}
+        return self._index_statements(cursor, indexes)[key]
 
     def _extract_table_bundle_ddl(
         self,
         cursor: "oracledb.Cursor",
         db_object: DbObject,
         base_ddl: str | None = None,
+        comments: list[str] | None = None,
+        indexes: list[str] | None = None,
     ) -> str:
         base_ddl = (base_ddl if base_ddl is not None else self._extract_ddl(cursor, db_object)).strip()
-        comments = self._extract_table_comments(cursor, db_object)
-        indexes = self._extract_table_indexes(cursor, db_object)
+        if comments is None:
+            comments = self._extract_table_comments(cursor, db_object)
+        if indexes is None:
+            indexes = self._extract_table_indexes(cursor, db_object)
+        return self._assemble_table_bundle(base_ddl, comments, indexes)
 
-        sections: list[str] = [base_ddl]
+    @staticmethod
+    def _assemble_table_bundle(base_ddl: str, comments: list[str], indexes: list[str]) -> str:
+        sections: list[str] = [base_ddl.strip()]
         if comments:
             sections.append("\n".join(comments))
         if indexes:
             sections.append("\n\n".join(indexes))
         return "\n\n".join(section for section in sections if section).strip() + "\n"
 
-    def extract(self) -> ExtractionResult:
-        self._require_driver()
+    def _fetch_audit_events(
+        self,
+        cursor: "oracledb.Cursor",
+        audit_table: str,
+        after_audit_id: int,
+    ) -> tuple[int, list[tuple[str, str, str]]]:
+        table = validate_audit_table_name(audit_table)
+        cursor.execute(
+            f"""
+            SELECT AUDIT_ID, SYSEVENT, OBJ_OWNER, OBJ_TYPE, OBJ_NAME
+            FROM {table}
+            WHERE AUDIT_ID > :1
+            ORDER BY AUDIT_ID
+            """,
+            [after_audit_id],
+        )
+        max_audit_id = after_audit_id
+        events: list[tuple[str, str, str]] = []
+        for audit_id, sysevent, obj_owner, obj_type, obj_name in cursor.fetchall():
+            max_audit_id = max(max_audit_id, int(audit_id))
+            if str(sysevent or "").upper() in AUDIT_IGNORED_EVENTS:
+                continue
+            if not obj_owner or not obj_type or not obj_name:
+                continue
+            events.append((str(obj_owner).upper(), str(obj_type).upper(), str(obj_name)))
+        return max_audit_id, events
 
-        items: list[ExtractedDdl] = []
-        failures: list[str] = []
+    def _current_audit_id(self, cursor: "oracledb.Cursor", audit_table: str) -> int:
+        table = validate_audit_table_name(audit_table)
+        cursor.execute(f"SELECT NVL(MAX(AUDIT_ID), 0) FROM {table}", [])
+        row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
 
-        connection = oracledb.connect(
+    def _resolve_index_tables(
+        self,
+        cursor: "oracledb.Cursor",
+        index_keys: set[tuple[str, str, str]],
+    ) -> dict[tuple[str, str, str], tuple[str, str]]:
+        by_owner: dict[str, list[str]] = {}
+        for owner, _, name in sorted(index_keys):
+            by_owner.setdefault(owner, []).append(name)
+
+        resolved: dict[tuple[str, str, str], tuple[str, str]] = {}
+        for owner, names in by_owner.items():
+            for start in range(0, len(names), self._bulk_chunk_size):
+                chunk = names[start : start + self._bulk_chunk_size]
+                cursor.execute(INDEX_TABLES_SQL, [owner, name_list(cursor, chunk)])
+                for index_name, table_owner, table_name in cursor.fetchall():
+                    resolved[(owner, "INDEX", str(index_name))] = (
+                        str(table_owner).upper(),
+                        str(table_name),
+                    )
+        return resolved
+
+    def _resolve_audit_targets(
+        self,
+        cursor: "oracledb.Cursor",
+        events: list[tuple[str, str, str]],
+    ) -> tuple[set[tuple[str, str, str]], set[str]]:
+        bundle_table_related = self._should_bundle_table_related()
+        targets: set[tuple[str, str, str]] = set()
+        index_keys: set[tuple[str, str, str]] = set()
+        for owner, object_type, object_name in events:
+            if object_type in {"COMMENT", "COLUMN"}:
+                # COMMENT ON COLUMN은 "TABLE.COLUMN" 형태로 기록될 수 있다.
+                targets.add((owner, "TABLE", object_name.split(".", 1)[0]))
+                continue
+            if object_type == "INDEX" and bundle_table_related:
+                index_keys.add((owner, object_type, object_name))
+                continue
+            targets.add((owner, object_type, object_name))
+            for related_type in AUDIT_RELATED_TYPES.get(object_type, ()):
+                targets.add((owner, related_type, object_name))
+
+        sweep_owners: set[str] = set()
+        if index_keys:
+            resolved = self._resolve_index_tables(cursor, index_keys)
+            for index_key in sorted(index_keys):
+                table = resolved.get(index_key)
+                if table is None:
+                    # 삭제된 인덱스는 소유 테이블을 알 수 없으므로 해당 스키마 테이블 워터마크를 재확인한다.
+                    sweep_owners.add(index_key[0])
+                    continue
+                targets.add((table[0], "TABLE", table[1]))
+        return targets, sweep_owners
+
+    def _cursor(self, connection: Any) -> Any:
+        return configure_cursor(connection.cursor(), self.oracle_config)
+
+    def _connect(self) -> "oracledb.Connection":
+        return oracledb.connect(
             user=self.oracle_config.username,
             password=self.oracle_config.password,
             dsn=self.oracle_config.dsn,
+            stmtcachesize=self.oracle_config.statement_cache_size,
         )
 
+    def _init_session(self, connection: "oracledb.Connection", requested_tag: str | None) -> None:
+        self._configure_transform(self._cursor(connection))
+
+    def _create_pool(self) -> "oracledb.ConnectionPool":
+        workers = self.oracle_config.workers
+        return oracledb.create_pool(
+            user=self.oracle_config.username,
+            password=self.oracle_config.password,
+            dsn=self.oracle_config.dsn,
+            min=1,
+            # 탐색용 세션 1개 + 작업 스레드별 세션.
+            max=workers + 1,
+            increment=1,
+            stmtcachesize=self.oracle_config.statement_cache_size,
+            session_callback=self._init_session,
+        )
+
+    @contextmanager
+    def _session(self) -> Iterator[tuple["oracledb.Cursor", "oracledb.ConnectionPool | None"]]:
+        if self._held_session is not None:
+            yield self._held_session
+            return
+        with self._open_session() as session:
+            yield session
+
+    @contextmanager
+    def hold_session(self) -> Iterator[None]:
+        """블록 안의 extract/감사 조회가 같은 세션(풀)을 재사용하게 한다(`orasnap watch`)."""
+        self._require_driver()
+        with self._open_session() as session:
+            self._held_session = session
+            try:
+                yield
+            finally:
+                self._held_session = None
+                self._registered_alerts.clear()
+
+    def poll_audit_id(self, audit_table: str) -> int:
+        with self._session() as (cursor, _):
+            return self._current_audit_id(cursor, audit_table)
+
+    def wait_for_alert(self, alert_name: str, timeout_seconds: float) -> bool:
+        """DBMS_ALERT 신호를 최대 timeout 동안 기다린다. 신호를 받으면 True."""
+        with self._session() as (cursor, _):
+            if alert_name not in self._registered_alerts:
+                cursor.execute(ALERT_REGISTER_SQL, [alert_name])
+                self._registered_alerts.add(alert_name)
+            message = cursor.var(str)
+            status = cursor.var(int)
+            cursor.execute(
+                ALERT_WAIT_SQL,
+                [alert_name, message, status, max(0, int(round(timeout_seconds)))],
+            )
+            return status.getvalue() == 0
+
+    @contextmanager
+    def _open_session(self) -> Iterator[tuple["oracledb.Cursor", "oracledb.ConnectionPool | None"]]:
+        if self.oracle_config.workers <= 1:
+            connection = self._connect()
+            try:
+                cursor = self._cursor(connection)
+                self._configure_transform(cursor)
+                yield cursor, None
+            finally:
+                connection.close()
+            return
+
+        pool = self._create_pool()
         try:
-            cursor = connection.cursor()
-            self._configure_transform(cursor)
-            objects = self._discover_objects(cursor)
-            self.logger.info("Discovered %s objects.", len(objects))
-
-            bulk_ddls, _ = self._extract_ddl_bulk(cursor, objects)
-            total_objects = len(objects)
-            for index, db_object in enumerate(objects, start=1):
-                try:
-                    key = self._object_key(db_object)
-                    base_ddl = bulk_ddls.get(key)
-                    if base_ddl is None:
-                        base_ddl = self._extract_ddl(cursor, db_object)
-                    if db_object.object_type == "TABLE":
-                        ddl = self._extract_table_bundle_ddl(cursor, db_object, base_ddl=base_ddl)
-                    else:
-                        ddl = base_ddl
-                    items.append(ExtractedDdl(db_object=db_object, ddl=ddl))
-                except Exception as exc:  # pragma: no cover - integration path.
-                    message = (
-                        f"{db_object.owner}.{db_object.object_type}.{db_object.object_name}: {exc}"
-                    )
-                    failures.append(message)
-                    self.logger.warning("DDL extraction failed: %s", message)
-                if index % 50 == 0 or index == total_objects:
-                    self.logger.info("Extraction progress: %s/%s", index, total_objects)
+            with pool.acquire() as connection:
+                yield self._cursor(connection), pool
         finally:
-            connection.close()
+            pool.close(force=True)
+
+    def _chunk_objects(self, objects: list[DbObject], chunk_size: int) -> list[list[DbObject]]:
+        grouped: dict[tuple[str, str], list[DbObject]] = {}
+        for db_object in objects:
+            grouped.setdefault((db_object.owner, db_object.object_type), []).append(db_object)
+        chunks: list[list[DbObject]] = []
+        for group in grouped.values():
+            for start in range(0, len(group), chunk_size):
+                chunks.append(group[start : start + chunk_size])
+        return chunks
+
+    def _parallel_chunk_size(self, object_count: int) -> int:
+        # 작업자 수보다 청크가 적으면 세션이 놀게 되므로 청크를 작게 나눈다(최소 50).
+        per_worker = -(-object_count // (self.oracle_config.workers * 4))
+        return max(min(self._bulk_chunk_size, 50), min(self._bulk_chunk_size, per_worker))
+
+    def _extract_chunk(
+        self,
+        pool: "oracledb.ConnectionPool",
+        chunk: list[DbObject],
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        with pool.acquire() as connection:
+            return self._extract_objects(self._cursor(connection), chunk, report_progress=False)
+
+    def _chunk_failures(self, chunk: list[DbObject], exc: BaseException) -> list[str]:
+        self.logger.warning(
+            "Chunk extraction failed for %s.%s (size=%s): %s",
+            chunk[0].owner,
+            chunk[0].object_type,
+            len(chunk),
+            exc,
+        )
+        self.metrics.record_failed(chunk[0].object_type, len(chunk), code=error_code(exc))
+        return [f"{item.owner}.{item.object_type}.{item.object_name}: {exc}" for item in chunk]
+
+    def _extract_parallel(
+        self,
+        pool: "oracledb.ConnectionPool",
+        chunks: list[list[DbObject]],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        total_objects = sum(len(chunk) for chunk in chunks)
+        workers = min(self.oracle_config.workers, len(chunks))
+        self.logger.info("Parallel extraction: chunks=%s workers=%s", len(chunks), workers)
+
+        items: list[ExtractedDdl] = []
+        failures: list[str] = []
+        done = 0
+
+        def collect(chunk: list[DbObject], future: Any) -> None:
+            nonlocal done
+            try:
+                chunk_items, chunk_failures = future.result()
+            except Exception as exc:  # pragma: no cover - integration path.
+                chunk_items, chunk_failures = [], self._chunk_failures(chunk, exc)
+            if sink is None:
+                items.extend(chunk_items)
+            else:
+                for item in chunk_items:
+                    sink(item)
+            failures.extend(chunk_failures)
+            done += len(chunk)
+            self.logger.info("Extraction progress: %s/%s", done, total_objects)
+
+        # 완료됐지만 아직 수집하지 않은 청크가 쌓이지 않도록 제출 개수를 작업자 수의 2배로 제한한다.
+        window = workers * 2
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="orasnap-extract") as executor:
+            pending: deque[tuple[list[DbObject], Any]] = deque()
+            # 제출 순서대로 수집해서 결과 순서를 직렬 실행과 동일하게 유지한다.
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(self._extract_chunk, pool, chunk)))
+                if len(pending) >= window:
+                    collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+        return items, failures
 
-        return ExtractionResult(items=items, failures=failures)
+    def _extract_serial(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        items: list[ExtractedDdl] = []
+        failures: list[str] = []
+        total_objects = len(objects)
+        done = 0
+        # 청크마다 벌크 조회 결과를 버리므로 메모리 사용량이 전체 객체 수와 무관하다.
+        for chunk in self._chunk_objects(objects, self._bulk_chunk_size):
+            chunk_items, chunk_failures = self._extract_objects(
+                cursor, chunk, report_progress=False, sink=sink
+            )
+            items.extend(chunk_items)
+            failures.extend(chunk_failures)
+            done += len(chunk)
+            self.logger.info("Extraction progress: %s/%s", done, total_objects)
+        return items, failures
+
+    def _run_extraction(
+        self,
+        cursor: "oracledb.Cursor",
+        pool: "oracledb.ConnectionPool | None",
+        objects: list[DbObject],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        if pool is None:
+            return self._extract_serial(cursor, objects, sink=sink)
+        chunks = self._chunk_objects(objects, self._parallel_chunk_size(len(objects)))
+        if len(chunks) <= 1:
+            return self._extract_serial(cursor, objects, sink=sink)
+        return self._extract_parallel(pool, chunks, sink=sink)
+
+    def _extract_all(
+        self,
+        cursor: "oracledb.Cursor",
+        pool: "oracledb.ConnectionPool | None",
+        objects: list[DbObject],
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        source_objects = [item for item in objects if self._uses_source(item.object_type)]
+        dictionary_objects = [item for item in objects if self._uses_dictionary(item.object_type)]
+        if not source_objects and not dictionary_objects:
+            return self._run_extraction(cursor, pool, objects, sink=sink)
+        items: list[ExtractedDdl] = []
+        emit = items.append if sink is None else sink
+        fallback = self._extract_source(cursor, source_objects, emit)
+        fallback.extend(self._extract_dictionary(cursor, dictionary_objects, emit))
+        remaining = [
+            item
+            for item in objects
+            if not self._uses_source(item.object_type) and not self._uses_dictionary(item.object_type)
+        ]
+        other_items, failures = self._run_extraction(cursor, pool, remaining + fallback, sink=sink)
+        return items + other_items, failures
+
+    def _extract_objects(
+        self,
+        cursor: "oracledb.Cursor",
+        objects: list[DbObject],
+        report_progress: bool = True,
+        sink: ItemSink | None = None,
+    ) -> tuple[list[ExtractedDdl], list[str]]:
+        items: list[ExtractedDdl] = []
+        failures: list[str] = []
+
+        bulk_errors: dict[tuple[str, str, str], BaseException] = {}
+        bulk_ddls, _ = self._extract_ddl_bulk(cursor, objects, errors=bulk_errors)
+        table_comments = self._prefetch_table_comments(cursor, objects)
+        table_indexes = self._prefetch_table_indexes(cursor, objects)
+        total_objects = len(objects)
+        for index, db_object in enumerate(objects, start=1):
+            try:
+                key = self._object_key(db_object)
+                base_ddl = bulk_ddls.get(key)
+                if base_ddl is None:
+                    if key in bulk_errors:
+                        raise bulk_errors[key]
+                    base_ddl = self._extract_ddl(cursor, db_object)
+                if db_object.object_type == "TABLE":
+                    ddl = self._extract_table_bundle_ddl(
+                        cursor,
+                        db_object,
+                        base_ddl=base_ddl,
+                        comments=table_comments.get(key),
+                        indexes=table_indexes.get(key),
+                    )
+                else:
+                    ddl = base_ddl
+            except Exception as exc:  # pragma: no cover - integration path.
+                message = f"{db_object.owner}.{db_object.object_type}.{db_object.object_name}: {exc}"
+                failures.append(message)
+                self.metrics.record_failed(db_object.object_type, code=error_code(exc))
+                self.logger.warning("DDL extraction failed: %s", message)
+            else:
+                self.metrics.record_extracted(db_object.object_type)
+                item = ExtractedDdl(db_object=db_object, ddl=ddl)
+                if sink is None:
+                    items.append(item)
+                else:
+                    sink(item)
+            if report_progress and (index % 50 == 0 or index == total_objects):
+                self.logger.info("Extraction progress: %s/%s", index, total_objects)
+        return items, failures
+
+    def extract(
+        self,
+        reusable: Callable[[DbObject], bool] | None = None,
+        audit_table: str | None = None,
+        sink: ItemSink | None = None,
+        known_hashes: KnownHash | None = None,
+        on_targets: Callable[[int], None] | None = None,
+    ) -> ExtractionResult:
+        self._require_driver()
+
+        reused: list[DbObject] = []
+        audit_id: int | None = None
+
+        with self._session() as (cursor, pool):
+            if audit_table is not None:
+                # 추출 도중 발생한 DDL은 다음 실행에서 다시 반영되도록 시작 시점 워터마크를 기록한다.
+                audit_id = self._current_audit_id(cursor, audit_table)
+            discovered = self._discover_objects(cursor)
+            self.logger.info("Discovered %s objects.", len(discovered))
+
+            objects = discovered
+            if reusable is not None:
+                objects = []
+                for db_object in discovered:
+                    if reusable(db_object):
+                        reused.append(db_object)
+                    else:
+                        objects.append(db_object)
+                self.logger.info(
+                    "Incremental extraction: changed=%s reused=%s",
+                    len(objects),
+                    len(reused),
+                )
+            if known_hashes is not None and objects:
+                objects, unchanged = self._filter_unchanged_by_hash(cursor, objects, known_hashes)
+                reused.extend(unchanged)
+            if on_targets is not None:
+                on_targets(len(objects))
+
+            items, failures = self._extract_all(cursor, pool, objects, sink=sink)
+
+        return ExtractionResult(items=items, failures=failures, reused=reused, audit_id=audit_id)
+
+    def extract_audit_changes(
+        self,
+        audit_table: str,
+        after_audit_id: int,
+        reusable: Callable[[DbObject], bool] | None = None,
+        extra_targets: list[DbObject] | None = None,
+        sink: ItemSink | None = None,
+        known_hashes: KnownHash | None = None,
+        on_targets: Callable[[int], None] | None = None,
+    ) -> ExtractionResult:
+        self._require_driver()
+
+        with self._session() as (cursor, pool):
+            audit_id, events = self._fetch_audit_events(cursor, audit_table, after_audit_id)
+            target_keys, sweep_owners = self._resolve_audit_targets(cursor, events)
+            target_keys.update(self._object_key(item) for item in extra_targets or [])
+            self.logger.info(
+                "Audit refresh: audit_id=%s->%s events=%s targets=%s sweep_owners=%s",
+                after_audit_id,
+                audit_id,
+                len(events),
+                len(target_keys),
+                sorted(sweep_owners),
+            )
+            if not target_keys and not sweep_owners:
+                return ExtractionResult(items=[], failures=[], targets=[], audit_id=audit_id)
+
+            owners = sorted({key[0] for key in target_keys} | sweep_owners)
+            objects: list[DbObject] = []
+            reused: list[DbObject] = []
+            for db_object in self._discover_objects(cursor, owners=owners):
+                if self._object_key(db_object) in target_keys:
+                    objects.append(db_object)
+                elif db_object.object_type == "TABLE" and db_object.owner in sweep_owners:
+                    if reusable is not None and reusable(db_object):
+                        reused.append(db_object)
+                    else:
+                        objects.append(db_object)
+            if known_hashes is not None and objects:
+                # 같은 내용으로 다시 CREATE OR REPLACE한 객체(배포 스크립트 재실행 등)는 본문을 받지 않는다.
+                objects, unchanged = self._filter_unchanged_by_hash(cursor, objects, known_hashes)
+                reused.extend(unchanged)
+            if on_targets is not None:
+                on_targets(len(objects))
+
+            items, failures = self._extract_all(cursor, pool, objects, sink=sink)
+
+        decided_keys = target_keys | {self._object_key(item) for item in objects}
+        targets = [
+            DbObject(owner=owner, object_type=object_type, object_name=object_name)
+            for owner, object_type, object_name in sorted(decided_keys)
+        ]
+        return ExtractionResult(
+            items=items,
+            failures=failures,
+            reused=reused,
+            targets=targets,
+            audit_id=audit_id,
+        )
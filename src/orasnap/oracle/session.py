@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import inspect
+import threading
+import weakref
+from typing import Any
+
+from orasnap.config import OracleConfig
+
+try:
+    import oracledb
+except ImportError:  # pragma: no cover - covered by runtime integration.
+    oracledb = None
+
+# 이 접미사로 끝나는 CLOB 컬럼은 크기 제한을 넘은 값이므로 로케이터 그대로 받는다.
+LOB_COLUMN_SUFFIX = "_LOB"
+# 객체 이름 목록은 이 컬렉션 하나로 바인드해서(`TABLE(:n)`) 청크 길이와 무관하게 SQL 텍스트를 고정한다.
+NAME_LIST_TYPE = "SYS.ODCIVARCHAR2LIST"
+
+# gettype은 왕복이 필요하므로 커넥션별로 한 번만 조회한다.
+_name_list_types: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+_name_list_lock = threading.Lock()
+
+
+def split_lob_columns(expression: str, alias: str, inline_max: int) -> str:
+    """CLOB 식을 `<alias>`(문자열로 fetch)와 `<alias>_LOB`(청크 스트리밍) 두 컬럼으로 나눈다."""
+    length = f"DBMS_LOB.GETLENGTH({expression})"
+    return (
+        f"CASE WHEN {length} <= {int(inline_max)} THEN {expression} END AS {alias}, "
+        f"CASE WHEN {length} > {int(inline_max)} THEN {expression} END AS {alias}{LOB_COLUMN_SUFFIX}"
+    )
+
+
+def first_value(values: Any) -> Any:
+    """split_lob_columns로 나눈 컬럼 중 값이 있는 쪽을 돌려준다."""
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _lob_as_string(cursor: Any, metadata: Any) -> Any:
+    if metadata.name.upper().endswith(LOB_COLUMN_SUFFIX):
+        return None
+    if metadata.type_code is oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    if metadata.type_code is oracledb.DB_TYPE_NCLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG_NVARCHAR, arraysize=cursor.arraysize)
+    return None
+
+
+def configure_cursor(cursor: Any, oracle_config: OracleConfig, arraysize: int | None = None) -> Any:
+    """행 단위 LOB 왕복을 없애도록 CLOB을 문자열로 받고 fetch 배치 크기를 맞춘다."""
+    cursor.arraysize = arraysize or oracle_config.arraysize
+    cursor.prefetchrows = max(oracle_config.prefetch_rows, 0)
+    if oracledb is not None:
+        cursor.outputtypehandler = _lob_as_string
+    return cursor
+
+
+def _cached_name_list_type(connection: Any) -> Any:
+    with _name_list_lock:
+        return _name_list_types.get(connection)
+
+
+def _store_name_list_type(connection: Any, list_type: Any) -> Any:
+    with _name_list_lock:
+        _name_list_types[connection] = list_type
+    return list_type
+
+
+def name_list(cursor: Any, names: list[str]) -> Any:
+    """이름 목록을 `NAME_LIST_TYPE` 컬렉션 바인드 값으로 만든다."""
+    connection = cursor.connection
+    list_type = _cached_name_list_type(connection)
+    if list_type is None:
+        list_type = _store_name_list_type(connection, connection.gettype(NAME_LIST_TYPE))
+    return list_type.newobject(list(names))
+
+
+async def name_list_async(cursor: Any, names: list[str]) -> Any:
+    connection = cursor.connection
+    list_type = _cached_name_list_type(connection)
+    if list_type is None:
+        list_type = _store_name_list_type(connection, await connection.gettype(NAME_LIST_TYPE))
+    return list_type.newobject(list(names))
+
+
+def read_lob(value: Any, chunk_size: int) -> str:
+    if not hasattr(value, "read"):
+        return str(value)
+    # 큰 LOB은 고정 크기로 나눠 읽어서 드라이버 버퍼가 값 전체 크기로 커지지 않게 한다.
+    parts: list[str] = []
+    offset = 1
+    while True:
+        chunk = value.read(offset, chunk_size)
+        if not chunk:
+            break
+        parts.append(chunk)
+        offset += len(chunk)
+        if len(chunk) < chunk_size:
+            break
+    return "".join(parts)
+
+
+async def read_lob_async(value: Any, chunk_size: int) -> str:
+    if not hasattr(value, "read"):
+        return str(value)
+    parts: list[str] = []
+    offset = 1
+    while True:
+        chunk = value.read(offset, chunk_size)
+        if inspect.isawaitable(chunk):
+            chunk = await chunk
+        if not chunk:
+            break
+        parts.append(chunk)
+        offset += len(chunk)
+        if len(chunk) < chunk_size:
+            break
+    return "".join(parts)
@@ -1,18 +1,42 @@
 from __future__ import annotations
 
+import json
 import logging
-from dataclasses import dataclass
+import signal
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 from pathlib import Path
 from time import perf_counter
 
-from orasnap.config import AppConfig, load_config
-from orasnap.models import SnapshotEntry
+from orasnap.config import AppConfig, ConfigError, load_config
+from orasnap.metrics import RunMetrics
+from orasnap.models import DbObject, ExtractedDdl, GitResult, SnapshotEntry, WriteResult
 from orasnap.normalize.ddl_normalizer import DdlNormalizer
+from orasnap.oracle.async_extractor import AsyncOracleMetadataExtractor
 from orasnap.oracle.audit_exporter import AuditExportResult, OracleAuditExporter
 from orasnap.oracle.extractor import OracleMetadataExtractor
+from orasnap.store.journal import ExtractionJournal
+from orasnap.store.object_manifest import ObjectManifest, content_hash
+from orasnap.store.raw_cache import RawDdlCache
 from orasnap.store.writer import SnapshotWriter
+from orasnap.streaming import BoundedStream
 from orasnap.vcs.git_ops import GitOps
+from orasnap.watch import SnapshotWatcher, WatchSummary
+
+
+@dataclass(frozen=True)
+class PendingCommit:
+    added_files: list[Path]
+    modified_files: list[Path]
+    deleted_files: list[Path]
+    # add 백엔드(또는 직전 실행이 커밋 전에 끝난 경우)에서 git add할 경로.
+    stage_paths: list[Path]
 
 
 @dataclass(frozen=True)
@@ -28,9 +52,17 @@ class SnapshotRunResult:
     pushed: bool
     failures: list[str]
     log_file: Path | None
+    # 단계별 소요 시간(초). 추출/쓰기는 겹쳐 실행되므로 write는 추출 종료 이후 남은 시간이다.
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    metrics_file: Path | None = None
+    # 이번 실행까지 반영한 DDL_AUDIT_LOG AUDIT_ID(감사 워터마크를 기록한 실행만).
+    audit_id: int | None = None
+    # defer_git로 실행하면 커밋하지 않고 커밋할 변경 목록을 돌려준다(fan-out이 모아서 커밋).
+    pending_commit: PendingCommit | None = None
 
 
 MAX_COMMIT_MESSAGE_FILES = 30
+STREAM_QUEUE_SIZE = 64
 
 
 def _to_repo_relative_path(path: Path, repo_path: Path) -> str:
@@ -48,12 +80,15 @@ def _build_commit_message(
     added_files: list[Path],
     modified_files: list[Path],
     deleted_files: list[Path],
+    target: str | None = None,
 ) -> str:
     timestamp = datetime.now().astimezone().isoformat(timespec="seconds")
     try:
-        base = template.format(timestamp=timestamp)
+        base = template.format(timestamp=timestamp, target=target or "")
     except KeyError:
         base = f"snapshot: {timestamp}"
+    if target and "{target}" not in template:
+        base = f"{base} [{target}]"
 
     changed_lines: list[str] = []
     for path in added_files:
@@ -76,7 +111,62 @@ def _build_commit_message(
     return subject + "\n" + "\n".join(body)
 
 
-def _resolve_logs_dir(config_path: Path) -> Path:
+def commit_snapshot(
+    git_ops: GitOps,
+    config: AppConfig,
+    pending: list[PendingCommit],
+    use_plumbing: bool,
+    target: str | None = None,
+) -> GitResult:
+    """여러 실행의 변경 목록을 한 커밋으로 묶는다. 같은 저장소를 쓰는 실행은 같은 git 설정을 쓴다."""
+    added = [path for item in pending for path in item.added_files]
+    modified = [path for item in pending for path in item.modified_files]
+    deleted = [path for item in pending for path in item.deleted_files]
+    message = _build_commit_message(
+        template=config.git.commit_message_template,
+        repo_path=config.git.repo_path,
+        added_files=added,
+        modified_files=modified,
+        deleted_files=deleted,
+        target=target,
+    )
+    if use_plumbing:
+        return git_ops.commit_changes(
+            changed_files=[*added, *modified],
+            deleted_files=deleted,
+            message=message,
+            auto_push=config.git.auto_push,
+            branch=config.git.branch,
+            remote=config.git.remote,
+        )
+    stage_paths = list(dict.fromkeys(path for item in pending for path in item.stage_paths))
+    return git_ops.commit_if_changed(
+        paths=stage_paths,
+        message=message,
+        auto_push=config.git.auto_push,
+        branch=config.git.branch,
+        remote=config.git.remote,
+    )
+
+
+def _journal_scope_key(config: AppConfig) -> str:
+    # 접속 대상/추출 범위가 바뀌면 저널의 DDL을 재사용하지 않는다.
+    scope = config.scope
+    return content_hash(
+        json.dumps(
+            [
+                config.oracle.dsn,
+                config.oracle.username.upper(),
+                scope.include_schemas,
+                scope.exclude_schemas,
+                scope.object_types,
+                sorted(scope.type_strategies.items()),
+            ]
+        )
+    )
+
+
+def resolve_logs_dir(config_path: Path) -> Path:
     config_path = config_path.resolve()
     config_parent = config_path.parent
     if config_parent.name.lower() == "config":
@@ -84,7 +174,7 @@ def _resolve_logs_dir(config_path: Path) -> Path:
     return config_parent / "logs"
 
 
-def _resolve_project_root(config_path: Path) -> Path:
+def resolve_project_root(config_path: Path) -> Path:
     config_path = config_path.resolve()
     config_parent = config_path.parent
     if config_parent.name.lower() == "config":
@@ -92,13 +182,20 @@ def _resolve_project_root(config_path: Path) -> Path:
     return config_parent
 
 
-def _resolve_audit_root(config: AppConfig) -> Path:
+def resolve_state_path(configured: str, project_root: Path) -> Path:
+    configured_path = Path(configured)
+    if configured_path.is_absolute():
+        return configured_path
+    return project_root / configured_path
+
+
+def resolve_audit_root(config: AppConfig) -> Path:
     if config.audit.root is not None:
         return config.audit.root
     return config.git.repo_path / "_audit"
 
 
-def _setup_logger(log_file_path: Path) -> logging.Logger:
+def setup_logger(log_file_path: Path, prefix: str | None = None) -> logging.Logger:
     logger = logging.getLogger("orasnap")
 
     for handler in list(logger.handlers):
@@ -111,7 +208,9 @@ def _setup_logger(log_file_path: Path) -> logging.Logger:
     logger.setLevel(logging.INFO)
     logger.propagate = False
 
-    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    # fan-out 실행은 여러 대상이 같은 콘솔에 쓰므로 줄마다 대상 이름을 붙인다.
+    label = f"[{prefix}] " if prefix else ""
+    formatter = logging.Formatter(f"%(asctime)s %(levelname)s {label}%(message)s")
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
@@ -131,7 +230,12 @@ def _purge_old_logs(logs_dir: Path, retention_days: int, logger: logging.Logger)
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
     removed = 0
-    for log_file in logs_dir.glob("orasnap-*.log"):
+    log_files = [
+        *logs_dir.glob("orasnap-*.log"),
+        *logs_dir.glob("orasnap-*.metrics.json"),
+        *logs_dir.glob("orasnap-*.report.json"),
+    ]
+    for log_file in log_files:
         try:
             modified_at = datetime.fromtimestamp(log_file.stat().st_mtime, tz=timezone.utc)
             if modified_at < cutoff:
@@ -143,6 +247,24 @@ def _purge_old_logs(logs_dir: Path, retention_days: int, logger: logging.Logger)
     return removed
 
 
+def create_extractor(
+    config: AppConfig,
+    logger: logging.Logger,
+    metrics: RunMetrics | None = None,
+) -> OracleMetadataExtractor:
+    extractor_class = (
+        AsyncOracleMetadataExtractor
+        if config.extraction.engine == "async"
+        else OracleMetadataExtractor
+    )
+    return extractor_class(
+        oracle_config=config.oracle,
+        scope_config=config.scope,
+        logger=logger,
+        metrics=metrics,
+    )
+
+
 class SnapshotPipeline:
     def __init__(
         self,
@@ -150,42 +272,386 @@ class SnapshotPipeline:
         logger: logging.Logger | None = None,
         log_file: Path | None = None,
         audit_state_path: Path | None = None,
+        manifest_path: Path | None = None,
+        file_manifest_path: Path | None = None,
+        stage_observer: Callable[[str, float], None] | None = None,
+        metrics_path: Path | None = None,
+        extractor: OracleMetadataExtractor | None = None,
+        defer_git: bool = False,
+        journal_path: Path | None = None,
+        resume: bool = False,
+        raw_cache_dir: Path | None = None,
+        target: str | None = None,
     ) -> None:
         self.config = config
         self.logger = logger or logging.getLogger("orasnap")
         self.log_file = log_file
         self.audit_state_path = audit_state_path
+        self.manifest_path = manifest_path
+        self.file_manifest_path = file_manifest_path
+        self.stage_observer = stage_observer
+        self.metrics_path = metrics_path
+        # 주입하면 실행마다 새로 만들지 않고 재사용한다(watch가 세션을 열어 둔 추출기).
+        self.extractor = extractor
+        # fan-out 실행에서는 각 대상이 커밋하지 않고 부모 프로세스가 저장소별로 순서대로 커밋한다.
+        self.defer_git = defer_git
+        # 지정하면 추출 결과를 저널에 남기고, resume이면 직전 중단 실행의 저널을 이어서 쓴다.
+        self.journal_path = journal_path
+        self.resume = resume
+        self.raw_cache_dir = raw_cache_dir
+        # fan-out 대상 이름. 지표 레이블로 남겨 같은 서비스를 여러 대상이 받을 때도 구분한다.
+        self.target = target
+        self.metrics = self._new_metrics()
+        self._stage_seconds: dict[str, float] = {}
+
+    def _new_metrics(self) -> RunMetrics:
+        labels = {"service": self.config.oracle.service_name}
+        if self.target is not None:
+            labels["target"] = self.target
+        return RunMetrics(labels)
+
+    def _finish_stage(self, name: str, started: float) -> float:
+        elapsed = perf_counter() - started
+        self._stage_seconds[name] = elapsed
+        self.metrics.record_stage(name, elapsed)
+        if self.stage_observer is not None:
+            self.stage_observer(name, elapsed)
+        return elapsed
+
+    def _export_metrics(self) -> Path | None:
+        # 지표 기록 실패가 스냅샷 결과를 바꾸지 않도록 경고만 남긴다.
+        metrics_file = None
+        try:
+            if self.metrics_path is not None:
+                self.metrics.write_json(self.metrics_path)
+                metrics_file = self.metrics_path
+            if self.config.logs.prometheus_textfile is not None:
+                self.metrics.write_prometheus(self.config.logs.prometheus_textfile)
+        except OSError as exc:
+            self.logger.warning("Run metrics export failed: %s", exc)
+        return metrics_file
 
     def run(self, dry_run: bool) -> SnapshotRunResult:
-        self.logger.info("Snapshot run started. dry_run=%s", dry_run)
+        return self._measured(self._run, dry_run)
 
-        extraction_started = perf_counter()
-        extractor = OracleMetadataExtractor(
-            oracle_config=self.config.oracle,
-            scope_config=self.config.scope,
-            logger=self.logger,
+    def renormalize(self, dry_run: bool) -> SnapshotRunResult:
+        return self._measured(self._renormalize, dry_run)
+
+    def _measured(
+        self,
+        stage: Callable[[bool], SnapshotRunResult],
+        dry_run: bool,
+    ) -> SnapshotRunResult:
+        self.metrics = self._new_metrics()
+        self.metrics.dry_run = dry_run
+        try:
+            result = stage(dry_run)
+        except BaseException:
+            self.metrics.success = False
+            self._export_metrics()
+            raise
+        self.metrics.success = True
+        return replace(result, metrics_file=self._export_metrics())
+
+    def _prepare_git(self, git_ops: GitOps, dry_run: bool) -> tuple[bool, bool]:
+        """(pending 표시 여부, plumbing 커밋 여부). 직전 실행이 커밋 전에 끝났으면 이번에는 git add로 반영한다."""
+        if self.config.git.commit_backend != "plumbing" or dry_run or self.defer_git:
+            return False, False
+        if git_ops.mark_pending():
+            self.logger.warning(
+                "Previous run did not finish its commit. Staging the snapshot tree with git add."
+            )
+            return True, False
+        return True, True
+
+    def _git_stage(
+        self,
+        git_ops: GitOps,
+        pending_commit: PendingCommit,
+        marked_pending: bool,
+        use_plumbing: bool,
+        target: str | None = None,
+    ) -> GitResult:
+        git_started = perf_counter()
+        git_result = commit_snapshot(
+            git_ops,
+            self.config,
+            [pending_commit],
+            use_plumbing=use_plumbing,
+            target=target,
         )
-        extraction = extractor.extract()
-        extraction_elapsed = perf_counter() - extraction_started
+        if marked_pending:
+            git_ops.clear_pending()
+        self.metrics.git_seconds = dict(git_ops.command_seconds)
+        git_elapsed = self._finish_stage("git", git_started)
         self.logger.info(
-            "Extraction stage finished in %.2fs. extracted=%s failed=%s",
-            extraction_elapsed,
-            len(extraction.items),
-            len(extraction.failures),
+            "Git stage finished in %.2fs. committed=%s pushed=%s",
+            git_elapsed,
+            git_result.committed,
+            git_result.pushed,
+        )
+        return git_result
+
+    def _raw_cache(self, dry_run: bool) -> RawDdlCache | None:
+        if dry_run or self.raw_cache_dir is None or not self.config.extraction.raw_cache:
+            return None
+        return RawDdlCache(self.raw_cache_dir, logger=self.logger)
+
+    def _normalizer(self) -> DdlNormalizer:
+        return DdlNormalizer(
+            line_ending=self.config.output.line_ending,
+            workers=self.config.output.normalize_workers,
+            parallel_threshold=self.config.output.normalize_parallel_threshold,
+            logger=self.logger,
         )
-        normalizer = DdlNormalizer(line_ending=self.config.output.line_ending)
 
-        write_started = perf_counter()
-        entries: list[SnapshotEntry] = []
-        for item in extraction.items:
-            normalized = normalizer.normalize(item.ddl)
-            entries.append(SnapshotEntry(db_object=item.db_object, ddl=normalized))
-
-        writer = SnapshotWriter(snapshot_root=self.config.output.snapshot_root)
-        write_result = writer.write(entries, dry_run=dry_run)
-        write_elapsed = perf_counter() - write_started
+    def _writer(self) -> SnapshotWriter:
+        return SnapshotWriter(
+            snapshot_root=self.config.output.snapshot_root,
+            manifest_path=self.file_manifest_path or Path(self.config.output.manifest_file),
+            verify=self.config.output.verify_manifest,
+            logger=self.logger,
+        )
+
+    def _open_journal(self, dry_run: bool) -> ExtractionJournal | None:
+        if dry_run or self.journal_path is None or not self.config.extraction.journal:
+            return None
+        return ExtractionJournal.open(
+            self.journal_path,
+            scope_key=_journal_scope_key(self.config),
+            resume=self.resume,
+            logger=self.logger,
+        )
+
+    def _run(self, dry_run: bool) -> SnapshotRunResult:
+        journal = self._open_journal(dry_run)
+        try:
+            return self._run_with_journal(dry_run, journal)
+        finally:
+            if journal is not None:
+                journal.close()
+
+    def _run_with_journal(self, dry_run: bool, journal: ExtractionJournal | None) -> SnapshotRunResult:
+        self.logger.info("Snapshot run started. dry_run=%s resume=%s", dry_run, self.resume)
+        self._stage_seconds = {}
+
+        manifest_path = self.manifest_path or Path(self.config.extraction.manifest_file)
+        manifest = ObjectManifest.load(manifest_path, logger=self.logger)
+        mode = self.config.extraction.mode
+        full_refresh = mode == "full" or manifest.full_refresh_due(
+            self.config.extraction.full_refresh_hours
+        )
+        if mode == "audit" and manifest.audit_id is None:
+            full_refresh = True
+        writer = self._writer()
+
+        def reusable(db_object: DbObject) -> bool:
+            return manifest.is_current(db_object) and writer.object_path(db_object).exists()
+
+        resumed: set[DbObject] = set()
+
+        def resume_from_journal(db_object: DbObject) -> bool:
+            # 저널에서 찾은 객체는 DB 조회 대상에서 빠지고, 저장된 원본 DDL이 바로 쓰기 단계로 넘어간다.
+            nonlocal extracted_count
+            ddl = journal.lookup(db_object) if journal is not None else None
+            if ddl is None:
+                return False
+            resumed.add(db_object)
+            extracted_count += 1
+            stream.put(ExtractedDdl(db_object=db_object, ddl=ddl))
+            return True
+
+        def reusable_or_resumed(db_object: DbObject) -> bool:
+            return resume_from_journal(db_object) or reusable(db_object)
+
+        def known_hash(db_object: DbObject) -> str | None:
+            # 직전 원본 해시가 있고 스냅샷 파일이 남아 있을 때만 서버 해시와 비교한다.
+            entry = manifest.get(db_object)
+            if entry is None or entry.raw_sha256 is None or not writer.object_path(db_object).exists():
+                return None
+            return entry.raw_sha256
+
+        server_hash = self.config.extraction.server_hash
+        hash_options = {"known_hashes": known_hash} if server_hash else {}
+
+        resume_hook = (
+            resume_from_journal if journal is not None and journal.resumable_count else None
+        )
+
+        git_ops = GitOps(repo_path=self.config.git.repo_path)
+        marked_pending, use_plumbing = self._prepare_git(git_ops, dry_run)
+
+        extractor = self.extractor
+        if extractor is None:
+            extractor = create_extractor(self.config, self.logger, self.metrics)
+        else:
+            extractor.metrics = self.metrics
+        normalizer = self._normalizer()
+        next_manifest = ObjectManifest(
+            last_full_refresh=(
+                datetime.now(timezone.utc) if full_refresh else manifest.last_full_refresh
+            ),
+        )
+
+        # 추출(DB) -> 정규화/쓰기(별도 스레드)를 크기 제한 큐로 연결해서
+        # 전체 DDL을 메모리에 모으지 않고 단계들이 겹쳐서 실행되도록 한다.
+        stream: BoundedStream[ExtractedDdl] = BoundedStream(maxsize=STREAM_QUEUE_SIZE)
+        retained: list[DbObject] = []
+        extracted_count = 0
+        target_count: int | None = None
+
+        def record_targets(count: int) -> None:
+            # 추출기가 탐색/증분 판정을 끝낸 뒤 알려 주는 추출 대상 수. 병렬 정규화 여부를 이 값으로 정한다.
+            nonlocal target_count
+            target_count = count
+
+        def emit(item: ExtractedDdl) -> None:
+            nonlocal extracted_count
+            extracted_count += 1
+            if journal is not None:
+                journal.record(item)
+            stream.put(item)
+
+        def normalized_ddls(source: Iterator[str]) -> Iterator[str]:
+            # 대상 수가 정해지기 전에 들어온 DDL(--resume 저널 재사용분)은 현재 프로세스에서 정규화하고,
+            # 정해진 뒤에는 남은 스트림을 그 수에 맞춰 iter_normalized에 넘긴다. 큐는 이 스레드에서만 읽는다.
+            for ddl in source:
+                if target_count is not None:
+                    yield from normalizer.iter_normalized(chain([ddl], source), expected_count=target_count)
+                    return
+                yield normalizer.normalize(ddl)
+
+        def normalized_entries() -> Iterator[SnapshotEntry]:
+            # iter_normalized는 입력 순서를 유지하므로 DDL과 객체를 같은 순서의 큐로 짝짓는다.
+            pending_objects: deque[tuple[DbObject, str | None]] = deque()
+
+            def ddls() -> Iterator[str]:
+                for item in stream:
+                    pending_objects.append((item.db_object, cache_raw(item.ddl)))
+                    yield item.ddl
+
+            for ddl in normalized_ddls(ddls()):
+                db_object, raw_sha256 = pending_objects.popleft()
+                entry = SnapshotEntry(db_object=db_object, ddl=ddl)
+                next_manifest.record(entry.db_object, entry.ddl, raw_sha256=raw_sha256)
+                yield entry
+
+        raw_cache = self._raw_cache(dry_run)
+
+        def cache_raw(ddl: str) -> str | None:
+            # 원본 DDL 캐시는 renormalize용 보조 데이터이므로 기록 실패가 스냅샷을 막지 않게 한다.
+            nonlocal raw_cache
+            if raw_cache is None:
+                # 서버 해시 비교용으로 캐시 없이도 원본 해시는 매니페스트에 남긴다.
+                return content_hash(ddl) if server_hash else None
+            try:
+                return raw_cache.put(ddl)
+            except OSError as exc:
+                self.logger.warning("Raw DDL cache disabled for this run: %s", exc)
+                raw_cache = None
+                return content_hash(ddl) if server_hash else None
+
+        def write_stage() -> WriteResult:
+            try:
+                # retained는 스트림을 닫기 전에 채워지고 writer는 entries를 모두 소비한 뒤에 읽는다.
+                return writer.write(normalized_entries(), dry_run=dry_run, retained=retained)
+            finally:
+                stream.drain()
+
+        extraction_started = perf_counter()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="orasnap-write") as executor:
+            write_future = executor.submit(write_stage)
+            try:
+                audit_table = self.config.audit.table if mode == "audit" else None
+                if full_refresh:
+                    extraction = extractor.extract(
+                        audit_table=audit_table,
+                        reusable=resume_hook,
+                        sink=emit,
+                        on_targets=record_targets,
+                        **hash_options,
+                    )
+                elif mode == "audit":
+                    extraction = extractor.extract_audit_changes(
+                        audit_table=self.config.audit.table,
+                        after_audit_id=manifest.audit_id or 0,
+                        reusable=reusable_or_resumed if resume_hook else reusable,
+                        extra_targets=[
+                            db_object
+                            for db_object in manifest.objects()
+                            if not writer.object_path(db_object).exists()
+                        ],
+                        sink=emit,
+                        on_targets=record_targets,
+                        **hash_options,
+                    )
+                else:
+                    extraction = extractor.extract(
+                        reusable=reusable_or_resumed if resume_hook else reusable,
+                        sink=emit,
+                        on_targets=record_targets,
+                        **hash_options,
+                    )
+                # sink를 쓰지 않고 결과를 한 번에 돌려주는 추출기도 같은 경로로 처리한다.
+                for item in extraction.items:
+                    emit(item)
+
+                retained.extend(
+                    db_object for db_object in extraction.reused if db_object not in resumed
+                )
+                if extraction.targets is not None:
+                    # 감사 로그 기반 갱신: 대상이 아닌 객체는 직전 스냅샷을 그대로 유지한다.
+                    decided = {*extraction.targets, *extraction.reused}
+                    retained.extend(
+                        db_object for db_object in manifest.objects() if db_object not in decided
+                    )
+            except BaseException:
+                if journal is not None:
+                    # 여기까지 받은 객체는 다음 --resume 실행이 다시 조회하지 않도록 저널에 확정한다.
+                    journal.flush()
+                # 일부만 추출된 상태에서 나머지 스냅샷 파일이 삭제되지 않도록 쓰기 단계를 중단한다.
+                stream.abort()
+                raise
+            stream.close()
+            extraction_elapsed = self._finish_stage("extract", extraction_started)
+            self.logger.info(
+                "Extraction stage finished in %.2fs. extracted=%s reused=%s resumed=%s failed=%s full_refresh=%s",
+                extraction_elapsed,
+                extracted_count,
+                len(extraction.reused) - len(resumed),
+                len(resumed),
+                len(extraction.failures),
+                full_refresh,
+            )
+
+            write_started = perf_counter()
+            write_result = write_future.result()
+
+        if not dry_run:
+            next_manifest.audit_id = extraction.audit_id
+            for db_object in retained:
+                previous = manifest.get(db_object)
+                if previous is None:
+                    continue
+                if db_object.last_ddl_time is not None and previous.last_ddl_time != db_object.last_ddl_time:
+                    # 서버 해시로 내용이 같다고 확인한 객체는 새 LAST_DDL_TIME을 기록해서 다음 실행에서 다시 비교하지 않는다.
+                    previous = replace(previous, db_object=db_object, last_ddl_time=db_object.last_ddl_time)
+                next_manifest.keep(previous)
+            next_manifest.save(manifest_path)
+            if journal is not None:
+                # 스냅샷과 매니페스트가 모두 기록됐으므로 이어 갈 작업이 없다.
+                journal.clear()
+            if raw_cache is not None and full_refresh and not extraction.failures:
+                # 전체 추출 직후에는 매니페스트가 모든 객체를 가리키므로 더 이상 쓰지 않는 원본을 정리한다.
+                pruned = raw_cache.prune(
+                    {entry.raw_sha256 for entry in next_manifest.entries.values() if entry.raw_sha256}
+                )
+                if pruned:
+                    self.logger.info("Raw DDL cache pruned. removed=%s", pruned)
+        self.metrics.bytes_written = write_result.written_bytes
+        write_elapsed = self._finish_stage("write", write_started)
         self.logger.info(
-            "Write stage finished in %.2fs. written=%s deleted=%s unchanged=%s",
+            "Write stage finished %.2fs after extraction. written=%s deleted=%s unchanged=%s",
             write_elapsed,
             len(write_result.written_files),
             len(write_result.deleted_files),
@@ -193,7 +659,7 @@ class SnapshotPipeline:
         )
 
         audit_result = AuditExportResult(exported_count=0, added_files=[], modified_files=[])
-        audit_root = _resolve_audit_root(self.config)
+        audit_root = resolve_audit_root(self.config)
         if self.config.audit.enabled and not dry_run:
             audit_started = perf_counter()
             audit_exporter = OracleAuditExporter(
@@ -203,9 +669,10 @@ class SnapshotPipeline:
                 state_path=self.audit_state_path or Path("logs/audit_state.json"),
                 table_name=self.config.audit.table,
                 logger=self.logger,
+                batch_size=self.config.audit.batch_size,
             )
             audit_result = audit_exporter.export(dry_run=False)
-            audit_elapsed = perf_counter() - audit_started
+            audit_elapsed = self._finish_stage("audit", audit_started)
             if audit_result.exported_count:
                 self.logger.info(
                     "Audit export finished in %.2fs. exported=%s added=%s modified=%s root=%s",
@@ -224,40 +691,27 @@ class SnapshotPipeline:
         committed = False
         commit_sha = None
         pushed = False
+        pending_commit = None
+        stage_paths = [self.config.output.snapshot_root]
+        if self.config.audit.enabled and audit_root.exists():
+            stage_paths.append(audit_root)
         if not dry_run:
-            git_started = perf_counter()
-            git_ops = GitOps(repo_path=self.config.git.repo_path)
-            commit_message = _build_commit_message(
-                template=self.config.git.commit_message_template,
-                repo_path=self.config.git.repo_path,
+            pending_commit = PendingCommit(
                 added_files=all_added_files,
                 modified_files=all_modified_files,
                 deleted_files=write_result.deleted_files,
+                stage_paths=stage_paths,
             )
-            stage_paths = [self.config.output.snapshot_root]
-            if self.config.audit.enabled and audit_root.exists():
-                stage_paths.append(audit_root)
-            git_result = git_ops.commit_if_changed(
-                paths=stage_paths,
-                message=commit_message,
-                auto_push=self.config.git.auto_push,
-                branch=self.config.git.branch,
-                remote=self.config.git.remote,
-            )
+        if pending_commit is not None and not self.defer_git:
+            git_result = self._git_stage(git_ops, pending_commit, marked_pending, use_plumbing)
+            pending_commit = None
             committed = git_result.committed
             commit_sha = git_result.commit_sha
             pushed = git_result.pushed
-            git_elapsed = perf_counter() - git_started
-            self.logger.info(
-                "Git stage finished in %.2fs. committed=%s pushed=%s",
-                git_elapsed,
-                committed,
-                pushed,
-            )
 
         self.logger.info(
             "Snapshot run finished. extracted=%s failed=%s written=%s deleted=%s unchanged=%s audit_exported=%s committed=%s pushed=%s",
-            len(extraction.items),
+            extracted_count,
             len(extraction.failures),
             len(write_result.written_files),
             len(write_result.deleted_files),
@@ -268,7 +722,7 @@ class SnapshotPipeline:
         )
 
         return SnapshotRunResult(
-            extracted_count=len(extraction.items),
+            extracted_count=extracted_count,
             failed_count=len(extraction.failures),
             written_count=len(write_result.written_files),
             deleted_count=len(write_result.deleted_files),
@@ -279,17 +733,144 @@ class SnapshotPipeline:
             pushed=pushed,
             failures=extraction.failures,
             log_file=self.log_file,
+            stage_seconds=dict(self._stage_seconds),
+            audit_id=extraction.audit_id,
+            pending_commit=pending_commit,
         )
 
+    def _renormalize(self, dry_run: bool) -> SnapshotRunResult:
+        """DB에 접속하지 않고 원본 DDL 캐시만으로 스냅샷 트리를 현재 정규화 규칙으로 다시 만든다."""
+        self.logger.info("Renormalize started. dry_run=%s", dry_run)
+        self._stage_seconds = {}
+        if self.raw_cache_dir is None or not self.config.extraction.raw_cache:
+            raise ConfigError("renormalize requires extraction.raw_cache to be enabled.")
+        raw_cache = RawDdlCache(self.raw_cache_dir, logger=self.logger)
+        manifest_path = self.manifest_path or Path(self.config.extraction.manifest_file)
+        manifest = ObjectManifest.load(manifest_path, logger=self.logger)
+        writer = self._writer()
+        normalizer = self._normalizer()
+        git_ops = GitOps(repo_path=self.config.git.repo_path)
+        marked_pending, use_plumbing = self._prepare_git(git_ops, dry_run)
+        next_manifest = ObjectManifest(
+            last_full_refresh=manifest.last_full_refresh,
+            audit_id=manifest.audit_id,
+        )
 
-def run_snapshot(config_path: str | Path, dry_run: bool = False) -> SnapshotRunResult:
-    config_file = Path(config_path).resolve()
+        # 캐시에 원본이 없는 객체(캐시 도입 전 추출분 등)는 기존 스냅샷 파일을 그대로 둔다.
+        retained: list[DbObject] = []
+        failures: list[str] = []
+        sources: list[tuple[DbObject, str]] = []
+        for db_object in manifest.objects():
+            entry = manifest.get(db_object)
+            if entry.raw_sha256 is not None and raw_cache.has(entry.raw_sha256):
+                sources.append((db_object, entry.raw_sha256))
+            else:
+                retained.append(db_object)
+                next_manifest.keep(entry)
+                failures.append(
+                    f"{db_object.owner}.{db_object.object_type}.{db_object.object_name}: not in raw DDL cache"
+                )
+        if failures:
+            self.logger.warning(
+                "Raw DDL cache misses: %s objects keep their current snapshot files.",
+                len(failures),
+            )
+
+        def normalized_entries() -> Iterator[SnapshotEntry]:
+            pending_objects: deque[tuple[DbObject, str]] = deque()
+
+            def ddls() -> Iterator[str]:
+                for db_object, raw_sha256 in sources:
+                    ddl = raw_cache.get(raw_sha256)
+                    if ddl is None:
+                        raise RuntimeError(
+                            f"Raw DDL cache entry disappeared or is corrupted: {raw_sha256}"
+                        )
+                    pending_objects.append((db_object, raw_sha256))
+                    yield ddl
+
+            for ddl in normalizer.iter_normalized(ddls(), expected_count=len(sources)):
+                db_object, raw_sha256 = pending_objects.popleft()
+                next_manifest.record(db_object, ddl, raw_sha256=raw_sha256)
+                yield SnapshotEntry(db_object=db_object, ddl=ddl)
+
+        write_started = perf_counter()
+        write_result = writer.write(normalized_entries(), dry_run=dry_run, retained=retained)
+        if not dry_run:
+            next_manifest.save(manifest_path)
+        self.metrics.bytes_written = write_result.written_bytes
+        write_elapsed = self._finish_stage("write", write_started)
+        self.logger.info(
+            "Renormalize write finished in %.2fs. objects=%s written=%s deleted=%s unchanged=%s",
+            write_elapsed,
+            len(sources),
+            len(write_result.written_files),
+            len(write_result.deleted_files),
+            write_result.unchanged_files,
+        )
+
+        git_result = GitResult(committed=False, commit_sha=None, pushed=False)
+        if not dry_run:
+            pending_commit = PendingCommit(
+                added_files=write_result.added_files,
+                modified_files=write_result.modified_files,
+                deleted_files=write_result.deleted_files,
+                stage_paths=[self.config.output.snapshot_root],
+            )
+            git_result = self._git_stage(
+                git_ops,
+                pending_commit,
+                marked_pending,
+                use_plumbing,
+                target="renormalize",
+            )
+
+        return SnapshotRunResult(
+            extracted_count=0,
+            failed_count=len(failures),
+            written_count=len(write_result.written_files),
+            deleted_count=len(write_result.deleted_files),
+            unchanged_count=write_result.unchanged_files,
+            audit_exported_count=0,
+            committed=git_result.committed,
+            commit_sha=git_result.commit_sha,
+            pushed=git_result.pushed,
+            failures=failures,
+            log_file=self.log_file,
+            stage_seconds=dict(self._stage_seconds),
+        )
+
+
+def load_run_config(
+    config_file: Path,
+    full_refresh: bool = False,
+    workers: int | None = None,
+    verify_manifest: bool = False,
+) -> AppConfig:
     config = load_config(config_file)
-    project_root = _resolve_project_root(config_file)
-    logs_dir = _resolve_logs_dir(config_file)
-    local_date = datetime.now().strftime("%Y%m%d")
-    log_file = logs_dir / f"orasnap-{local_date}.log"
-    logger = _setup_logger(log_file)
+    if full_refresh:
+        config = replace(config, extraction=replace(config.extraction, mode="full"))
+    if workers is not None:
+        if workers < 1:
+            raise ConfigError("--workers must be >= 1.")
+        config = replace(config, oracle=replace(config.oracle, workers=workers))
+    if verify_manifest:
+        config = replace(config, output=replace(config.output, verify_manifest=True))
+    return config
+
+
+def start_logging(
+    config: AppConfig,
+    logs_dir: Path,
+    started_at: datetime,
+    target: str | None = None,
+) -> tuple[logging.Logger, Path]:
+    if target:
+        log_file = logs_dir / f"orasnap-{target}-{started_at:%Y%m%d}.log"
+        logger = setup_logger(log_file, prefix=target)
+    else:
+        log_file = logs_dir / f"orasnap-{started_at:%Y%m%d}.log"
+        logger = setup_logger(log_file)
     removed_logs = _purge_old_logs(logs_dir, config.logs.retention_days, logger)
     if removed_logs:
         logger.info(
@@ -297,16 +878,145 @@ def run_snapshot(config_path: str | Path, dry_run: bool = False) -> SnapshotRunR
             removed_logs,
             config.logs.retention_days,
         )
-
-    configured_state_path = Path(config.audit.state_file)
-    if configured_state_path.is_absolute():
-        audit_state_path = configured_state_path
-    else:
-        audit_state_path = project_root / configured_state_path
-    pipeline = SnapshotPipeline(
+    return logger, log_file
+
+
+def build_pipeline(
+    config: AppConfig,
+    config_file: Path,
+    logger: logging.Logger,
+    log_file: Path,
+    metrics_path: Path | None,
+    extractor: OracleMetadataExtractor | None = None,
+    defer_git: bool = False,
+    resume: bool = False,
+    target: str | None = None,
+) -> SnapshotPipeline:
+    project_root = resolve_project_root(config_file)
+    return SnapshotPipeline(
         config=config,
         logger=logger,
         log_file=log_file,
-        audit_state_path=audit_state_path,
+        audit_state_path=resolve_state_path(config.audit.state_file, project_root),
+        manifest_path=resolve_state_path(config.extraction.manifest_file, project_root),
+        file_manifest_path=resolve_state_path(config.output.manifest_file, project_root),
+        journal_path=resolve_state_path(config.extraction.journal_file, project_root),
+        raw_cache_dir=resolve_state_path(config.extraction.raw_cache_dir, project_root),
+        resume=resume,
+        metrics_path=metrics_path if config.logs.metrics_json else None,
+        extractor=extractor,
+        defer_git=defer_git,
+        target=target,
+    )
+
+
+def run_snapshot(
+    config_path: str | Path,
+    dry_run: bool = False,
+    full_refresh: bool = False,
+    workers: int | None = None,
+    verify_manifest: bool = False,
+    resume: bool = False,
+) -> SnapshotRunResult:
+    config_file = Path(config_path).resolve()
+    config = load_run_config(config_file, full_refresh, workers, verify_manifest)
+    logs_dir = resolve_logs_dir(config_file)
+    started_at = datetime.now()
+    logger, log_file = start_logging(config, logs_dir, started_at)
+    pipeline = build_pipeline(
+        config,
+        config_file,
+        logger,
+        log_file,
+        metrics_path=logs_dir / f"orasnap-{started_at:%Y%m%d-%H%M%S}.metrics.json",
+        resume=resume,
     )
     return pipeline.run(dry_run=dry_run)
+
+
+def run_renormalize(
+    config_path: str | Path,
+    dry_run: bool = False,
+    workers: int | None = None,
+) -> SnapshotRunResult:
+    config_file = Path(config_path).resolve()
+    config = load_run_config(config_file)
+    if workers is not None:
+        if workers < 1:
+            raise ConfigError("--workers must be >= 1.")
+        # renormalize는 DB를 쓰지 않으므로 --workers는 정규화 프로세스 수를 뜻한다.
+        config = replace(config, output=replace(config.output, normalize_workers=workers))
+    logs_dir = resolve_logs_dir(config_file)
+    started_at = datetime.now()
+    logger, log_file = start_logging(config, logs_dir, started_at)
+    pipeline = build_pipeline(
+        config,
+        config_file,
+        logger,
+        log_file,
+        metrics_path=logs_dir / f"orasnap-{started_at:%Y%m%d-%H%M%S}.metrics.json",
+    )
+    return pipeline.renormalize(dry_run=dry_run)
+
+
+def run_watch(
+    config_path: str | Path,
+    workers: int | None = None,
+    max_cycles: int | None = None,
+    stop_event: threading.Event | None = None,
+) -> WatchSummary:
+    config_file = Path(config_path).resolve()
+    config = load_run_config(config_file, workers=workers)
+    # watch는 항상 감사 로그 기준으로 바뀐 객체만 다시 추출한다.
+    config = replace(config, extraction=replace(config.extraction, mode="audit"))
+    logs_dir = resolve_logs_dir(config_file)
+    logger, log_file = start_logging(config, logs_dir, datetime.now())
+    extractor = create_extractor(config, logger)
+
+    def run_cycle() -> SnapshotRunResult:
+        nonlocal logger, log_file
+        if log_file.name != f"orasnap-{datetime.now():%Y%m%d}.log":
+            # 장시간 실행 중 날짜가 바뀌면 일자별 로그 파일/보관 정책을 다시 적용한다.
+            logger, log_file = start_logging(config, logs_dir, datetime.now())
+        # 주기마다 파일이 쌓이지 않도록 watch 지표는 같은 파일을 덮어쓴다.
+        pipeline = build_pipeline(
+            config,
+            config_file,
+            logger,
+            log_file,
+            metrics_path=logs_dir / "orasnap-watch.metrics.json",
+            extractor=extractor,
+        )
+        return pipeline.run(dry_run=False)
+
+    watcher = SnapshotWatcher(
+        config=config,
+        extractor=extractor,
+        run_cycle=run_cycle,
+        logger=logger,
+        stop_event=stop_event,
+    )
+    with _stop_on_signals(watcher, logger):
+        return watcher.run(max_cycles=max_cycles)
+
+
+@contextmanager
+def _stop_on_signals(watcher: SnapshotWatcher, logger: logging.Logger) -> Iterator[None]:
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def request_stop(signum: int, _frame: object) -> None:
+        if watcher.stop_event.is_set():
+            # 두 번째 신호는 진행 중인 스냅샷을 기다리지 않고 중단한다.
+            raise KeyboardInterrupt
+        logger.info("Shutdown requested (signal %s). Finishing the current cycle.", signum)
+        watcher.stop()
+
+    handled = [signal.SIGINT, signal.SIGTERM]
+    previous = {signum: signal.signal(signum, request_stop) for signum in handled}
+    try:
+        yield
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
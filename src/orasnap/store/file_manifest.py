@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+FILE_MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FileRecord:
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class FileManifest:
+    """스냅샷 루트 기준 상대 경로별 파일 크기/mtime/내용 해시."""
+
+    def __init__(self, records: dict[str, FileRecord] | None = None) -> None:
+        self.records: dict[str, FileRecord] = dict(records or {})
+
+    def get(self, rel_path: str) -> FileRecord | None:
+        return self.records.get(rel_path)
+
+    @classmethod
+    def load(cls, path: Path, logger: logging.Logger | None = None) -> "FileManifest | None":
+        logger = logger or logging.getLogger(__name__)
+        if not path.exists():
+            return None
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as exc:  # pragma: no cover - defensive path.
+            logger.warning("File manifest read failed: %s (%s)", path, exc)
+            return None
+        if not isinstance(raw, dict) or raw.get("version") != FILE_MANIFEST_VERSION:
+            logger.warning("File manifest ignored (unsupported format): %s", path)
+            return None
+
+        records: dict[str, FileRecord] = {}
+        for rel_path, item in (raw.get("files") or {}).items():
+            try:
+                records[str(rel_path)] = FileRecord(
+                    size=int(item["size"]),
+                    mtime_ns=int(item["mtime_ns"]),
+                    sha256=str(item["sha256"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return cls(records)
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": FILE_MANIFEST_VERSION,
+            "files": {
+                rel_path: {
+                    "size": record.size,
+                    "mtime_ns": record.mtime_ns,
+                    "sha256": record.sha256,
+                }
+                for rel_path, record in sorted(self.records.items())
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(path)
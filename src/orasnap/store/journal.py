@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+from orasnap.models import DbObject, ExtractedDdl
+from orasnap.store.object_manifest import ObjectKey, ObjectManifest
+
+JOURNAL_VERSION = 1
+# 이 행 수마다 커밋한다. 세션이 끊기면 마지막 배치만 다시 추출하면 된다.
+JOURNAL_COMMIT_ROWS = 200
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS objects ("
+    " owner TEXT NOT NULL,"
+    " object_type TEXT NOT NULL,"
+    " object_name TEXT NOT NULL,"
+    " last_ddl_time TEXT,"
+    " ddl TEXT NOT NULL,"
+    " PRIMARY KEY (owner, object_type, object_name))",
+)
+
+
+class ExtractionJournal:
+    """추출을 마친 객체의 원본 DDL을 로컬 SQLite에 바로 남긴다.
+
+    실행이 중간에 끊기면 다음 `--resume` 실행은 LAST_DDL_TIME이 그대로인 객체를 DB에서 다시 받지 않고
+    저널의 DDL을 그대로 정규화/쓰기 단계로 넘긴다. 실행이 끝까지 성공하면 저널을 비운다.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, logger: logging.Logger | None = None) -> None:
+        self._connection = connection
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._pending_rows = 0
+        # 재개 판단은 메모리의 (키 -> LAST_DDL_TIME)로 하고, DDL 본문은 일치할 때만 읽는다.
+        self._ddl_times: dict[ObjectKey, str] = {}
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        scope_key: str,
+        resume: bool,
+        logger: logging.Logger | None = None,
+    ) -> "ExtractionJournal":
+        logger = logger or logging.getLogger(__name__)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            journal = cls(cls._connect(path), logger=logger)
+        except sqlite3.DatabaseError as exc:
+            logger.warning("Extraction journal unreadable, starting a new one: %s (%s)", path, exc)
+            path.unlink(missing_ok=True)
+            journal = cls(cls._connect(path), logger=logger)
+
+        meta = dict(journal._connection.execute("SELECT name, value FROM meta"))
+        compatible = meta.get("version") == str(JOURNAL_VERSION) and meta.get("scope") == scope_key
+        if resume and not compatible and meta:
+            logger.warning("Extraction journal ignored (config scope changed): %s", path)
+        if resume and compatible:
+            journal._ddl_times = {
+                (owner, object_type, object_name): last_ddl_time
+                for owner, object_type, object_name, last_ddl_time in journal._connection.execute(
+                    "SELECT owner, object_type, object_name, last_ddl_time FROM objects"
+                    " WHERE last_ddl_time IS NOT NULL"
+                )
+            }
+            logger.info("Extraction journal loaded. resumable=%s path=%s", len(journal._ddl_times), path)
+        else:
+            journal._connection.execute("DELETE FROM objects")
+        journal._connection.executemany(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+            [("version", str(JOURNAL_VERSION)), ("scope", scope_key)],
+        )
+        journal._connection.commit()
+        return journal
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        # 추출 스레드(sink)에서 기록하므로 스레드 검사는 끄고 _lock으로 직렬화한다.
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    @property
+    def resumable_count(self) -> int:
+        return len(self._ddl_times)
+
+    def lookup(self, db_object: DbObject) -> str | None:
+        """직전 실행에서 같은 LAST_DDL_TIME으로 받아 둔 DDL. 없거나 바뀌었으면 None."""
+        if db_object.last_ddl_time is None:
+            return None
+        key = ObjectManifest.key(db_object)
+        if self._ddl_times.get(key) != db_object.last_ddl_time:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT ddl FROM objects WHERE owner = ? AND object_type = ? AND object_name = ?",
+                key,
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def record(self, item: ExtractedDdl) -> None:
+        db_object = item.db_object
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO objects"
+                " (owner, object_type, object_name, last_ddl_time, ddl) VALUES (?, ?, ?, ?, ?)",
+                (
+                    db_object.owner,
+                    db_object.object_type,
+                    db_object.object_name,
+                    db_object.last_ddl_time,
+                    item.ddl,
+                ),
+            )
+            self._pending_rows += 1
+            if self._pending_rows >= JOURNAL_COMMIT_ROWS:
+                self._connection.commit()
+                self._pending_rows = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._connection.commit()
+            self._pending_rows = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM objects")
+            self._connection.commit()
+            self._pending_rows = 0
+            self._ddl_times = {}
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from orasnap.models import DbObject
+
+MANIFEST_VERSION = 1
+
+ObjectKey = tuple[str, str, str]
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    db_object: DbObject
+    last_ddl_time: str | None
+    sha256: str
+    # 정규화 전 원본 DDL의 해시(원본 DDL 캐시 키). 캐시를 쓰지 않았으면 None.
+    raw_sha256: str | None = None
+
+
+class ObjectManifest:
+    def __init__(
+        self,
+        entries: dict[ObjectKey, ManifestEntry] | None = None,
+        last_full_refresh: datetime | None = None,
+        audit_id: int | None = None,
+    ) -> None:
+        self.entries: dict[ObjectKey, ManifestEntry] = dict(entries or {})
+        self.last_full_refresh = last_full_refresh
+        self.audit_id = audit_id
+
+    @staticmethod
+    def key(db_object: DbObject) -> ObjectKey:
+        return (db_object.owner, db_object.object_type, db_object.object_name)
+
+    def get(self, db_object: DbObject) -> ManifestEntry | None:
+        return self.entries.get(self.key(db_object))
+
+    def is_current(self, db_object: DbObject) -> bool:
+        if db_object.last_ddl_time is None:
+            return False
+        entry = self.get(db_object)
+        return entry is not None and entry.last_ddl_time == db_object.last_ddl_time
+
+    def record(self, db_object: DbObject, content: str, raw_sha256: str | None = None) -> None:
+        self.entries[self.key(db_object)] = ManifestEntry(
+            db_object=db_object,
+            last_ddl_time=db_object.last_ddl_time,
+            sha256=content_hash(content),
+            raw_sha256=raw_sha256,
+        )
+
+    def keep(self, entry: ManifestEntry) -> None:
+        self.entries[self.key(entry.db_object)] = entry
+
+    def objects(self) -> list[DbObject]:
+        return [entry.db_object for _, entry in sorted(self.entries.items())]
+
+    def full_refresh_due(self, interval_hours: int, now: datetime | None = None) -> bool:
+        if interval_hours <= 0:
+            return self.last_full_refresh is None
+        if self.last_full_refresh is None:
+            return True
+        now = now or datetime.now(timezone.utc)
+        return now - self.last_full_refresh >= timedelta(hours=interval_hours)
+
+    @classmethod
+    def load(cls, path: Path, logger: logging.Logger | None = None) -> "ObjectManifest":
+        logger = logger or logging.getLogger(__name__)
+        if not path.exists():
+            return cls()
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as exc:  # pragma: no cover - defensive path.
+            logger.warning("Object manifest read failed: %s (%s)", path, exc)
+            return cls()
+        if not isinstance(raw, dict) or raw.get("version") != MANIFEST_VERSION:
+            logger.warning("Object manifest ignored (unsupported format): %s", path)
+            return cls()
+
+        last_full_refresh = None
+        if raw.get("last_full_refresh"):
+            try:
+                last_full_refresh = datetime.fromisoformat(str(raw["last_full_refresh"]))
+            except ValueError:
+                last_full_refresh = None
+
+        audit_id = None
+        if raw.get("audit_id") is not None:
+            try:
+                audit_id = int(raw["audit_id"])
+            except (TypeError, ValueError):
+                audit_id = None
+
+        entries: dict[ObjectKey, ManifestEntry] = {}
+        for item in raw.get("objects") or []:
+            try:
+                last_ddl_time = item.get("last_ddl_time")
+                db_object = DbObject(
+                    owner=str(item["owner"]),
+                    object_type=str(item["object_type"]),
+                    object_name=str(item["object_name"]),
+                    last_ddl_time=str(last_ddl_time) if last_ddl_time is not None else None,
+                )
+                entries[cls.key(db_object)] = ManifestEntry(
+                    db_object=db_object,
+                    last_ddl_time=db_object.last_ddl_time,
+                    sha256=str(item["sha256"]),
+                    raw_sha256=str(item["raw_sha256"]) if item.get("raw_sha256") else None,
+                )
+            except (KeyError, TypeError, AttributeError):
+                continue
+        return cls(entries=entries, last_full_refresh=last_full_refresh, audit_id=audit_id)
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "last_full_refresh": (
+                self.last_full_refresh.isoformat() if self.last_full_refresh else None
+            ),
+            "audit_id": self.audit_id,
+            "objects": [
+                {
+                    "owner": entry.db_object.owner,
+                    "object_type": entry.db_object.object_type,
+                    "object_name": entry.db_object.object_name,
+                    "last_ddl_time": entry.last_ddl_time,
+                    "sha256": entry.sha256,
+                    "raw_sha256": entry.raw_sha256,
+                }
+                for _, entry in sorted(self.entries.items())
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        temp_path.replace(path)
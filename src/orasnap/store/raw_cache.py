@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import zlib
+from pathlib import Path
+
+from orasnap.store.object_manifest import content_hash
+
+BLOB_SUFFIX = ".z"
+
+
+class RawDdlCache:
+    """추출한 원본 DDL을 zlib으로 압축해서 SHA-256 이름으로 저장하는 내용 주소 캐시.
+
+    객체 키/LAST_DDL_TIME -> raw_sha256 연결은 객체 매니페스트가 갖고 있으므로,
+    정규화 규칙이 바뀌어도 DB 없이 캐시만으로 스냅샷 트리를 다시 만들 수 있다(`orasnap renormalize`).
+    """
+
+    def __init__(self, root: Path, level: int = 6, logger: logging.Logger | None = None) -> None:
+        self.root = root
+        self.level = level
+        self.logger = logger or logging.getLogger(__name__)
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest[2:]}{BLOB_SUFFIX}"
+
+    def has(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def put(self, ddl: str) -> str:
+        digest = content_hash(ddl)
+        path = self.path(digest)
+        if path.exists():
+            # 같은 내용은 한 번만 저장한다(재추출한 미변경 객체, 스키마 간 동일 DDL).
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(zlib.compress(ddl.encode("utf-8"), self.level))
+        temp_path.replace(path)
+        return digest
+
+    def get(self, digest: str) -> str | None:
+        path = self.path(digest)
+        try:
+            ddl = zlib.decompress(path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, UnicodeDecodeError) as exc:
+            self.logger.warning("Raw DDL cache entry unreadable: %s (%s)", path, exc)
+            return None
+        if content_hash(ddl) != digest:
+            self.logger.warning("Raw DDL cache entry corrupted: %s", path)
+            return None
+        return ddl
+
+    def prune(self, keep: set[str]) -> int:
+        """keep에 없는 blob을 지운다. 전체 재추출 뒤처럼 매니페스트가 모든 객체를 가리킬 때만 호출한다."""
+        if not self.root.exists():
+            return 0
+        removed = 0
+        for bucket in self.root.iterdir():
+            if not bucket.is_dir() or len(bucket.name) != 2:
+                continue
+            for blob in bucket.iterdir():
+                digest = bucket.name + blob.name.removesuffix(BLOB_SUFFIX)
+                if blob.name.endswith(BLOB_SUFFIX) and digest in keep:
+                    continue
+                try:
+                    blob.unlink()
+                    removed += 1
+                except OSError as exc:
+                    self.logger.warning("Failed to delete raw DDL cache entry: %s (%s)", blob, exc)
+        return removed
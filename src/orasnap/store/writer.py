@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import logging
 import re
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 
-from orasnap.models import SnapshotEntry, WriteResult
+from orasnap.models import DbObject, SnapshotEntry, WriteResult
+from orasnap.store.file_manifest import FileManifest, FileRecord
+from orasnap.store.object_manifest import content_hash
 
 SAFE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
 
@@ -15,14 +19,27 @@ def _safe_name(value: str) -> str:
 
 
 class SnapshotWriter:
-    def __init__(self, snapshot_root: Path) -> None:
+    def __init__(
+        self,
+        snapshot_root: Path,
+        manifest_path: Path | None = None,
+        verify: bool = False,
+        logger: logging.Logger | None = None,
+    ) -> None:
         self.snapshot_root = snapshot_root
+        # manifest_path가 없으면 매 실행마다 디스크를 직접 읽고 rglob으로 삭제 대상을 찾는다.
+        self.manifest_path = manifest_path
+        self.verify = verify
+        self.logger = logger or logging.getLogger(__name__)
+
+    def object_path(self, db_object: DbObject) -> Path:
+        owner = _safe_name(db_object.owner)
+        object_type = _safe_name(db_object.object_type.upper().replace(" ", "_"))
+        object_name = _safe_name(db_object.object_name)
+        return self.snapshot_root / owner / object_type / f"{object_name}.sql"
 
     def _entry_path(self, entry: SnapshotEntry) -> Path:
-        owner = _safe_name(entry.db_object.owner)
-        object_type = _safe_name(entry.db_object.object_type.upper().replace(" ", "_"))
-        object_name = _safe_name(entry.db_object.object_name)
-        return self.snapshot_root / owner / object_type / f"{object_name}.sql"
+        return self.object_path(entry.db_object)
 
     def _atomic_write(self, path: Path, content: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -36,11 +53,58 @@ class SnapshotWriter:
             temp_path = Path(handle.name)
         temp_path.replace(path)
 
-    def write(self, entries: list[SnapshotEntry], dry_run: bool = False) -> WriteResult:
+    def _record_from_disk(self, path: Path, digest: str | None = None) -> FileRecord | None:
+        try:
+            stat = path.stat()
+            if digest is None:
+                digest = content_hash(path.read_text(encoding="utf-8"))
+        except OSError:
+            return None
+        return FileRecord(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=digest)
+
+    def _classify(
+        self,
+        target: Path,
+        content: str,
+        digest: str,
+        record: FileRecord | None,
+    ) -> tuple[str, FileRecord | None]:
+        if record is not None:
+            if not self.verify:
+                # 매니페스트를 신뢰하면 파일을 열지 않고 해시만 비교한다.
+                return ("unchanged" if record.sha256 == digest else "modified"), record
+            try:
+                stat = target.stat()
+            except FileNotFoundError:
+                return "added", None
+            if stat.st_size == record.size and stat.st_mtime_ns == record.mtime_ns:
+                return ("unchanged" if record.sha256 == digest else "modified"), record
+            self.logger.info("File manifest stale, comparing with disk: %s", target)
+
+        if not target.exists():
+            return "added", None
+        if target.read_text(encoding="utf-8") == content:
+            if self.manifest_path is None:
+                return "unchanged", None
+            return "unchanged", self._record_from_disk(target, digest)
+        return "modified", None
+
+    def write(
+        self,
+        entries: Iterable[SnapshotEntry],
+        dry_run: bool = False,
+        retained: Iterable[DbObject] = (),
+    ) -> WriteResult:
         desired_rel_paths: set[Path] = set()
         added_files: list[Path] = []
         modified_files: list[Path] = []
         unchanged_files = 0
+        written_bytes = 0
+
+        manifest = None
+        if self.manifest_path is not None:
+            manifest = FileManifest.load(self.manifest_path, logger=self.logger)
+        next_manifest = FileManifest()
 
         if not dry_run:
             self.snapshot_root.mkdir(parents=True, exist_ok=True)
@@ -54,14 +118,17 @@ class SnapshotWriter:
             if not content.endswith("\n"):
                 content += "\n"
 
-            exists_before = target.exists()
-            if exists_before:
-                current = target.read_text(encoding="utf-8")
-                if current == content:
-                    unchanged_files += 1
-                    continue
+            rel_key = rel_path.as_posix()
+            digest = content_hash(content)
+            record = manifest.get(rel_key) if manifest is not None else None
+            state, record = self._classify(target, content, digest, record)
+            if state == "unchanged":
+                unchanged_files += 1
+                if record is not None:
+                    next_manifest.records[rel_key] = record
+                continue
 
-            if exists_before:
+            if state == "modified":
                 modified_files.append(target)
             else:
                 added_files.append(target)
@@ -69,9 +136,42 @@ class SnapshotWriter:
             if dry_run:
                 continue
             self._atomic_write(target, content)
+            written_bytes += len(content.encode("utf-8"))
+            if self.manifest_path is not None:
+                written_record = self._record_from_disk(target, digest)
+                if written_record is not None:
+                    next_manifest.records[rel_key] = written_record
+
+        # 증분 실행에서 재추출하지 않은 객체는 기존 파일을 그대로 유지한다.
+        # entries가 스트림이면 retained는 추출이 끝난 뒤에 확정되므로 반드시 entries 다음에 읽는다.
+        for db_object in retained:
+            target = self.object_path(db_object)
+            rel_path = target.relative_to(self.snapshot_root)
+            desired_rel_paths.add(rel_path)
+            unchanged_files += 1
+            if self.manifest_path is not None and not dry_run:
+                rel_key = rel_path.as_posix()
+                record = manifest.get(rel_key) if manifest is not None else None
+                if record is None:
+                    record = self._record_from_disk(target)
+                if record is not None:
+                    next_manifest.records[rel_key] = record
 
         deleted_files: list[Path] = []
-        if self.snapshot_root.exists():
+        if manifest is not None and not self.verify:
+            # 직전 실행에 쓴 파일 목록과의 차집합으로 삭제 대상을 찾는다(rglob 생략).
+            desired_keys = {rel_path.as_posix() for rel_path in desired_rel_paths}
+            for rel_key in sorted(manifest.records):
+                if rel_key in desired_keys:
+                    continue
+                existing = self.snapshot_root / rel_key
+                if not existing.exists():
+                    continue
+                deleted_files.append(existing)
+                if dry_run:
+                    continue
+                existing.unlink()
+        elif self.snapshot_root.exists():
             for existing in self.snapshot_root.rglob("*.sql"):
                 rel_path = existing.relative_to(self.snapshot_root)
                 if rel_path in desired_rel_paths:
@@ -81,10 +181,14 @@ class SnapshotWriter:
                     continue
                 existing.unlink()
 
+        if self.manifest_path is not None and not dry_run:
+            next_manifest.save(self.manifest_path)
+
         return WriteResult(
             added_files=added_files,
             modified_files=modified_files,
             deleted_files=deleted_files,
             unchanged_files=unchanged_files,
+            written_bytes=written_bytes,
         )
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import queue
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_CLOSED = object()
+_ABORTED = object()
+
+
+class StreamAborted(RuntimeError):
+    pass
+
+
+class BoundedStream(Generic[T]):
+    """생산자 스레드와 소비자 스레드를 잇는 크기 제한 큐.
+
+    큐가 가득 차면 `put`이 막히므로 소비자가 느려도 메모리에 쌓이는 항목 수는 `maxsize`를 넘지 않는다.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=maxsize)
+        self._finished = False
+
+    def put(self, item: T) -> None:
+        self._queue.put(item)
+
+    def close(self) -> None:
+        self._queue.put(_CLOSED)
+
+    def abort(self) -> None:
+        self._queue.put(_ABORTED)
+
+    def __iter__(self) -> Iterator[T]:
+        while not self._finished:
+            item = self._queue.get()
+            if item is _CLOSED:
+                self._finished = True
+                return
+            if item is _ABORTED:
+                self._finished = True
+                raise StreamAborted("producer aborted the stream")
+            yield item  # type: ignore[misc]
+
+    def drain(self) -> None:
+        # 소비자가 중간에 실패해도 생산자가 put에서 멈추지 않도록 종료 표시까지 버린다.
+        while not self._finished:
+            item = self._queue.get()
+            if item is _CLOSED or item is _ABORTED:
+                self._finished = True
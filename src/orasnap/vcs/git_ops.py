@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
+from time import perf_counter
 
 from orasnap.models import GitResult
 
+ZERO_OID = "0" * 40
+PENDING_MARKER = "ORASNAP_COMMIT_PENDING"
+
 
 class GitError(RuntimeError):
     pass
@@ -13,14 +17,24 @@ class GitError(RuntimeError):
 class GitOps:
     def __init__(self, repo_path: Path) -> None:
         self.repo_path = repo_path
+        # git 하위 명령별 누적 실행 시간(초). 실행 지표로 내보낸다.
+        self.command_seconds: dict[str, float] = {}
 
-    def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess[str]:
+    def _run(
+        self,
+        *args: str,
+        check: bool = True,
+        input: str | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        started = perf_counter()
         process = subprocess.run(
             ["git", "-C", str(self.repo_path), *args],
             text=True,
             capture_output=True,
             check=False,
+            input=input,
         )
+        self.command_seconds[args[0]] = self.command_seconds.get(args[0], 0.0) + perf_counter() - started
         if check and process.returncode != 0:
             raise GitError(process.stderr.strip() or process.stdout.strip())
         return process
@@ -53,6 +67,12 @@ class GitOps:
             raise GitError(f"Current branch is '{current}', expected '{expected_branch}'.")
         return current
 
+    def _repo_relative(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.repo_path.resolve()).as_posix()
+        except ValueError as exc:
+            raise GitError(f"Path is outside the repository: {path}") from exc
+
     def stage(self, paths: list[Path]) -> None:
         if not paths:
             return
@@ -97,3 +117,73 @@ class GitOps:
 
         return GitResult(committed=True, commit_sha=sha, pushed=pushed)
 
+    def _pending_marker(self) -> Path:
+        git_dir = Path(self._run("rev-parse", "--git-dir").stdout.strip())
+        if not git_dir.is_absolute():
+            git_dir = self.repo_path / git_dir
+        return git_dir / PENDING_MARKER
+
+    def mark_pending(self) -> bool:
+        # commit_changes는 이번 실행의 변경 목록만 커밋하므로, 직전 실행이 쓰기 후 커밋 전에 끝났는지 표시해 둔다.
+        self.ensure_repo()
+        marker = self._pending_marker()
+        previous = marker.exists()
+        marker.touch()
+        return previous
+
+    def clear_pending(self) -> None:
+        self._pending_marker().unlink(missing_ok=True)
+
+    def commit_changes(
+        self,
+        changed_files: list[Path],
+        deleted_files: list[Path],
+        message: str,
+        auto_push: bool,
+        branch: str | None,
+        remote: str = "origin",
+    ) -> GitResult:
+        # 작업 트리 전체를 훑는 `git add`/`git status` 대신, 변경 파일만 plumbing 명령으로 커밋한다.
+        self.ensure_repo()
+        current = self.verify_branch(branch)
+
+        changed = sorted({self._repo_relative(path) for path in changed_files})
+        deleted = sorted({self._repo_relative(path) for path in deleted_files} - set(changed))
+        if not changed and not deleted:
+            return GitResult(committed=False, commit_sha=None, pushed=False)
+
+        index_lines: list[str] = []
+        if changed:
+            hashed = self._run("hash-object", "-w", "--stdin-paths", input="\n".join(changed) + "\n")
+            blob_ids = hashed.stdout.split()
+            if len(blob_ids) != len(changed):
+                raise GitError("git hash-object returned an unexpected number of object ids.")
+            for rel_path, blob_id in zip(changed, blob_ids):
+                index_lines.append(f"100644 {blob_id}\t{rel_path}")
+        for rel_path in deleted:
+            index_lines.append(f"0 {ZERO_OID}\t{rel_path}")
+        self._run("update-index", "-z", "--index-info", input="\0".join(index_lines) + "\0")
+
+        tree = self._run("write-tree").stdout.strip()
+        head = self._run("rev-parse", "--verify", "-q", "HEAD", check=False)
+        parent = head.stdout.strip() if head.returncode == 0 else None
+        if parent is not None:
+            parent_tree = self._run("rev-parse", f"{parent}^{{tree}}").stdout.strip()
+            if parent_tree == tree:
+                return GitResult(committed=False, commit_sha=None, pushed=False)
+
+        commit_args = ["commit-tree", tree]
+        if parent is not None:
+            commit_args.extend(["-p", parent])
+        if not message.endswith("\n"):
+            message += "\n"
+        sha = self._run(*commit_args, input=message).stdout.strip()
+        subject = message.splitlines()[0] if message else ""
+        self._run("update-ref", "-m", f"commit: {subject}", "HEAD", sha, parent or ZERO_OID)
+
+        pushed = False
+        if auto_push:
+            self._run("push", remote, current)
+            pushed = True
+
+        return GitResult(committed=True, commit_sha=sha, pushed=pushed)
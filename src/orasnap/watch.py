@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from orasnap.config import AppConfig
+from orasnap.oracle.chunking import CONNECTION_ERROR_CODES, error_code
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+if TYPE_CHECKING:
+    from orasnap.pipeline import SnapshotRunResult
+
+
+@dataclass
+class WatchSummary:
+    cycles: int = 0
+    failed_cycles: int = 0
+    reconnects: int = 0
+    last_result: "SnapshotRunResult | None" = None
+
+
+class SnapshotWatcher:
+    """세션을 열어 둔 채 DDL_AUDIT_LOG를 감시하다가 새 이벤트가 잠잠해지면 audit 모드 스냅샷을 만든다.
+
+    스냅샷은 한 번에 하나씩만 실행한다. 실행 중에 들어온 이벤트는 감사 테이블에 남아 있다가
+    다음 실행에 한꺼번에 반영되므로 배포 중 이벤트가 몰려도 메모리/작업이 쌓이지 않는다.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        extractor: OracleMetadataExtractor,
+        run_cycle: Callable[[], "SnapshotRunResult"],
+        logger: logging.Logger | None = None,
+        stop_event: threading.Event | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.config = config
+        self.extractor = extractor
+        self.run_cycle = run_cycle
+        self.logger = logger or logging.getLogger("orasnap")
+        self.stop_event = stop_event or threading.Event()
+        self.clock = clock
+        self.applied_audit_id: int | None = None
+        self._alert_name = config.watch.alert_name
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def _done(self, summary: WatchSummary, max_cycles: int | None) -> bool:
+        return self.stop_event.is_set() or (max_cycles is not None and summary.cycles >= max_cycles)
+
+    def run(self, max_cycles: int | None = None) -> WatchSummary:
+        watch = self.config.watch
+        summary = WatchSummary()
+        failures = 0
+        self.logger.info(
+            "Watch started. poll=%.1fs debounce=%.1fs max_delay=%.1fs alert=%s",
+            watch.poll_seconds,
+            watch.debounce_seconds,
+            watch.max_delay_seconds,
+            self._alert_name,
+        )
+        while not self._done(summary, max_cycles):
+            try:
+                with self.extractor.hold_session():
+                    while not self._done(summary, max_cycles):
+                        self._step(summary)
+                        failures = 0
+            except Exception as exc:
+                failures += 1
+                summary.reconnects += 1
+                delay = min(watch.poll_seconds * 2 ** (failures - 1), watch.max_backoff_seconds)
+                self.logger.warning("Watch session failed: %s. Reconnecting in %.1fs.", exc, delay)
+                self.stop_event.wait(delay)
+        self.logger.info(
+            "Watch stopped. cycles=%s failed_cycles=%s reconnects=%s",
+            summary.cycles,
+            summary.failed_cycles,
+            summary.reconnects,
+        )
+        return summary
+
+    def _step(self, summary: WatchSummary) -> None:
+        if self.applied_audit_id is None:
+            # 시작 직후 한 번 실행해서 중단된 동안 쌓인 이벤트(또는 첫 전체 스냅샷)를 반영한다.
+            self._run_cycle(summary)
+            return
+        latest = self.extractor.poll_audit_id(self.config.audit.table)
+        if latest <= self.applied_audit_id:
+            self._idle()
+            return
+        latest = self._settle(latest)
+        if self.stop_event.is_set():
+            # 남은 이벤트는 감사 테이블에 그대로 있으므로 다음 시작 때 반영된다.
+            return
+        self.logger.info(
+            "DDL events settled. audit_id=%s->%s",
+            self.applied_audit_id,
+            latest,
+        )
+        self._run_cycle(summary)
+
+    def _run_cycle(self, summary: WatchSummary) -> None:
+        try:
+            result = self.run_cycle()
+        except Exception:
+            summary.cycles += 1
+            summary.failed_cycles += 1
+            raise
+        summary.cycles += 1
+        summary.last_result = result
+        if result.audit_id is not None:
+            self.applied_audit_id = result.audit_id
+        elif self.applied_audit_id is None:
+            self.applied_audit_id = 0
+
+    def _settle(self, latest: int) -> int:
+        """AUDIT_ID가 debounce 동안 그대로이거나 max_delay가 지날 때까지 기다린다."""
+        watch = self.config.watch
+        first_seen = quiet_since = self.clock()
+        while watch.debounce_seconds > 0 and not self.stop_event.is_set():
+            now = self.clock()
+            quiet_left = watch.debounce_seconds - (now - quiet_since)
+            delay_left = watch.max_delay_seconds - (now - first_seen)
+            if quiet_left <= 0 or delay_left <= 0:
+                break
+            self.stop_event.wait(min(watch.poll_seconds, quiet_left, delay_left))
+            current = self.extractor.poll_audit_id(self.config.audit.table)
+            if current != latest:
+                latest = current
+                quiet_since = self.clock()
+        return latest
+
+    def _idle(self) -> None:
+        timeout = self.config.watch.poll_seconds
+        if self._alert_name is not None:
+            try:
+                # WAITONE은 세션을 막고 기다리므로 종료 요청은 최대 poll_seconds 뒤에 반영된다.
+                self.extractor.wait_for_alert(self._alert_name, timeout)
+                return
+            except Exception as exc:
+                if error_code(exc) in CONNECTION_ERROR_CODES:
+                    raise
+                self.logger.warning(
+                    "DBMS_ALERT wait failed for %s: %s. Falling back to polling.",
+                    self._alert_name,
+                    exc,
+                )
+                self._alert_name = None
+        self.stop_event.wait(timeout)
@@ -0,0 +1,174 @@
+"""DdlNormalizer 마이크로 벤치마크(pytest 수집 대상 아님).
+
+    python tests/unit/bench_normalizer.py --size-mb 5 --repeat 5
+
+수 MB짜리 GET_DDL 형태 입력(파티션 테이블, 패키지 본문, 뷰)을 만들어 현재 정규화기와
+이전 다중 패스 구현(_legacy_normalize, 변경 전 코드를 그대로 옮긴 것)의 소요 시간을 비교한다.
+리터럴/주석에 키워드가 없는 입력은 두 구현의 결과가 같아야 하므로 함께 확인한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from orasnap.normalize.ddl_normalizer import DdlNormalizer  # noqa: E402
+
+# 기준선: 단일 패스 스캐너 이전 DdlNormalizer.normalize를 그대로 옮긴 것(정규식/줄 처리 모두 원본과 같다).
+# 원래 STORAGE 정규식은 닫는 괄호가 없으면 역추적이 폭증하므로 아래 입력은 모두 괄호가 닫힌 절만 쓴다.
+_LEGACY_TABLESPACE = re.compile(r"(?is)\s+TABLESPACE\s+(?:\"[^\"]+\"|[A-Z0-9_$#]+)")
+_LEGACY_STORAGE = re.compile(r"(?is)\s+STORAGE\s*\((?:[^)(]+|\([^)(]*\))*\)")
+
+
+def _legacy_is_partition_instance_line(stripped_upper: str) -> bool:
+    if stripped_upper.startswith("PARTITION BY"):
+        return False
+    if stripped_upper.startswith("SUBPARTITION BY"):
+        return False
+    return stripped_upper.startswith("PARTITION ") or stripped_upper.startswith("SUBPARTITION ")
+
+
+def _legacy_remove_partition_instance_lines(text: str) -> str:
+    lines = text.split("\n")
+    output: list[str] = []
+    skipping = False
+    depth = 0
+
+    for line in lines:
+        stripped_upper = line.lstrip().upper()
+        if not skipping and _legacy_is_partition_instance_line(stripped_upper):
+            skipping = True
+            depth = line.count("(") - line.count(")")
+            if depth <= 0 and not line.rstrip().endswith(","):
+                skipping = False
+                depth = 0
+            continue
+
+        if skipping:
+            depth += line.count("(") - line.count(")")
+            if depth <= 0 and not line.rstrip().endswith(","):
+                skipping = False
+                depth = 0
+            continue
+
+        output.append(line)
+
+    return "\n".join(output)
+
+
+def _legacy_normalize(ddl: str) -> str:
+    """리터럴/주석을 구분하지 않던 이전 구현(LF 기준, 전체 텍스트 패스 여러 번)."""
+    text = ddl.replace("\r\n", "\n").replace("\r", "\n")
+    text = _LEGACY_STORAGE.sub("", text)
+    text = _LEGACY_TABLESPACE.sub("", text)
+    text = _legacy_remove_partition_instance_lines(text)
+
+    lines = [line.rstrip() for line in text.split("\n")]
+    compacted: list[str] = []
+    previous_blank = False
+    for line in lines:
+        is_blank = len(line.strip()) == 0
+        if is_blank and previous_blank:
+            continue
+        compacted.append(line)
+        previous_blank = is_blank
+
+    result = "\n".join(compacted).strip()
+    if result and not result.endswith("\n"):
+        result += "\n"
+    return result
+
+
+def partitioned_table(size_mb: float) -> str:
+    partition = (
+        '  PARTITION "P_{index:05d}"  VALUES LESS THAN ({bound}) SEGMENT CREATION IMMEDIATE \n'
+        "  PCTFREE 10 PCTUSED 40 INITRANS 1 MAXTRANS 255 \n NOCOMPRESS LOGGING \n"
+        "  STORAGE(INITIAL 8388608 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645\n"
+        "  PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1\n"
+        "  BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)\n"
+        '  TABLESPACE "USERS" '
+    )
+    count = max(1, int(size_mb * 1_000_000 / len(partition)))
+    parts = ",\n".join(partition.format(index=index, bound=index * 1000) for index in range(count))
+    columns = ",\n".join(f'\t"C_{index:03d}" VARCHAR2(100)' for index in range(50))
+    return (
+        f'\n  CREATE TABLE "HMES"."T_BIG" \n   (\t{columns}\n   ) PCTFREE 10\n'
+        '  STORAGE(INITIAL 65536)\n  TABLESPACE "USERS" \n  PARTITION BY RANGE ("C_000") \n'
+        f" (\n{parts} )  ;\n"
+    )
+
+
+def package_body(size_mb: float, with_keywords: bool = False) -> str:
+    # with_keywords=True면 주석/리터럴마다 STORAGE/TABLESPACE가 들어간 최악의 입력이 된다.
+    note = "storage (x)" if with_keywords else "counter"
+    literal = "tablespace users (" if with_keywords else "value ("
+    statement = (
+        "    v_{index} := v_{index} + 1; -- line {index} " + note + "   \n"
+        "    l_msg := '" + literal + "' || v_{index} || ')';\n"
+        "    /* block {index} */\n"
+    )
+    count = max(1, int(size_mb * 1_000_000 / len(statement)))
+    body = "".join(
+        statement.format(index=index) + ("\n\n" if index % 7 == 0 else "") for index in range(count)
+    )
+    return f'\n  CREATE OR REPLACE PACKAGE BODY "HMES"."PKG_BIG" AS\n  PROCEDURE p IS\n  BEGIN\n{body}  END;\nEND;\n'
+
+
+def view(size_mb: float) -> str:
+    column = '    "T{index}"."COL_{index}" AS "ALIAS_{index}",   \n'
+    count = max(1, int(size_mb * 1_000_000 / len(column)))
+    columns = "".join(column.format(index=index) for index in range(count))
+    return f'\n  CREATE OR REPLACE FORCE VIEW "HMES"."V_BIG" AS \n  SELECT\n{columns}    1 AS "X"\n  FROM DUAL\n'
+
+
+def _best_seconds(function: Callable[[str], str], ddl: str, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(ddl)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="DdlNormalizer micro-benchmark")
+    parser.add_argument("--size-mb", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    normalizer = DdlNormalizer("LF")
+    cases = [
+        ("partitioned_table", partitioned_table(args.size_mb), True),
+        ("package_body", package_body(args.size_mb), True),
+        ("view", view(args.size_mb), True),
+        # 이전 구현은 주석/리터럴 안의 키워드도 지우므로 결과 비교에서 뺀다.
+        ("package_body_keywords", package_body(args.size_mb, with_keywords=True), False),
+    ]
+    print("baseline: pre-change DdlNormalizer.normalize (verbatim copy of the multi-pass regex implementation)")
+    print(f"{'case':<24}{'MB':>7}{'legacy ms':>12}{'current ms':>12}{'MB/s':>9}{'speedup':>9}")
+    mismatched = []
+    for name, ddl, comparable in cases:
+        legacy_seconds, legacy_result = _best_seconds(_legacy_normalize, ddl, args.repeat)
+        current_seconds, current_result = _best_seconds(normalizer.normalize, ddl, args.repeat)
+        size_mb = len(ddl) / 1_000_000
+        print(
+            f"{name:<24}{size_mb:>7.1f}{legacy_seconds * 1000:>12.1f}{current_seconds * 1000:>12.1f}"
+            f"{size_mb / current_seconds:>9.1f}{legacy_seconds / current_seconds:>8.1f}x"
+        )
+        if comparable and legacy_result != current_result:
+            mismatched.append(name)
+    if mismatched:
+        print(f"output mismatch: {', '.join(mismatched)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+
+from orasnap.bench.harness import patched_oracledb
+from orasnap.bench.synthetic import SyntheticOracleDb, SyntheticSchema
+from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.models import DbObject
+from orasnap.oracle import extractor as extractor_module
+from orasnap.oracle.async_extractor import AsyncOracleMetadataExtractor
+
+VIEW_NAMES = [f"V_{index:03d}" for index in range(120)]
+
+
+class _FakeSyncCursor:
+    def __init__(self) -> None:
+        self._rows: list[tuple[object, ...]] = []
+
+    def execute(self, sql: str, binds: list[object] | None = None) -> None:
+        if "SET_TRANSFORM_PARAM" in sql:
+            self._rows = []
+        elif "LAST_DDL_TIME" in sql:
+            ddl_time = datetime(2026, 2, 13, 8, 0, 0)
+            self._rows = [("HMES", "VIEW", name, ddl_time) for name in VIEW_NAMES]
+        else:
+            raise AssertionError(f"unexpected SQL on discovery session: {sql}")
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+class _FakeSyncConnection:
+    def cursor(self) -> _FakeSyncCursor:
+        return _FakeSyncCursor()
+
+    def close(self) -> None:
+        return None
+
+
+class _FakeAsyncCursor:
+    def __init__(self, connection: "_FakeAsyncConnection") -> None:
+        self.connection = connection
+        self._rows: list[tuple[object, ...]] = []
+
+    async def execute(self, sql: str, binds: list[object] | None = None) -> None:
+        binds = binds or []
+        if "SET_TRANSFORM_PARAM" in sql:
+            self.connection.transforms += 1
+            self._rows = []
+        elif "DBMS_METADATA.GET_DDL(:1, OBJECT_NAME" in sql:
+            # 변환 파라미터는 session_callback에서 세션당 한 번만 설정한다.
+            assert self.connection.transforms == 1
+            # 마지막 뷰는 벌크 결과에서 빠뜨려 단건 폴백 경로를 확인한다.
+            self._rows = [(name, f"DDL {name}") for name in binds[4] if name != "V_119"]
+        elif "DBMS_METADATA.GET_DDL(:1, :2, :3)" in sql:
+            self._rows = [(f"SINGLE {binds[1]}",)]
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    async def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+    async def fetchone(self) -> tuple[object, ...] | None:
+        return self._rows[0] if self._rows else None
+
+
+class _FakeNameListType:
+    def newobject(self, names: list[str]) -> tuple[str, ...]:
+        return tuple(names)
+
+
+class _FakeAsyncConnection:
+    def __init__(self) -> None:
+        self.transforms = 0
+
+    def cursor(self) -> _FakeAsyncCursor:
+        return _FakeAsyncCursor(self)
+
+    async def gettype(self, _name: str) -> _FakeNameListType:
+        return _FakeNameListType()
+
+
+class _FakeAcquire:
+    def __init__(self, pool: "_FakeAsyncPool") -> None:
+        self.pool = pool
+
+    async def __aenter__(self) -> _FakeAsyncConnection:
+        self.pool.active += 1
+        self.pool.peak = max(self.pool.peak, self.pool.active)
+        connection = _FakeAsyncConnection()
+        await self.pool.kwargs["session_callback"](connection, None)
+        self.pool.sessions += 1
+        return connection
+
+    async def __aexit__(self, *_: object) -> None:
+        self.pool.active -= 1
+
+
+class _FakeAsyncPool:
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+        self.active = 0
+        self.peak = 0
+        self.sessions = 0
+        self.closed = False
+
+    def acquire(self) -> _FakeAcquire:
+        return _FakeAcquire(self)
+
+    async def close(self, force: bool = False) -> None:
+        self.closed = True
+
+
+class _FakeOracleDb:
+    def __init__(self) -> None:
+        self.pool: _FakeAsyncPool | None = None
+
+    def connect(self, **_: object) -> _FakeSyncConnection:
+        return _FakeSyncConnection()
+
+    def create_pool(self, **_: object) -> None:
+        raise AssertionError("async engine should not create a threaded pool")
+
+    def create_pool_async(self, **kwargs: object) -> _FakeAsyncPool:
+        self.pool = _FakeAsyncPool(**kwargs)
+        return self.pool
+
+
+def test_async_extraction_keeps_discovery_order(monkeypatch) -> None:
+    fake_db = _FakeOracleDb()
+    monkeypatch.setattr(extractor_module, "oracledb", fake_db)
+
+    extractor = AsyncOracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+            workers=3,
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+    )
+
+    result = extractor.extract()
+
+    assert result.failures == []
+    assert [item.db_object.object_name for item in result.items] == VIEW_NAMES
+    assert result.items[0].ddl == "DDL V_000"
+    assert result.items[-1].ddl == "SINGLE V_119"
+    assert fake_db.pool is not None
+    assert fake_db.pool.kwargs["max"] == 3
+    assert 1 <= fake_db.pool.peak <= 3
+    assert fake_db.pool.closed
+
+
+def test_async_extraction_feeds_sink_off_the_event_loop(monkeypatch) -> None:
+    fake_db = _FakeOracleDb()
+    monkeypatch.setattr(extractor_module, "oracledb", fake_db)
+    extractor = AsyncOracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+            workers=2,
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+    )
+    received: list[str] = []
+    threads: set[str] = set()
+
+    def sink(item) -> None:
+        # 파이프라인 sink는 쓰기 단계가 밀리면 블록되므로 이벤트 루프 스레드에서 부르면 안 된다.
+        threads.add(threading.current_thread().name)
+        received.append(item.db_object.object_name)
+
+    result = extractor.extract(sink=sink)
+
+    assert result.failures == []
+    assert received == VIEW_NAMES
+    assert threading.main_thread().name not in threads
+
+
+def test_async_batched_comment_failure_falls_back_per_table(monkeypatch) -> None:
+    database = SyntheticOracleDb(
+        SyntheticSchema(
+            tables=4,
+            partitions_per_table=0,
+            indexes_per_table=1,
+            comments_per_table=2,
+            views=0,
+            packages=0,
+            audit_rows=0,
+            latency_ms=0.0,
+        )
+    )
+    original = database.server.execute
+
+    def execute(sql: str, binds: list[object]) -> tuple[list[tuple[object, ...]], int]:
+        # 여러 테이블을 묶은 코멘트 조회만 실패시킨다.
+        if "FROM ALL_COL_COMMENTS" in sql and len(binds[1].aslist()) > 1:
+            raise RuntimeError("ORA-04036: PGA memory used by the instance exceeds PGA_AGGREGATE_LIMIT")
+        return original(sql, binds)
+
+    monkeypatch.setattr(database.server, "execute", execute)
+    extractor = AsyncOracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+            workers=2,
+        ),
+        scope_config=ScopeConfig(include_schemas=["BENCH"], object_types=["TABLE", "INDEX"]),
+    )
+    tables = [
+        DbObject(owner="BENCH", object_type="TABLE", object_name=name)
+        for object_type, name in database.catalog.objects
+        if object_type == "TABLE"
+    ]
+
+    with patched_oracledb(database):
+        items, failures = extractor._run_extraction(None, None, tables)
+
+    assert failures == []
+    assert [item.db_object.object_name for item in items] == [item.object_name for item in tables]
+    for item in items:
+        assert f"{item.db_object.object_name} column 2" in item.ddl
+        assert f"IX_{item.db_object.object_name}_1" in item.ddl
@@ -23,6 +23,10 @@ class _FakeCursor:
     def fetchall(self) -> list[tuple[object, ...]]:
         return self._rows
 
+    def fetchmany(self, size: int) -> list[tuple[object, ...]]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
 
 class _FakeConnection:
     def __init__(self, rows: list[tuple[object, ...]]) -> None:
@@ -57,8 +61,9 @@ class _FakeLob:
     def __init__(self, payload: str) -> None:
         self._payload = payload
 
-    def read(self) -> str:
-        return self._payload
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
+        end = None if amount is None else offset - 1 + amount
+        return self._payload[offset - 1 : end]
 
 
 class _ConnBoundLob:
@@ -66,10 +71,11 @@ class _ConnBoundLob:
         self._payload = payload
         self._connection = connection
 
-    def read(self) -> str:
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
         if self._connection.closed:
             raise RuntimeError("DPY-1001: not connected to database")
-        return self._payload
+        end = None if amount is None else offset - 1 + amount
+        return self._payload[offset - 1 : end]
 
 
 def test_audit_exporter_writes_jsonl_and_state(tmp_path: Path, monkeypatch) -> None:
@@ -179,3 +185,91 @@ def test_audit_exporter_reads_lob_before_connection_close(tmp_path: Path, monkey
     output_file = audit_root / "ORCLPDB" / "HMES" / "TABLE" / "T_TEST.jsonl"
     record = json.loads(output_file.read_text(encoding="utf-8").strip())
     assert "ALTER TABLE HMES.T_TEST" in record["sql_text"]
+
+
+def _audit_row(audit_id: int, obj_name: str) -> tuple[object, ...]:
+    return (
+        audit_id,
+        datetime(2026, 2, 13, 15, 0, 0),
+        "ALTER",
+        "HMES",
+        "HMES",
+        "HMES",
+        "windows",
+        "pc1",
+        "192.168.0.10",
+        "SQL Developer",
+        "HMES",
+        "TABLE",
+        obj_name,
+        f"ALTER TABLE HMES.{obj_name} ADD C{audit_id} NUMBER",
+    )
+
+
+def _exporter(tmp_path: Path, batch_size: int) -> OracleAuditExporter:
+    return OracleAuditExporter(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="orasnap_svc",
+            password="pw",
+        ),
+        service_name="ORCLPDB",
+        audit_root=tmp_path / "_audit",
+        state_path=tmp_path / "logs" / "audit_state.json",
+        table_name="DDL_AUDIT_LOG",
+        batch_size=batch_size,
+    )
+
+
+def test_audit_exporter_checkpoints_each_batch(tmp_path: Path, monkeypatch) -> None:
+    rows = [_audit_row(101, "T_A"), _audit_row(102, "T_B"), _audit_row(103, "T_A")]
+    oracle_db = _FakeOracleDb(rows)
+    monkeypatch.setattr(audit_exporter, "oracledb", oracle_db)
+
+    original_fetchmany = _FakeCursor.fetchmany
+    calls = {"count": 0}
+
+    def _failing_fetchmany(self: _FakeCursor, size: int) -> list[tuple[object, ...]]:
+        calls["count"] += 1
+        if calls["count"] == 2:
+            raise RuntimeError("ORA-03113: end-of-file on communication channel")
+        return original_fetchmany(self, size)
+
+    monkeypatch.setattr(_FakeCursor, "fetchmany", _failing_fetchmany)
+    result = _exporter(tmp_path, batch_size=2).export(dry_run=False)
+
+    assert result.exported_count == 2
+    assert oracle_db.connection is not None
+    assert oracle_db.connection._cursor.arraysize == 2
+    state = json.loads((tmp_path / "logs" / "audit_state.json").read_text(encoding="utf-8"))
+    assert state == {"ORCLPDB::ORASNAP_SVC": 102}
+    table_dir = tmp_path / "_audit" / "ORCLPDB" / "HMES" / "TABLE"
+    assert len((table_dir / "T_A.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_audit_exporter_recovers_interrupted_batch(tmp_path: Path, monkeypatch) -> None:
+    state_path = tmp_path / "logs" / "audit_state.json"
+    state_path.parent.mkdir(parents=True)
+    state_path.write_text(
+        json.dumps({"ORCLPDB::ORASNAP_SVC": 100, "ORCLPDB::ORASNAP_SVC::pending": 103}),
+        encoding="utf-8",
+    )
+    table_dir = tmp_path / "_audit" / "ORCLPDB" / "HMES" / "TABLE"
+    table_dir.mkdir(parents=True)
+    # 직전 실행이 T_A에 101만 쓰고 103을 쓰는 도중 중단된 상태.
+    (table_dir / "T_A.jsonl").write_text('{"audit_id": 101}\n{"audit_id": 1', encoding="utf-8")
+
+    rows = [_audit_row(101, "T_A"), _audit_row(102, "T_B"), _audit_row(103, "T_A")]
+    monkeypatch.setattr(audit_exporter, "oracledb", _FakeOracleDb(rows))
+    result = _exporter(tmp_path, batch_size=2).export(dry_run=False)
+
+    assert result.exported_count == 2
+    ids = [
+        json.loads(line)["audit_id"]
+        for line in (table_dir / "T_A.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    assert ids == [101, 103]
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state == {"ORCLPDB::ORASNAP_SVC": 103}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from orasnap.bench.harness import run_scenario
+from orasnap.bench.synthetic import SyntheticSchema
+from orasnap.oracle import audit_exporter, extractor
+
+
+def test_bench_scenarios_run_pipeline_on_synthetic_schema() -> None:
+    schema = SyntheticSchema(
+        tables=6,
+        partitions_per_table=2,
+        indexes_per_table=2,
+        comments_per_table=2,
+        views=3,
+        packages=2,
+        package_lines=5,
+        audit_rows=4,
+        latency_ms=0.0,
+    )
+    original = extractor.oracledb
+
+    bulk = run_scenario("bulk", schema, track_memory=False)
+    assert bulk.objects == 6 + 12 + 3 + 4
+    assert bulk.extracted == 6 + 3 + 4
+    assert bulk.written == bulk.extracted
+    assert bulk.audit_exported == 4
+    assert [sample.stage for sample in bulk.stages] == ["extract", "write", "audit", "git"]
+
+    incremental = run_scenario("incremental", schema, workers=2, change_ratio=0.25)
+    assert 0 < incremental.extracted < bulk.extracted
+    assert incremental.peak_bytes > 0
+
+    assert extractor.oracledb is original
+    assert audit_exporter.oracledb is original
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from orasnap.models import DbObject
+from orasnap.oracle.chunking import AdaptiveChunkSizer, BisectState, error_code
+
+
+def test_adaptive_chunk_sizer_tracks_latency_and_payload_per_type() -> None:
+    sizer = AdaptiveChunkSizer(target_seconds=1.0, target_bytes=1000)
+    table_key = ("bulk", "TABLE")
+    view_key = ("bulk", "VIEW")
+
+    assert sizer.size(table_key, 500) == 500
+    # 객체당 0.01초면 1초 목표에는 100개가 맞지만 한 번에 절반까지만 줄인다.
+    assert sizer.observe(table_key, 500, 500, 5.0, 0) == 250
+    assert sizer.observe(table_key, 500, 250, 2.5, 0) == 125
+    assert sizer.observe(table_key, 500, 125, 1.25, 0) == 100
+    # 페이로드가 크면 시간과 무관하게 줄인다.
+    assert sizer.observe(view_key, 500, 100, 0.01, 100 * 50) == 250
+    assert sizer.size(view_key, 500) == 250
+    assert sizer.observe(table_key, 500, 100, 0.1, 0) == 200
+    assert sizer.shrink(table_key, 500) == 100
+    assert sizer.size(table_key, 200) == 100
+    for _ in range(10):
+        sizer.shrink(table_key, 500)
+    assert sizer.size(table_key, 500) == 10
+
+
+def test_bisect_state_stops_on_connection_errors_and_budget() -> None:
+    chunk = [DbObject(owner="HMES", object_type="VIEW", object_name=f"V_{index}") for index in range(4)]
+
+    state = BisectState(budget=2)
+    assert state.split(chunk, RuntimeError("ORA-00942: table or view does not exist")) == [
+        chunk[2:],
+        chunk[:2],
+    ]
+    assert state.split(chunk[:2], RuntimeError("ORA-00942")) == []
+    assert state.split(chunk[:1], RuntimeError("ORA-00942")) == []
+    assert list(state.isolated) == [("HMES", "VIEW", "V_0")]
+    assert state.failures == 3
+
+    connection_lost = RuntimeError("DPY-4011: the database or network closed the connection")
+    assert BisectState(budget=10).split(chunk, connection_lost) == []
+    assert error_code(connection_lost) == "DPY-4011"
+    assert error_code(ValueError("boom")) == "ValueError"
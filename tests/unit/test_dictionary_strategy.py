@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from orasnap.bench.harness import bench_config, init_repo, patched_oracledb, run_pipeline
+from orasnap.bench.synthetic import SyntheticOracleDb, SyntheticSchema
+from orasnap.config import ConfigError, OracleConfig, ScopeConfig, load_config
+from orasnap.models import DbObject, ExtractedDdl
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+_SCHEMA = SyntheticSchema(
+    tables=3,
+    partitions_per_table=0,
+    indexes_per_table=0,
+    comments_per_table=0,
+    views=4,
+    packages=1,
+    package_lines=2,
+    sequences=3,
+    # _bulk_chunk_size(500)보다 많으면 이름 필터 없이 스키마 전체를 읽는다.
+    synonyms=600,
+    audit_rows=0,
+    latency_ms=0.0,
+)
+_DICTIONARY_TYPES = {"VIEW", "SEQUENCE", "SYNONYM"}
+
+
+def _extractor() -> OracleMetadataExtractor:
+    return OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope_config=ScopeConfig(
+            include_schemas=["BENCH"],
+            object_types=sorted(_DICTIONARY_TYPES),
+            type_strategies={object_type: "dictionary" for object_type in _DICTIONARY_TYPES},
+        ),
+    )
+
+
+def _dictionary_objects(database: SyntheticOracleDb) -> list[DbObject]:
+    return [
+        DbObject(owner="BENCH", object_type=object_type, object_name=name)
+        for object_type, name in database.catalog.objects
+        if object_type in _DICTIONARY_TYPES
+    ]
+
+
+def _count_get_ddl(monkeypatch, database: SyntheticOracleDb, rewrite=None) -> list[str]:
+    calls: list[str] = []
+    original = database.catalog.ddl
+
+    def ddl(object_type: str, name: str) -> str | None:
+        calls.append(object_type)
+        text = original(object_type, name)
+        return rewrite(object_type, text) if rewrite is not None and text is not None else text
+
+    monkeypatch.setattr(database.catalog, "ddl", ddl)
+    return calls
+
+
+def test_dictionary_strategy_renders_get_ddl_text(monkeypatch) -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    expected = {
+        (object_type, name): database.catalog.ddl(object_type, name)
+        for object_type, name in database.catalog.objects
+    }
+    calls = _count_get_ddl(monkeypatch, database)
+    extractor = _extractor()
+    # 무작위 표본은 빼고 타입마다 처음 객체들만 비교하게 한다.
+    extractor._verify_random = 0
+    objects = _dictionary_objects(database)
+    items: list[ExtractedDdl] = []
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_dictionary(extractor._cursor(connection), objects, items.append)
+
+    assert fallback == []
+    assert len(items) == len(objects)
+    for item in items:
+        assert item.ddl == expected[(item.db_object.object_type, item.db_object.object_name)]
+    assert sorted(calls) == ["SEQUENCE"] * 3 + ["SYNONYM"] * 3 + ["VIEW"] * 3
+
+
+def test_dictionary_pipeline_writes_same_files_as_bulk(tmp_path: Path) -> None:
+    logger = logging.getLogger("test")
+    outputs: dict[str, dict[str, str]] = {}
+    for scenario in ("bulk", "dictionary"):
+        work_dir = tmp_path / scenario
+        with patched_oracledb(SyntheticOracleDb(_SCHEMA)):
+            init_repo(work_dir / "repo")
+            config = bench_config(work_dir, _SCHEMA, scenario, workers=1)
+            result = run_pipeline(config, work_dir, logger)
+        assert result.failed_count == 0
+        root = Path(config.output.snapshot_root)
+        outputs[scenario] = {
+            str(path.relative_to(root)): path.read_text(encoding="utf-8")
+            for path in sorted(root.rglob("*.sql"))
+        }
+
+    assert outputs["dictionary"] == outputs["bulk"]
+    assert len(outputs["dictionary"]) > _SCHEMA.synonyms
+
+
+def test_dictionary_renderers_follow_get_ddl_layout() -> None:
+    extractor = OracleMetadataExtractor
+
+    assert extractor._view_ddl("HMES", "V_A", "select 1 x from dual", ["X"], "Y") == (
+        '\n  CREATE OR REPLACE FORCE EDITIONABLE VIEW "HMES"."V_A" ("X") AS \n  select 1 x from dual;'
+    )
+    # 컬럼 목록을 모르면 GET_DDL로 넘긴다.
+    assert extractor._view_ddl("HMES", "V_A", "select 1 x from dual", [], "Y") is None
+
+    sequence = extractor._sequence_ddl(
+        "HMES", "SEQ_A", ("1", "999", "5", "41", 0, "Y", "Y", "N", "Y", "N", "N")
+    )
+    assert sequence == (
+        '\n   CREATE SEQUENCE  "HMES"."SEQ_A"  MINVALUE 1 MAXVALUE 999 INCREMENT BY 5 START WITH 41 NOCACHE '
+        "ORDER  CYCLE  NOKEEP  SCALE  NOEXTEND  GLOBAL ;"
+    )
+
+    assert extractor._synonym_ddl("HMES", "S_A", "REMOTE", "T_A", "LINK.WORLD", "N") == (
+        '\n  CREATE OR REPLACE NONEDITIONABLE SYNONYM "HMES"."S_A" FOR "REMOTE"."T_A"@"LINK.WORLD";'
+    )
+    assert extractor._synonym_ddl("PUBLIC", "S_A", "HMES", "T_A", None, "N") == (
+        '\n  CREATE OR REPLACE PUBLIC SYNONYM "S_A" FOR "HMES"."T_A";'
+    )
+
+
+def test_dictionary_mismatch_with_get_ddl_falls_back(monkeypatch) -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    # 이 DB 버전의 GET_DDL은 시노님에 EDITIONABLE을 붙이지 않는 경우.
+    calls = _count_get_ddl(
+        monkeypatch,
+        database,
+        lambda object_type, text: text.replace("EDITIONABLE ", "") if object_type == "SYNONYM" else text,
+    )
+    extractor = _extractor()
+    objects = _dictionary_objects(database)
+    items: list[ExtractedDdl] = []
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_dictionary(extractor._cursor(connection), objects, items.append)
+
+    assert {item.object_type for item in fallback} == {"SYNONYM"}
+    assert len(fallback) == _SCHEMA.synonyms
+    assert {item.db_object.object_type for item in items} == {"VIEW", "SEQUENCE"}
+    # 불일치가 확인되면 나머지 시노님은 비교하지 않고 바로 GET_DDL 대상으로 넘긴다.
+    assert calls.count("SYNONYM") == 1
+
+
+def test_dictionary_mismatch_falls_back_per_variant(monkeypatch) -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    # DB 링크 시노님만 이 DB 버전의 GET_DDL과 모양이 다른 경우.
+    linked = {name for object_type, name in database.catalog.objects if object_type == "SYNONYM"}
+    linked = set(sorted(linked)[1::2])
+    original_rows = database.catalog.dictionary_rows
+    original_ddl = database.catalog.ddl
+
+    def dictionary_rows(object_type: str, names: set[str] | None) -> list[tuple]:
+        rows = original_rows(object_type, names)
+        if object_type != "SYNONYM":
+            return rows
+        return [(row[0], row[1], row[2], "LINK.WORLD" if row[0] in linked else None, row[4]) for row in rows]
+
+    def ddl(object_type: str, name: str) -> str | None:
+        text = original_ddl(object_type, name)
+        if object_type == "SYNONYM" and name in linked and text is not None:
+            return text.replace('";', '"@LINK.WORLD;')
+        return text
+
+    monkeypatch.setattr(database.catalog, "dictionary_rows", dictionary_rows)
+    monkeypatch.setattr(database.catalog, "ddl", ddl)
+    extractor = _extractor()
+    extractor._verify_random = 0
+    objects = [item for item in _dictionary_objects(database) if item.object_type == "SYNONYM"]
+    items: list[ExtractedDdl] = []
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_dictionary(extractor._cursor(connection), objects, items.append)
+
+    # 렌더러는 "LINK.WORLD"로 따옴표를 붙이므로 DB 링크 시노님만 GET_DDL로 넘어간다.
+    assert {item.object_name for item in fallback} == linked
+    assert {item.db_object.object_name for item in items} == {item.object_name for item in objects} - linked
+
+
+def test_dictionary_strategy_is_rejected_for_other_types(tmp_path: Path) -> None:
+    config_file = tmp_path / "snapshot.yml"
+    config_file.write_text(
+        "oracle:\n  host: h\n  port: 1521\n  service_name: s\n  username: u\n  password: p\n"
+        "scope:\n  include_schemas: [HMES]\n  type_strategies:\n    TABLE: dictionary\n"
+        f"output:\n  snapshot_root: {tmp_path / 'out'}\n"
+        f"git:\n  repo_path: {tmp_path}\n",
+        encoding="utf-8",
+    )
+
+    try:
+        load_config(config_file)
+    except ConfigError as exc:
+        assert "TABLE" in str(exc)
+    else:
+        raise AssertionError("ConfigError was not raised")
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+
+class _FakeNameListType:
+    def newobject(self, names: list[str]) -> tuple[str, ...]:
+        return tuple(names)
+
+
+class _FakeConnection:
+    def gettype(self, _name: str) -> _FakeNameListType:
+        return _FakeNameListType()
+
+
+class _FakeCursor:
+    def __init__(self, behaviors: dict[tuple[object, ...], list[tuple[object, ...]]]) -> None:
+        self.behaviors = behaviors
+        self.connection = _FakeConnection()
+        self._rows: list[tuple[object, ...]] = []
+
+    def execute(self, _sql: str, binds: list[object]) -> None:
+        self._rows = self.behaviors[tuple(binds)]
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+def _build_extractor(object_types: list[str]) -> OracleMetadataExtractor:
+    return OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=object_types),
+    )
+
+
+def test_fetch_audit_events_skips_truncate_and_tracks_watermark() -> None:
+    extractor = _build_extractor(["TABLE", "INDEX"])
+    cursor = _FakeCursor(
+        {
+            (10,): [
+                (11, "ALTER", "hmes", "TABLE", "T1"),
+                (12, "TRUNCATE", "HMES", "TABLE", "T2"),
+                (13, "CREATE", None, None, None),
+            ]
+        }
+    )
+
+    audit_id, events = extractor._fetch_audit_events(cursor, "DDL_AUDIT_LOG", 10)
+
+    assert audit_id == 13
+    assert events == [("HMES", "TABLE", "T1")]
+
+
+def test_resolve_audit_targets_maps_indexes_comments_and_bodies() -> None:
+    extractor = _build_extractor(["TABLE", "INDEX", "PACKAGE", "PACKAGE BODY"])
+    cursor = _FakeCursor(
+        {
+            ("HMES", ("IX_DROPPED", "IX_T1")): [("IX_T1", "HMES", "T1")],
+        }
+    )
+
+    targets, sweep_owners = extractor._resolve_audit_targets(
+        cursor,
+        [
+            ("HMES", "INDEX", "IX_T1"),
+            ("HMES", "INDEX", "IX_DROPPED"),
+            ("HMES", "COLUMN", "T2.C1"),
+            ("HMES", "PACKAGE BODY", "PKG_UTIL"),
+        ],
+    )
+
+    assert targets == {
+        ("HMES", "TABLE", "T1"),
+        ("HMES", "TABLE", "T2"),
+        ("HMES", "PACKAGE BODY", "PKG_UTIL"),
+        ("HMES", "PACKAGE", "PKG_UTIL"),
+    }
+    assert sweep_owners == {"HMES"}
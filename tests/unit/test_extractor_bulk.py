@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from datetime import datetime
+from types import SimpleNamespace
+
+import orasnap.oracle.extractor as extractor_module
 from orasnap.config import OracleConfig, ScopeConfig
 from orasnap.models import DbObject
 from orasnap.oracle.extractor import OracleMetadataExtractor
@@ -9,13 +13,29 @@ class _FakeLob:
     def __init__(self, payload: str) -> None:
         self.payload = payload
 
-    def read(self) -> str:
-        return self.payload
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
+        end = None if amount is None else offset - 1 + amount
+        return self.payload[offset - 1 : end]
+
+
+class _FakeNameListType:
+    def newobject(self, names: list[str]) -> tuple[str, ...]:
+        return tuple(names)
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.gettype_calls = 0
+
+    def gettype(self, _name: str) -> _FakeNameListType:
+        self.gettype_calls += 1
+        return _FakeNameListType()
 
 
 class _FakeCursor:
     def __init__(self, behaviors: dict[tuple[object, ...], object]) -> None:
         self.behaviors = behaviors
+        self.connection = _FakeConnection()
         self._rows: list[tuple[object, ...]] = []
 
     def execute(self, _sql: str, binds: list[object]) -> None:
@@ -51,11 +71,11 @@ def test_extract_ddl_bulk_success() -> None:
     extractor = _build_extractor()
     cursor = _FakeCursor(
         {
-            ("VIEW", "HMES", "HMES", "VIEW", "V_A", "V_B"): [
+            ("VIEW", "HMES", "HMES", "VIEW", ("V_A", "V_B")): [
                 ("V_A", "DDL_VIEW_A"),
                 ("V_B", _FakeLob("DDL_VIEW_B")),
             ],
-            ("PACKAGE_BODY", "HMES", "HMES", "PACKAGE BODY", "PKG_UTIL"): [
+            ("PACKAGE_BODY", "HMES", "HMES", "PACKAGE BODY", ("PKG_UTIL",)): [
                 ("PKG_UTIL", "DDL_PKG_BODY")
             ],
         }
@@ -78,8 +98,8 @@ def test_extract_ddl_bulk_group_failure_marks_fallback_targets() -> None:
     extractor = _build_extractor()
     cursor = _FakeCursor(
         {
-            ("VIEW", "HMES", "HMES", "VIEW", "V_A", "V_B"): RuntimeError("bulk failed"),
-            ("SEQUENCE", "HMES", "HMES", "SEQUENCE", "SEQ_A"): [("SEQ_A", "DDL_SEQ_A")],
+            ("VIEW", "HMES", "HMES", "VIEW", ("V_A", "V_B")): RuntimeError("bulk failed"),
+            ("SEQUENCE", "HMES", "HMES", "SEQUENCE", ("SEQ_A",)): [("SEQ_A", "DDL_SEQ_A")],
         }
     )
 
@@ -97,7 +117,7 @@ def test_extract_ddl_bulk_missing_rows_mark_fallback_targets() -> None:
     extractor = _build_extractor()
     cursor = _FakeCursor(
         {
-            ("VIEW", "HMES", "HMES", "VIEW", "V_A", "V_B"): [("V_A", "DDL_VIEW_A")],
+            ("VIEW", "HMES", "HMES", "VIEW", ("V_A", "V_B")): [("V_A", "DDL_VIEW_A")],
         }
     )
 
@@ -108,3 +128,158 @@ def test_extract_ddl_bulk_missing_rows_mark_fallback_targets() -> None:
 
     assert ddls == {("HMES", "VIEW", "V_A"): "DDL_VIEW_A"}
     assert failed == [view_b]
+    view_metrics = extractor.metrics.types["VIEW"]
+    assert (view_metrics.bulk_hits, view_metrics.fallbacks) == (1, 1)
+    assert view_metrics.bytes_fetched == len("DDL_VIEW_A")
+    assert view_metrics.latency["bulk"].count == 1
+
+
+def test_extract_ddl_bulk_streams_oversized_lob_column() -> None:
+    extractor = _build_extractor()
+    cursor = _FakeCursor(
+        {
+            ("VIEW", "HMES", "HMES", "VIEW", ("V_A", "V_B")): [
+                ("V_A", "DDL_VIEW_A", None),
+                ("V_B", None, _FakeLob("DDL_VIEW_B" * 3)),
+            ],
+        }
+    )
+    extractor.oracle_config = OracleConfig(
+        host="127.0.0.1",
+        port=1521,
+        service_name="ORCLPDB",
+        username="ORASNAP_SVC",
+        password="pw",
+        lob_chunk_size=4,
+    )
+
+    view_a = DbObject(owner="HMES", object_type="VIEW", object_name="V_A")
+    view_b = DbObject(owner="HMES", object_type="VIEW", object_name="V_B")
+    ddls, failed = extractor._extract_ddl_bulk(cursor, [view_a, view_b])
+
+    assert failed == []
+    assert ddls[("HMES", "VIEW", "V_B")] == "DDL_VIEW_B" * 3
+
+
+class _FakeRefCursor:
+    def __init__(self) -> None:
+        self.value: _FakeCursor | None = None
+
+    def getvalue(self) -> _FakeCursor | None:
+        return self.value
+
+
+class _FakeMetadataApiCursor:
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self.rows = rows
+        self.calls: list[tuple[str, list[object]]] = []
+
+    def var(self, _db_type: object) -> _FakeRefCursor:
+        return _FakeRefCursor()
+
+    def execute(self, sql: str, binds: list[object]) -> None:
+        self.calls.append((sql, binds))
+        ref_cursor = _FakeCursor({})
+        ref_cursor._rows = self.rows
+        binds[3].value = ref_cursor
+
+
+def test_extract_ddl_metadata_api_strategy_joins_rows_per_object(monkeypatch) -> None:
+    monkeypatch.setattr(extractor_module, "oracledb", SimpleNamespace(DB_TYPE_CURSOR="CURSOR"))
+    extractor = OracleMetadataExtractor(
+        oracle_config=_build_extractor().oracle_config,
+        scope_config=ScopeConfig(
+            include_schemas=["HMES"],
+            object_types=["PACKAGE"],
+            type_strategies={"PACKAGE": "metadata_api"},
+        ),
+    )
+    cursor = _FakeMetadataApiCursor(
+        [
+            ("PKG_A", "SPEC_A;", None),
+            ("PKG_A", None, _FakeLob("BODY_A;")),
+            ("PKG_B", "SPEC_B;", None),
+        ]
+    )
+
+    pkg_a = DbObject(owner="HMES", object_type="PACKAGE", object_name="PKG_A")
+    pkg_b = DbObject(owner="HMES", object_type="PACKAGE", object_name="O'NEIL")
+    ddls, failed = extractor._extract_ddl_bulk(cursor, [pkg_a, pkg_b])
+
+    sql, binds = cursor.calls[0]
+    assert "DBMS_METADATA.OPEN(:1)" in sql
+    assert binds[:3] == ["PACKAGE", "HMES", "IN ('PKG_A', 'O''NEIL')"]
+    assert ddls == {("HMES", "PACKAGE", "PKG_A"): "SPEC_A;BODY_A;"}
+    assert failed == [pkg_b]
+    assert extractor.metrics.types["PACKAGE"].latency["metadata_api"].count == 1
+
+
+def test_discover_objects_folds_index_watermark_into_table() -> None:
+    extractor = OracleMetadataExtractor(
+        oracle_config=_build_extractor().oracle_config,
+        scope_config=ScopeConfig(
+            include_schemas=["HMES"],
+            object_types=["TABLE", "INDEX"],
+        ),
+    )
+    ddl_time = datetime(2026, 2, 13, 8, 0, 0)
+    index_time = datetime(2026, 2, 13, 9, 0, 0)
+    cursor = _FakeCursor(
+        {
+            ("TABLE", "INDEX", "HMES"): [
+                ("HMES", "INDEX", "PK_T1", index_time),
+                ("HMES", "TABLE", "T1", ddl_time),
+                ("HMES", "TABLE", "T2", ddl_time),
+            ],
+            ("HMES",): [("HMES", "T1", 1, index_time)],
+        }
+    )
+
+    objects = extractor._discover_objects(cursor)
+
+    assert [item.object_name for item in objects] == ["T1", "T2"]
+    assert objects[0].last_ddl_time == "2026-02-13T08:00:00;indexes=1@2026-02-13T09:00:00"
+    assert objects[1].last_ddl_time == "2026-02-13T08:00:00"
+
+
+class _BrokenViewCursor:
+    def __init__(self, broken: set[str]) -> None:
+        self.broken = broken
+        self.connection = _FakeConnection()
+        self.calls: list[list[str]] = []
+        self.statements: set[str] = set()
+        self._rows: list[tuple[object, ...]] = []
+
+    def execute(self, sql: str, binds: list[object]) -> None:
+        names = [str(name) for name in binds[4]]
+        self.calls.append(names)
+        self.statements.add(sql)
+        if self.broken.intersection(names):
+            raise RuntimeError("ORA-31603: object not found in schema")
+        self._rows = [(name, f"DDL_{name}") for name in names]
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+def test_extract_ddl_bulk_bisects_failing_chunk_to_broken_object() -> None:
+    extractor = _build_extractor()
+    cursor = _BrokenViewCursor({"V_5"})
+    views = [DbObject(owner="HMES", object_type="VIEW", object_name=f"V_{index}") for index in range(8)]
+
+    errors: dict[tuple[str, str, str], BaseException] = {}
+    ddls, failed = extractor._extract_ddl_bulk(cursor, views, errors=errors)
+
+    assert failed == [views[5]]
+    assert len(ddls) == 7
+    assert list(errors) == [("HMES", "VIEW", "V_5")]
+    # 8 -> 4 -> 2 -> 1 로 좁히면서 성공한 절반은 한 번에 가져온다.
+    assert len(cursor.calls) == 7
+    # 청크 길이가 달라도 이름 목록은 컬렉션 바인드 하나이므로 SQL 텍스트는 하나뿐이다.
+    assert len(cursor.statements) == 1
+    assert cursor.connection.gettype_calls == 1
+
+    items, failures = extractor._extract_objects(cursor, views, report_progress=False)
+    assert len(items) == 7
+    assert failures == ["HMES.VIEW.V_5: ORA-31603: object not found in schema"]
+    assert extractor.metrics.types["VIEW"].errors == {"ORA-31603": 1}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.oracle import extractor as extractor_module
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+VIEW_NAMES = [f"V_{index:03d}" for index in range(120)]
+
+
+class _FakeCursor:
+    def __init__(self, connection: "_FakeConnection") -> None:
+        self.connection = connection
+        self._rows: list[tuple[object, ...]] = []
+
+    def execute(self, sql: str, binds: list[object] | None = None) -> None:
+        binds = binds or []
+        if "SET_TRANSFORM_PARAM" in sql:
+            self.connection.configured = True
+            self._rows = []
+        elif "LAST_DDL_TIME" in sql:
+            ddl_time = datetime(2026, 2, 13, 8, 0, 0)
+            self._rows = [("HMES", "VIEW", name, ddl_time) for name in VIEW_NAMES]
+        elif "DBMS_METADATA.GET_DDL(:1, OBJECT_NAME" in sql:
+            assert self.connection.configured
+            self._rows = [(name, f"DDL {name}") for name in binds[4]]
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+class _FakeNameListType:
+    def newobject(self, names: list[str]) -> tuple[str, ...]:
+        return tuple(names)
+
+
+class _FakeConnection:
+    def __init__(self, pool: "_FakePool") -> None:
+        self.pool = pool
+        self.configured = False
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def gettype(self, _name: str) -> _FakeNameListType:
+        return _FakeNameListType()
+
+    def __enter__(self) -> "_FakeConnection":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+class _FakePool:
+    def __init__(self, session_callback, **kwargs: object) -> None:
+        self.session_callback = session_callback
+        self.kwargs = kwargs
+        self.closed = False
+
+    def acquire(self) -> _FakeConnection:
+        connection = _FakeConnection(self)
+        self.session_callback(connection, None)
+        return connection
+
+    def close(self, force: bool = False) -> None:
+        self.closed = True
+
+
+class _FakeOracleDb:
+    def __init__(self) -> None:
+        self.pool: _FakePool | None = None
+
+    def connect(self, **_: object) -> None:
+        raise AssertionError("pool should be used when workers > 1")
+
+    def create_pool(self, **kwargs: object) -> _FakePool:
+        self.pool = _FakePool(**kwargs)
+        return self.pool
+
+
+def test_parallel_extraction_keeps_discovery_order(monkeypatch) -> None:
+    fake_db = _FakeOracleDb()
+    monkeypatch.setattr(extractor_module, "oracledb", fake_db)
+
+    extractor = OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+            workers=3,
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+    )
+
+    result = extractor.extract()
+
+    assert result.failures == []
+    assert [item.db_object.object_name for item in result.items] == VIEW_NAMES
+    assert result.items[0].ddl == "DDL V_000"
+    assert fake_db.pool is not None
+    assert fake_db.pool.kwargs["max"] == 4
+    assert fake_db.pool.kwargs["stmtcachesize"] == 40
+    assert fake_db.pool.closed
+
+
+def test_parallel_extraction_streams_items_to_sink(monkeypatch) -> None:
+    fake_db = _FakeOracleDb()
+    monkeypatch.setattr(extractor_module, "oracledb", fake_db)
+
+    extractor = OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+            workers=2,
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+    )
+
+    streamed: list[str] = []
+    result = extractor.extract(sink=lambda item: streamed.append(item.db_object.object_name))
+
+    assert result.items == []
+    assert result.failures == []
+    assert streamed == VIEW_NAMES
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.models import DbObject
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+
+SOURCES = ("ALL_COL_COMMENTS", "ALL_TAB_COMMENTS", "ALL_INDEXES", "ALL_OBJECTS")
+
+
+class _FakeNameListType:
+    def newobject(self, names: list[str]) -> tuple[str, ...]:
+        return tuple(names)
+
+
+class _FakeConnection:
+    def gettype(self, _name: str) -> _FakeNameListType:
+        return _FakeNameListType()
+
+
+class _FakeCursor:
+    def __init__(self, behaviors: dict[tuple[object, ...], list[tuple[object, ...]]]) -> None:
+        self.behaviors = behaviors
+        self.connection = _FakeConnection()
+        self.executed: list[tuple[object, ...]] = []
+        self._rows: list[tuple[object, ...]] = []
+
+    def execute(self, sql: str, binds: list[object]) -> None:
+        source = next(name for name in SOURCES if name in sql)
+        self.executed.append((source, *binds))
+        self._rows = self.behaviors.get((source, tuple(binds)), [])
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self._rows
+
+
+def _build_extractor(object_types: list[str]) -> OracleMetadataExtractor:
+    return OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=object_types),
+    )
+
+
+def _table(name: str) -> DbObject:
+    return DbObject(owner="HMES", object_type="TABLE", object_name=name)
+
+
+def test_prefetch_table_comments_batches_per_owner() -> None:
+    extractor = _build_extractor(["TABLE"])
+    cursor = _FakeCursor(
+        {
+            ("ALL_COL_COMMENTS", ("HMES", ("T1", "T2", "T3"))): [
+                ("T1", "ID", "identifier"),
+                ("T1", "NM", "it's a name"),
+                ("T2", "ID", "t2 id"),
+            ],
+            ("ALL_TAB_COMMENTS", ("HMES", ("T1", "T2", "T3"))): [
+                ("T1", "table one"),
+                ("T3", "table three"),
+            ],
+        }
+    )
+
+    tables = [_table("T1"), _table("T2"), _table("T3")]
+    comments = extractor._prefetch_table_comments(cursor, tables)
+
+    assert len(cursor.executed) == 2
+    assert comments[("HMES", "TABLE", "T1")] == [
+        'COMMENT ON COLUMN "HMES"."T1"."ID" IS \'identifier\';',
+        'COMMENT ON COLUMN "HMES"."T1"."NM" IS \'it\'\'s a name\';',
+        'COMMENT ON TABLE "HMES"."T1" IS \'table one\';',
+    ]
+    assert comments[("HMES", "TABLE", "T2")] == ['COMMENT ON COLUMN "HMES"."T2"."ID" IS \'t2 id\';']
+    assert comments[("HMES", "TABLE", "T3")] == ['COMMENT ON TABLE "HMES"."T3" IS \'table three\';']
+
+
+def test_table_bundle_uses_prefetched_comments() -> None:
+    extractor = _build_extractor(["TABLE"])
+    cursor = _FakeCursor({})
+
+    ddl = extractor._extract_table_bundle_ddl(
+        cursor,
+        _table("T1"),
+        base_ddl="\n  CREATE TABLE \"HMES\".\"T1\" (\"ID\" NUMBER);\n",
+        comments=['COMMENT ON TABLE "HMES"."T1" IS \'table one\';'],
+    )
+
+    assert cursor.executed == []
+    assert ddl == (
+        'CREATE TABLE "HMES"."T1" ("ID" NUMBER);\n'
+        "\n"
+        'COMMENT ON TABLE "HMES"."T1" IS \'table one\';\n'
+    )
+
+
+class _FakeLob:
+    def __init__(self, payload: str) -> None:
+        self.payload = payload
+
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
+        end = None if amount is None else offset - 1 + amount
+        return self.payload[offset - 1 : end]
+
+
+def test_prefetch_table_indexes_bulk_fetches_across_tables() -> None:
+    extractor = _build_extractor(["TABLE", "INDEX"])
+    bulk_binds = ("INDEX", "HMES", "HMES", "INDEX", ("IX_T1_A", "PK_T1", "IX_T2_A"))
+    cursor = _FakeCursor(
+        {
+            ("ALL_INDEXES", ("HMES", ("T1", "T2", "T3"))): [
+                ("T1", "HMES", "IX_T1_A"),
+                ("T1", "HMES", "PK_T1"),
+                ("T2", "HMES", "IX_T2_A"),
+            ],
+            ("ALL_OBJECTS", bulk_binds): [
+                ("IX_T1_A", "\n  CREATE INDEX IX_T1_A;\n"),
+                ("IX_T2_A", _FakeLob("CREATE INDEX IX_T2_A;")),
+                ("PK_T1", "CREATE UNIQUE INDEX PK_T1;"),
+            ],
+        }
+    )
+
+    tables = [_table("T1"), _table("T2"), _table("T3")]
+    indexes = extractor._prefetch_table_indexes(cursor, tables)
+
+    assert [item[0] for item in cursor.executed] == ["ALL_INDEXES", "ALL_OBJECTS"]
+    assert indexes[("HMES", "TABLE", "T1")] == ["CREATE INDEX IX_T1_A;", "CREATE UNIQUE INDEX PK_T1;"]
+    assert indexes[("HMES", "TABLE", "T2")] == ["CREATE INDEX IX_T2_A;"]
+    assert indexes[("HMES", "TABLE", "T3")] == []
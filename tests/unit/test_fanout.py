@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ConfigError,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+    TargetConfig,
+    TargetsConfig,
+    load_targets,
+)
+from orasnap.fanout import FanoutRunner, TargetOutcome
+from orasnap.pipeline import PendingCommit, SnapshotRunResult
+from orasnap.vcs.git_ops import PENDING_MARKER
+
+
+def _git(repo: Path, *args: str) -> str:
+    process = subprocess.run(["git", *args], cwd=repo, text=True, capture_output=True, check=True)
+    return process.stdout
+
+
+def _init_repo(repo: Path) -> None:
+    repo.mkdir(parents=True, exist_ok=True)
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "orasnap@example.com")
+    _git(repo, "config", "user.name", "orasnap")
+    (repo / ".seed").write_text("seed\n", encoding="utf-8")
+    _git(repo, "add", "--", ".seed")
+    _git(repo, "commit", "-m", "seed")
+
+
+def _config(tmp_path: Path, name: str, backend: str = "plumbing") -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name=name.upper(),
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=["HMES"]),
+        output=OutputConfig(snapshot_root=tmp_path / "repo" / name),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False, commit_backend=backend),
+        logs=LogsConfig(),
+        audit=AuditConfig(enabled=False),
+    )
+
+
+def _targets(tmp_path: Path, names: list[str], **options: object) -> tuple[TargetsConfig, dict[str, AppConfig]]:
+    targets = [TargetConfig(name=name, config_path=tmp_path / name / "snapshot.yml") for name in names]
+    configs = {name: _config(tmp_path, name) for name in names}
+    return TargetsConfig(targets=targets, **options), configs
+
+
+def _fake_run_target(
+    target: TargetConfig,
+    config: AppConfig,
+    dry_run: bool,
+    _started_at: datetime,
+    _resume: bool,
+) -> TargetOutcome:
+    if target.name == "broken":
+        return TargetOutcome(name=target.name, error="DPY-6005: cannot connect to database")
+    path = config.output.snapshot_root / "HMES" / "VIEW" / "V_A.sql"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"-- {target.name}\n", encoding="utf-8")
+    result = SnapshotRunResult(
+        extracted_count=1,
+        failed_count=0,
+        written_count=1,
+        deleted_count=0,
+        unchanged_count=0,
+        audit_exported_count=0,
+        committed=False,
+        commit_sha=None,
+        pushed=False,
+        failures=[],
+        log_file=None,
+        pending_commit=(
+            None
+            if dry_run
+            else PendingCommit(
+                added_files=[path],
+                modified_files=[],
+                deleted_files=[],
+                stage_paths=[config.output.snapshot_root],
+            )
+        ),
+    )
+    return TargetOutcome(name=target.name, result=result)
+
+
+def _runner(targets_config: TargetsConfig, configs: dict[str, AppConfig]) -> FanoutRunner:
+    return FanoutRunner(
+        targets_config,
+        configs,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        run_target=_fake_run_target,
+    )
+
+
+def test_fanout_commits_each_target_serially(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    targets_config, configs = _targets(tmp_path, ["alpha", "beta", "gamma"], concurrency=2)
+
+    result = _runner(targets_config, configs).run(dry_run=False)
+
+    assert not result.failed_targets
+    assert result.totals()["extracted"] == 3
+    assert len(result.commits) == 3
+    subjects = _git(repo, "log", "--format=%s", "-3").splitlines()
+    assert sorted(subject.split("[")[1].split("]")[0] for subject in subjects) == ["alpha", "beta", "gamma"]
+    assert all(outcome.result.commit_sha for outcome in result.outcomes)
+    assert _git(repo, "status", "--porcelain") == ""
+    assert not (repo / ".git" / PENDING_MARKER).exists()
+
+
+def test_fanout_batch_commits_once_and_reports_failed_target(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    targets_config, configs = _targets(
+        tmp_path,
+        ["alpha", "broken", "gamma"],
+        commit_mode="batch",
+    )
+
+    result = _runner(targets_config, configs).run(dry_run=False)
+
+    assert [outcome.name for outcome in result.failed_targets] == ["broken"]
+    assert len(result.commits) == 1
+    assert sorted(result.commits[0].targets) == ["alpha", "gamma"]
+    subject = _git(repo, "log", "--format=%s", "-1").strip()
+    assert "[2 targets]" in subject
+    assert "(2 files)" in subject
+    # 실패한 대상이 있으면 다음 실행이 git add로 남은 파일을 스테이징하도록 표시를 남긴다.
+    assert (repo / ".git" / PENDING_MARKER).exists()
+
+
+def test_fanout_dry_run_does_not_touch_git(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    head = _git(repo, "rev-parse", "HEAD")
+    targets_config, configs = _targets(tmp_path, ["alpha", "beta"])
+
+    result = _runner(targets_config, configs).run(dry_run=True)
+
+    assert result.commits == []
+    assert _git(repo, "rev-parse", "HEAD") == head
+
+
+def test_fanout_rejects_overlapping_targets(tmp_path: Path) -> None:
+    targets_config, configs = _targets(tmp_path, ["alpha", "beta"])
+    configs["beta"] = _config(tmp_path, "alpha")
+
+    try:
+        _runner(targets_config, configs)
+    except ConfigError as exc:
+        assert "alpha" in str(exc) and "beta" in str(exc)
+    else:
+        raise AssertionError("ConfigError was not raised")
+
+
+def test_load_targets_defaults_names_to_config_stem(tmp_path: Path) -> None:
+    targets_file = tmp_path / "targets.yml"
+    targets_file.write_text(
+        "concurrency: 8\n"
+        "git:\n"
+        "  commit: batch\n"
+        "  batch_window_seconds: 30\n"
+        "targets:\n"
+        "  - services/mes_prod.yml\n"
+        "  - name: erp\n"
+        "    config: services/erp.yml\n"
+        "    workers: 2\n",
+        encoding="utf-8",
+    )
+
+    targets_config = load_targets(targets_file)
+
+    assert targets_config.concurrency == 8
+    assert targets_config.commit_mode == "batch"
+    assert targets_config.batch_window_seconds == 30.0
+    assert [target.name for target in targets_config.targets] == ["mes_prod", "erp"]
+    assert targets_config.targets[0].config_path == (tmp_path / "services" / "mes_prod.yml").resolve()
+    assert targets_config.targets[1].workers == 2
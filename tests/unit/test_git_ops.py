@@ -53,3 +53,66 @@ def test_git_ops_commit_if_changed(tmp_path: Path) -> None:
     assert second.commit_sha is None
     assert second.pushed is False
 
+
+
+def test_git_ops_commit_changes_with_plumbing(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+
+    snapshots = repo / "snapshots" / "HMES"
+    snapshots.mkdir(parents=True, exist_ok=True)
+    first_file = snapshots / "a.sql"
+    second_file = snapshots / "b.sql"
+    first_file.write_text("A\n", encoding="utf-8")
+    second_file.write_text("B\n", encoding="utf-8")
+
+    git_ops = GitOps(repo_path=repo)
+    first = git_ops.commit_changes(
+        changed_files=[first_file, second_file],
+        deleted_files=[],
+        message="snapshot 1",
+        auto_push=False,
+        branch=None,
+    )
+    assert first.committed is True
+    assert _run(["git", "rev-parse", "HEAD"], cwd=repo).stdout.strip() == first.commit_sha
+    assert _run(["git", "show", "HEAD:snapshots/HMES/b.sql"], cwd=repo).stdout == "B\n"
+
+    first_file.write_text("A2\n", encoding="utf-8")
+    second_file.unlink()
+    second = git_ops.commit_changes(
+        changed_files=[first_file],
+        deleted_files=[second_file],
+        message="snapshot 2",
+        auto_push=False,
+        branch=None,
+    )
+    assert second.committed is True
+    tree = _run(["git", "ls-tree", "-r", "--name-only", "HEAD"], cwd=repo).stdout.split()
+    assert tree == [".seed", "snapshots/HMES/a.sql"]
+    assert _run(["git", "log", "-1", "--format=%s%n%P"], cwd=repo).stdout.split() == [
+        "snapshot",
+        "2",
+        first.commit_sha,
+    ]
+    assert _run(["git", "status", "--porcelain"], cwd=repo).stdout == ""
+
+    third = git_ops.commit_changes(
+        changed_files=[first_file],
+        deleted_files=[],
+        message="snapshot 3",
+        auto_push=False,
+        branch=None,
+    )
+    assert third.committed is False
+
+
+def test_git_ops_pending_marker(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    git_ops = GitOps(repo_path=repo)
+
+    assert git_ops.mark_pending() is False
+    assert git_ops.mark_pending() is True
+    git_ops.clear_pending()
+    assert git_ops.mark_pending() is False
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import orasnap.pipeline as pipeline_module
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ExtractionConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+)
+from orasnap.models import DbObject, ExtractedDdl, GitResult
+from orasnap.oracle.extractor import ExtractionResult
+from orasnap.store.journal import ExtractionJournal
+
+
+def _build_config(tmp_path: Path, include_schemas: list[str] | None = None) -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=include_schemas or ["HMES"], object_types=["VIEW"]),
+        output=OutputConfig(
+            snapshot_root=tmp_path / "snapshots",
+            manifest_file=str(tmp_path / "files.json"),
+        ),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False),
+        logs=LogsConfig(retention_days=30),
+        audit=AuditConfig(enabled=False),
+        extraction=ExtractionConfig(mode="full", manifest_file=str(tmp_path / "manifest.json")),
+    )
+
+
+def _view(name: str, ddl_time: str) -> DbObject:
+    return DbObject(owner="HMES", object_type="VIEW", object_name=name, last_ddl_time=ddl_time)
+
+
+def _ddl(name: str) -> str:
+    return f"CREATE VIEW {name} AS SELECT 1 FROM DUAL;"
+
+
+class _FakeGitOps:
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self.command_seconds: dict[str, float] = {}
+
+    def commit_if_changed(self, **_: object) -> GitResult:
+        return GitResult(committed=False, commit_sha=None, pushed=False)
+
+
+class _FlakyExtractor:
+    """discovered 순서대로 sink에 넘기다가 fail_after개 뒤에 세션이 끊기는 추출기 대역."""
+
+    discovered: list[DbObject] = []
+    fail_after: int | None = None
+    fetched: list[str] = []
+
+    def __init__(self, **_: object) -> None:
+        pass
+
+    def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+        reused = [item for item in self.discovered if reusable is not None and reusable(item)]
+        for index, db_object in enumerate(item for item in self.discovered if item not in reused):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise RuntimeError("DPY-4011: the database or network closed the connection")
+            self.fetched.append(db_object.object_name)
+            sink(ExtractedDdl(db_object=db_object, ddl=_ddl(db_object.object_name)))
+        return ExtractionResult(items=[], failures=[], reused=reused)
+
+
+def _run(tmp_path: Path, monkeypatch, resume: bool, config: AppConfig | None = None):
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _FlakyExtractor)
+    monkeypatch.setattr(pipeline_module, "GitOps", _FakeGitOps)
+    pipeline = pipeline_module.SnapshotPipeline(
+        config=config or _build_config(tmp_path),
+        logger=logging.getLogger("test"),
+        journal_path=tmp_path / "journal.sqlite",
+        resume=resume,
+    )
+    return pipeline.run(dry_run=False)
+
+
+def test_resume_skips_objects_journaled_before_disconnect(tmp_path: Path, monkeypatch) -> None:
+    _FlakyExtractor.discovered = [_view("V_A", "t1"), _view("V_B", "t1"), _view("V_C", "t1")]
+    _FlakyExtractor.fail_after = 2
+    _FlakyExtractor.fetched = []
+    try:
+        _run(tmp_path, monkeypatch, resume=False)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("RuntimeError was not raised")
+    assert _FlakyExtractor.fetched == ["V_A", "V_B"]
+
+    # V_B는 중단 이후 DDL이 바뀌었으므로 저널 내용을 쓰지 않고 다시 받는다.
+    _FlakyExtractor.discovered = [_view("V_A", "t1"), _view("V_B", "t2"), _view("V_C", "t1")]
+    _FlakyExtractor.fail_after = None
+    _FlakyExtractor.fetched = []
+    result = _run(tmp_path, monkeypatch, resume=True)
+
+    assert _FlakyExtractor.fetched == ["V_B", "V_C"]
+    assert result.extracted_count == 3
+    # 쓰기 단계는 스트림을 바로 소비하므로 중단된 실행이 이미 쓴 V_A/V_B 파일은 변경 없음으로 센다.
+    assert result.written_count == 1
+    assert result.unchanged_count == 2
+    assert (tmp_path / "snapshots" / "HMES" / "VIEW" / "V_A.sql").exists()
+
+    # 성공한 실행 뒤에는 이어 갈 내용이 없다.
+    journal = ExtractionJournal.open(
+        tmp_path / "journal.sqlite",
+        scope_key=pipeline_module._journal_scope_key(_build_config(tmp_path)),
+        resume=True,
+    )
+    assert journal.resumable_count == 0
+    journal.close()
+
+
+def _interrupted_run(tmp_path: Path, monkeypatch) -> None:
+    _FlakyExtractor.discovered = [_view("V_A", "t1"), _view("V_B", "t1")]
+    _FlakyExtractor.fail_after = 1
+    _FlakyExtractor.fetched = []
+    try:
+        _run(tmp_path, monkeypatch, resume=False)
+    except RuntimeError:
+        pass
+    _FlakyExtractor.fail_after = None
+    _FlakyExtractor.fetched = []
+
+
+def test_journal_is_ignored_without_resume_or_after_scope_change(tmp_path: Path, monkeypatch) -> None:
+    _interrupted_run(tmp_path, monkeypatch)
+    _run(tmp_path, monkeypatch, resume=False)
+    assert _FlakyExtractor.fetched == ["V_A", "V_B"]
+
+    _interrupted_run(tmp_path, monkeypatch)
+    _run(tmp_path, monkeypatch, resume=True, config=_build_config(tmp_path, ["HMES", "MES"]))
+    assert _FlakyExtractor.fetched == ["V_A", "V_B"]
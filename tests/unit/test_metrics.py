@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import orasnap.pipeline as pipeline_module
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ExtractionConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+)
+from orasnap.metrics import RunMetrics
+from orasnap.models import DbObject, ExtractedDdl, GitResult
+from orasnap.oracle.extractor import ExtractionResult
+
+
+def test_run_metrics_prometheus_textfile_format() -> None:
+    metrics = RunMetrics()
+    metrics.success = True
+    metrics.record_stage("extract", 1.5)
+    metrics.git_seconds = {"commit": 0.25}
+    metrics.observe_fetch("VIEW", "bulk", 0.02, 100)
+    metrics.observe_fetch("VIEW", "single", 3.0, 20)
+    metrics.record_bulk("VIEW", 9, 1)
+    metrics.record_extracted("VIEW", 10)
+    metrics.bytes_written = 64
+
+    assert metrics.bulk_ratio() == 0.9
+    assert metrics.to_dict()["totals"]["bytes_fetched"] == 120
+
+    text = metrics.to_prometheus()
+    assert "orasnap_last_run_success 1" in text
+    assert 'orasnap_stage_seconds{stage="extract"} 1.5' in text
+    assert 'orasnap_git_command_seconds{command="commit"} 0.25' in text
+    assert 'orasnap_bulk_objects{object_type="VIEW",path="fallback"} 1' in text
+    assert 'orasnap_ddl_fetch_seconds_bucket{object_type="VIEW",mode="bulk",le="0.025"} 1' in text
+    assert 'orasnap_ddl_fetch_seconds_bucket{object_type="VIEW",mode="single",le="2.5"} 0' in text
+    assert 'orasnap_ddl_fetch_seconds_bucket{object_type="VIEW",mode="single",le="+Inf"} 1' in text
+    assert 'orasnap_ddl_fetch_seconds_count{object_type="VIEW",mode="single"} 1' in text
+    assert "orasnap_bytes_written 64" in text
+
+
+def _series(text: str) -> set[str]:
+    return {line.rsplit(" ", 1)[0] for line in text.splitlines() if line and not line.startswith("#")}
+
+
+def test_prometheus_series_are_labeled_per_database() -> None:
+    texts = []
+    for labels in ({"service": "ORCLPDB"}, {"service": "MESPDB", "target": "mes"}):
+        metrics = RunMetrics(labels)
+        metrics.success = True
+        metrics.record_stage("extract", 1.0)
+        metrics.git_seconds = {"commit": 0.1}
+        metrics.observe_fetch("VIEW", "bulk", 0.02, 100)
+        metrics.record_bulk("VIEW", 1, 0)
+        metrics.record_extracted("VIEW")
+        metrics.record_failed("VIEW", code="ORA-31603")
+        texts.append(metrics.to_prometheus())
+
+    first, second = (_series(text) for text in texts)
+    # node-exporter가 같은 디렉터리의 .prom 파일 두 개를 읽어도 중복 시계열이 없어야 한다.
+    assert first and second
+    assert first.isdisjoint(second)
+    assert all('service="ORCLPDB"' in series for series in first)
+    assert all('service="MESPDB",target="mes"' in series for series in second)
+    assert 'orasnap_stage_seconds{service="ORCLPDB",stage="extract"}' in first
+    assert (
+        'orasnap_ddl_fetch_seconds_bucket{service="MESPDB",target="mes",object_type="VIEW",mode="bulk",le="+Inf"}'
+        in second
+    )
+    assert 'orasnap_ddl_fetch_seconds_sum{service="ORCLPDB",object_type="VIEW",mode="bulk"}' in first
+
+
+class _FakeGitOps:
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self.command_seconds = {"add": 0.5, "commit": 0.25}
+
+    def commit_if_changed(self, **_: object) -> GitResult:
+        return GitResult(committed=True, commit_sha="abc", pushed=False)
+
+
+def _build_config(tmp_path: Path) -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+        output=OutputConfig(
+            snapshot_root=tmp_path / "snapshots",
+            manifest_file=str(tmp_path / "files.json"),
+        ),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False),
+        logs=LogsConfig(prometheus_textfile=tmp_path / "textfile" / "orasnap.prom"),
+        audit=AuditConfig(enabled=False),
+        extraction=ExtractionConfig(manifest_file=str(tmp_path / "manifest.json")),
+    )
+
+
+def test_pipeline_exports_metrics_json_and_textfile(tmp_path: Path, monkeypatch) -> None:
+    class _Extractor:
+        def __init__(self, metrics: RunMetrics, **_: object) -> None:
+            self.metrics = metrics
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            self.metrics.observe_fetch("VIEW", "bulk", 0.01, 40)
+            self.metrics.record_bulk("VIEW", 1, 0)
+            self.metrics.record_extracted("VIEW")
+            db_object = DbObject(owner="HMES", object_type="VIEW", object_name="V_A")
+            sink(ExtractedDdl(db_object=db_object, ddl="CREATE VIEW V_A AS SELECT 1 FROM DUAL;"))
+            return ExtractionResult(items=[], failures=[])
+
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _Extractor)
+    monkeypatch.setattr(pipeline_module, "GitOps", _FakeGitOps)
+    config = _build_config(tmp_path)
+    metrics_path = tmp_path / "logs" / "orasnap-20260101-000000.metrics.json"
+    pipeline = pipeline_module.SnapshotPipeline(
+        config=config,
+        logger=logging.getLogger("test"),
+        metrics_path=metrics_path,
+    )
+
+    result = pipeline.run(dry_run=False)
+
+    assert result.metrics_file == metrics_path
+    payload = json.loads(metrics_path.read_text(encoding="utf-8"))
+    assert payload["success"] is True
+    assert set(payload["stage_seconds"]) == {"extract", "write", "git"}
+    assert payload["git_seconds"] == {"add": 0.5, "commit": 0.25}
+    assert payload["totals"]["bulk_ratio"] == 1.0
+    assert payload["totals"]["bytes_written"] == len("CREATE VIEW V_A AS SELECT 1 FROM DUAL;\n")
+    assert payload["object_types"]["VIEW"]["extracted"] == 1
+    textfile = tmp_path / "textfile" / "orasnap.prom"
+    assert 'orasnap_last_run_success{service="ORCLPDB"} 1' in textfile.read_text(encoding="utf-8")
+    assert not (tmp_path / "textfile" / "orasnap.prom.tmp").exists()
+
+    class _BrokenExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _BrokenExtractor)
+    try:
+        pipeline.run(dry_run=False)
+    except RuntimeError:
+        pass
+    else:  # pragma: no cover - defensive path.
+        raise AssertionError("extraction error should propagate")
+
+    assert json.loads(metrics_path.read_text(encoding="utf-8"))["success"] is False
+    assert 'orasnap_last_run_success{service="ORCLPDB"} 0' in textfile.read_text(encoding="utf-8")
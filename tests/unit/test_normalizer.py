@@ -43,3 +43,109 @@ def test_normalizer_respects_crlf() -> None:
     assert "\r\n" in normalized
     assert normalized.endswith("\r\n")
 
+
+
+def test_normalize_many_in_process_below_threshold(monkeypatch) -> None:
+    import orasnap.normalize.ddl_normalizer as normalizer_module
+
+    def _no_pool(**_: object) -> None:
+        raise AssertionError("small batches should not start a process pool")
+
+    monkeypatch.setattr(normalizer_module, "ProcessPoolExecutor", _no_pool)
+    normalizer = DdlNormalizer("LF", workers=4, parallel_threshold=10)
+
+    assert normalizer.normalize_many(["SELECT 1  ", "SELECT 2"]) == ["SELECT 1\n", "SELECT 2\n"]
+
+
+def test_iter_normalized_decides_from_expected_count(monkeypatch) -> None:
+    import orasnap.normalize.ddl_normalizer as normalizer_module
+
+    contexts: list[str] = []
+    original = normalizer_module.ProcessPoolExecutor
+
+    def _pool(**kwargs: object):
+        contexts.append(kwargs["mp_context"].get_start_method())
+        return original(**kwargs)
+
+    monkeypatch.setattr(normalizer_module, "ProcessPoolExecutor", _pool)
+    normalizer = DdlNormalizer("LF", workers=2, parallel_threshold=10)
+    ddls = [f"SELECT {index}  " for index in range(20)]
+
+    # 개수를 모르는 스트림은 미리 모아 세지 않고 현재 프로세스에서 처리한다.
+    assert list(normalizer.iter_normalized(iter(ddls))) == [normalizer.normalize(ddl) for ddl in ddls]
+    assert contexts == []
+
+    assert list(normalizer.iter_normalized(iter(ddls), expected_count=len(ddls))) == [
+        normalizer.normalize(ddl) for ddl in ddls
+    ]
+    # 쓰기/드라이버 스레드가 도는 프로세스에서 fork하지 않는다.
+    assert contexts and contexts[0] in {"forkserver", "spawn"}
+
+
+def test_normalize_many_process_pool_keeps_order() -> None:
+    ddls = [f'CREATE TABLE T{index} (ID NUMBER) TABLESPACE "USERS";' for index in range(100)]
+    normalizer = DdlNormalizer("CRLF", workers=2, parallel_threshold=10)
+
+    assert normalizer.normalize_many(ddls) == [normalizer.normalize(ddl) for ddl in ddls]
+
+
+def test_normalizer_keeps_keywords_inside_literals_and_comments() -> None:
+    ddl = """
+CREATE OR REPLACE PACKAGE BODY "HMES"."PKG_LOG" AS
+  PROCEDURE p IS
+  BEGIN
+    l_msg := 'move to TABLESPACE users, STORAGE (INITIAL 1)';
+    -- 주의: TABLESPACE hmes_space 는 운영에서만 쓴다
+    /* STORAGE (NEXT 1) 는 DBA가 관리 */
+    l_sql := q'[ALTER TABLE t MOVE TABLESPACE ts_a]';
+  END;
+END;
+""".strip()
+
+    normalized = DdlNormalizer("LF").normalize(ddl)
+
+    assert normalized == ddl + "\n"
+
+
+def test_normalizer_partition_lines_ignore_parentheses_in_literals() -> None:
+    ddl = """
+CREATE TABLE "HMES"."T_LIST" (
+  "CODE" VARCHAR2(10)
+) STORAGE (INITIAL 65536)
+  TABLESPACE "USERS"
+PARTITION BY LIST ("CODE")
+(
+  PARTITION "P_A" VALUES ('(A'),
+  PARTITION "P_B" VALUES ('B)')  TABLESPACE "USERS",
+
+
+  PARTITION "P_DEFAULT" VALUES (DEFAULT)
+)  ;
+""".strip()
+
+    normalized = DdlNormalizer("LF").normalize(ddl)
+
+    assert normalized == (
+        'CREATE TABLE "HMES"."T_LIST" (\n'
+        '  "CODE" VARCHAR2(10)\n'
+        ")\n"
+        'PARTITION BY LIST ("CODE")\n'
+        "(\n"
+        "\n"
+        ")  ;\n"
+    )
+
+
+def test_normalizer_keeps_partition_text_inside_literal() -> None:
+    ddl = "BEGIN\n  l_sql := '\n  PARTITION P1 VALUES (1)\n';\nEND;\n"
+
+    assert DdlNormalizer("LF").normalize(ddl) == ddl
+
+
+def test_normalizer_unbalanced_storage_does_not_backtrack() -> None:
+    # 닫는 괄호가 없는 STORAGE 절은 그대로 두고, 긴 입력에서도 바로 끝나야 한다.
+    ddl = "CREATE TABLE T1 (ID NUMBER) STORAGE (" + "INITIAL 1 (NEXT 2) " * 5000 + "\n"
+
+    normalized = DdlNormalizer("LF").normalize(ddl)
+
+    assert normalized == ddl.rstrip() + "\n"
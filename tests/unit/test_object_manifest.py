@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from orasnap.models import DbObject
+from orasnap.store.object_manifest import ObjectManifest
+
+
+def _object(name: str, ddl_time: str | None) -> DbObject:
+    return DbObject(owner="HMES", object_type="VIEW", object_name=name, last_ddl_time=ddl_time)
+
+
+def test_manifest_round_trip_and_is_current(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    refreshed_at = datetime(2026, 2, 13, 9, 0, tzinfo=timezone.utc)
+    manifest = ObjectManifest(last_full_refresh=refreshed_at)
+    manifest.record(_object("V_A", "2026-02-13T08:00:00"), "CREATE VIEW V_A;\n")
+    manifest.save(path)
+
+    loaded = ObjectManifest.load(path)
+
+    assert loaded.last_full_refresh == refreshed_at
+    assert loaded.is_current(_object("V_A", "2026-02-13T08:00:00"))
+    assert not loaded.is_current(_object("V_A", "2026-02-13T08:30:00"))
+    assert not loaded.is_current(_object("V_A", None))
+    assert not loaded.is_current(_object("V_B", "2026-02-13T08:00:00"))
+    assert loaded.objects() == [_object("V_A", "2026-02-13T08:00:00")]
+
+
+def test_manifest_full_refresh_schedule() -> None:
+    now = datetime(2026, 2, 13, 9, 0, tzinfo=timezone.utc)
+
+    assert ObjectManifest().full_refresh_due(168, now=now)
+    assert ObjectManifest().full_refresh_due(0, now=now)
+
+    recent = ObjectManifest(last_full_refresh=now - timedelta(hours=1))
+    assert not recent.full_refresh_due(168, now=now)
+    assert not recent.full_refresh_due(0, now=now)
+
+    stale = ObjectManifest(last_full_refresh=now - timedelta(hours=200))
+    assert stale.full_refresh_due(168, now=now)
@@ -37,13 +37,13 @@ def test_run_snapshot_uses_project_root_for_relative_audit_state(tmp_path: Path,
 
     config = _build_config(tmp_path, ".orasnap_audit_state.json")
     monkeypatch.setattr(pipeline_module, "load_config", lambda _: config)
-    monkeypatch.setattr(pipeline_module, "_setup_logger", lambda _: logging.getLogger("test"))
+    monkeypatch.setattr(pipeline_module, "setup_logger", lambda _: logging.getLogger("test"))
     monkeypatch.setattr(pipeline_module, "_purge_old_logs", lambda *_: 0)
 
     captured: dict[str, Path] = {}
 
     class _FakePipeline:
-        def __init__(self, *, config, logger, log_file, audit_state_path) -> None:
+        def __init__(self, *, config, logger, log_file, audit_state_path, **_: object) -> None:
             captured["audit_state_path"] = audit_state_path
 
         def run(self, *, dry_run: bool) -> SnapshotRunResult:
@@ -75,13 +75,13 @@ def test_run_snapshot_uses_absolute_audit_state_as_is(tmp_path: Path, monkeypatc
     absolute_state_path = tmp_path / "state" / "audit_state.json"
     config = _build_config(tmp_path, str(absolute_state_path))
     monkeypatch.setattr(pipeline_module, "load_config", lambda _: config)
-    monkeypatch.setattr(pipeline_module, "_setup_logger", lambda _: logging.getLogger("test"))
+    monkeypatch.setattr(pipeline_module, "setup_logger", lambda _: logging.getLogger("test"))
     monkeypatch.setattr(pipeline_module, "_purge_old_logs", lambda *_: 0)
 
     captured: dict[str, Path] = {}
 
     class _FakePipeline:
-        def __init__(self, *, config, logger, log_file, audit_state_path) -> None:
+        def __init__(self, *, config, logger, log_file, audit_state_path, **_: object) -> None:
             captured["audit_state_path"] = audit_state_path
 
         def run(self, *, dry_run: bool) -> SnapshotRunResult:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import orasnap.pipeline as pipeline_module
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ExtractionConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+)
+from orasnap.models import DbObject, ExtractedDdl, GitResult
+from orasnap.oracle.extractor import ExtractionResult
+from orasnap.store.object_manifest import ObjectManifest
+
+
+def _build_config(tmp_path: Path, mode: str) -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+        output=OutputConfig(
+            snapshot_root=tmp_path / "snapshots",
+            line_ending="LF",
+            manifest_file=str(tmp_path / "files.json"),
+        ),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False),
+        logs=LogsConfig(retention_days=30),
+        audit=AuditConfig(enabled=False),
+        extraction=ExtractionConfig(mode=mode, manifest_file=str(tmp_path / "manifest.json")),
+    )
+
+
+def _view(name: str, ddl_time: str) -> DbObject:
+    return DbObject(owner="HMES", object_type="VIEW", object_name=name, last_ddl_time=ddl_time)
+
+
+def _item(name: str, ddl_time: str, ddl: str) -> ExtractedDdl:
+    return ExtractedDdl(db_object=_view(name, ddl_time), ddl=ddl)
+
+
+class _FakeGitOps:
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self.command_seconds: dict[str, float] = {}
+
+    def commit_if_changed(self, **_: object) -> GitResult:
+        return GitResult(committed=False, commit_sha=None, pushed=False)
+
+
+def _run(config: AppConfig, extractor_cls: type, monkeypatch) -> pipeline_module.SnapshotRunResult:
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", extractor_cls)
+    monkeypatch.setattr(pipeline_module, "GitOps", _FakeGitOps)
+    pipeline = pipeline_module.SnapshotPipeline(config=config, logger=logging.getLogger("test"))
+    return pipeline.run(dry_run=False)
+
+
+def test_incremental_run_reuses_unchanged_objects(tmp_path: Path, monkeypatch) -> None:
+    class _FirstExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            items = [
+                _item("V_A", "t1", "CREATE VIEW V_A AS SELECT 1 FROM DUAL;"),
+                _item("V_B", "t1", "CREATE VIEW V_B AS SELECT 2 FROM DUAL;"),
+            ]
+            return ExtractionResult(items=items, failures=[])
+
+    config = _build_config(tmp_path, "incremental")
+    first = _run(config, _FirstExtractor, monkeypatch)
+    assert first.written_count == 2
+
+    seen: list[str] = []
+
+    class _SecondExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            assert reusable is not None
+            discovered = [_view("V_A", "t1"), _view("V_B", "t2")]
+            reused = [item for item in discovered if reusable(item)]
+            seen.extend(item.object_name for item in reused)
+            items = [_item("V_B", "t2", "CREATE VIEW V_B AS SELECT 3 FROM DUAL;")]
+            return ExtractionResult(items=items, failures=[], reused=reused)
+
+    second = _run(config, _SecondExtractor, monkeypatch)
+
+    assert seen == ["V_A"]
+    assert second.written_count == 1
+    assert second.deleted_count == 0
+    assert second.unchanged_count == 1
+    manifest = ObjectManifest.load(tmp_path / "manifest.json")
+    assert manifest.get(_view("V_B", "t2")).last_ddl_time == "t2"
+
+
+def test_audit_run_rewrites_targets_and_deletes_dropped(tmp_path: Path, monkeypatch) -> None:
+    class _FullExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            assert audit_table == "DDL_AUDIT_LOG"
+            items = [
+                _item("V_A", "t1", "CREATE VIEW V_A AS SELECT 1 FROM DUAL;"),
+                _item("V_B", "t1", "CREATE VIEW V_B AS SELECT 2 FROM DUAL;"),
+                _item("V_C", "t1", "CREATE VIEW V_C AS SELECT 3 FROM DUAL;"),
+            ]
+            return ExtractionResult(items=items, failures=[], audit_id=100)
+
+    config = _build_config(tmp_path, "audit")
+    _run(config, _FullExtractor, monkeypatch)
+
+    class _AuditExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract_audit_changes(
+            self,
+            audit_table,
+            after_audit_id,
+            reusable=None,
+            extra_targets=None,
+            sink=None,
+            on_targets=None,
+        ) -> ExtractionResult:
+            assert after_audit_id == 100
+            assert extra_targets == []
+            items = [_item("V_B", "t2", "CREATE VIEW V_B AS SELECT 20 FROM DUAL;")]
+            targets = [_view("V_B", "t2"), _view("V_C", "t1")]
+            return ExtractionResult(items=items, failures=[], targets=targets, audit_id=105)
+
+    result = _run(config, _AuditExtractor, monkeypatch)
+
+    assert result.written_count == 1
+    assert result.deleted_count == 1
+    assert result.unchanged_count == 1
+    manifest = ObjectManifest.load(tmp_path / "manifest.json")
+    assert manifest.audit_id == 105
+    assert [item.object_name for item in manifest.objects()] == ["V_A", "V_B"]
+
+
+def test_streaming_run_keeps_snapshots_when_extraction_aborts(tmp_path: Path, monkeypatch) -> None:
+    class _StreamingExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            assert sink is not None
+            sink(_item("V_A", "t1", "CREATE VIEW V_A AS SELECT 1 FROM DUAL;"))
+            sink(_item("V_B", "t1", "CREATE VIEW V_B AS SELECT 2 FROM DUAL;"))
+            return ExtractionResult(items=[], failures=[])
+
+    config = _build_config(tmp_path, "full")
+    first = _run(config, _StreamingExtractor, monkeypatch)
+    assert first.extracted_count == 2
+    assert first.written_count == 2
+
+    class _BrokenExtractor:
+        def __init__(self, **_: object) -> None:
+            pass
+
+        def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+            sink(_item("V_A", "t2", "CREATE VIEW V_A AS SELECT 10 FROM DUAL;"))
+            raise RuntimeError("connection lost")
+
+    try:
+        _run(config, _BrokenExtractor, monkeypatch)
+    except RuntimeError as exc:
+        assert str(exc) == "connection lost"
+    else:  # pragma: no cover - defensive path.
+        raise AssertionError("extraction error should propagate")
+
+    assert (tmp_path / "snapshots" / "HMES" / "VIEW" / "V_B.sql").exists()
+    manifest = ObjectManifest.load(tmp_path / "manifest.json")
+    assert manifest.get(_view("V_A", "t1")).last_ddl_time == "t1"
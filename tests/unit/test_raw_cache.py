@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from pathlib import Path
+
+import orasnap.pipeline as pipeline_module
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    ExtractionConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+)
+from orasnap.models import DbObject, ExtractedDdl, GitResult
+from orasnap.oracle.extractor import ExtractionResult
+from orasnap.store.object_manifest import ObjectManifest
+from orasnap.store.raw_cache import RawDdlCache
+
+
+def test_raw_cache_deduplicates_and_detects_corruption(tmp_path: Path) -> None:
+    cache = RawDdlCache(tmp_path / "cache")
+    first = cache.put("CREATE VIEW V_A AS SELECT 1 FROM DUAL")
+    second = cache.put("CREATE VIEW V_A AS SELECT 1 FROM DUAL")
+    other = cache.put("CREATE VIEW V_B AS SELECT 2 FROM DUAL")
+
+    assert first == second
+    assert len(list((tmp_path / "cache").rglob("*.z"))) == 2
+    assert cache.get(first) == "CREATE VIEW V_A AS SELECT 1 FROM DUAL"
+
+    cache.path(other).write_bytes(b"not zlib")
+    assert cache.get(other) is None
+
+    assert cache.prune({first}) == 1
+    assert cache.has(first)
+    assert not cache.has(other)
+
+
+def _build_config(tmp_path: Path) -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+        output=OutputConfig(
+            snapshot_root=tmp_path / "snapshots",
+            manifest_file=str(tmp_path / "files.json"),
+        ),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False),
+        logs=LogsConfig(retention_days=30),
+        audit=AuditConfig(enabled=False),
+        extraction=ExtractionConfig(mode="full", manifest_file=str(tmp_path / "manifest.json")),
+    )
+
+
+class _FakeGitOps:
+    commits: list[str] = []
+
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+        self.command_seconds: dict[str, float] = {}
+
+    def commit_if_changed(self, message: str, **_: object) -> GitResult:
+        self.commits.append(message)
+        return GitResult(committed=True, commit_sha="abc", pushed=False)
+
+
+class _Extractor:
+    def __init__(self, **_: object) -> None:
+        pass
+
+    def extract(self, reusable=None, audit_table=None, sink=None, on_targets=None) -> ExtractionResult:
+        items = [
+            ExtractedDdl(
+                db_object=DbObject("HMES", "VIEW", name, last_ddl_time="t1"),
+                ddl=f"CREATE VIEW {name} AS SELECT 1 FROM DUAL   \n\n\n;",
+            )
+            for name in ("V_A", "V_B")
+        ]
+        return ExtractionResult(items=items, failures=[])
+
+
+def _pipeline(config: AppConfig, tmp_path: Path) -> pipeline_module.SnapshotPipeline:
+    return pipeline_module.SnapshotPipeline(
+        config=config,
+        logger=logging.getLogger("test"),
+        raw_cache_dir=tmp_path / "raw",
+    )
+
+
+def test_renormalize_rebuilds_snapshots_from_cache_only(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _Extractor)
+    monkeypatch.setattr(pipeline_module, "GitOps", _FakeGitOps)
+    _FakeGitOps.commits = []
+    config = _build_config(tmp_path)
+    _pipeline(config, tmp_path).run(dry_run=False)
+
+    manifest = ObjectManifest.load(tmp_path / "manifest.json")
+    assert all(entry.raw_sha256 for entry in manifest.entries.values())
+
+    # 정규화 설정만 바꿔서 다시 만든다. 추출기는 호출되면 안 된다.
+    class _NoDatabase:
+        def __init__(self, **_: object) -> None:
+            raise AssertionError("renormalize must not connect to the database")
+
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _NoDatabase)
+    crlf = replace(config, output=replace(config.output, line_ending="CRLF"))
+    result = _pipeline(crlf, tmp_path).renormalize(dry_run=False)
+
+    assert result.written_count == 2
+    assert result.failed_count == 0
+    path = tmp_path / "snapshots" / "HMES" / "VIEW" / "V_A.sql"
+    assert path.read_bytes() == b"CREATE VIEW V_A AS SELECT 1 FROM DUAL\r\n\r\n;\r\n"
+    assert "[renormalize]" in _FakeGitOps.commits[-1]
+    renormalized = ObjectManifest.load(tmp_path / "manifest.json")
+    assert {key: entry.raw_sha256 for key, entry in renormalized.entries.items()} == {
+        key: entry.raw_sha256 for key, entry in manifest.entries.items()
+    }
+
+
+def test_renormalize_keeps_objects_missing_from_cache(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_module, "OracleMetadataExtractor", _Extractor)
+    monkeypatch.setattr(pipeline_module, "GitOps", _FakeGitOps)
+    config = _build_config(tmp_path)
+    _pipeline(config, tmp_path).run(dry_run=False)
+    manifest = ObjectManifest.load(tmp_path / "manifest.json")
+    missing = manifest.get(DbObject("HMES", "VIEW", "V_B"))
+    RawDdlCache(tmp_path / "raw").path(missing.raw_sha256).unlink()
+
+    result = _pipeline(config, tmp_path).renormalize(dry_run=False)
+
+    assert result.failed_count == 1
+    assert "V_B" in result.failures[0]
+    assert result.deleted_count == 0
+    assert (tmp_path / "snapshots" / "HMES" / "VIEW" / "V_B.sql").exists()
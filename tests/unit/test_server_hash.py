@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from orasnap.bench.harness import bench_config, init_repo, patched_oracledb, run_pipeline, run_scenario
+from orasnap.bench.synthetic import SyntheticOracleDb, SyntheticSchema
+from orasnap.config import OracleConfig, ScopeConfig
+from orasnap.models import DbObject
+from orasnap.oracle.extractor import OracleMetadataExtractor
+from orasnap.store.object_manifest import ObjectManifest, content_hash
+
+_SCHEMA = SyntheticSchema(
+    tables=3,
+    partitions_per_table=1,
+    indexes_per_table=1,
+    comments_per_table=1,
+    views=6,
+    packages=2,
+    package_lines=5,
+    audit_rows=0,
+    latency_ms=0.0,
+)
+
+
+def test_server_hash_skips_objects_recompiled_with_same_content(tmp_path: Path) -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    logger = logging.getLogger("test")
+    with patched_oracledb(database):
+        init_repo(tmp_path / "repo")
+        config = bench_config(tmp_path, _SCHEMA, "server_hash", workers=1)
+        first = run_pipeline(config, tmp_path, logger)
+        manifest = ObjectManifest.load(Path(config.extraction.manifest_file))
+        view = DbObject(owner="BENCH", object_type="VIEW", object_name="V_00001")
+        # 원본 캐시 없이도 원본 해시를 매니페스트에 남긴다.
+        assert manifest.get(view).raw_sha256 == content_hash(database.catalog.ddl("VIEW", "V_00001"))
+
+        recompiled = database.catalog.recompile(1.0)
+        second = run_pipeline(config, tmp_path, logger)
+        # 같은 내용으로 다시 만든 뷰/패키지는 본문을 받지 않고, 새 LAST_DDL_TIME으로 매니페스트를 갱신한다.
+        third = run_pipeline(config, tmp_path, logger)
+
+    assert first.extracted_count == 3 + 6 + 4
+    assert len(recompiled) == 6 + 4
+    assert second.extracted_count == 0
+    assert second.written_count == 0 and second.deleted_count == 0
+    updated = ObjectManifest.load(Path(config.extraction.manifest_file)).get(view)
+    assert updated.last_ddl_time == database.catalog.ddl_time(("VIEW", "V_00001")).isoformat()
+    assert third.extracted_count == 0
+
+
+def test_server_hash_scenario_fetches_only_changed_objects() -> None:
+    incremental = run_scenario("incremental", _SCHEMA, track_memory=False, change_ratio=0.2)
+    server_hash = run_scenario("server_hash", _SCHEMA, track_memory=False, change_ratio=0.2)
+
+    # server_hash는 모든 뷰/패키지의 LAST_DDL_TIME이 바뀌었어도 내용이 바뀐 객체만 받는다.
+    assert server_hash.extracted == incremental.extracted
+    assert server_hash.written == incremental.written
+
+
+class _FailingHashCursor:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    def execute(self, sql: str, binds: list[object] | None = None) -> None:
+        self.executed.append(sql)
+        raise RuntimeError("ORA-00904: \"DBMS_CRYPTO\".\"HASH\": invalid identifier")
+
+    def fetchall(self) -> list[tuple[object, ...]]:  # pragma: no cover - execute always fails.
+        return []
+
+
+def test_server_hash_failure_falls_back_to_full_fetch(monkeypatch) -> None:
+    import orasnap.oracle.extractor as extractor_module
+
+    monkeypatch.setattr(extractor_module, "name_list", lambda _cursor, names: names)
+    extractor = OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope_config=ScopeConfig(include_schemas=["HMES"], object_types=["TABLE", "VIEW"]),
+    )
+    objects = [
+        DbObject(owner="HMES", object_type="TABLE", object_name="T_A", last_ddl_time="t2"),
+        DbObject(owner="HMES", object_type="VIEW", object_name="V_A", last_ddl_time="t2"),
+    ]
+    cursor = _FailingHashCursor()
+
+    changed, reused = extractor._filter_unchanged_by_hash(cursor, objects, lambda _item: "0" * 64)
+
+    assert changed == objects
+    assert reused == []
+    # TABLE 번들은 해시 조회 대상이 아니므로 VIEW 청크 하나만 조회했다.
+    assert len(cursor.executed) == 1
+    assert extractor.metrics.totals()["hash_skipped"] == 0
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import oracledb
+
+from orasnap.config import OracleConfig
+from orasnap.oracle import session
+
+
+class _ChunkedLob:
+    def __init__(self, payload: str) -> None:
+        self.payload = payload
+        self.reads: list[tuple[int, int | None]] = []
+
+    def read(self, offset: int = 1, amount: int | None = None) -> str:
+        self.reads.append((offset, amount))
+        end = None if amount is None else offset - 1 + amount
+        return self.payload[offset - 1 : end]
+
+
+class _FakeCursor:
+    arraysize = 100
+    prefetchrows = 2
+
+    def var(self, db_type: object, arraysize: int) -> tuple[object, int]:
+        return db_type, arraysize
+
+
+def _oracle_config(**overrides: int) -> OracleConfig:
+    return OracleConfig(
+        host="127.0.0.1",
+        port=1521,
+        service_name="ORCLPDB",
+        username="ORASNAP_SVC",
+        password="pw",
+        **overrides,
+    )
+
+
+def test_read_lob_streams_in_fixed_chunks() -> None:
+    lob = _ChunkedLob("A" * 10 + "B" * 10 + "C" * 3)
+
+    assert session.read_lob(lob, chunk_size=10) == lob.payload
+    assert lob.reads == [(1, 10), (11, 10), (21, 10)]
+    assert session.read_lob("plain", chunk_size=10) == "plain"
+
+
+def test_configure_cursor_fetches_inline_clobs_as_strings() -> None:
+    cursor = session.configure_cursor(_FakeCursor(), _oracle_config(arraysize=250, prefetch_rows=251))
+
+    assert (cursor.arraysize, cursor.prefetchrows) == (250, 251)
+    handler = cursor.outputtypehandler
+    clob = SimpleNamespace(name="DDL", type_code=oracledb.DB_TYPE_CLOB)
+    oversized = SimpleNamespace(name="DDL_LOB", type_code=oracledb.DB_TYPE_CLOB)
+    number = SimpleNamespace(name="AUDIT_ID", type_code=oracledb.DB_TYPE_NUMBER)
+    assert handler(cursor, clob) == (oracledb.DB_TYPE_LONG, 250)
+    assert handler(cursor, oversized) is None
+    assert handler(cursor, number) is None
+
+    sql = session.split_lob_columns("DDL", "DDL", 1000)
+    assert "DBMS_LOB.GETLENGTH(DDL) <= 1000 THEN DDL END AS DDL," in sql
+    assert sql.endswith("DBMS_LOB.GETLENGTH(DDL) > 1000 THEN DDL END AS DDL_LOB")
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import replace
+from pathlib import Path
+
+from orasnap.bench.harness import bench_config, init_repo, patched_oracledb, run_pipeline
+from orasnap.bench.synthetic import SyntheticOracleDb, SyntheticSchema
+from orasnap.config import ConfigError, OracleConfig, ScopeConfig, load_config
+from orasnap.models import DbObject, ExtractedDdl
+from orasnap.oracle.extractor import OracleMetadataExtractor
+
+_SCHEMA = SyntheticSchema(
+    tables=2,
+    partitions_per_table=0,
+    indexes_per_table=1,
+    comments_per_table=0,
+    views=2,
+    packages=3,
+    package_lines=4,
+    audit_rows=0,
+    latency_ms=0.0,
+)
+
+
+def _extractor(type_strategies: dict[str, str]) -> OracleMetadataExtractor:
+    return OracleMetadataExtractor(
+        oracle_config=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope_config=ScopeConfig(
+            include_schemas=["BENCH"],
+            object_types=["PACKAGE", "PACKAGE BODY"],
+            type_strategies=type_strategies,
+        ),
+    )
+
+
+def _packages(database: SyntheticOracleDb) -> list[DbObject]:
+    return [
+        DbObject(owner="BENCH", object_type=object_type, object_name=name)
+        for object_type, name in database.catalog.objects
+        if object_type in {"PACKAGE", "PACKAGE BODY"}
+    ]
+
+
+def test_source_strategy_reassembles_get_ddl_text() -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    extractor = _extractor({"PACKAGE": "source", "PACKAGE BODY": "source"})
+    objects = _packages(database)
+    items: list[ExtractedDdl] = []
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_source(extractor._cursor(connection), objects, items.append)
+
+    assert fallback == []
+    assert len(items) == len(objects)
+    for item in items:
+        expected = database.catalog.ddl(item.db_object.object_type, item.db_object.object_name)
+        assert item.ddl == expected
+    totals = extractor.metrics.totals()
+    assert totals["bulk_hits"] == len(objects)
+
+
+def test_source_strategy_checks_a_sample_against_get_ddl(monkeypatch) -> None:
+    database = SyntheticOracleDb(replace(_SCHEMA, packages=12))
+    calls: list[str] = []
+    original = database.catalog.ddl
+
+    def ddl(object_type: str, name: str) -> str | None:
+        calls.append(object_type)
+        return original(object_type, name)
+
+    monkeypatch.setattr(database.catalog, "ddl", ddl)
+    extractor = _extractor({"PACKAGE": "source", "PACKAGE BODY": "source"})
+    extractor._verify_random = 0
+    objects = _packages(database)
+    items: list[ExtractedDdl] = []
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_source(extractor._cursor(connection), objects, items.append)
+
+    assert fallback == []
+    assert len(items) == len(objects)
+    assert sorted(calls) == ["PACKAGE"] * 3 + ["PACKAGE BODY"] * 3
+
+
+def test_get_ddl_check_covers_risky_and_random_objects() -> None:
+    extractor = _extractor({"TRIGGER": "source"})
+    extractor._verify_rng = random.Random(7)
+    objects = [
+        DbObject(owner="BENCH", object_type="TRIGGER", object_name=f"TRG_{index}") for index in range(1000)
+    ]
+    check = extractor._get_ddl_check(objects, "ALL_SOURCE reassembly")
+
+    picked = [extractor._should_verify(check, "TRIGGER", risky=False) for _ in objects]
+
+    assert picked[:3] == [True, True, True]
+    # 처음 3개 뒤로는 평균 2개만 무작위로 고른다.
+    assert 0 < sum(picked[3:]) < 10
+    assert extractor._should_verify(check, "TRIGGER", risky=True)
+
+
+def test_source_pipeline_writes_same_files_as_bulk(tmp_path: Path) -> None:
+    logger = logging.getLogger("test")
+    outputs: dict[str, dict[str, str]] = {}
+    for scenario in ("bulk", "source"):
+        work_dir = tmp_path / scenario
+        with patched_oracledb(SyntheticOracleDb(_SCHEMA)):
+            init_repo(work_dir / "repo")
+            config = bench_config(work_dir, _SCHEMA, scenario, workers=1)
+            result = run_pipeline(config, work_dir, logger)
+        assert result.failed_count == 0
+        root = Path(config.output.snapshot_root)
+        outputs[scenario] = {
+            str(path.relative_to(root)): path.read_text(encoding="utf-8")
+            for path in sorted(root.rglob("*.sql"))
+        }
+
+    assert outputs["source"] == outputs["bulk"]
+    assert any("PACKAGE" in path.upper() for path in outputs["source"])
+
+
+def test_assemble_source_matches_get_ddl_header() -> None:
+    assemble = OracleMetadataExtractor._assemble_source
+
+    ddl = assemble("HMES", "PROCEDURE", "P_RUN", "procedure  p_run IS\nBEGIN\n  NULL;\nEND;", ("Y", None))
+    assert ddl == '\n  CREATE OR REPLACE EDITIONABLE PROCEDURE "HMES"."P_RUN" IS\nBEGIN\n  NULL;\nEND;\n/'
+
+    ddl = assemble("HMES", "PACKAGE BODY", "pkg", 'PACKAGE BODY hmes."pkg" AS\nEND;\n', ("N", None))
+    assert ddl == '\n  CREATE OR REPLACE NONEDITIONABLE PACKAGE BODY "HMES"."pkg" AS\nEND;\n/'
+
+    ddl = assemble(
+        "HMES", "TRIGGER", "TRG_A", "TRIGGER trg_a\nBEFORE INSERT ON t_a\nBEGIN NULL; END;", ("Y", "DISABLED")
+    )
+    assert ddl is not None
+    assert ddl.endswith('END;\n/\nALTER TRIGGER "HMES"."TRG_A" DISABLE;')
+
+
+def test_assemble_source_flags_objects_it_cannot_rebuild() -> None:
+    assemble = OracleMetadataExtractor._assemble_source
+
+    # 암호화된 소스, 이름/타입이 다른 헤더, 상태를 모르는 트리거는 GET_DDL로 넘긴다.
+    assert assemble("HMES", "PACKAGE BODY", "PKG", "PACKAGE BODY pkg wrapped\na000000\n", ("Y", None)) is None
+    assert assemble("HMES", "PACKAGE", "PKG", "PACKAGE other AS\nEND;", ("Y", None)) is None
+    assert assemble("HMES", "PACKAGE", "PKG", "PROCEDURE pkg IS\nEND;", ("Y", None)) is None
+    assert assemble("HMES", "TRIGGER", "TRG", "TRIGGER trg\nBEGIN NULL; END;", ("Y", None)) is None
+
+
+def test_source_mismatch_with_get_ddl_falls_back(monkeypatch) -> None:
+    database = SyntheticOracleDb(_SCHEMA)
+    extractor = _extractor({"PACKAGE BODY": "source"})
+    bodies = [item for item in _packages(database) if item.object_type == "PACKAGE BODY"]
+    items: list[ExtractedDdl] = []
+    # GET_DDL이 재조립 결과와 다른 모양(예: 다른 버전의 변환 파라미터)을 돌려주는 경우.
+    original = database.catalog.ddl
+    monkeypatch.setattr(
+        database.catalog,
+        "ddl",
+        lambda object_type, name: (original(object_type, name) or "").replace("EDITIONABLE ", ""),
+    )
+
+    with patched_oracledb(database):
+        connection = database.connect()
+        fallback = extractor._extract_source(extractor._cursor(connection), bodies, items.append)
+
+    assert items == []
+    assert fallback == bodies
+
+
+def test_source_strategy_is_rejected_for_non_plsql_types(tmp_path: Path) -> None:
+    config_file = tmp_path / "snapshot.yml"
+    config_file.write_text(
+        "oracle:\n  host: h\n  port: 1521\n  service_name: s\n  username: u\n  password: p\n"
+        "scope:\n  include_schemas: [HMES]\n  type_strategies:\n    VIEW: source\n"
+        f"output:\n  snapshot_root: {tmp_path / 'out'}\n"
+        f"git:\n  repo_path: {tmp_path}\n",
+        encoding="utf-8",
+    )
+
+    try:
+        load_config(config_file)
+    except ConfigError as exc:
+        assert "VIEW" in str(exc)
+    else:
+        raise AssertionError("ConfigError was not raised")
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+import orasnap.oracle.extractor as extractor_module
+from orasnap.config import (
+    AppConfig,
+    AuditConfig,
+    GitConfig,
+    LogsConfig,
+    OracleConfig,
+    OutputConfig,
+    ScopeConfig,
+    WatchConfig,
+)
+from orasnap.oracle.extractor import OracleMetadataExtractor
+from orasnap.pipeline import SnapshotRunResult
+from orasnap.watch import SnapshotWatcher
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeStop:
+    def __init__(self, clock: _FakeClock) -> None:
+        self.clock = clock
+        self.flag = False
+        self.waits: list[float] = []
+
+    def is_set(self) -> bool:
+        return self.flag
+
+    def set(self) -> None:
+        self.flag = True
+
+    def wait(self, timeout: float) -> bool:
+        self.waits.append(timeout)
+        self.clock.now += timeout
+        return self.flag
+
+
+class _FakeWatchExtractor:
+    """시각별 최대 AUDIT_ID 목록을 돌려주는 추출기 대역."""
+
+    def __init__(self, clock: _FakeClock, timeline: list[tuple[float, int]]) -> None:
+        self.clock = clock
+        self.timeline = timeline
+        self.sessions = 0
+        self.fail_polls = 0
+        self.alert_error: Exception | None = None
+        self.alert_waits = 0
+
+    @contextmanager
+    def hold_session(self):
+        self.sessions += 1
+        yield
+
+    def poll_audit_id(self, _audit_table: str) -> int:
+        if self.fail_polls:
+            self.fail_polls -= 1
+            raise RuntimeError("DPY-4011: the database or network closed the connection")
+        return max((audit_id for at, audit_id in self.timeline if at <= self.clock.now), default=0)
+
+    def wait_for_alert(self, _alert_name: str, timeout_seconds: float) -> bool:
+        self.alert_waits += 1
+        if self.alert_error is not None:
+            raise self.alert_error
+        self.clock.now += timeout_seconds
+        return False
+
+
+def _build_config(tmp_path: Path, **watch: object) -> AppConfig:
+    return AppConfig(
+        oracle=OracleConfig(
+            host="127.0.0.1",
+            port=1521,
+            service_name="ORCLPDB",
+            username="ORASNAP_SVC",
+            password="pw",
+        ),
+        scope=ScopeConfig(include_schemas=["HMES"], object_types=["VIEW"]),
+        output=OutputConfig(snapshot_root=tmp_path / "snapshots"),
+        git=GitConfig(repo_path=tmp_path / "repo", auto_push=False),
+        logs=LogsConfig(),
+        audit=AuditConfig(enabled=False),
+        watch=WatchConfig(poll_seconds=1.0, debounce_seconds=2.0, max_delay_seconds=10.0, **watch),
+    )
+
+
+def _result(audit_id: int) -> SnapshotRunResult:
+    return SnapshotRunResult(
+        extracted_count=0,
+        failed_count=0,
+        written_count=0,
+        deleted_count=0,
+        unchanged_count=0,
+        audit_exported_count=0,
+        committed=False,
+        commit_sha=None,
+        pushed=False,
+        failures=[],
+        log_file=None,
+        audit_id=audit_id,
+    )
+
+
+def _watcher(tmp_path: Path, timeline: list[tuple[float, int]], **watch: object):
+    clock = _FakeClock()
+    stop = _FakeStop(clock)
+    extractor = _FakeWatchExtractor(clock, timeline)
+    cycles: list[float] = []
+
+    def run_cycle() -> SnapshotRunResult:
+        cycles.append(clock.now)
+        return _result(extractor.poll_audit_id("DDL_AUDIT_LOG"))
+
+    watcher = SnapshotWatcher(
+        config=_build_config(tmp_path, **watch),
+        extractor=extractor,
+        run_cycle=run_cycle,
+        logger=logging.getLogger("test"),
+        stop_event=stop,
+        clock=clock,
+    )
+    return watcher, extractor, stop, cycles
+
+
+def test_watch_debounces_burst_into_one_cycle(tmp_path: Path) -> None:
+    # 시작 시 5까지 반영, 10초부터 1초 간격으로 이벤트 4개가 이어서 들어온다.
+    timeline = [(0.0, 5), (10.0, 6), (11.0, 7), (12.0, 8), (13.0, 9)]
+    watcher, extractor, _, cycles = _watcher(tmp_path, timeline)
+
+    summary = watcher.run(max_cycles=2)
+
+    assert summary.cycles == 2
+    assert extractor.sessions == 1
+    # 마지막 이벤트(13초) 이후 debounce 2초가 지나고 나서 한 번만 실행한다.
+    assert cycles == [0.0, 15.0]
+    assert watcher.applied_audit_id == 9
+
+
+def test_watch_runs_within_max_delay_while_events_keep_coming(tmp_path: Path) -> None:
+    timeline = [(0.0, 1), *[(float(second), second) for second in range(5, 40)]]
+    watcher, _, _, cycles = _watcher(tmp_path, timeline)
+
+    watcher.run(max_cycles=2)
+
+    assert cycles == [0.0, 15.0]
+
+
+def test_watch_reconnects_with_backoff_after_session_error(tmp_path: Path) -> None:
+    watcher, extractor, stop, cycles = _watcher(tmp_path, [(0.0, 3), (20.0, 4)])
+    watcher.applied_audit_id = 3
+    extractor.fail_polls = 2
+
+    summary = watcher.run(max_cycles=1)
+
+    assert summary.reconnects == 2
+    assert extractor.sessions == 3
+    assert stop.waits[:2] == [1.0, 2.0]
+    assert summary.cycles == 1
+    assert watcher.applied_audit_id == 4
+
+
+def test_watch_falls_back_to_polling_when_alert_is_unavailable(tmp_path: Path) -> None:
+    watcher, extractor, _, cycles = _watcher(
+        tmp_path,
+        [(0.0, 1), (3.0, 2)],
+        alert_name="ORASNAP_DDL",
+    )
+    extractor.alert_error = RuntimeError("PLS-00201: identifier 'DBMS_ALERT' must be declared")
+
+    watcher.run(max_cycles=2)
+
+    assert extractor.alert_waits == 1
+    assert cycles == [0.0, 5.0]
+
+
+class _FakeCursor:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    def execute(self, sql: str, binds: list[object] | None = None) -> None:
+        self.executed.append(sql)
+
+    def fetchone(self) -> tuple[object, ...]:
+        return (42,)
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.cursor_obj = _FakeCursor()
+        self.closed = False
+
+    def cursor(self) -> _FakeCursor:
+        return self.cursor_obj
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeOracleDb:
+    def __init__(self) -> None:
+        self.connections: list[_FakeConnection] = []
+
+    def connect(self, **_: object) -> _FakeConnection:
+        self.connections.append(_FakeConnection())
+        return self.connections[-1]
+
+
+def test_hold_session_reuses_one_connection(tmp_path: Path, monkeypatch) -> None:
+    fake_db = _FakeOracleDb()
+    monkeypatch.setattr(extractor_module, "oracledb", fake_db)
+    config = _build_config(tmp_path)
+    extractor = OracleMetadataExtractor(oracle_config=config.oracle, scope_config=config.scope)
+
+    with extractor.hold_session():
+        assert extractor.poll_audit_id("DDL_AUDIT_LOG") == 42
+        assert extractor.poll_audit_id("DDL_AUDIT_LOG") == 42
+        assert not fake_db.connections[0].closed
+
+    assert len(fake_db.connections) == 1
+    assert fake_db.connections[0].closed
+    # transform 설정은 세션을 열 때 한 번만 실행한다.
+    executed = fake_db.connections[0].cursor_obj.executed
+    assert sum("SET_TRANSFORM_PARAM" in sql for sql in executed) == 1
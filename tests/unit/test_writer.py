@@ -46,3 +46,79 @@ def test_writer_dry_run_does_not_write(tmp_path: Path) -> None:
     assert len(result.added_files) == 1
     assert not result.added_files[0].exists()
 
+
+
+def test_writer_keeps_retained_objects(tmp_path: Path) -> None:
+    writer = SnapshotWriter(snapshot_root=tmp_path / "snapshots")
+    writer.write(
+        [
+            _entry("T1", "CREATE TABLE T1 (ID NUMBER);"),
+            _entry("T2", "CREATE TABLE T2 (ID NUMBER);"),
+        ]
+    )
+
+    retained = DbObject(owner="HMES", object_type="TABLE", object_name="T1")
+    result = writer.write(
+        [_entry("T2", "CREATE TABLE T2 (ID NUMBER, NM VARCHAR2(10));")],
+        retained=[retained],
+    )
+
+    assert result.deleted_files == []
+    assert len(result.modified_files) == 1
+    assert result.unchanged_files == 1
+    assert writer.object_path(retained).exists()
+
+
+def test_writer_manifest_skips_disk_reads(tmp_path: Path, monkeypatch) -> None:
+    manifest_path = tmp_path / "files.json"
+    writer = SnapshotWriter(snapshot_root=tmp_path / "snapshots", manifest_path=manifest_path)
+    writer.write(
+        [
+            _entry("T1", "CREATE TABLE T1 (ID NUMBER);"),
+            _entry("T2", "CREATE TABLE T2 (ID NUMBER);"),
+        ]
+    )
+    assert manifest_path.exists()
+
+    original_read_text = Path.read_text
+
+    def _guarded_read(self: Path, *args: object, **kwargs: object) -> str:
+        assert self.suffix != ".sql", f"unexpected snapshot read: {self}"
+        return original_read_text(self, *args, **kwargs)
+
+    def _fail_rglob(self: Path, *args: object) -> None:
+        raise AssertionError(f"unexpected rglob: {self}")
+
+    monkeypatch.setattr(Path, "read_text", _guarded_read)
+    monkeypatch.setattr(Path, "rglob", _fail_rglob)
+    result = SnapshotWriter(snapshot_root=tmp_path / "snapshots", manifest_path=manifest_path).write(
+        [_entry("T1", "CREATE TABLE T1 (ID NUMBER);")]
+    )
+
+    assert result.unchanged_files == 1
+    assert [path.name for path in result.deleted_files] == ["T2.sql"]
+    assert not (tmp_path / "snapshots" / "HMES" / "TABLE" / "T2.sql").exists()
+
+
+def test_writer_verify_mode_detects_stale_manifest(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "files.json"
+    writer = SnapshotWriter(snapshot_root=tmp_path / "snapshots", manifest_path=manifest_path)
+    first = writer.write([_entry("T1", "CREATE TABLE T1 (ID NUMBER);")])
+    target = first.added_files[0]
+    target.write_text("-- edited by hand\n", encoding="utf-8")
+    (target.parent / "STRAY.sql").write_text("-- not managed\n", encoding="utf-8")
+
+    trusted = writer.write([_entry("T1", "CREATE TABLE T1 (ID NUMBER);")], dry_run=True)
+    assert trusted.unchanged_files == 1
+    assert trusted.deleted_files == []
+
+    verifying = SnapshotWriter(
+        snapshot_root=tmp_path / "snapshots",
+        manifest_path=manifest_path,
+        verify=True,
+    )
+    result = verifying.write([_entry("T1", "CREATE TABLE T1 (ID NUMBER);")])
+
+    assert result.modified_files == [target]
+    assert [path.name for path in result.deleted_files] == ["STRAY.sql"]
+    assert target.read_text(encoding="utf-8") == "CREATE TABLE T1 (ID NUMBER);\n"